@@ -54,6 +54,7 @@ if app_settings.sentry_dsn and app_settings.environment not in ("development", "
 from backend.dependencies import get_admin_supabase
 from backend.middleware.logging_context import LoggingContextMiddleware
 from backend.middleware.rate_limit import limiter
+from backend.middleware.rate_limit_storage import start_rate_limit_sync
 from backend.middleware.security import SecurityHeadersMiddleware
 from backend.middleware.seo import (
     enrich_html_for_crawler,
@@ -129,10 +130,13 @@ from backend.services.content_packs.orphan_sweeper_scheduler import (
     OrphanSweeperScheduler,
 )
 from backend.services.dungeon_content_service import load_all_content as load_dungeon_content
+from backend.services.dungeon_content_service import start_content_refresh
 from backend.services.dungeon_engine_service import start_instance_cleanup
 from backend.services.epoch_cycle_scheduler import EpochCycleScheduler
 from backend.services.github_app import check_env_config, close_github_app_client
 from backend.services.heartbeat_service import HeartbeatService
+from backend.services.image_rendition_service import shutdown_encode_pool
+from backend.services.instagram_render_pool import shutdown_render_pool
 from backend.services.instagram_scheduler import InstagramScheduler
 from backend.services.journal.fragment_generation_scheduler import (
     FragmentGenerationScheduler,
@@ -143,6 +147,9 @@ from backend.services.platform_research_domains import ensure_loaded as ensure_r
 from backend.services.resonance_scheduler import ResonanceScheduler
 from backend.services.scanning.scanner_service import ScannerService
 from backend.services.sentry_rule_cache_refresher import SentryRuleCacheRefresher
+from backend.services.simulation_settings_cache import start_settings_cache_refresh
+from backend.services.translation_queue_service import TranslationQueueService
+from backend.services.weather_provider import close_weather_client
 
 
 @asynccontextmanager
@@ -232,11 +239,40 @@ async def lifespan(app: FastAPI):
             "RUN_SCHEDULERS is disabled — background schedulers not started. "
             "This instance is passive; another deployment owns the tick.",
         )
+
+    # Per-worker, NOT gated by run_schedulers: every process serving dungeon
+    # runs holds its own content cache and must converge on the DB version,
+    # passive instances included. Polls one stamp RPC per interval.
+    content_refresh_task = await start_content_refresh()
+    # Same reasoning: each worker's simulation settings cache converges on
+    # the per-simulation version stamps written by the settings trigger.
+    settings_refresh_task = await start_settings_cache_refresh()
+    # Per-worker as well: each process pushes its rate-limit hits and pulls
+    # the cluster totals, so quotas are shared by every replica.
+    rate_limit_sync_task = await start_rate_limit_sync(app_settings.rate_limit_sync_seconds)
+    # Per-worker: each process buffers the auto-translations of its own
+    # writes and helps drain the shared translation_jobs queue.
+    translation_queue_task = await TranslationQueueService.start()
     yield
+    translation_queue_task.cancel()
+    # Persist translations buffered since the last tick so a deploy loses none.
+    try:
+        await TranslationQueueService.flush(await get_admin_supabase())
+    except Exception:  # noqa: BLE001 — shutdown must continue
+        logging.getLogger(__name__).exception("Translation queue flush on shutdown failed")
+    rate_limit_sync_task.cancel()
+    settings_refresh_task.cancel()
+    content_refresh_task.cancel()
     for task in reversed(scheduler_tasks):
         task.cancel()
     # Release the persistent GitHub App httpx client pool.
     await close_github_app_client()
+    # Stop the Instagram render workers (spawned lazily on first composition).
+    shutdown_render_pool()
+    # Stop the image encode workers (spawned lazily on first rendition job).
+    shutdown_encode_pool()
+    # Release the pooled Open-Meteo client (ambient weather).
+    await close_weather_client()
 
 
 app = FastAPI(
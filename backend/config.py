@@ -16,10 +16,22 @@ class Settings(BaseSettings):
     replicate_api_token: str = ""
     tavily_api_key: str = ""
     forge_mock_mode: bool = False
+    # Forge batch image pipeline: jobs in flight, per-provider request slots, and the
+    # RAM budget for decode/encode (jobs hold only compressed bytes outside it).
+    forge_image_concurrency: int = 6
+    forge_openrouter_concurrency: int = 4
+    forge_replicate_concurrency: int = 4
+    forge_image_memory_budget_mb: int = 160
+    # Hi-res archive export: parallel image downloads, and the archive size kept in RAM
+    # before it spills to a temp file.
+    hires_archive_concurrency: int = 8
+    hires_archive_spool_mb: int = 16
 
     # Translation
     translation_backend: str = "claude"  # "claude" or "deepl"
     deepl_api_key: str = ""
+    # Max provider batch calls in flight per worker when draining the translation queue.
+    translation_concurrency: int = 2
 
     # Security
     settings_encryption_key: str = ""
@@ -50,6 +62,32 @@ class Settings(BaseSettings):
     # double-run. pydantic-settings maps run_schedulers → RUN_SCHEDULERS (case-insensitive).
     run_schedulers: bool = True
 
+    # Rate limiting — "shared://" adds other workers' hits to each worker's slowapi
+    # counters via the rate_limit_counters table (synced every rate_limit_sync_seconds),
+    # so limits hold across replicas. "memory://" limits per process.
+    rate_limit_storage_uri: str = "shared://"
+    rate_limit_sync_seconds: float = 1.0
+
+    # Dungeon content — directory for compiled, hash-addressed content snapshots
+    # (dungeon_content_service). Empty = "<system tmp>/velgarien-dungeon-content-<uid>".
+    # Must be a 0700 directory owned by the service user, or snapshots are skipped.
+    # Per-host accelerator only; the DB stamp stays the source of truth.
+    dungeon_content_snapshot_dir: str = ""
+
+    # Instagram rendering — process-pool size for feed/story composition
+    # (instagram_render_pool). 0 = no pool; jobs run in the default thread pool.
+    # Opt-in like IMAGE_ENCODE_WORKERS below: set INSTAGRAM_RENDER_WORKERS on
+    # hosts with spare cores.
+    instagram_render_workers: int = 0
+    # Image renditions — process-pool size for decode + AVIF/WebP encoding of
+    # generated images (image_rendition_service). 0 = default thread pool.
+    # Each pool process is a full interpreter per uvicorn worker, so the pool
+    # is opt-in: set IMAGE_ENCODE_WORKERS on hosts with spare cores.
+    image_encode_workers: int = 0
+
+    # Ambient weather — Open-Meteo forecast endpoint (weather_provider).
+    open_meteo_url: str = "https://api.open-meteo.com/v1/forecast"
+
     # Sentry
     sentry_dsn: str = ""
     sentry_traces_sample_rate: float = 0.1
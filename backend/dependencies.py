@@ -6,12 +6,14 @@ from uuid import UUID
 
 import jwt as pyjwt
 from cachetools import TTLCache
-from fastapi import Depends, Header, HTTPException, Path, Query, status
+from fastapi import Depends, Header, HTTPException, Path, Query, Request, status
 from jwt import PyJWKClient
 from supabase_auth.errors import AuthApiError
 
 from backend.config import settings
 from backend.models.common import CurrentUser
+from backend.utils.call_stats import instrument_client
+from backend.utils.data_loader import DataLoaders
 from backend.utils.db import maybe_single_data
 from backend.utils.supabase_admin_cache import get_admin_supabase_client
 from supabase import AsyncClient as Client
@@ -78,7 +80,18 @@ def _decode_jwt(token: str) -> dict:
     )
 
 
+def verified_user_id(request: Request) -> str | None:
+    """Id of the user ``get_current_user`` verified for this request, if any.
+
+    Set only after the JWT signature checked out, so it is safe to key
+    per-user state (rate-limit buckets) on. None on routes that never
+    resolved a user — public routes, or a missing/invalid token.
+    """
+    return getattr(request.state, "user_id", None)
+
+
 async def get_current_user(
+    request: Request,
     authorization: Annotated[str, Header()],
 ) -> CurrentUser:
     """Extract and validate the current user from the JWT Bearer token."""
@@ -108,6 +121,7 @@ async def get_current_user(
             detail="Token missing 'sub' claim.",
         )
 
+    request.state.user_id = user_id  # see verified_user_id()
     return CurrentUser(id=UUID(user_id), email=email, access_token=token)
 
 
@@ -126,7 +140,8 @@ async def get_supabase(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Session expired or invalid.",
         ) from e
-    return client
+    # After set_session: signing in rebuilds the PostgREST session.
+    return instrument_client(client)
 
 
 async def get_anon_supabase() -> Client:
@@ -134,7 +149,7 @@ async def get_anon_supabase() -> Client:
 
     Applies anon RLS policies — used for public read-only endpoints.
     """
-    return await create_async_client(settings.supabase_url, settings.supabase_anon_key)
+    return instrument_client(await create_async_client(settings.supabase_url, settings.supabase_anon_key))
 
 
 # ── Slug/UUID Resolution ───────────────────────────────────────────────
@@ -206,6 +221,16 @@ async def get_effective_supabase(
     return supabase
 
 
+async def get_loaders(supabase: Client = Depends(get_effective_supabase)) -> DataLoaders:
+    """Request-scoped ``DataLoaders`` on the effective client.
+
+    FastAPI resolves a dependency once per request, so every service the
+    route hands the registry to shares its batches and cache. See
+    ``backend/utils/data_loader.py``.
+    """
+    return DataLoaders(supabase)
+
+
 def require_role(required_role: str):
     """Dependency factory that checks the user has the required role in a simulation.
 
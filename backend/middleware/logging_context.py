@@ -1,4 +1,4 @@
-"""Request context middleware — injects correlation IDs into every log line."""
+"""Request context middleware — injects correlation IDs and DB round-trip counts into every log line."""
 
 import base64
 import json
@@ -12,6 +12,9 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from backend.services.query_stats_service import QueryStatsService
+from backend.utils.call_stats import CallStats, track_calls
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +23,10 @@ class LoggingContextMiddleware(BaseHTTPMiddleware):
 
     Every log call during the request lifecycle automatically includes
     these fields — no changes needed in service or router code.
+
+    The request's PostgREST round trips (``backend.utils.call_stats``) are
+    bound as ``db_*`` fields for the completion log, attached to the Sentry
+    transaction, and recorded per route in ``QueryStatsService``.
     """
 
     async def dispatch(self, request: Request, call_next) -> Response:
@@ -40,10 +47,12 @@ class LoggingContextMiddleware(BaseHTTPMiddleware):
         )
 
         start = time.perf_counter()
-        response = await call_next(request)
+        with track_calls() as calls:
+            response = await call_next(request)
         duration_ms = round((time.perf_counter() - start) * 1000, 1)
 
         response.headers["x-request-id"] = request_id
+        self._report_calls(request, calls)
 
         logger.info(
             "Request completed",
@@ -51,6 +60,25 @@ class LoggingContextMiddleware(BaseHTTPMiddleware):
         )
         return response
 
+    @staticmethod
+    def _report_calls(request: Request, calls: CallStats) -> None:
+        if not calls.db_calls:
+            return
+        structlog.contextvars.bind_contextvars(
+            db_calls=calls.db_calls,
+            db_rows=calls.db_rows,
+            db_ms=round(calls.db_ms, 1),
+            db_bytes=calls.db_bytes,
+        )
+        span = sentry_sdk.get_current_span()
+        if span is not None:
+            span.set_data("db.round_trips", calls.db_calls)
+            span.set_data("db.rows", calls.db_rows)
+        # Unmatched paths (404s) share one key so scanners cannot grow the rollup.
+        route = request.scope.get("route")
+        template = getattr(route, "path", None) or "<unmatched>"
+        QueryStatsService.record(f"{request.method} {template}", calls)
+
     @staticmethod
     def _extract_user_id(request: Request) -> str | None:
         """Best-effort user_id from JWT payload. Decode only, no validation."""
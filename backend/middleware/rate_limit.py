@@ -1,8 +1,36 @@
 from slowapi import Limiter
 from slowapi.util import get_remote_address
+from starlette.requests import Request
 
-# Rate limiter instance using client IP as key
-limiter = Limiter(key_func=get_remote_address)
+import backend.middleware.rate_limit_storage  # noqa: F401 — registers the shared:// storage scheme
+from backend.config import settings
+from backend.dependencies import verified_user_id
+
+
+def rate_limit_key(request: Request) -> str:
+    """Bucket per authenticated user; per client IP for everything else.
+
+    Keying on the user id keeps users behind one NAT or proxy from sharing a
+    budget and stops one user from multiplying it across addresses. Only a
+    user that ``get_current_user`` verified earlier in the request selects a
+    user bucket — the limit is checked inside the endpoint wrapper, after
+    FastAPI resolved its dependencies. Public routes never verify a token,
+    so a bearer header there (forged or not) still counts against the IP.
+    """
+    user_id = verified_user_id(request)
+    if user_id:
+        return f"user:{user_id}"
+    return f"ip:{get_remote_address(request)}"
+
+
+# Sliding-window counters shared across workers and replicas through the
+# rate_limit_counters table (see rate_limit_storage.py), so quotas hold
+# cluster-wide instead of per process.
+limiter = Limiter(
+    key_func=rate_limit_key,
+    storage_uri=settings.rate_limit_storage_uri,
+    strategy="sliding-window-counter",
+)
 
 # Rate limit constants
 RATE_LIMIT_AI_GENERATION = "120/hour"
@@ -0,0 +1,161 @@
+"""Cluster-wide slowapi counters: local sliding windows synced through Postgres.
+
+slowapi checks limits synchronously inside the request, so the storage
+cannot await a database round trip per hit. ``SharedCounterStorage`` keeps
+the ``limits`` in-memory sliding-window counters as the hot path and adds
+what every other worker has counted for the same window key:
+
+- each local hit is applied immediately and queued as a pending delta;
+- ``sync()`` (every ``rate_limit_sync_seconds``, from the app lifespan)
+  pushes all pending deltas in ONE ``fn_rate_limit_sync`` call, which adds
+  them to the UNLOGGED ``rate_limit_counters`` table and returns the
+  cluster totals of every live window key this worker tracks;
+- ``get`` / ``incr`` answer ``local + (cluster total - our pushed hits)``.
+
+Sliding-window keys embed the window index (``key/<epoch // expiry>``), so
+all workers agree on them without coordination. A cluster-wide limit can
+be overshot by at most the hits the other workers admit within one sync
+interval. If the shared table is unreachable the pending deltas are kept
+and limits degrade to per-worker counting until the next successful sync.
+
+Registered with ``limits`` as the ``shared://`` scheme; ``memory://`` (or
+simply never starting the sync loop, as in tests) is the in-memory fallback.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+import weakref
+from collections import Counter
+
+import httpx
+from limits.storage import MemoryStorage
+from postgrest.exceptions import APIError as PostgrestAPIError
+
+from supabase import AsyncClient as Client
+
+logger = logging.getLogger(__name__)
+
+_storages: weakref.WeakSet[SharedCounterStorage] = weakref.WeakSet()
+
+
+class SharedCounterStorage(MemoryStorage):
+    """``MemoryStorage`` whose counters include other workers' hits."""
+
+    STORAGE_SCHEME = ["shared"]
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **options: str) -> None:
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.remote: dict[str, int] = {}  # other workers' hits per window key (as of last sync)
+        self.pending: Counter[str] = Counter()  # local hits not yet pushed
+        self.pushed: Counter[str] = Counter()  # local hits already in the shared table
+        self.deadlines: dict[str, float] = {}  # wall-clock expiry of every tracked key
+        _storages.add(self)
+
+    # ── limits Storage API ──────────────────────────────────────
+
+    def _forget_expired(self, key: str) -> None:
+        deadline = self.deadlines.get(key)
+        if deadline is not None and deadline <= time.time():
+            self.deadlines.pop(key, None)
+            self.remote.pop(key, None)
+            self.pending.pop(key, None)
+            self.pushed.pop(key, None)
+
+    def get(self, key: str) -> int:
+        self._forget_expired(key)
+        return super().get(key) + self.remote.get(key, 0)
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        local = super().incr(key, expiry, amount)
+        self.deadlines.setdefault(key, time.time() + expiry)
+        self.pending[key] += amount
+        return local + self.remote.get(key, 0)
+
+    def decr(self, key: str, amount: int = 1) -> int:
+        local = super().decr(key, amount)
+        if key in self.deadlines:
+            self.pending[key] -= amount
+        return local + self.remote.get(key, 0)
+
+    def clear(self, key: str) -> None:
+        super().clear(key)
+        for state in (self.remote, self.pending, self.pushed, self.deadlines):
+            state.pop(key, None)
+
+    def reset(self) -> int | None:
+        for state in (self.remote, self.pending, self.pushed, self.deadlines):
+            state.clear()
+        return super().reset()
+
+    # ── Cluster sync ────────────────────────────────────────────
+
+    async def sync(self, admin: Client) -> int:
+        """Push pending deltas and pull cluster totals in one RPC. Returns keys synced."""
+        now = time.time()
+        for key in [k for k, deadline in self.deadlines.items() if deadline <= now]:
+            self._forget_expired(key)
+        keys = list(self.deadlines)
+        if not keys:
+            return 0
+
+        snapshot, self.pending = self.pending, Counter()
+        hits = [
+            {"k": key, "n": count, "ttl": max(1, math.ceil(self.deadlines[key] - now))}
+            for key, count in snapshot.items()
+            if count and key in self.deadlines
+        ]
+        try:
+            response = await admin.rpc("fn_rate_limit_sync", {"p_hits": hits, "p_keys": keys}).execute()
+        except BaseException:
+            self.pending.update(snapshot)  # retried on the next sync; limits stay local meanwhile
+            raise
+
+        for hit in hits:
+            self.pushed[hit["k"]] += hit["n"]
+        totals = {row["key"]: int(row["hits"]) for row in response.data or []}
+        for key in keys:
+            if key in self.deadlines:
+                self.remote[key] = max(0, totals.get(key, 0) - self.pushed.get(key, 0))
+        return len(keys)
+
+
+async def sync_shared_counters(admin: Client) -> int:
+    """Sync every live ``SharedCounterStorage`` (normally exactly one)."""
+    synced = 0
+    for storage in list(_storages):
+        synced += await storage.sync(admin)
+    return synced
+
+
+async def _rate_limit_sync_loop(interval: float) -> None:
+    """Infinite loop: exchange counter deltas with the shared table."""
+    from backend.utils.supabase_admin_cache import get_admin_supabase_client
+
+    failing = False
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            admin = await get_admin_supabase_client()
+            await sync_shared_counters(admin)
+            if failing:
+                logger.info("Rate limit counter sync recovered")
+            failing = False
+        except asyncio.CancelledError:
+            logger.info("Rate limit sync loop shutting down")
+            raise
+        except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError):
+            # Log once per outage — the loop runs every second.
+            if not failing:
+                logger.warning("Rate limit counter sync failed; limiting per worker", exc_info=True)
+            failing = True
+
+
+async def start_rate_limit_sync(interval: float) -> asyncio.Task:
+    """Launch the counter sync loop. Called from app lifespan."""
+    task = asyncio.create_task(_rate_limit_sync_loop(interval))
+    logger.info("Rate limit sync loop started (interval=%.1fs)", interval)
+    return task
@@ -154,6 +154,32 @@ class ForecastProjection(BaseModel):
     generated_at: datetime
 
 
+# ── Query stats ──────────────────────────────────────────────────────────
+
+
+class RenderStatsSnapshot(BaseModel):
+    """Per-job Instagram render and per-rendition image encode metrics (this worker)."""
+
+    instagram: dict[str, dict[str, float]] = Field(default_factory=dict)
+    image_encode: dict[str, dict[str, float]] = Field(default_factory=dict)
+
+
+class QueryStatsEntry(BaseModel):
+    """Rolling PostgREST round-trip statistics for one route or background job."""
+
+    key: str
+    samples: int
+    total: int
+    avg_db_calls: float
+    p95_db_calls: float
+    max_db_calls: int
+    p50_db_ms: float
+    p95_db_ms: float
+    avg_db_bytes: int
+    top_tables: dict[str, int] = Field(default_factory=dict)
+    n_plus_one: dict[str, int] = Field(default_factory=dict)
+
+
 # ── Sentry budget tile ───────────────────────────────────────────────────
 
 
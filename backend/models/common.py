@@ -22,6 +22,7 @@ class PaginationMeta(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None  # keyset cursor for the following page, if any
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -54,6 +55,42 @@ class DeleteResponse(BaseModel):
     id: str | None = None
 
 
+class BulkItemsRequest(BaseModel):
+    """Body of a bulk create/update: one object per row, validated row by row."""
+
+    items: list[dict] = Field(min_length=1, max_length=500)
+
+
+class BulkDeleteRequest(BaseModel):
+    """Body of a bulk soft-delete."""
+
+    ids: list[UUID] = Field(min_length=1, max_length=500)
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of one row of a bulk request (``index`` into the request items)."""
+
+    index: int
+    ok: bool
+    id: str | None = None
+    error: str | None = None
+    data: dict | None = None
+
+
+class BulkResult(BaseModel):
+    """Per-row outcomes of a bulk operation, in request order."""
+
+    succeeded: int
+    failed: int
+    results: list[BulkItemResult]
+
+    @classmethod
+    def from_items(cls, items: list[BulkItemResult]) -> "BulkResult":
+        items = sorted(items, key=lambda item: item.index)
+        succeeded = sum(1 for item in items if item.ok)
+        return cls(succeeded=succeeded, failed=len(items) - succeeded, results=items)
+
+
 class ErrorDetail(BaseModel):
     """Error detail information."""
 
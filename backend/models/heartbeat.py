@@ -230,6 +230,28 @@ class CascadeRuleResponse(BaseModel):
 # -- Admin Dashboard --
 
 
+class HeartbeatPhaseTiming(BaseModel):
+    """Rolling statistics for one tick phase over recent completed ticks."""
+
+    phase: str
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    avg_db_calls: float = 0.0
+    avg_db_rows: float = 0.0
+    avg_llm_calls: float = 0.0
+    failures: int = 0
+
+
+class HeartbeatTimings(BaseModel):
+    """Tick wall-time percentiles plus the per-phase breakdown."""
+
+    samples: int = 0
+    tick_p50_ms: float | None = None
+    tick_p95_ms: float | None = None
+    phases: list[HeartbeatPhaseTiming] = Field(default_factory=list)
+
+
 class HeartbeatSimulationStatus(BaseModel):
     """Per-simulation heartbeat status for admin dashboard."""
 
@@ -243,6 +265,7 @@ class HeartbeatSimulationStatus(BaseModel):
     active_arcs: int = 0
     scar_tissue_level: float = 0.0
     pending_responses: int = 0
+    timings: HeartbeatTimings = Field(default_factory=HeartbeatTimings)
 
 
 class HeartbeatDashboard(BaseModel):
@@ -252,3 +275,4 @@ class HeartbeatDashboard(BaseModel):
     interval_seconds: int
     active_systems: list[str]
     simulations: list[HeartbeatSimulationStatus]
+    timings: HeartbeatTimings = Field(default_factory=HeartbeatTimings)
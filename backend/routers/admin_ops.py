@@ -15,6 +15,8 @@ Endpoint surface:
     GET    /admin/ops/heatmap              HeatmapPanel (MV-backed, P2.6)
     GET    /admin/ops/forecast             ForecastPanel projection + driver (P3.1)
     GET    /admin/ops/audit                Incident Dossier drawer
+    GET    /admin/ops/query-stats          DB round trips per route / job (this worker)
+    GET    /admin/ops/render-stats         Image render / encode timings (this worker)
     GET    /admin/ops/budgets              Budget list for the CRUD UI
     POST   /admin/ops/budget               Create a budget
     PUT    /admin/ops/budget/{id}          Update a budget
@@ -49,6 +51,8 @@ from backend.models.bureau_ops import (
     KillActionResponse,
     LedgerSnapshot,
     OpsAuditEntry,
+    QueryStatsEntry,
+    RenderStatsSnapshot,
     ResetCircuitRequest,
     RevertKillRequest,
     SentryRule,
@@ -59,8 +63,11 @@ from backend.models.common import CurrentUser, DeleteResponse, SuccessResponse
 from backend.services.budget_enforcement_service import BudgetEnforcementService
 from backend.services.circuit_breaker_service import circuit_breaker
 from backend.services.circuit_kill_service import CircuitKillService
+from backend.services.image_rendition_service import encode_stats
+from backend.services.instagram_render_pool import render_stats
 from backend.services.ops_forecast_service import OpsForecastService
 from backend.services.ops_ledger_service import OpsLedgerService
+from backend.services.query_stats_service import QueryStatsService
 from backend.services.sentry_rule_service import SentryRuleService
 from supabase import AsyncClient as Client
 
@@ -157,6 +164,33 @@ async def get_forecast(
     return SuccessResponse(data=data)
 
 
+@router.get("/query-stats")
+async def get_query_stats(
+    _user: Annotated[CurrentUser, Depends(require_platform_admin())],
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> SuccessResponse[list[QueryStatsEntry]]:
+    """PostgREST round trips per route and background job, most DB-heavy first.
+
+    In-process rollup of the last 200 samples per key, so each uvicorn
+    worker reports only the traffic it served. ``n_plus_one`` counts the
+    samples in which a query shape repeated with different parameters.
+    """
+    return SuccessResponse(data=QueryStatsService.snapshot()[:limit])
+
+
+@router.get("/render-stats")
+async def get_render_stats(
+    _user: Annotated[CurrentUser, Depends(require_platform_admin())],
+) -> SuccessResponse[RenderStatsSnapshot]:
+    """Instagram render and image encode timings since this worker started.
+
+    Shows whether the jobs run in a process pool or queue behind the thread
+    pool (``wait_ms_avg``) before INSTAGRAM_RENDER_WORKERS or
+    IMAGE_ENCODE_WORKERS is raised.
+    """
+    return SuccessResponse(data=RenderStatsSnapshot(instagram=render_stats(), image_encode=encode_stats()))
+
+
 # ── Budget CRUD ──────────────────────────────────────────────────────────
 
 
@@ -9,6 +9,9 @@ from fastapi import APIRouter, Depends, Header, Query
 from backend.dependencies import get_current_user, get_effective_supabase, require_role
 from backend.models.agent import AgentCreate, AgentResponse, AgentUpdate
 from backend.models.common import (
+    BulkDeleteRequest,
+    BulkItemsRequest,
+    BulkResult,
     CurrentUser,
     MessageResponse,
     PaginatedResponse,
@@ -46,6 +49,7 @@ async def list_agents(
     search: Annotated[str | None, Query(description="Full-text search")] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 25,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="Keyset cursor from meta.next_cursor (overrides offset)")] = None,
 ) -> PaginatedResponse[AgentResponse]:
     """List agents in a simulation with optional filters."""
     data, total = await _service.list(
@@ -57,8 +61,10 @@ async def list_agents(
         search=search,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        count="estimated" if cursor else "exact",
     )
-    return paginated(data, total, limit, offset)
+    return paginated(data, total, limit, offset, _service.page_cursor(data, limit))
 
 
 @router.get("/{agent_id}")
@@ -89,7 +95,6 @@ async def create_agent(
     sim = await SimulationService.get_simulation_context(supabase, simulation_id)
     if sim:
         schedule_auto_translation(
-            supabase,
             "agents",
             agent["id"],
             agent,
@@ -129,7 +134,6 @@ async def update_agent(
         sim = await SimulationService.get_simulation_context(supabase, simulation_id)
         if sim:
             schedule_auto_translation(
-                supabase,
                 "agents",
                 agent["id"],
                 agent,
@@ -155,6 +159,84 @@ async def delete_agent(
     return SuccessResponse(data=agent)
 
 
+@router.post("/bulk")
+async def bulk_create_agents(
+    simulation_id: UUID,
+    body: BulkItemsRequest,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("editor"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+) -> SuccessResponse[BulkResult]:
+    """Create up to 500 agents; each item is validated and reported on its own."""
+    result = await _service.create_many(supabase, simulation_id, user.id, body.items, schema=AgentCreate)
+    created = [r.data for r in result.results if r.ok and r.data]
+    await AuditService.safe_log_many(supabase, simulation_id, user.id, "agents", [r["id"] for r in created], "create")
+    sim = await SimulationService.get_simulation_context(supabase, simulation_id) if created else None
+    if sim:
+        for row in created:
+            schedule_auto_translation(
+                "agents",
+                row["id"],
+                row,
+                simulation_name=sim["name"],
+                simulation_theme=sim.get("theme", ""),
+                entity_type="agent",
+            )
+    return SuccessResponse(data=result)
+
+
+@router.patch("/bulk")
+async def bulk_update_agents(
+    simulation_id: UUID,
+    body: BulkItemsRequest,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("editor"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+) -> SuccessResponse[BulkResult]:
+    """Patch up to 500 agents; each item is ``{"id": ..., **fields}``."""
+    result = await _service.update_many(
+        supabase,
+        simulation_id,
+        body.items,
+        schema=AgentUpdate,
+        prepare=lambda data: {**data, **null_de_fields_for_update("agents", data)},
+    )
+    updated_ids = [r.id for r in result.results if r.ok and r.id]
+    await AuditService.safe_log_many(supabase, simulation_id, user.id, "agents", updated_ids, "update")
+    retranslate = [
+        r.data for r in result.results if r.ok and r.data and null_de_fields_for_update("agents", body.items[r.index])
+    ]
+    sim = await SimulationService.get_simulation_context(supabase, simulation_id) if retranslate else None
+    if sim:
+        for row in retranslate:
+            schedule_auto_translation(
+                "agents",
+                row["id"],
+                row,
+                simulation_name=sim["name"],
+                simulation_theme=sim.get("theme", ""),
+                entity_type="agent",
+            )
+    return SuccessResponse(data=result)
+
+
+@router.post("/bulk/delete")
+async def bulk_delete_agents(
+    simulation_id: UUID,
+    body: BulkDeleteRequest,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("editor"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+) -> SuccessResponse[BulkResult]:
+    """Soft-delete up to 500 agents. Farewells their active bonds."""
+    result = await _service.soft_delete_many(supabase, simulation_id, body.ids)
+    deleted_ids = [r.id for r in result.results if r.ok and r.id]
+    if deleted_ids:
+        await BondService.farewell_agent_bonds_many(supabase, [UUID(i) for i in deleted_ids])
+    await AuditService.safe_log_many(supabase, simulation_id, user.id, "agents", deleted_ids, "delete")
+    return SuccessResponse(data=result)
+
+
 @router.get("/{agent_id}/reactions")
 async def get_agent_reactions(
     simulation_id: UUID,
@@ -15,6 +15,9 @@ from backend.models.building import (
     ProfessionRequirementResponse,
 )
 from backend.models.common import (
+    BulkDeleteRequest,
+    BulkItemsRequest,
+    BulkResult,
     CurrentUser,
     MessageResponse,
     PaginatedResponse,
@@ -50,6 +53,7 @@ async def list_buildings(
     search: Annotated[str | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 25,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="Keyset cursor from meta.next_cursor (overrides offset)")] = None,
 ) -> PaginatedResponse[BuildingResponse]:
     """List buildings in a simulation with optional filters."""
     data, total = await _service.list(
@@ -62,8 +66,10 @@ async def list_buildings(
         search=search,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        count="estimated" if cursor else "exact",
     )
-    return paginated(data, total, limit, offset)
+    return paginated(data, total, limit, offset, _service.page_cursor(data, limit))
 
 
 @router.get("/{building_id}")
@@ -93,7 +99,6 @@ async def create_building(
     sim = await SimulationService.get_simulation_context(supabase, simulation_id)
     if sim:
         schedule_auto_translation(
-            supabase,
             "buildings",
             building["id"],
             building,
@@ -131,7 +136,6 @@ async def update_building(
         sim = await SimulationService.get_simulation_context(supabase, simulation_id)
         if sim:
             schedule_auto_translation(
-                supabase,
                 "buildings",
                 building["id"],
                 building,
@@ -156,6 +160,86 @@ async def delete_building(
     return SuccessResponse(data=building)
 
 
+@router.post("/bulk")
+async def bulk_create_buildings(
+    simulation_id: UUID,
+    body: BulkItemsRequest,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("editor"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+) -> SuccessResponse[BulkResult]:
+    """Create up to 500 buildings; each item is validated and reported on its own."""
+    result = await _service.create_many(supabase, simulation_id, user.id, body.items, schema=BuildingCreate)
+    created = [r.data for r in result.results if r.ok and r.data]
+    await AuditService.safe_log_many(
+        supabase, simulation_id, user.id, "buildings", [r["id"] for r in created], "create"
+    )
+    sim = await SimulationService.get_simulation_context(supabase, simulation_id) if created else None
+    if sim:
+        for row in created:
+            schedule_auto_translation(
+                "buildings",
+                row["id"],
+                row,
+                simulation_name=sim["name"],
+                simulation_theme=sim.get("theme", ""),
+                entity_type="building",
+            )
+    return SuccessResponse(data=result)
+
+
+@router.patch("/bulk")
+async def bulk_update_buildings(
+    simulation_id: UUID,
+    body: BulkItemsRequest,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("editor"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+) -> SuccessResponse[BulkResult]:
+    """Patch up to 500 buildings; each item is ``{"id": ..., **fields}``."""
+    result = await _service.update_many(
+        supabase,
+        simulation_id,
+        body.items,
+        schema=BuildingUpdate,
+        prepare=lambda data: {**data, **null_de_fields_for_update("buildings", data)},
+    )
+    updated_ids = [r.id for r in result.results if r.ok and r.id]
+    await AuditService.safe_log_many(supabase, simulation_id, user.id, "buildings", updated_ids, "update")
+    retranslate = [
+        r.data
+        for r in result.results
+        if r.ok and r.data and null_de_fields_for_update("buildings", body.items[r.index])
+    ]
+    sim = await SimulationService.get_simulation_context(supabase, simulation_id) if retranslate else None
+    if sim:
+        for row in retranslate:
+            schedule_auto_translation(
+                "buildings",
+                row["id"],
+                row,
+                simulation_name=sim["name"],
+                simulation_theme=sim.get("theme", ""),
+                entity_type="building",
+            )
+    return SuccessResponse(data=result)
+
+
+@router.post("/bulk/delete")
+async def bulk_delete_buildings(
+    simulation_id: UUID,
+    body: BulkDeleteRequest,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("editor"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+) -> SuccessResponse[BulkResult]:
+    """Soft-delete up to 500 buildings."""
+    result = await _service.soft_delete_many(supabase, simulation_id, body.ids)
+    deleted_ids = [r.id for r in result.results if r.ok and r.id]
+    await AuditService.safe_log_many(supabase, simulation_id, user.id, "buildings", deleted_ids, "delete")
+    return SuccessResponse(data=result)
+
+
 @router.get("/{building_id}/agents")
 async def get_building_agents(
     simulation_id: UUID,
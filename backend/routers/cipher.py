@@ -61,7 +61,7 @@ async def redeem_cipher(
     auth_header = request.headers.get("authorization", "")
     if auth_header.startswith("Bearer "):
         try:
-            user = await get_current_user(auth_header)
+            user = await get_current_user(request, auth_header)
             user_id = user.id
         except Exception:
             # Anonymous redemption is a supported path, but a systematically
@@ -1,7 +1,8 @@
 """Admin CRUD router for dungeon content tables.
 
 All endpoints require platform admin (email allowlist).
-Mutations use service_role client and trigger cache reload.
+Mutations use service_role client and refresh the content cache — only the
+archetype / ability school whose DB stamp changed is reloaded.
 Audit-logged via AuditService.safe_log().
 """
 
@@ -18,7 +19,7 @@ from backend.middleware.rate_limit import RATE_LIMIT_ADMIN_MUTATION, limiter
 from backend.models.common import CurrentUser, MessageResponse, PaginatedResponse, SuccessResponse
 from backend.services.audit_service import AuditService
 from backend.services.dungeon_content_admin_service import DungeonContentAdminService
-from backend.services.dungeon_content_service import load_all_content
+from backend.services.dungeon_content_service import load_all_content, refresh_content
 from backend.utils.responses import paginated
 from supabase import AsyncClient as Client
 
@@ -108,7 +109,7 @@ async def update_content_item(
     admin_supabase: Annotated[Client, Depends(get_admin_supabase)],
     user: Annotated[CurrentUser, Depends(require_platform_admin())],
 ) -> SuccessResponse:
-    """Update a content item. Reloads content cache after mutation."""
+    """Update a content item. Refreshes the changed content scope."""
     data = await _service.update_item(admin_supabase, content_type, item_id, body.data)
     await AuditService.safe_log(
         admin_supabase,
@@ -119,7 +120,7 @@ async def update_content_item(
         "update",
         details={"content_type": content_type, "fields": list(body.data.keys())},
     )
-    await load_all_content(admin_supabase)
+    await refresh_content(admin_supabase)
     return SuccessResponse(data=data)
 
 
@@ -130,8 +131,8 @@ async def reload_cache(
     admin_supabase: Annotated[Client, Depends(get_admin_supabase)],
     user: Annotated[CurrentUser, Depends(require_platform_admin())],
 ) -> SuccessResponse[MessageResponse]:
-    """Force reload of the dungeon content cache."""
-    await load_all_content(admin_supabase)
+    """Force a full rebuild of the dungeon content cache from the DB."""
+    await load_all_content(admin_supabase, use_snapshot=False)
     await AuditService.safe_log(
         admin_supabase,
         None,
@@ -152,7 +153,7 @@ async def create_content_item(
     admin_supabase: Annotated[Client, Depends(get_admin_supabase)],
     user: Annotated[CurrentUser, Depends(require_platform_admin())],
 ) -> SuccessResponse:
-    """Create a new content item. Reloads content cache after mutation."""
+    """Create a new content item. Refreshes the changed content scope."""
     data = await _service.create_item(admin_supabase, content_type, body.data)
     await AuditService.safe_log(
         admin_supabase,
@@ -163,7 +164,7 @@ async def create_content_item(
         "create",
         details={"content_type": content_type},
     )
-    await load_all_content(admin_supabase)
+    await refresh_content(admin_supabase)
     return SuccessResponse(data=data)
 
 
@@ -176,7 +177,7 @@ async def delete_content_item(
     admin_supabase: Annotated[Client, Depends(get_admin_supabase)],
     user: Annotated[CurrentUser, Depends(require_platform_admin())],
 ) -> SuccessResponse:
-    """Delete a content item. Reloads content cache after mutation."""
+    """Delete a content item. Refreshes the changed content scope."""
     data = await _service.delete_item(admin_supabase, content_type, item_id)
     await AuditService.safe_log(
         admin_supabase,
@@ -187,5 +188,5 @@ async def delete_content_item(
         "delete",
         details={"content_type": content_type},
     )
-    await load_all_content(admin_supabase)
+    await refresh_content(admin_supabase)
     return SuccessResponse(data=data)
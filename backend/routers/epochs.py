@@ -10,6 +10,7 @@ from backend.dependencies import (
     get_admin_supabase,
     get_current_user,
     get_effective_supabase,
+    get_loaders,
     require_epoch_creator,
     require_epoch_participant,
 )
@@ -48,6 +49,7 @@ from backend.services.epoch_service import EpochService
 from backend.services.game_instance_service import GameInstanceService
 from backend.services.scoring_service import ScoringService
 from backend.services.sitrep_service import SitrepService
+from backend.utils.data_loader import DataLoaders
 from backend.utils.responses import paginated
 from supabase import AsyncClient as Client
 
@@ -471,9 +473,10 @@ async def draft_agents(
     body: DraftRequest,
     user: Annotated[CurrentUser, Depends(get_current_user)],
     supabase: Annotated[Client, Depends(get_effective_supabase)],
+    loaders: Annotated[DataLoaders, Depends(get_loaders)],
 ) -> SuccessResponse[ParticipantResponse]:
     """Lock in a draft roster for a participant (lobby phase only)."""
-    data = await EpochService.draft_agents(supabase, epoch_id, simulation_id, body.agent_ids)
+    data = await EpochService.draft_agents(supabase, epoch_id, simulation_id, body.agent_ids, loaders=loaders)
     await AuditService.safe_log(
         supabase,
         simulation_id,
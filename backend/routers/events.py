@@ -9,6 +9,9 @@ from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, stat
 
 from backend.dependencies import get_current_user, get_effective_supabase, require_role
 from backend.models.common import (
+    BulkDeleteRequest,
+    BulkItemsRequest,
+    BulkResult,
     CurrentUser,
     MessageResponse,
     PaginatedResponse,
@@ -55,6 +58,7 @@ async def list_events(
     date_to: Annotated[datetime | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 25,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="Keyset cursor from meta.next_cursor (overrides offset)")] = None,
 ) -> PaginatedResponse[EventResponse]:
     """List events with optional filters."""
     data, total = await _service.list(
@@ -68,8 +72,10 @@ async def list_events(
         date_to=date_to,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        count="estimated" if cursor else "exact",
     )
-    return paginated(data, total, limit, offset)
+    return paginated(data, total, limit, offset, _service.page_cursor(data, limit))
 
 
 @router.get("/{event_id}")
@@ -138,6 +144,62 @@ async def delete_event(
     return SuccessResponse(data=event)
 
 
+@router.post("/bulk")
+async def bulk_create_events(
+    simulation_id: UUID,
+    body: BulkItemsRequest,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("editor"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+) -> SuccessResponse[BulkResult]:
+    """Create up to 500 events; each item is validated and reported on its own."""
+    result = await _service.create_many(supabase, simulation_id, user.id, body.items, schema=EventCreate)
+    created = [r.data for r in result.results if r.ok and r.data]
+    await AuditService.safe_log_many(supabase, simulation_id, user.id, "events", [r["id"] for r in created], "create")
+    if result.succeeded:
+        await _service._post_event_mutation(supabase, simulation_id)
+    return SuccessResponse(data=result)
+
+
+@router.patch("/bulk")
+async def bulk_update_events(
+    simulation_id: UUID,
+    body: BulkItemsRequest,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("editor"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+) -> SuccessResponse[BulkResult]:
+    """Patch up to 500 events; each item is ``{"id": ..., **fields}``."""
+    result = await _service.update_many(
+        supabase,
+        simulation_id,
+        body.items,
+        schema=EventUpdate,
+    )
+    updated_ids = [r.id for r in result.results if r.ok and r.id]
+    await AuditService.safe_log_many(supabase, simulation_id, user.id, "events", updated_ids, "update")
+    if result.succeeded:
+        await _service._post_event_mutation(supabase, simulation_id)
+    return SuccessResponse(data=result)
+
+
+@router.post("/bulk/delete")
+async def bulk_delete_events(
+    simulation_id: UUID,
+    body: BulkDeleteRequest,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("editor"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+) -> SuccessResponse[BulkResult]:
+    """Soft-delete up to 500 events."""
+    result = await _service.soft_delete_many(supabase, simulation_id, body.ids)
+    deleted_ids = [r.id for r in result.results if r.ok and r.id]
+    await AuditService.safe_log_many(supabase, simulation_id, user.id, "events", deleted_ids, "delete")
+    if result.succeeded:
+        await _service._post_event_mutation(supabase, simulation_id)
+    return SuccessResponse(data=result)
+
+
 @router.get("/{event_id}/reactions")
 async def get_event_reactions(
     simulation_id: UUID,
@@ -403,9 +403,13 @@ async def force_tick(
     simulation_id: UUID,
     user: Annotated[CurrentUser, Depends(require_platform_admin())],
     admin_supabase: Annotated[Client, Depends(get_admin_supabase)],
+    profile: Annotated[bool, Query()] = False,
 ) -> SuccessResponse:
-    """Force a heartbeat tick for a specific simulation (admin only)."""
-    data = await HeartbeatService.force_tick(admin_supabase, simulation_id)
+    """Force a heartbeat tick for a specific simulation (admin only).
+
+    ``?profile=true`` runs the tick under cProfile and returns the report.
+    """
+    data = await HeartbeatService.force_tick(admin_supabase, simulation_id, profile=profile)
     await AuditService.safe_log(
         admin_supabase,
         simulation_id,
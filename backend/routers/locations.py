@@ -24,7 +24,7 @@ from backend.models.location import (
     ZoneUpdate,
 )
 from backend.services.audit_service import AuditService
-from backend.services.location_service import LocationService
+from backend.services.location_service import CityService, LocationService, StreetService, ZoneService
 from backend.utils.responses import paginated
 from supabase import AsyncClient as Client
 
@@ -49,10 +49,11 @@ async def list_cities(
     supabase: Annotated[Client, Depends(get_effective_supabase)],
     limit: Annotated[int, Query(ge=1, le=100)] = 25,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="Keyset cursor from meta.next_cursor (overrides offset)")] = None,
 ) -> PaginatedResponse[CityResponse]:
     """List all cities in a simulation."""
-    data, total = await _service.list_cities(supabase, simulation_id, limit=limit, offset=offset)
-    return paginated(data, total, limit, offset)
+    data, total = await _service.list_cities(supabase, simulation_id, limit=limit, offset=offset, cursor=cursor)
+    return paginated(data, total, limit, offset, CityService.page_cursor(data, limit))
 
 
 @router.get("/cities/{city_id}")
@@ -109,10 +110,13 @@ async def list_zones(
     city_id: Annotated[UUID | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 25,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="Keyset cursor from meta.next_cursor (overrides offset)")] = None,
 ) -> PaginatedResponse[ZoneResponse]:
     """List zones, optionally filtered by city."""
-    data, total = await _service.list_zones(supabase, simulation_id, city_id=city_id, limit=limit, offset=offset)
-    return paginated(data, total, limit, offset)
+    data, total = await _service.list_zones(
+        supabase, simulation_id, city_id=city_id, limit=limit, offset=offset, cursor=cursor
+    )
+    return paginated(data, total, limit, offset, ZoneService.page_cursor(data, limit))
 
 
 @router.get("/zones/{zone_id}")
@@ -170,6 +174,7 @@ async def list_streets(
     zone_id: Annotated[UUID | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 25,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="Keyset cursor from meta.next_cursor (overrides offset)")] = None,
 ) -> PaginatedResponse[StreetResponse]:
     """List streets, optionally filtered by city or zone."""
     data, total = await _service.list_streets(
@@ -179,8 +184,9 @@ async def list_streets(
         zone_id=zone_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
-    return paginated(data, total, limit, offset)
+    return paginated(data, total, limit, offset, StreetService.page_cursor(data, limit))
 
 
 @router.post("/streets", status_code=201)
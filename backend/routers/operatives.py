@@ -10,6 +10,7 @@ from backend.dependencies import (
     get_admin_supabase,
     get_current_user,
     get_effective_supabase,
+    get_loaders,
     require_epoch_creator,
     require_epoch_participant,
 )
@@ -20,6 +21,7 @@ from backend.services.battle_log_service import BattleLogService
 from backend.services.cycle_resolution_service import CycleResolutionService
 from backend.services.epoch_service import EpochService
 from backend.services.operative_service import OperativeService
+from backend.utils.data_loader import DataLoaders
 from backend.utils.responses import paginated
 from supabase import AsyncClient as Client
 
@@ -40,9 +42,10 @@ async def deploy_operative(
     _participant: Annotated[dict, Depends(require_epoch_participant())],
     supabase: Annotated[Client, Depends(get_effective_supabase)],
     admin_supabase: Annotated[Client, Depends(get_admin_supabase)],
+    loaders: Annotated[DataLoaders, Depends(get_loaders)],
 ) -> SuccessResponse[MissionResponse]:
     """Deploy an operative agent on a mission. Must be a participant in the epoch."""
-    mission = await OperativeService.deploy(supabase, epoch_id, simulation_id, body, admin_supabase)
+    mission = await OperativeService.deploy(supabase, epoch_id, simulation_id, body, admin_supabase, loaders=loaders)
 
     # Track player action for activity-gated ready (not in service — bots must not trigger)
     await CycleResolutionService.mark_acted(admin_supabase, epoch_id, simulation_id)
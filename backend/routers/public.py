@@ -173,10 +173,19 @@ async def list_agents(
     search: Annotated[str | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 25,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="Keyset cursor from meta.next_cursor (overrides offset)")] = None,
 ) -> PaginatedResponse:
     """List agents in a simulation (public)."""
-    data, total = await AgentService.list(supabase, simulation_id, search=search, limit=limit, offset=offset)
-    return paginated(data, total, limit, offset)
+    data, total = await AgentService.list(
+        supabase,
+        simulation_id,
+        search=search,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count="estimated" if cursor else "exact",
+    )
+    return paginated(data, total, limit, offset, AgentService.page_cursor(data, limit))
 
 
 @router.get("/simulations/{simulation_id}/agents/by-slug/{slug}")
@@ -211,10 +220,19 @@ async def list_buildings(
     search: Annotated[str | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 25,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="Keyset cursor from meta.next_cursor (overrides offset)")] = None,
 ) -> PaginatedResponse:
     """List buildings in a simulation (public)."""
-    data, total = await BuildingService.list(supabase, simulation_id, search=search, limit=limit, offset=offset)
-    return paginated(data, total, limit, offset)
+    data, total = await BuildingService.list(
+        supabase,
+        simulation_id,
+        search=search,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count="estimated" if cursor else "exact",
+    )
+    return paginated(data, total, limit, offset, BuildingService.page_cursor(data, limit))
 
 
 @router.get("/simulations/{simulation_id}/buildings/by-slug/{slug}")
@@ -249,10 +267,19 @@ async def list_events(
     search: Annotated[str | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 25,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="Keyset cursor from meta.next_cursor (overrides offset)")] = None,
 ) -> PaginatedResponse:
     """List events in a simulation (public)."""
-    data, total = await EventService.list(supabase, simulation_id, search=search, limit=limit, offset=offset)
-    return paginated(data, total, limit, offset)
+    data, total = await EventService.list(
+        supabase,
+        simulation_id,
+        search=search,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count="estimated" if cursor else "exact",
+    )
+    return paginated(data, total, limit, offset, EventService.page_cursor(data, limit))
 
 
 @router.get("/simulations/{simulation_id}/events/{event_id}")
@@ -3,6 +3,7 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from backend.dependencies import (
     get_admin_supabase,
@@ -26,6 +27,7 @@ from backend.models.simulation import (
 )
 from backend.services.audit_service import AuditService
 from backend.services.lore_service import LoreService
+from backend.services.simulation_export_service import MEDIA_TYPES, ExportFormat, SimulationExportService
 from backend.services.simulation_service import SimulationService
 from backend.services.threshold_service import ThresholdService
 from backend.utils.responses import paginated
@@ -155,6 +157,37 @@ async def delete_simulation(
     return SuccessResponse(data=simulation)
 
 
+@router.get("/{simulation_id}/export")
+async def export_simulation(
+    simulation_id: UUID,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    _role_check: Annotated[str, Depends(require_role("admin"))],
+    supabase: Annotated[Client, Depends(get_effective_supabase)],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+    tables: Annotated[
+        str | None, Query(description="Comma-separated tables (default: all). CSV takes exactly one.")
+    ] = None,
+    resume: Annotated[str | None, Query(description="'<table>:<last id>' checkpoint to continue after")] = None,
+) -> StreamingResponse:
+    """Stream the simulation's content tables as NDJSON, CSV or ZIP.
+
+    Rows are read in keyset pages and written as they arrive, so memory use
+    does not grow with the simulation. Requires admin role or higher.
+    """
+    selected = SimulationExportService.resolve_tables(
+        [t.strip() for t in tables.split(",") if t.strip()] if tables else None,
+        export_format,
+    )
+    SimulationExportService.parse_resume(resume, selected)  # reject bad tokens before streaming
+
+    name = selected[0] if export_format == "csv" else "export"
+    return StreamingResponse(
+        SimulationExportService.stream(supabase, simulation_id, export_format, selected, resume=resume),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{simulation_id}-{name}.{export_format}"'},
+    )
+
+
 # ── Threshold Actions ────────────────────────────────────────────────
 
 
@@ -69,7 +69,6 @@ class AgentMemoryService:
         )
         if sim_resp.data:
             schedule_auto_translation(
-                supabase,
                 "agent_memories",
                 saved["id"],
                 {"content": content},
@@ -10,7 +10,9 @@ import httpx
 from postgrest.exceptions import APIError as PostgrestAPIError
 
 from backend.services.base_service import BaseService
+from backend.services.chat_context_cache import ChatContextCache
 from backend.utils.errors import not_found
+from backend.utils.pagination import CountMode, apply_page
 from backend.utils.responses import extract_list
 from backend.utils.search import apply_search_filter
 from supabase import AsyncClient as Client
@@ -23,6 +25,13 @@ class AgentService(BaseService):
 
     table_name = "agents"
     view_name = "active_agents"
+    list_order_by = "name"
+    list_order_desc = False
+
+    @classmethod
+    def _after_write(cls, simulation_id: UUID) -> None:
+        # Chat turns reuse the agent profile for a few minutes.
+        ChatContextCache.invalidate_simulation(simulation_id)
 
     @classmethod
     async def list(
@@ -36,11 +45,18 @@ class AgentService(BaseService):
         search: str | None = None,
         limit: int = 25,
         offset: int = 0,
+        cursor: str | None = None,
+        count: CountMode = "exact",
         include_deleted: bool = False,
     ) -> tuple[list[dict], int]:
         """List agents with optional filters and full-text search."""
         table = cls._read_table(include_deleted)
-        query = supabase.table(table).select("*", count="exact").eq("simulation_id", str(simulation_id)).order("name")
+        query = (
+            supabase.table(table)
+            .select("*", count=count)
+            .eq("simulation_id", str(simulation_id))
+            .order(cls.list_order_by, desc=cls.list_order_desc)
+        )
 
         if system:
             query = query.eq("system", system)
@@ -51,7 +67,14 @@ class AgentService(BaseService):
         if search:
             query = apply_search_filter(query, search)
 
-        query = query.range(offset, offset + limit - 1)
+        query = apply_page(
+            query,
+            order_by=cls.list_order_by,
+            order_desc=cls.list_order_desc,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
         response = await query.execute()
 
         total = response.count if response.count is not None else len(extract_list(response))
@@ -4,13 +4,14 @@ Fetches current conditions from Open-Meteo API (free, no key required), classifi
 them into narrative categories, composes bilingual template-based descriptions via
 a 4-layer composable system, and applies zone_ambient moodlets to agents.
 
-Zero LLM calls. One HTTP call per simulation per tick. Pure template composition
+Zero LLM calls. Weather comes from WeatherProvider (geo-cell cache, batched
+Open-Meteo requests shared across simulations). Pure template composition
 with SHA-256 seeded selection and Tetris 7-bag anti-repetition.
 
 Anti-repetition: each template pool is treated as a shuffled bag. Items are dealt
 sequentially. When the bag empties, it's reshuffled and refilled. Maximum drought
 before any item repeats: 2N-1 draws (where N = pool size). Bag state persists in
-the heartbeat summary JSONB.
+the heartbeat summary JSONB and is carried between ticks by WeatherProvider.
 
 Research basis: NWS Graphical Forecast Editor (rule/template NLG), Caves of Qud
 (FDG'17 replacement grammar), Tetris 7-bag guideline, Emily Short (multi-tag salience).
@@ -51,15 +52,12 @@ from backend.services.ambient_weather_templates import (
     OPENERS,
 )
 from backend.services.heartbeat_entry_builder import make_heartbeat_entry
+from backend.services.weather_provider import WeatherProvider
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
 
-_OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
-_OPEN_METEO_TIMEOUT = 10.0  # seconds
-
-
 class AmbientWeatherService:
     """Generates ambient weather events from real-world conditions per heartbeat tick.
 
@@ -84,30 +82,14 @@ class AmbientWeatherService:
         sim_name: str = "",
         cached_weather: dict | None = None,
     ) -> WeatherConditions:
-        """Fetch current weather from Open-Meteo API.
+        """Fetch current weather from Open-Meteo via the shared WeatherProvider cache.
 
         Plan B: cached weather data from last successful heartbeat summary.
         Plan C: deterministic climate fallback based on lat + month.
         """
         logger.info("Fetching weather for %s (%.2f, %.2f)", sim_name, lat, lon)
         try:
-            async with httpx.AsyncClient(timeout=_OPEN_METEO_TIMEOUT) as client:
-                resp = await client.get(
-                    _OPEN_METEO_URL,
-                    params={
-                        "latitude": lat,
-                        "longitude": lon,
-                        "current": (
-                            "temperature_2m,relative_humidity_2m,wind_speed_10m,"
-                            "precipitation,cloud_cover,weather_code,visibility,is_day"
-                        ),
-                        "daily": "sunrise,sunset",
-                        "timezone": "auto",
-                        "forecast_days": 1,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            data = await WeatherProvider.get(lat, lon)
 
             current = data.get("current", {})
             daily = data.get("daily", {})
@@ -396,8 +378,11 @@ class AmbientWeatherService:
         lat, lon = cls._resolve_coordinates(sim)
         sim_name = sim.get("name", "Unknown")
 
-        # Load cached weather from last heartbeat (Plan B data)
-        cached_weather = await cls._load_cached_weather(supabase, sim_id)
+        # Plan B data + bag state from the previous tick; the DB is only read
+        # on the first tick after a restart.
+        cached_weather = WeatherProvider.last_summary(str(sim_id))
+        if cached_weather is None:
+            cached_weather = await cls._load_cached_weather(supabase, sim_id)
 
         # Step 1: Fetch weather
         conditions = await cls.fetch_conditions(lat, lon, sim_name, cached_weather)
@@ -436,6 +421,8 @@ class AmbientWeatherService:
             bag_state,
         )
 
+        WeatherProvider.remember_summary(str(sim_id), weather_summary)
+
         logger.info(
             "Ambient weather: %d zone events for %s",
             len(entries),
@@ -38,6 +38,35 @@ class AuditService:
         except (PostgrestAPIError, httpx.HTTPError):
             logger.warning("Audit log skipped (RLS): %s %s %s", entity_type, action, entity_id)
 
+    @staticmethod
+    async def safe_log_many(
+        supabase: Client,
+        simulation_id: UUID | None,
+        user_id: UUID,
+        entity_type: str,
+        entity_ids: list[str],
+        action: str,
+    ) -> None:
+        """Best-effort audit entries for a bulk operation — one INSERT for all ids."""
+        if not entity_ids:
+            return
+        entries = []
+        for entity_id in entity_ids:
+            entry = {
+                "user_id": str(user_id),
+                "entity_type": entity_type,
+                "entity_id": str(entity_id),
+                "action": action,
+                "details": {"bulk": True},
+            }
+            if simulation_id is not None:
+                entry["simulation_id"] = str(simulation_id)
+            entries.append(entry)
+        try:
+            await supabase.table("audit_log").insert(entries).execute()
+        except (PostgrestAPIError, httpx.HTTPError):
+            logger.warning("Audit log skipped (RLS): %s bulk %s (%d)", entity_type, action, len(entries))
+
     @staticmethod
     async def log_action(
         supabase: Client,
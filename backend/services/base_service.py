@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from datetime import UTC, date, datetime
 from uuid import UUID
 
+from postgrest.exceptions import APIError as PostgrestAPIError
+from pydantic import BaseModel, ValidationError
+
+from backend.models.common import BulkItemResult, BulkResult
 from backend.utils.errors import bad_request, conflict, forbidden, not_found
+from backend.utils.pagination import CountMode, apply_page, next_cursor
 from backend.utils.responses import extract_list, extract_one
 from supabase import AsyncClient as Client
 
@@ -35,6 +41,9 @@ def paginate_response(response: object) -> tuple[list[dict], int]:
         query = supabase.table("t").select("*", count="exact")...
         query = query.range(offset, offset + limit - 1)
         data, total = paginate_response(query.execute())
+
+    For keyset pages, pair it with ``backend.utils.pagination.next_cursor``
+    and pass the result to ``paginated(..., next_cursor=...)``.
     """
     resp_data = getattr(response, "data", None) or []
     resp_count = getattr(response, "count", None)
@@ -42,15 +51,42 @@ def paginate_response(response: object) -> tuple[list[dict], int]:
     return resp_data, total
 
 
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}" for err in exc.errors())
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
 class BaseService:
     """Base service providing standard CRUD operations for simulation-scoped entities.
 
     Subclasses set `table_name` and optionally `view_name` for soft-delete filtering.
+    `list_order_by` / `list_order_desc` set the default list ordering, which
+    is also the ordering `page_cursor` issues keyset cursors for.
+
+    The ``*_many`` methods take up to a few hundred rows, validate each one
+    on its own and write in chunks of `bulk_chunk_size` — one statement (and
+    so one transaction) per chunk. They never raise for a bad row; every row
+    gets a `BulkItemResult`.
     """
 
     table_name: str
     view_name: str | None = None  # e.g. "active_agents" — used for list/get queries
     supports_created_by: bool = True  # Override to False for tables without created_by_id
+    list_order_by: str = "created_at"  # NULLs page in Postgres' default order (see utils.pagination)
+    list_order_desc: bool = True
+    bulk_chunk_size: int = 100
+
+    @classmethod
+    def _after_write(cls, simulation_id: UUID) -> None:
+        """Called after rows of the simulation were updated or deleted.
+
+        No-op by default; services whose rows feed process-wide caches
+        override it to drop the simulation's entries.
+        """
 
     @classmethod
     def _read_table(cls, include_deleted: bool = False) -> str:
@@ -67,20 +103,29 @@ class BaseService:
         *,
         select: str = "*",
         filters: dict | None = None,
-        order_by: str = "created_at",
-        order_desc: bool = True,
+        order_by: str | None = None,
+        order_desc: bool | None = None,
         limit: int = 25,
         offset: int = 0,
+        cursor: str | None = None,
+        count: CountMode = "exact",
         include_deleted: bool = False,
     ) -> tuple[list[dict], int]:
         """List entities with pagination and optional filters.
 
+        With ``cursor`` (from ``page_cursor`` on the previous page) the page
+        is a keyset seek and ``offset`` is ignored. ``count`` selects the
+        PostgREST count strategy for ``total`` — ``"estimated"`` /
+        ``"planned"`` avoid counting large filtered sets.
+
         Returns (data, total_count).
         """
+        order_by = order_by or cls.list_order_by
+        order_desc = cls.list_order_desc if order_desc is None else order_desc
         table = cls._read_table(include_deleted)
         query = (
             supabase.table(table)
-            .select(select, count="exact")
+            .select(select, count=count)
             .eq("simulation_id", str(simulation_id))
             .order(order_by, desc=order_desc)
         )
@@ -90,12 +135,29 @@ class BaseService:
                 if value is not None:
                     query = query.eq(key, value)
 
-        query = query.range(offset, offset + limit - 1)
+        query = apply_page(query, order_by=order_by, order_desc=order_desc, limit=limit, offset=offset, cursor=cursor)
         response = await query.execute()
 
         total = response.count if response.count is not None else len(extract_list(response))
         return extract_list(response), total
 
+    @classmethod
+    def page_cursor(
+        cls,
+        rows: list[dict],
+        limit: int,
+        *,
+        order_by: str | None = None,
+        order_desc: bool | None = None,
+    ) -> str | None:
+        """Keyset cursor for the page after ``rows`` (None on the last page)."""
+        return next_cursor(
+            rows,
+            limit=limit,
+            order_by=order_by or cls.list_order_by,
+            order_desc=cls.list_order_desc if order_desc is None else order_desc,
+        )
+
     @classmethod
     async def get(
         cls,
@@ -277,6 +339,7 @@ class BaseService:
             )
             raise not_found(cls.table_name, entity_id)
 
+        cls._after_write(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -304,6 +367,7 @@ class BaseService:
             )
             raise not_found(cls.table_name, entity_id)
 
+        cls._after_write(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -334,4 +398,211 @@ class BaseService:
                 detail=f"{cls.table_name} '{entity_id}' not found or already deleted.",
             )
 
+        cls._after_write(simulation_id)
         return response.data[0]
+
+    # ── Bulk operations ─────────────────────────────────────────
+
+    @staticmethod
+    def _validate_rows(
+        rows: list[dict],
+        schema: type[BaseModel] | None,
+        prepare: Callable[[dict], dict] | None,
+    ) -> tuple[list[tuple[int, dict]], list[BulkItemResult]]:
+        """Split rows into ``(index, data)`` pairs to write and per-row failures."""
+        valid: list[tuple[int, dict]] = []
+        failed: list[BulkItemResult] = []
+        for index, row in enumerate(rows):
+            data = row
+            if schema is not None:
+                try:
+                    data = schema.model_validate(row).model_dump(exclude_none=True)
+                except ValidationError as exc:
+                    failed.append(BulkItemResult(index=index, ok=False, error=_validation_message(exc)))
+                    continue
+            if prepare is not None:
+                data = prepare(data)
+            valid.append((index, data))
+        return valid, failed
+
+    @classmethod
+    async def create_many(
+        cls,
+        supabase: Client,
+        simulation_id: UUID,
+        user_id: UUID,
+        rows: list[dict],
+        *,
+        schema: type[BaseModel] | None = None,
+    ) -> BulkResult:
+        """Create many entities with one multi-row INSERT per chunk.
+
+        A chunk is all-or-nothing: a constraint or RLS violation fails every
+        row of that chunk (with the database error) and the next chunk is
+        still attempted. Rows failing ``schema`` are never sent.
+        """
+        valid, results = cls._validate_rows(rows, schema, None)
+        for chunk in _chunks(valid, cls.bulk_chunk_size):
+            payload = []
+            for _index, data in chunk:
+                insert_data = serialize_for_json({**data, "simulation_id": str(simulation_id)})
+                if cls.supports_created_by:
+                    insert_data.setdefault("created_by_id", str(user_id))
+                payload.append(insert_data)
+            try:
+                response = await supabase.table(cls.table_name).insert(payload).execute()
+            except PostgrestAPIError as exc:
+                logger.warning(
+                    "Bulk insert chunk failed",
+                    extra={"table": cls.table_name, "simulation_id": str(simulation_id), "rows": len(chunk)},
+                )
+                results.extend(BulkItemResult(index=index, ok=False, error=exc.message) for index, _ in chunk)
+                continue
+            created = extract_list(response)
+            if len(created) != len(chunk):
+                # RETURNING yields no rows when RLS WITH CHECK rejected the insert.
+                results.extend(
+                    BulkItemResult(index=index, ok=False, error=f"Not authorized to create {cls.table_name}.")
+                    for index, _ in chunk
+                )
+                continue
+            results.extend(
+                BulkItemResult(index=index, ok=True, id=str(row["id"]), data=row)
+                for (index, _), row in zip(chunk, created, strict=True)
+            )
+        return BulkResult.from_items(results)
+
+    @classmethod
+    async def update_many(
+        cls,
+        supabase: Client,
+        simulation_id: UUID,
+        patches: list[dict],
+        *,
+        schema: type[BaseModel] | None = None,
+        prepare: Callable[[dict], dict] | None = None,
+    ) -> BulkResult:
+        """Apply per-row patches (each ``{"id": ..., **fields}``) in chunks.
+
+        Each chunk is one ``fn_bulk_update_entities`` call: the patches are
+        applied in a single transaction under the caller's RLS, and rows
+        that are missing or soft-deleted come back as not found. ``schema``
+        validates the fields (the ``id`` is checked separately); ``prepare``
+        may add derived fields (e.g. nulled translations) before the write.
+
+        A patch may carry ``if_updated_at`` — the per-row equivalent of
+        ``update(if_updated_at=...)``: a row edited since then is reported as
+        a conflict and left unchanged.
+        """
+        results: list[BulkItemResult] = []
+        candidates: list[dict] = []
+        ids: dict[int, str] = {}
+        locks: dict[int, str] = {}
+        for index, patch in enumerate(patches):
+            try:
+                ids[index] = str(UUID(str(patch.get("id"))))
+            except ValueError:
+                results.append(BulkItemResult(index=index, ok=False, error="id: a valid UUID is required"))
+                continue
+            if patch.get("if_updated_at") is not None:
+                locks[index] = str(patch["if_updated_at"])
+            candidates.append({key: value for key, value in patch.items() if key not in ("id", "if_updated_at")})
+        indices = sorted(ids)
+        valid, failed = cls._validate_rows(candidates, schema, prepare)
+        results.extend(r.model_copy(update={"index": indices[r.index]}) for r in failed)
+
+        writes: list[tuple[int, dict]] = []
+        for position, data in valid:
+            index = indices[position]
+            if not data:
+                results.append(BulkItemResult(index=index, ok=False, id=ids[index], error="No fields to update."))
+                continue
+            lock = {"if_updated_at": locks[index]} if index in locks else {}
+            writes.append((index, serialize_for_json({**data, "id": ids[index], **lock})))
+
+        for chunk in _chunks(writes, cls.bulk_chunk_size):
+            try:
+                response = await supabase.rpc(
+                    "fn_bulk_update_entities",
+                    {
+                        "p_table": cls.table_name,
+                        "p_simulation_id": str(simulation_id),
+                        "p_patches": [data for _, data in chunk],
+                    },
+                ).execute()
+            except PostgrestAPIError as exc:
+                logger.warning(
+                    "Bulk update chunk failed",
+                    extra={"table": cls.table_name, "simulation_id": str(simulation_id), "rows": len(chunk)},
+                )
+                results.extend(BulkItemResult(index=i, ok=False, id=ids[i], error=exc.message) for i, _ in chunk)
+                continue
+            updated = response.data or []
+            for position, (index, _) in enumerate(chunk):
+                row = updated[position] if position < len(updated) else None
+                if row == "conflict":
+                    results.append(
+                        BulkItemResult(
+                            index=index,
+                            ok=False,
+                            id=ids[index],
+                            error="Conflict: entity was modified by another user. Please refresh and try again.",
+                        )
+                    )
+                elif row is None:
+                    results.append(
+                        BulkItemResult(index=index, ok=False, id=ids[index], error=f"{cls.table_name} not found.")
+                    )
+                else:
+                    results.append(BulkItemResult(index=index, ok=True, id=ids[index], data=row))
+        if writes:
+            cls._after_write(simulation_id)
+        return BulkResult.from_items(results)
+
+    @classmethod
+    async def soft_delete_many(
+        cls,
+        supabase: Client,
+        simulation_id: UUID,
+        entity_ids: list[UUID],
+    ) -> BulkResult:
+        """Soft-delete many entities with one UPDATE per chunk.
+
+        Ids that are unknown, in another simulation or already deleted are
+        reported as not found; the rest of the chunk is still deleted.
+        """
+        ids = [str(entity_id) for entity_id in entity_ids]
+        results: list[BulkItemResult] = []
+        deleted_at = datetime.now(UTC).isoformat()
+        for chunk in _chunks(list(enumerate(ids)), cls.bulk_chunk_size):
+            try:
+                response = await (
+                    supabase.table(cls.table_name)
+                    .update({"deleted_at": deleted_at})
+                    .eq("simulation_id", str(simulation_id))
+                    .in_("id", [entity_id for _, entity_id in chunk])
+                    .is_("deleted_at", "null")
+                    .execute()
+                )
+            except PostgrestAPIError as exc:
+                results.extend(
+                    BulkItemResult(index=i, ok=False, id=entity_id, error=exc.message) for i, entity_id in chunk
+                )
+                continue
+            rows = {str(row["id"]): row for row in extract_list(response)}
+            for index, entity_id in chunk:
+                row = rows.pop(entity_id, None)
+                if row is None:
+                    results.append(
+                        BulkItemResult(
+                            index=index,
+                            ok=False,
+                            id=entity_id,
+                            error=f"{cls.table_name} not found or already deleted.",
+                        )
+                    )
+                else:
+                    results.append(BulkItemResult(index=index, ok=True, id=entity_id, data=row))
+        if ids:
+            cls._after_write(simulation_id)
+        return BulkResult.from_items(results)
@@ -12,6 +12,38 @@ from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
 
+_MISSION_EVENT_TYPES = {
+    "success": "mission_success",
+    "failed": "mission_failed",
+    "detected": "detected",
+    "captured": "captured",
+}
+
+
+def _mission_result_entry(epoch_id: UUID, cycle_number: int, mission: dict) -> dict:
+    """battle_log row for a resolved mission."""
+    result = mission.get("mission_result", {})
+    outcome = result.get("outcome", "unknown")
+    entry = {
+        "epoch_id": str(epoch_id),
+        "cycle_number": cycle_number,
+        "event_type": _MISSION_EVENT_TYPES.get(outcome, "mission_failed"),
+        "narrative": result.get("narrative", f"Mission {outcome}."),
+        "is_public": outcome in ("detected", "captured"),
+        "source_simulation_id": str(mission["source_simulation_id"]),
+        "mission_id": str(mission["id"]),
+        "metadata": {
+            "operative_type": mission["operative_type"],
+            "outcome": outcome,
+            "agent_name": (
+                mission.get("agents", {}).get("name") if isinstance(mission.get("agents"), dict) else None
+            ),
+        },
+    }
+    if mission.get("target_simulation_id"):
+        entry["target_simulation_id"] = str(mission["target_simulation_id"])
+    return entry
+
 
 class BattleLogService:
     """Service for recording and querying competitive event narratives."""
@@ -151,38 +183,32 @@ class BattleLogService:
         mission: dict,
     ) -> dict:
         """Log a mission resolution (success/failure/detection)."""
-        result = mission.get("mission_result", {})
-        outcome = result.get("outcome", "unknown")
-        narrative = result.get("narrative", f"Mission {outcome}.")
-        is_public = outcome in ("detected", "captured")
-
-        event_type_map = {
-            "success": "mission_success",
-            "failed": "mission_failed",
-            "detected": "detected",
-            "captured": "captured",
-        }
+        entries = await cls.log_mission_results(supabase, epoch_id, cycle_number, [mission])
+        return entries[0]
 
-        return await cls.log_event(
-            supabase,
-            epoch_id,
-            cycle_number,
-            event_type_map.get(outcome, "mission_failed"),
-            narrative,
-            source_simulation_id=UUID(mission["source_simulation_id"]),
-            target_simulation_id=(
-                UUID(mission["target_simulation_id"]) if mission.get("target_simulation_id") else None
-            ),
-            mission_id=UUID(mission["id"]),
-            is_public=is_public,
-            metadata={
-                "operative_type": mission["operative_type"],
-                "outcome": outcome,
-                "agent_name": (
-                    mission.get("agents", {}).get("name") if isinstance(mission.get("agents"), dict) else None
-                ),
-            },
-        )
+    @classmethod
+    async def log_mission_results(
+        cls,
+        supabase: Client,
+        epoch_id: UUID,
+        cycle_number: int,
+        missions: list[dict],
+    ) -> list[dict]:
+        """Log a cycle's mission resolutions with a single insert."""
+        if not missions:
+            return []
+        rows = [_mission_result_entry(epoch_id, cycle_number, mission) for mission in missions]
+        try:
+            resp = await supabase.table("battle_log").insert(rows).execute()
+            return resp.data or rows
+        except (PostgrestAPIError, httpx.HTTPError):
+            logger.error(
+                "Battle log insert failed for %d mission results",
+                len(rows),
+                extra={"epoch_id": str(epoch_id), "cycle_number": cycle_number},
+                exc_info=True,
+            )
+            return rows
 
     @classmethod
     async def log_phase_change(
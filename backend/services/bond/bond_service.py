@@ -10,11 +10,13 @@ with unique access patterns (5-slot limit, forming state, attention RPC).
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import sentry_sdk
 
+from backend.services.simulation_settings_cache import SimulationSettingsCache
 from backend.utils.db import maybe_single_data
 from backend.utils.errors import bad_request, conflict, not_found
 from backend.utils.responses import extract_list
@@ -46,17 +48,9 @@ async def _load_bond_settings(supabase: Client, simulation_id: UUID) -> dict:
 
     Returns dict with resolved values, falling back to defaults.
     """
-    settings: dict = {}
+    settings: Mapping = {}
     try:
-        resp = await (
-            supabase.table("simulation_settings")
-            .select("setting_key, setting_value")
-            .eq("simulation_id", str(simulation_id))
-            .eq("category", "bonds")
-            .execute()
-        )
-        for row in extract_list(resp):
-            settings[row["setting_key"]] = row["setting_value"]
+        settings = await SimulationSettingsCache.get(supabase, simulation_id, "bonds")
     except Exception:  # noqa: BLE001
         logger.warning("Failed to load bond settings", exc_info=True)
 
@@ -773,15 +767,31 @@ class BondService:
         """Farewell all active/strained bonds for a deleted agent.
 
         Called from the agent soft-delete endpoint. Returns count of
-        farewelled bonds. Uses batch UPDATE (not per-bond farewell())
-        to avoid N+1 queries. The lifecycle trigger handles farewell_at.
+        farewelled bonds. The lifecycle trigger handles farewell_at.
         """
+        return await cls.farewell_agent_bonds_many(supabase, [agent_id])
+
+    @classmethod
+    async def farewell_agent_bonds_many(
+        cls,
+        supabase: Client,
+        agent_ids: list[UUID],
+    ) -> int:
+        """Farewell all active/strained bonds for several deleted agents.
+
+        Called from the bulk agent soft-delete endpoint. Returns count of
+        farewelled bonds. Uses batch UPDATE (not per-bond farewell()) to
+        avoid N+1 queries.
+        """
+        agent_ids = [str(a) for a in agent_ids]
+        if not agent_ids:
+            return 0
         # Batch transition all active/strained bonds to farewell
         # First get the IDs of bonds to farewell, then update
         pre_resp = await (
             supabase.table("agent_bonds")
             .select("id")
-            .eq("agent_id", str(agent_id))
+            .in_("agent_id", agent_ids)
             .in_("status", ["active", "strained"])
             .execute()
         )
@@ -812,7 +822,7 @@ class BondService:
             logger.info(
                 "Farewelled %d bonds for deleted agent",
                 len(farewelled),
-                extra={"agent_id": str(agent_id)},
+                extra={"agent_ids": agent_ids},
             )
         return len(farewelled)
 
@@ -26,6 +26,7 @@ from backend.services.bot_game_state import BotGameState
 from backend.services.bot_personality import create_personality
 from backend.services.epoch_service import EpochService
 from backend.services.operative_service import OperativeService
+from backend.utils.data_loader import DataLoaders
 from backend.utils.db import maybe_single_data
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
@@ -157,6 +158,7 @@ class BotService:
         # 3b. Execute deployments (via same OperativeService humans use)
         deployed = []
         deployment_outcomes: list[dict] = []
+        loaders = DataLoaders(admin_supabase)  # target names shared across this bot's deployments
         for plan in decisions.deployments:
             try:
                 # Fog-of-war zone targeting: pick weakest zone IF bot has spy intel.
@@ -179,6 +181,7 @@ class BotService:
                     UUID(epoch_id),
                     UUID(participant["simulation_id"]),
                     body,
+                    loaders=loaders,
                 )
                 deployed.append(mission)
                 deployment_outcomes.append(
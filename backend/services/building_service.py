@@ -7,6 +7,7 @@ from uuid import UUID
 
 from backend.services.base_service import BaseService
 from backend.utils.errors import not_found, server_error
+from backend.utils.pagination import CountMode, apply_page
 from backend.utils.responses import extract_list
 from backend.utils.search import apply_search_filter
 from supabase import AsyncClient as Client
@@ -20,6 +21,8 @@ class BuildingService(BaseService):
     table_name = "buildings"
     view_name = "active_buildings"
     supports_created_by = False
+    list_order_by = "name"
+    list_order_desc = False
 
     @classmethod
     async def list(
@@ -34,11 +37,18 @@ class BuildingService(BaseService):
         search: str | None = None,
         limit: int = 25,
         offset: int = 0,
+        cursor: str | None = None,
+        count: CountMode = "exact",
         include_deleted: bool = False,
     ) -> tuple[list[dict], int]:
         """List buildings with optional filters and full-text search."""
         table = cls._read_table(include_deleted)
-        query = supabase.table(table).select("*", count="exact").eq("simulation_id", str(simulation_id)).order("name")
+        query = (
+            supabase.table(table)
+            .select("*", count=count)
+            .eq("simulation_id", str(simulation_id))
+            .order(cls.list_order_by, desc=cls.list_order_desc)
+        )
 
         if building_type:
             query = query.eq("building_type", building_type)
@@ -51,7 +61,14 @@ class BuildingService(BaseService):
         if search:
             query = apply_search_filter(query, search)
 
-        query = query.range(offset, offset + limit - 1)
+        query = apply_page(
+            query,
+            order_by=cls.list_order_by,
+            order_desc=cls.list_order_desc,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
         response = await query.execute()
 
         total = response.count if response.count is not None else len(extract_list(response))
@@ -7,7 +7,7 @@ import logging
 import re
 import time
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
 
@@ -15,6 +15,7 @@ from backend.config import settings
 from backend.dependencies import get_admin_supabase
 from backend.services.agent_memory_service import AgentMemoryService
 from backend.services.ai_usage_service import AIUsageService
+from backend.services.chat_context_cache import ChatContextCache
 from backend.services.external.openrouter import BudgetContext, OpenRouterService
 from backend.services.i18n_utils import (
     EMOTION_LABELS,
@@ -26,7 +27,8 @@ from backend.services.i18n_utils import (
     localize_label,
 )
 from backend.services.model_resolver import ModelResolver, ResolvedModel
-from backend.services.prompt_service import LOCALE_NAMES, PromptResolver
+from backend.services.prompt_service import LOCALE_NAMES, PromptResolver, ResolvedPrompt
+from backend.services.simulation_settings_cache import SimulationSettingsCache
 from backend.utils.db import maybe_single_data
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
@@ -69,6 +71,23 @@ def _max_history_messages(model_id: str) -> int:
     return max(_MIN_MESSAGES, min(estimated, _MAX_MESSAGES_HARD))
 
 
+# ── Warm per-conversation context ─────────────────────────
+# Everything a chat turn needs that does NOT change between consecutive
+# turns is kept in ``ChatContextCache`` (see there for invalidation);
+# per-turn data (history, memories, mood, model) is always loaded fresh.
+
+
+@dataclass(frozen=True)
+class _WarmContext:
+    """Turn-invariant context for a single-agent conversation."""
+
+    agent: dict
+    simulation: dict
+    locale: str
+    prompt_template: ResolvedPrompt
+    relationship_context: str
+
+
 @dataclass
 class SSEEvent:
     """A Server-Sent Event for chat streaming.
@@ -86,6 +105,32 @@ class SSEEvent:
     data: dict
 
 
+@dataclass
+class _GroupContext:
+    """Shared state for one group-chat round (one user message, N speakers).
+
+    ``transcript`` is assembled incrementally: DB history + the user message
+    once, then each completed reply is appended as the next speaker's
+    context — no per-speaker history reload or prompt rebuild.
+    """
+
+    agents: list[dict]
+    agent_names: list[str]
+    simulation: dict
+    locale: str
+    prompt_template: ResolvedPrompt
+    model: ResolvedModel
+    event_context: str
+    group_instruction: ResolvedPrompt | None
+    transcript: list[dict[str, str]] = field(default_factory=list)
+
+    def append_turn(self, saved_message: dict) -> None:
+        """Append a completed speaker reply (prefixed with its name)."""
+        name = ChatAIService._find_agent_name(self.agents, saved_message.get("agent_id"))
+        prefix = f"[{name}]: " if name else ""
+        self.transcript.append({"role": "assistant", "content": f"{prefix}{saved_message['content']}"})
+
+
 class ChatAIService:
     """Generates AI responses for chat conversations.
 
@@ -120,13 +165,37 @@ class ChatAIService:
     ) -> list[dict[str, str]]:
         """Build the full message list (system prompt + history) for OpenRouter.
 
-        Shared by both streaming and non-streaming generation paths. Handles:
-        template variable injection, mood context, language instruction, and
-        extra context assembly.
+        Shared by both streaming and non-streaming generation paths.
 
         Returns:
             Complete messages list ready for OpenRouter: [system, *history].
         """
+        system_message = await self._build_system_message(
+            agent=agent,
+            simulation=simulation,
+            locale=locale,
+            prompt_template=prompt_template,
+            extra_variables=extra_variables,
+            extra_context=extra_context,
+        )
+        return [system_message, *history_messages]
+
+    async def _build_system_message(
+        self,
+        *,
+        agent: dict,
+        simulation: dict,
+        locale: str,
+        prompt_template: str,
+        extra_variables: dict[str, str] | None = None,
+        extra_context: str = "",
+    ) -> dict[str, str]:
+        """Build the system message for one agent.
+
+        Handles template variable injection, mood context, language
+        instruction, and extra context assembly. Independent of the chat
+        history, which is what lets group turns prefetch it.
+        """
         variables = self._build_agent_variables(agent, simulation, locale)
         if extra_variables:
             variables.update(extra_variables)
@@ -141,7 +210,7 @@ class ChatAIService:
         if extra_context:
             system_prompt += f"\n\n{extra_context}"
 
-        return [{"role": "system", "content": system_prompt}, *history_messages]
+        return {"role": "system", "content": system_prompt}
 
     # ── Core generation helper (non-streaming) ─────────────
 
@@ -158,11 +227,13 @@ class ChatAIService:
         extra_variables: dict[str, str] | None = None,
         extra_context: str = "",
         extra_metadata: dict[str, Any] | None = None,
+        system_message: dict[str, str] | None = None,
     ) -> tuple[str, dict]:
         """Core generation logic for a single agent response.
 
         Handles: system prompt assembly, OpenRouter call, AI usage logging,
-        message persistence.
+        message persistence. A prebuilt ``system_message`` (group-turn
+        prefetch) skips prompt assembly.
 
         Returns:
             Tuple of (response_text, saved_message_dict).
@@ -171,15 +242,18 @@ class ChatAIService:
         if settings.forge_mock_mode:
             return await self._mock_response(conversation_id, agent)
 
-        messages = await self._build_generation_context(
-            agent=agent,
-            simulation=simulation,
-            locale=locale,
-            prompt_template=prompt_template,
-            history_messages=history_messages,
-            extra_variables=extra_variables,
-            extra_context=extra_context,
-        )
+        if system_message is not None:
+            messages = [system_message, *history_messages]
+        else:
+            messages = await self._build_generation_context(
+                agent=agent,
+                simulation=simulation,
+                locale=locale,
+                prompt_template=prompt_template,
+                history_messages=history_messages,
+                extra_variables=extra_variables,
+                extra_context=extra_context,
+            )
 
         # Bureau Ops Deferral A.2 — attach simulation context to the budget
         # pre-check. user_id is not threaded through _generate_single_response
@@ -230,10 +304,12 @@ class ChatAIService:
         extra_variables: dict[str, str] | None = None,
         extra_context: str = "",
         extra_metadata: dict[str, Any] | None = None,
+        system_message: dict[str, str] | None = None,
     ) -> AsyncIterator[SSEEvent]:
         """Stream a single agent's response token-by-token.
 
-        Yields SSEEvent objects: agent_start, token*, agent_done.
+        Yields SSEEvent objects: agent_start, token*, agent_done. A prebuilt
+        ``system_message`` (group-turn prefetch) skips prompt assembly.
         """
         agent_id = str(agent["id"])
         agent_name = agent.get("name", "Agent")
@@ -266,15 +342,18 @@ class ChatAIService:
             )
             return
 
-        messages = await self._build_generation_context(
-            agent=agent,
-            simulation=simulation,
-            locale=locale,
-            prompt_template=prompt_template,
-            history_messages=history_messages,
-            extra_variables=extra_variables,
-            extra_context=extra_context,
-        )
+        if system_message is not None:
+            messages = [system_message, *history_messages]
+        else:
+            messages = await self._build_generation_context(
+                agent=agent,
+                simulation=simulation,
+                locale=locale,
+                prompt_template=prompt_template,
+                history_messages=history_messages,
+                extra_variables=extra_variables,
+                extra_context=extra_context,
+            )
 
         yield SSEEvent(
             event="agent_start",
@@ -522,45 +601,86 @@ class ChatAIService:
         conversation_id: UUID,
         user_message: str,
     ) -> dict[str, Any]:
-        """Shared setup for single-agent generate/stream. Returns all context needed."""
-        conversation = await self._load_conversation(conversation_id)
-        agent_id = conversation.get("agent_id")
-        if not agent_id:
-            msg = f"Conversation {conversation_id} has no agent_id — use group methods for multi-agent conversations"
-            raise ValueError(msg)
-        agent = await self._load_agent(agent_id)
-        simulation = await self._load_simulation()
-        locale = await self._get_locale()
+        """Shared setup for single-agent generate/stream. Returns all context needed.
 
-        memories = await AgentMemoryService.retrieve(
-            self._supabase,
-            UUID(agent["id"]),
-            self._simulation_id,
-            query_text=user_message,
-            top_k=8,
-        )
-        memory_text = AgentMemoryService.format_for_prompt(memories)
+        Assembled as a small dependency graph instead of a serial chain:
 
-        # L4: Inject relationship context into agent prompts
-        relationship_context = await self._build_relationship_context(agent["id"], locale)
+            model ──► history ─────────────────┐
+            warm context (cached, or 2 waves) ─┴► memories (needs agent id)
+
+        Model resolution + history load run alongside the warm-context load,
+        and memory retrieval (embedding call + RPC) overlaps the history load.
+        """
 
-        prompt_template = await self._prompt_resolver.resolve("chat_system_prompt", locale)
-        model = await self._model_resolver.resolve_text_model("chat_response")
+        async def _model_and_history() -> tuple[ResolvedModel, list[dict]]:
+            model = await self._model_resolver.resolve_text_model("chat_response")
+            return model, await self._load_history(conversation_id, model.model_id)
 
-        history = await self._load_history(conversation_id, model.model_id)
-        history_messages = self._build_history_messages(history, user_message)
+        history_task = asyncio.ensure_future(_model_and_history())
+        try:
+            warm = await self._get_warm_context(conversation_id)
+            memories, (model, history) = await asyncio.gather(
+                AgentMemoryService.retrieve(
+                    self._supabase,
+                    UUID(warm.agent["id"]),
+                    self._simulation_id,
+                    query_text=user_message,
+                    top_k=8,
+                ),
+                history_task,
+            )
+        except BaseException:
+            history_task.cancel()
+            raise
 
         return {
-            "agent": agent,
-            "simulation": simulation,
-            "locale": locale,
-            "prompt_template": prompt_template,
+            "agent": warm.agent,
+            "simulation": warm.simulation,
+            "locale": warm.locale,
+            "prompt_template": warm.prompt_template,
             "model": model,
-            "history_messages": history_messages,
-            "memory_text": memory_text,
-            "relationship_context": relationship_context,
+            "history_messages": self._build_history_messages(history, user_message),
+            "memory_text": AgentMemoryService.format_for_prompt(memories),
+            "relationship_context": warm.relationship_context,
         }
 
+    async def _get_warm_context(self, conversation_id: UUID) -> _WarmContext:
+        """Return the turn-invariant context, loading it in two concurrent waves on a miss.
+
+        Wave 1 (independent): conversation, simulation, locale.
+        Wave 2 (needs agent id + locale): agent, relationships, prompt template.
+        """
+        warm = ChatContextCache.get(self._simulation_id, conversation_id)
+        if warm is not None:
+            return warm
+
+        conversation, simulation, locale = await asyncio.gather(
+            self._load_conversation(conversation_id),
+            self._load_simulation(),
+            self._get_locale(),
+        )
+        agent_id = conversation.get("agent_id")
+        if not agent_id:
+            msg = f"Conversation {conversation_id} has no agent_id — use group methods for multi-agent conversations"
+            raise ValueError(msg)
+
+        # L4: relationship context is injected into agent prompts
+        agent, relationship_context, prompt_template = await asyncio.gather(
+            self._load_agent(agent_id),
+            self._build_relationship_context(agent_id, locale),
+            self._prompt_resolver.resolve("chat_system_prompt", locale),
+        )
+        warm = _WarmContext(
+            agent=agent,
+            simulation=simulation,
+            locale=locale,
+            prompt_template=prompt_template,
+            relationship_context=relationship_context,
+        )
+        if agent:
+            ChatContextCache.put(self._simulation_id, conversation_id, warm)
+        return warm
+
     async def _build_relationship_context(self, agent_id: str, locale: str) -> str:
         """Build relationship context string for injection into agent prompts.
 
@@ -683,52 +803,37 @@ class ChatAIService:
         """Generate AI responses for all agents in a group conversation.
 
         Each agent responds sequentially, seeing previous agents' responses.
-        Returns list of saved message dicts.
+        The next agent's system prompt is prefetched while the current one
+        generates (see ``_prepare_group_context``). Returns list of saved
+        message dicts.
         """
-        # Load shared context
-        agents = await self._load_conversation_agents(conversation_id)
-        event_refs = await self._load_event_references(conversation_id)
-        simulation = await self._load_simulation()
-        locale = await self._get_locale()
-        prompt_template = await self._prompt_resolver.resolve("chat_system_prompt", locale)
-        model = await self._model_resolver.resolve_text_model("chat_response")
-
-        # Build event context block
-        event_ids = [ref.get("event_id") for ref in event_refs if ref.get("event_id")]
-        agent_ids = [str(a["id"]) for a in agents]
-        reactions = await self._load_event_reactions(event_ids, agent_ids)
-        event_context = await self._build_event_context(event_refs, reactions, locale)
-
-        agent_names = [a.get("name", "Agent") for a in agents]
+        ctx = await self._prepare_group_context(conversation_id, user_message)
         saved_messages: list[dict] = []
 
-        for idx, agent in enumerate(agents):
-            extra_parts, history_messages = await self._build_group_turn_context(
-                conversation_id=conversation_id,
-                agents=agents,
-                agent_names=agent_names,
-                idx=idx,
-                event_context=event_context,
-                locale=locale,
-                user_message=user_message,
-                saved_messages=saved_messages,
-                model_id=model.model_id,
-            )
-
-            _, saved = await self._generate_single_response(
-                conversation_id=conversation_id,
-                agent=agent,
-                simulation=simulation,
-                locale=locale,
-                prompt_template=prompt_template,
-                model=model,
-                history_messages=history_messages,
-                extra_context="\n\n".join(extra_parts),
-                extra_metadata={"group_turn_index": idx},
-            )
+        pending = self._prefetch_group_turn(ctx, 0)
+        try:
+            for idx, agent in enumerate(ctx.agents):
+                system_message = await pending
+                pending = self._prefetch_group_turn(ctx, idx + 1)
+
+                _, saved = await self._generate_single_response(
+                    conversation_id=conversation_id,
+                    agent=agent,
+                    simulation=ctx.simulation,
+                    locale=ctx.locale,
+                    prompt_template=ctx.prompt_template,
+                    model=ctx.model,
+                    history_messages=list(ctx.transcript),
+                    extra_metadata={"group_turn_index": idx},
+                    system_message=system_message,
+                )
 
-            if saved:
-                saved_messages.append(saved)
+                if saved:
+                    saved_messages.append(saved)
+                    ctx.append_turn(saved)
+        finally:
+            if pending is not None:
+                pending.cancel()
 
         return saved_messages
 
@@ -773,89 +878,88 @@ class ChatAIService:
 
         Each agent responds sequentially — the next agent sees the previous
         agent's completed response in history. Yields interleaved SSEEvents.
-        """
-        agents = await self._load_conversation_agents(conversation_id)
-        event_refs = await self._load_event_references(conversation_id)
-        simulation = await self._load_simulation()
-        locale = await self._get_locale()
-        prompt_template = await self._prompt_resolver.resolve("chat_system_prompt", locale)
-        model = await self._model_resolver.resolve_text_model("chat_response")
-
-        event_ids = [ref.get("event_id") for ref in event_refs if ref.get("event_id")]
-        agent_ids = [str(a["id"]) for a in agents]
-        reactions = await self._load_event_reactions(event_ids, agent_ids)
-        event_context = await self._build_event_context(event_refs, reactions, locale)
-
-        agent_names = [a.get("name", "Agent") for a in agents]
-        saved_messages: list[dict] = []
-
-        for idx, agent in enumerate(agents):
-            extra_parts, history_messages = await self._build_group_turn_context(
-                conversation_id=conversation_id,
-                agents=agents,
-                agent_names=agent_names,
-                idx=idx,
-                event_context=event_context,
-                locale=locale,
-                user_message=user_message,
-                saved_messages=saved_messages,
-                model_id=model.model_id,
-            )
-
-            async for sse_event in self.stream_single_response(
-                conversation_id=conversation_id,
-                agent=agent,
-                simulation=simulation,
-                locale=locale,
-                prompt_template=prompt_template,
-                model=model,
-                history_messages=history_messages,
-                agent_index=idx,
-                agent_total=len(agents),
-                extra_context="\n\n".join(extra_parts),
-                extra_metadata={"group_turn_index": idx},
-            ):
-                yield sse_event
-                if sse_event.event == "agent_done":
-                    msg_data = sse_event.data.get("message", {})
-                    if msg_data:
-                        saved_messages.append(msg_data)
 
-    # ── Group chat context helper ──────────────────────────
+        Pipelined: while agent N streams, agent N+1's system prompt (mood
+        lookup + template fill) is already being built, so the gap between
+        speakers is only the model's own time-to-first-token.
+        """
+        ctx = await self._prepare_group_context(conversation_id, user_message)
 
-    async def _build_group_turn_context(
-        self,
-        *,
-        conversation_id: UUID,
-        agents: list[dict],
-        agent_names: list[str],
-        idx: int,
-        event_context: str,
-        locale: str,
-        user_message: str,
-        saved_messages: list[dict],
-        model_id: str = "",
-    ) -> tuple[list[str], list[dict[str, str]]]:
-        """Build extra_parts and history_messages for a single agent's turn
-        in a group conversation. Shared by streaming and non-streaming paths.
+        pending = self._prefetch_group_turn(ctx, 0)
+        try:
+            for idx, agent in enumerate(ctx.agents):
+                system_message = await pending
+                pending = self._prefetch_group_turn(ctx, idx + 1)
+
+                async for sse_event in self.stream_single_response(
+                    conversation_id=conversation_id,
+                    agent=agent,
+                    simulation=ctx.simulation,
+                    locale=ctx.locale,
+                    prompt_template=ctx.prompt_template,
+                    model=ctx.model,
+                    history_messages=list(ctx.transcript),
+                    agent_index=idx,
+                    agent_total=len(ctx.agents),
+                    extra_metadata={"group_turn_index": idx},
+                    system_message=system_message,
+                ):
+                    yield sse_event
+                    if sse_event.event == "agent_done":
+                        msg_data = sse_event.data.get("message", {})
+                        if msg_data:
+                            ctx.append_turn(msg_data)
+        finally:
+            # Client disconnect / error: don't leave a prefetch running.
+            if pending is not None:
+                pending.cancel()
+
+    # ── Group chat pipeline ────────────────────────────────
+
+    async def _prepare_group_context(self, conversation_id: UUID, user_message: str) -> _GroupContext:
+        """Load everything a group turn needs, concurrently, once per user message.
+
+        Wave 1: agents, event references, simulation, locale, model.
+        Wave 2: chat + group prompt templates, event context, and the
+        conversation history (loaded ONCE — later speakers see earlier
+        speakers via ``_GroupContext.append_turn`` instead of a reload).
         """
-        extra_parts: list[str] = []
-        if event_context:
-            extra_parts.append(event_context)
-
-        if len(agents) > 1:
-            group_instr = await self._prompt_resolver.resolve("chat_group_instruction", locale)
-            other_names = [n for i, n in enumerate(agent_names) if i != idx]
-            group_text = self._prompt_resolver.fill_template(
-                group_instr,
-                {
-                    "other_agent_names": ", ".join(other_names),
-                },
-            )
-            extra_parts.append(group_text)
+        agents, event_refs, simulation, locale, model = await asyncio.gather(
+            self._load_conversation_agents(conversation_id),
+            self._load_event_references(conversation_id),
+            self._load_simulation(),
+            self._get_locale(),
+            self._model_resolver.resolve_text_model("chat_response"),
+        )
 
-        history = await self._load_history(conversation_id, model_id)
-        history_messages: list[dict[str, str]] = []
+        async def _event_context() -> str:
+            event_ids = [ref.get("event_id") for ref in event_refs if ref.get("event_id")]
+            agent_ids = [str(a["id"]) for a in agents]
+            reactions = await self._load_event_reactions(event_ids, agent_ids)
+            return await self._build_event_context(event_refs, reactions, locale)
+
+        async def _group_instruction() -> str | None:
+            if len(agents) <= 1:
+                return None
+            return await self._prompt_resolver.resolve("chat_group_instruction", locale)
+
+        prompt_template, group_instruction, event_context, history = await asyncio.gather(
+            self._prompt_resolver.resolve("chat_system_prompt", locale),
+            _group_instruction(),
+            _event_context(),
+            self._load_history(conversation_id, model.model_id),
+        )
+
+        ctx = _GroupContext(
+            agents=agents,
+            agent_names=[a.get("name", "Agent") for a in agents],
+            simulation=simulation,
+            locale=locale,
+            prompt_template=prompt_template,
+            model=model,
+            event_context=event_context,
+            group_instruction=group_instruction,
+        )
         for msg in history:
             role = "assistant" if msg["sender_role"] == "assistant" else "user"
             content = msg["content"]
@@ -863,15 +967,44 @@ class ChatAIService:
                 msg_agent_name = self._find_agent_name(agents, msg["agent_id"])
                 if msg_agent_name:
                     content = f"[{msg_agent_name}]: {content}"
-            history_messages.append({"role": role, "content": content})
-        history_messages.append({"role": "user", "content": user_message})
+            ctx.transcript.append({"role": role, "content": content})
+        ctx.transcript.append({"role": "user", "content": user_message})
+        return ctx
 
-        for prev_msg in saved_messages:
-            prev_agent_name = self._find_agent_name(agents, prev_msg.get("agent_id"))
-            prefix = f"[{prev_agent_name}]: " if prev_agent_name else ""
-            history_messages.append({"role": "assistant", "content": f"{prefix}{prev_msg['content']}"})
+    def _prefetch_group_turn(self, ctx: _GroupContext, idx: int) -> asyncio.Future[dict[str, str]] | None:
+        """Start building agent ``idx``'s system message in the background.
 
-        return extra_parts, history_messages
+        Nothing in it depends on earlier speakers' output — only the
+        transcript does, and that is passed separately at generation time.
+        """
+        if idx >= len(ctx.agents):
+            return None
+        return asyncio.ensure_future(
+            self._build_system_message(
+                agent=ctx.agents[idx],
+                simulation=ctx.simulation,
+                locale=ctx.locale,
+                prompt_template=ctx.prompt_template,
+                extra_context="\n\n".join(self._group_extra_parts(ctx, idx)),
+            )
+        )
+
+    def _group_extra_parts(self, ctx: _GroupContext, idx: int) -> list[str]:
+        """Event context + "you are talking with X, Y" instruction for one speaker."""
+        extra_parts: list[str] = []
+        if ctx.event_context:
+            extra_parts.append(ctx.event_context)
+        if ctx.group_instruction is not None:
+            other_names = [n for i, n in enumerate(ctx.agent_names) if i != idx]
+            extra_parts.append(
+                self._prompt_resolver.fill_template(
+                    ctx.group_instruction,
+                    {
+                        "other_agent_names": ", ".join(other_names),
+                    },
+                )
+            )
+        return extra_parts
 
     @staticmethod
     def _build_agent_variables(agent: dict, simulation: dict, locale: str) -> dict[str, str]:
@@ -1134,16 +1267,7 @@ class ChatAIService:
         """Get the simulation's content locale (cached per instance)."""
         if hasattr(self, "_cached_locale"):
             return self._cached_locale
-        response = await (
-            self._supabase.table("simulation_settings")
-            .select("setting_value")
-            .eq("simulation_id", str(self._simulation_id))
-            .eq("setting_key", "general.content_locale")
-            .limit(1)
-            .execute()
-        )
-        locale = "de"
-        if response and response.data:
-            locale = str(response.data[0].get("setting_value", "de"))
+        value = await SimulationSettingsCache.find(self._supabase, self._simulation_id, "general.content_locale")
+        locale = "de" if value is None else str(value)
         self._cached_locale = locale
         return locale
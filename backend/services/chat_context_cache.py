@@ -0,0 +1,53 @@
+"""Warm per-conversation chat context — the store and its invalidation hooks.
+
+``ChatAIService`` keeps everything a chat turn needs that does NOT change
+between consecutive turns (agent profile, simulation, locale, prompt
+template, relationship context) keyed by (simulation, conversation), so
+follow-up turns skip five round trips before the first token.
+
+The store lives apart from ``chat_ai_service`` so the services that write
+those inputs — agents, relationships, prompt templates — can drop a
+simulation's entries without importing the chat stack. The TTL only bounds
+staleness for writers that bypass them (direct SQL, other processes).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from cachetools import TTLCache
+
+_TTL_SECONDS = 90
+_MAX_CONVERSATIONS = 512
+
+
+class ChatContextCache:
+    """Process-wide (simulation_id, conversation_id) → warm context cache."""
+
+    _entries: TTLCache[tuple[str, str], Any] = TTLCache(maxsize=_MAX_CONVERSATIONS, ttl=_TTL_SECONDS)
+
+    @classmethod
+    def get(cls, simulation_id: UUID | str, conversation_id: UUID | str) -> Any | None:
+        return cls._entries.get((str(simulation_id), str(conversation_id)))
+
+    @classmethod
+    def put(cls, simulation_id: UUID | str, conversation_id: UUID | str, context: Any) -> None:
+        cls._entries[(str(simulation_id), str(conversation_id))] = context
+
+    @classmethod
+    def invalidate_conversation(cls, simulation_id: UUID | str, conversation_id: UUID | str) -> None:
+        """Drop the warm context of one conversation (next turn reloads it)."""
+        cls._entries.pop((str(simulation_id), str(conversation_id)), None)
+
+    @classmethod
+    def invalidate_simulation(cls, simulation_id: UUID | str) -> None:
+        """Drop every conversation of a simulation — after agent, relationship or prompt writes."""
+        sim = str(simulation_id)
+        for key in [key for key in list(cls._entries) if key[0] == sim]:
+            cls._entries.pop(key, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every warm conversation context (tests)."""
+        cls._entries.clear()
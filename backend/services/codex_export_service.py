@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 import re
+import tempfile
+import time
 import zipfile
 from datetime import UTC, datetime
+from typing import BinaryIO
 from uuid import UUID
 
 import httpx
@@ -15,6 +19,7 @@ from postgrest.exceptions import APIError as PostgrestAPIError
 
 from backend.config import settings
 from backend.utils.responses import extract_list
+from backend.utils.resumable_upload import TUS_CHUNK_SIZE, upload_resumable
 from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
@@ -175,8 +180,10 @@ class CodexExportService:
         """Package all simulation images at full native resolution into a ZIP.
 
         Background task. Downloads .full.avif originals (falling back to
-        thumbnail .avif on 404), organises into folders, uploads ZIP to
-        Supabase Storage.
+        thumbnail .avif on 404) with bounded concurrency, organises them into
+        folders of a ZIP that spills from RAM to a temp file, and uploads it
+        to Supabase Storage (resumable above one chunk). Progress is reported
+        on the purchase for the polling client.
         """
         structlog.contextvars.bind_contextvars(simulation_id=str(simulation_id))
         from backend.services.forge_feature_service import ForgeFeatureService
@@ -258,34 +265,26 @@ class CodexExportService:
                 thumb = f"{base_storage}/{img_slug}.avif"
                 manifest.append((full, thumb, f"{safe_name}-fullres/lore/{img_slug}.avif"))
 
-            # 4. Download all images and write ZIP
-            buf = io.BytesIO()
-            image_count = 0
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
-                    for full_url, fallback_url, zip_path in manifest:
-                        data = await _download_with_fallback(client, full_url, fallback_url)
-                        if data:
-                            zf.writestr(zip_path, data)
-                            image_count += 1
-
-            zip_bytes = buf.getvalue()
-
-            # 5. Upload ZIP to Supabase Storage
+            # 4. Download images concurrently into a spooled ZIP (spills to disk)
+            progress = _ProgressReporter(admin_supabase, purchase_id)
             date_str = datetime.now(UTC).strftime("%Y%m%d")
             filename = f"hires-{slug}-{date_str}.zip"
             storage_path = f"{simulation_id}/exports/{filename}"
 
             download_url = ""
-            try:
-                await admin_supabase.storage.from_("simulation.assets").upload(
-                    storage_path,
-                    zip_bytes,
-                    {"content-type": "application/zip"},
-                )
-                download_url = await admin_supabase.storage.from_("simulation.assets").get_public_url(storage_path)
-            except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError, OSError):
-                logger.exception("Storage upload failed for hires archive")
+            with tempfile.SpooledTemporaryFile(max_size=settings.hires_archive_spool_mb * 1024 * 1024) as archive:
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    image_count = await _build_archive(client, manifest, archive, progress)
+                archive_size = archive.seek(0, io.SEEK_END)
+
+                # 5. Upload ZIP to Supabase Storage
+                try:
+                    await _upload_archive(admin_supabase, storage_path, archive, archive_size, progress)
+                    download_url = await admin_supabase.storage.from_("simulation.assets").get_public_url(
+                        storage_path
+                    )
+                except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError, OSError):
+                    logger.exception("Storage upload failed for hires archive")
 
             # 6. Mark completed
             await ForgeFeatureService.complete_feature(
@@ -303,6 +302,7 @@ class CodexExportService:
                     "simulation_id": str(simulation_id),
                     "filename": filename,
                     "image_count": image_count,
+                    "archive_bytes": archive_size,
                 },
             )
 
@@ -479,6 +479,91 @@ def _dedup_name(seen: dict[str, int], name: str) -> str:
     return f"{name}_{seen[name]}"
 
 
+class _ProgressReporter:
+    """Throttled ``ForgeFeatureService.report_progress`` — progress is cosmetic, never fatal."""
+
+    def __init__(self, supabase: Client, purchase_id: str, interval: float = 1.0) -> None:
+        self._supabase = supabase
+        self._purchase_id = purchase_id
+        self._interval = interval
+        self._last = 0.0
+
+    async def __call__(self, phase: str, current: int, total: int) -> None:
+        now = time.monotonic()
+        if current < total and now - self._last < self._interval:
+            return
+        self._last = now
+        from backend.services.forge_feature_service import ForgeFeatureService
+
+        try:
+            await ForgeFeatureService.report_progress(self._supabase, self._purchase_id, phase, current, total)
+        except (PostgrestAPIError, httpx.HTTPError) as exc:
+            logger.warning("Archive progress update failed", extra={"error": str(exc)})
+
+
+async def _build_archive(
+    client: httpx.AsyncClient,
+    manifest: list[tuple[str, str | None, str]],
+    archive: BinaryIO,
+    progress: _ProgressReporter,
+) -> int:
+    """Download the manifest with bounded concurrency into a ZIP. Returns images written.
+
+    At most ``hires_archive_concurrency`` images are held in memory; each is
+    written to the archive as soon as it arrives, so entries follow
+    completion order rather than manifest order.
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.hires_archive_concurrency))
+    image_count = 0
+    done = 0
+
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+
+        async def _fetch(full_url: str, fallback_url: str | None, zip_path: str) -> None:
+            nonlocal image_count, done
+            async with semaphore:
+                data = await _download_with_fallback(client, full_url, fallback_url)
+            if data:
+                zf.writestr(zip_path, data)
+                image_count += 1
+            done += 1
+            await progress("downloading", done, len(manifest))
+
+        await asyncio.gather(*(_fetch(*entry) for entry in manifest))
+
+    return image_count
+
+
+async def _upload_archive(
+    admin_supabase: Client,
+    storage_path: str,
+    archive: BinaryIO,
+    size: int,
+    progress: _ProgressReporter,
+) -> None:
+    """Upload the archive: one request up to a chunk, resumable chunks above."""
+    archive.seek(0)
+    if size <= TUS_CHUNK_SIZE:
+        await admin_supabase.storage.from_("simulation.assets").upload(
+            storage_path,
+            archive.read(),
+            {"content-type": "application/zip"},
+        )
+        return
+
+    async def _on_progress(offset: int) -> None:
+        await progress("uploading", offset, size)
+
+    await upload_resumable(
+        "simulation.assets",
+        storage_path,
+        archive,
+        size,
+        content_type="application/zip",
+        on_progress=_on_progress,
+    )
+
+
 async def _download_with_fallback(
     client: httpx.AsyncClient,
     primary_url: str,
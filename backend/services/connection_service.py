@@ -18,6 +18,7 @@ from backend.models.echo import ConnectionResponse
 from backend.services.base_service import serialize_for_json
 from backend.services.cache_config import get_ttl
 from backend.services.embassy_service import EmbassyService
+from backend.services.multiverse_graph import CONNECTION_SELECT, MultiverseGraph
 from backend.utils.errors import bad_request, not_found
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
@@ -47,14 +48,7 @@ class ConnectionService:
         active_only: bool = True,
     ) -> list[ConnectionResponse]:
         """List all simulation connections."""
-        query = (
-            supabase.table(cls.table_name)
-            .select(
-                "*, simulation_a:simulations!simulation_a_id(id, name, slug, theme, banner_url, description),"
-                " simulation_b:simulations!simulation_b_id(id, name, slug, theme, banner_url, description)"
-            )
-            .order("created_at", desc=False)
-        )
+        query = supabase.table(cls.table_name).select(CONNECTION_SELECT).order("created_at", desc=False)
         if active_only:
             query = query.eq("is_active", True)
 
@@ -82,21 +76,9 @@ class ConnectionService:
         instance_ids = {s["id"] for s in simulations if s.get("simulation_type") == "game_instance"}
         template_ids = [s["id"] for s in simulations if s.get("simulation_type") in (None, "template")]
 
-        # Connections: filter by sim_ids in SQL (no orphan fetch)
+        # Connections among the map's simulations, from the in-memory graph index
         sim_id_list = list(sim_ids)
-        conn_resp = await (
-            supabase.table(cls.table_name)
-            .select(
-                "*, simulation_a:simulations!simulation_a_id(id, name, slug, theme, banner_url, description),"
-                " simulation_b:simulations!simulation_b_id(id, name, slug, theme, banner_url, description)"
-            )
-            .eq("is_active", True)
-            .in_("simulation_a_id", sim_id_list)
-            .in_("simulation_b_id", sim_id_list)
-            .order("created_at", desc=False)
-            .execute()
-        )
-        connections = extract_list(conn_resp)
+        connections = await MultiverseGraph.connections_among(supabase, sim_ids)
 
         all_embassies = await EmbassyService.list_all_active(supabase)
         # Filter embassies: only show template-template embassy edges on the map.
@@ -348,6 +330,7 @@ class ConnectionService:
         response = await admin_supabase.table(cls.table_name).insert(serialize_for_json(data)).execute()
         if not response.data:
             raise bad_request("Failed to create connection.")
+        MultiverseGraph.upsert_connection(response.data[0])
         return ConnectionResponse.model_validate(response.data[0])
 
     @classmethod
@@ -362,6 +345,7 @@ class ConnectionService:
         response = await admin_supabase.table(cls.table_name).update(update_data).eq("id", str(connection_id)).execute()
         if not response.data:
             raise not_found("connection", connection_id)
+        MultiverseGraph.upsert_connection(response.data[0])
         return ConnectionResponse.model_validate(response.data[0])
 
     @classmethod
@@ -374,3 +358,4 @@ class ConnectionService:
         response = await admin_supabase.table(cls.table_name).delete().eq("id", str(connection_id)).execute()
         if not response.data:
             raise not_found("connection", connection_id)
+        MultiverseGraph.remove_connection(connection_id)
@@ -1,6 +1,9 @@
 """Cycle resolution — RP management and full cycle pipeline."""
 
 import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
@@ -11,8 +14,11 @@ from postgrest.exceptions import APIError as PostgrestAPIError
 from backend.models.epoch import DEFAULT_EPOCH_CONFIG
 from backend.services.battle_log_service import BattleLogService
 from backend.services.game_instance_service import GameInstanceService
+from backend.services.heartbeat_profiler import phase_record
 from backend.services.journal.hooks import enqueue_epoch_signature
 from backend.services.platform_config_service import PlatformConfigService
+from backend.services.success_modifier_table import SuccessModifierTable
+from backend.utils.call_stats import track_calls
 from backend.utils.errors import bad_request, conflict, not_found, server_error
 from backend.utils.responses import extract_one
 from supabase import AsyncClient as Client
@@ -22,6 +28,22 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONFIG = DEFAULT_EPOCH_CONFIG
 
 
+@contextmanager
+def _timed_stage(timings: list[dict] | None, stage: str) -> Iterator[None]:
+    """Append the stage's profile record to ``timings`` (no-op when None)."""
+    if timings is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    ok = False
+    with track_calls() as calls:
+        try:
+            yield
+            ok = True
+        finally:
+            timings.append(phase_record(stage, time.perf_counter() - t0, calls, ok=ok))
+
+
 class CycleResolutionService:
     """Cycle resolution: RP management, cycle advancement, and full pipeline."""
 
@@ -205,6 +227,8 @@ class CycleResolutionService:
         supabase: Client,
         epoch_id: UUID,
         admin_supabase: Client,
+        *,
+        timings: list[dict] | None = None,
     ) -> dict:
         """Full cycle resolution pipeline (migration 090 alliance steps marked ★).
 
@@ -216,11 +240,16 @@ class CycleResolutionService:
         5. Advance mission timers
         6. Expire fortifications
         7. Resolve missions
-        8. Bot execution (includes proposal voting)
-        9. Scoring
-        10. ★ Tension computation — ``fn_compute_alliance_tension`` (migration 090)
-        11. Notifications
-        12. ★ Clear dissolved team_ids
+        8. Success modifier table for the new cycle
+        9. Bot execution (includes proposal voting)
+        10. Scoring
+        11. ★ Tension computation — ``fn_compute_alliance_tension`` (migration 090)
+        12. Notifications
+        13. ★ Clear dissolved team_ids
+
+        When ``timings`` is given, one profile record per stage (wall time,
+        DB round trips/rows — same shape as the heartbeat phase records) is
+        appended to it.
 
         Returns updated epoch data.
         """
@@ -233,129 +262,146 @@ class CycleResolutionService:
         from backend.services.operative_service import OperativeService
         from backend.services.scoring_service import ScoringService
 
-        data = await cls.resolve_cycle(supabase, epoch_id, admin_supabase=admin_supabase)
+        with _timed_stage(timings, "advance"):
+            data = await cls.resolve_cycle(supabase, epoch_id, admin_supabase=admin_supabase)
         config = {**DEFAULT_CONFIG, **data.get("config", {})}
         cycle_number = data.get("current_cycle", 1)
 
         db = admin_supabase or supabase
 
-        # Alliance upkeep deduction (after RP grant, before missions)
-        try:
-            upkeep_teams = await AllianceService.deduct_upkeep(db, epoch_id, cycle_number)
-            if upkeep_teams:
-                logger.info(
-                    "Alliance upkeep step complete",
-                    extra={"epoch_id": str(epoch_id), "teams": len(upkeep_teams)},
-                )
-        except (PostgrestAPIError, httpx.HTTPError, KeyError, ValueError):
-            logger.warning("Alliance upkeep deduction failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-            sentry_sdk.capture_exception()
-
-        # Expire stale alliance proposals
-        try:
-            expired = await AllianceService.expire_proposals(db, epoch_id, cycle_number)
-            if expired:
-                logger.info("Alliance proposals expired", extra={"epoch_id": str(epoch_id), "count": expired})
-        except (PostgrestAPIError, httpx.HTTPError, KeyError, ValueError):
-            logger.warning("Alliance proposal expiry failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-            sentry_sdk.capture_exception()
-
-        # Resolve missions that have passed their resolves_at time
-        # (after timer advancement in resolve_cycle, before bots act)
-        # CRITICAL: tension computation (below) depends on resolved missions.
-        resolved = None
-        try:
-            resolved = await OperativeService.resolve_pending_missions(db, epoch_id, epoch_config=config)
-            # Log mission results to battle log
-            for mission in resolved:
-                try:
-                    await BattleLogService.log_mission_result(db, epoch_id, cycle_number, mission)
-                except (PostgrestAPIError, httpx.HTTPError):
-                    logger.debug("Battle log write failed for mission result", exc_info=True)
-        except (PostgrestAPIError, httpx.HTTPError):
-            logger.warning("Mission resolution failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-            sentry_sdk.capture_exception()
-        except (KeyError, ValueError) as exc:
-            logger.error("Mission resolution logic error: %s", exc, extra={"epoch_id": str(epoch_id)}, exc_info=True)
-            sentry_sdk.capture_exception()
-            raise
-
-        # Expire zone fortifications that have passed their expiry cycle
-        try:
-            # Atomic fortification expiry (migration 148): downgrades zones
-            # and deletes forts in a single transaction.
-            await db.rpc(
-                "fn_expire_fortifications",
-                {
-                    "p_epoch_id": str(epoch_id),
-                    "p_cycle_number": cycle_number,
-                },
-            ).execute()
-        except (PostgrestAPIError, httpx.HTTPError, KeyError, ValueError):
-            logger.warning("Fortification expiry failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-            sentry_sdk.capture_exception()
-
-        # Execute bot decisions (after RP grant + mission resolution, before next cycle)
-        try:
-            await BotService.execute_bot_cycle(
-                supabase=supabase,
-                admin_supabase=admin_supabase,
-                epoch_id=str(epoch_id),
-                cycle_number=cycle_number,
-                config=config,
-            )
-        except Exception as exc:
-            logger.warning("Bot cycle execution failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-            sentry_sdk.capture_exception(exc)
-
-        # Compute scores after missions resolve (best-effort)
-        try:
-            await ScoringService.compute_cycle_scores(supabase, epoch_id, cycle_number)
-        except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError, AttributeError) as exc:
-            logger.warning(
-                "Scoring failed", extra={"epoch_id": str(epoch_id), "cycle_number": cycle_number}, exc_info=True
-            )
-            sentry_sdk.capture_exception(exc)
-
-        # Compute alliance tension (after missions — counts same-target attacks)
-        # DEPENDENCY: requires mission resolution to have completed successfully
-        tension_results = None
-        if resolved is not None:
+        with _timed_stage(timings, "alliances"):
+            # Alliance upkeep deduction (after RP grant, before missions)
             try:
-                tension_results = await AllianceService.compute_tension(db, epoch_id, cycle_number)
-                dissolved = [r for r in tension_results if r.get("dissolved")]
-                if dissolved:
+                upkeep_teams = await AllianceService.deduct_upkeep(db, epoch_id, cycle_number)
+                if upkeep_teams:
                     logger.info(
-                        "Alliance tension dissolved teams",
-                        extra={
-                            "epoch_id": str(epoch_id),
-                            "dissolved_count": len(dissolved),
-                            "teams": [r.get("team_name") for r in dissolved],
-                        },
+                        "Alliance upkeep step complete",
+                        extra={"epoch_id": str(epoch_id), "teams": len(upkeep_teams)},
                     )
+            except (PostgrestAPIError, httpx.HTTPError, KeyError, ValueError):
+                logger.warning("Alliance upkeep deduction failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
+                sentry_sdk.capture_exception()
+
+            # Expire stale alliance proposals
+            try:
+                expired = await AllianceService.expire_proposals(db, epoch_id, cycle_number)
+                if expired:
+                    logger.info("Alliance proposals expired", extra={"epoch_id": str(epoch_id), "count": expired})
+            except (PostgrestAPIError, httpx.HTTPError, KeyError, ValueError):
+                logger.warning("Alliance proposal expiry failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
+                sentry_sdk.capture_exception()
+
+        with _timed_stage(timings, "missions"):
+            # Resolve missions that have passed their resolves_at time
+            # (after timer advancement in resolve_cycle, before bots act)
+            # CRITICAL: tension computation (below) depends on resolved missions.
+            resolved = None
+            try:
+                resolved = await OperativeService.resolve_pending_missions(db, epoch_id, epoch_config=config)
+                # Log mission results to battle log (one insert; failures are logged inside)
+                if resolved:
+                    await BattleLogService.log_mission_results(db, epoch_id, cycle_number, resolved)
             except (PostgrestAPIError, httpx.HTTPError):
-                logger.warning("Alliance tension computation failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
+                logger.warning("Mission resolution failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
                 sentry_sdk.capture_exception()
             except (KeyError, ValueError) as exc:
-                logger.error("Tension logic error: %s", exc, extra={"epoch_id": str(epoch_id)}, exc_info=True)
+                logger.error(
+                    "Mission resolution logic error: %s", exc, extra={"epoch_id": str(epoch_id)}, exc_info=True
+                )
                 sentry_sdk.capture_exception()
                 raise
-        else:
-            logger.warning(
-                "Skipping tension computation -- mission resolution failed",
-                extra={"epoch_id": str(epoch_id)},
-            )
 
-        # Send cycle notification emails (best-effort, non-blocking)
-        try:
-            await CycleNotificationService.send_cycle_notifications(
-                admin_supabase,
-                str(epoch_id),
-                cycle_number,
-            )
-        except (PostgrestAPIError, httpx.HTTPError, OSError, KeyError, ValueError):
-            logger.warning("Cycle notification failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-            sentry_sdk.capture_exception()
+        with _timed_stage(timings, "fortifications"):
+            # Expire zone fortifications that have passed their expiry cycle
+            try:
+                # Atomic fortification expiry (migration 148): downgrades zones
+                # and deletes forts in a single transaction.
+                await db.rpc(
+                    "fn_expire_fortifications",
+                    {
+                        "p_epoch_id": str(epoch_id),
+                        "p_cycle_number": cycle_number,
+                    },
+                ).execute()
+            except (PostgrestAPIError, httpx.HTTPError, KeyError, ValueError):
+                logger.warning("Fortification expiry failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
+                sentry_sdk.capture_exception()
+
+        with _timed_stage(timings, "modifiers"):
+            # Success-probability inputs for this cycle's deploys (bots below,
+            # players until the next deadline) — after zones changed above.
+            try:
+                await SuccessModifierTable.materialize(db, epoch_id, cycle_number)
+            except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError):
+                logger.warning("Success modifier table build failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
+
+        with _timed_stage(timings, "bots"):
+            # Execute bot decisions (after RP grant + mission resolution, before next cycle)
+            try:
+                await BotService.execute_bot_cycle(
+                    supabase=supabase,
+                    admin_supabase=admin_supabase,
+                    epoch_id=str(epoch_id),
+                    cycle_number=cycle_number,
+                    config=config,
+                )
+            except Exception as exc:
+                logger.warning("Bot cycle execution failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
+                sentry_sdk.capture_exception(exc)
+
+        with _timed_stage(timings, "scoring"):
+            # Compute scores after missions resolve (best-effort)
+            try:
+                await ScoringService.compute_cycle_scores(supabase, epoch_id, cycle_number)
+            except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError, AttributeError) as exc:
+                logger.warning(
+                    "Scoring failed", extra={"epoch_id": str(epoch_id), "cycle_number": cycle_number}, exc_info=True
+                )
+                sentry_sdk.capture_exception(exc)
+
+        with _timed_stage(timings, "tension"):
+            # Compute alliance tension (after missions — counts same-target attacks)
+            # DEPENDENCY: requires mission resolution to have completed successfully
+            tension_results = None
+            if resolved is not None:
+                try:
+                    tension_results = await AllianceService.compute_tension(db, epoch_id, cycle_number)
+                    dissolved = [r for r in tension_results if r.get("dissolved")]
+                    if dissolved:
+                        logger.info(
+                            "Alliance tension dissolved teams",
+                            extra={
+                                "epoch_id": str(epoch_id),
+                                "dissolved_count": len(dissolved),
+                                "teams": [r.get("team_name") for r in dissolved],
+                            },
+                        )
+                except (PostgrestAPIError, httpx.HTTPError):
+                    logger.warning(
+                        "Alliance tension computation failed", extra={"epoch_id": str(epoch_id)}, exc_info=True
+                    )
+                    sentry_sdk.capture_exception()
+                except (KeyError, ValueError) as exc:
+                    logger.error("Tension logic error: %s", exc, extra={"epoch_id": str(epoch_id)}, exc_info=True)
+                    sentry_sdk.capture_exception()
+                    raise
+            else:
+                logger.warning(
+                    "Skipping tension computation -- mission resolution failed",
+                    extra={"epoch_id": str(epoch_id)},
+                )
+
+        with _timed_stage(timings, "notifications"):
+            # Send cycle notification emails (best-effort, non-blocking)
+            try:
+                await CycleNotificationService.send_cycle_notifications(
+                    admin_supabase,
+                    str(epoch_id),
+                    cycle_number,
+                )
+            except (PostgrestAPIError, httpx.HTTPError, OSError, KeyError, ValueError):
+                logger.warning("Cycle notification failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
+                sentry_sdk.capture_exception()
 
         # Clear team_ids for dissolved alliances (AFTER notifications have read them)
         # DEPENDENCY: requires tension computation to have run
@@ -366,10 +412,11 @@ class CycleResolutionService:
                 logger.warning("Dissolved team cleanup failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
                 sentry_sdk.capture_exception()
 
-        # Journal: Signature fragment per participant. Runs after scoring
-        # is committed so dimension_dominance reflects this cycle's data.
-        # Fire-and-forget — the helper absorbs all failures internally.
-        await enqueue_epoch_signature(db, epoch_id, cycle_number)
+        with _timed_stage(timings, "journal"):
+            # Journal: Signature fragment per participant. Runs after scoring
+            # is committed so dimension_dominance reflects this cycle's data.
+            # Fire-and-forget — the helper absorbs all failures internally.
+            await enqueue_epoch_signature(db, epoch_id, cycle_number)
 
         return data
 
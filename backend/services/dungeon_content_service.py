@@ -2,7 +2,24 @@
 
 All dungeon content (banter, encounters, enemies, loot, abilities, etc.)
 is loaded from DB tables at startup and cached in a module-level dataclass.
-Admin CRUD endpoints call invalidate() after mutations to trigger a reload.
+Admin CRUD endpoints call refresh_content() after mutations to reload only
+the scopes (archetypes / ability schools) whose rows changed.
+
+Versioning:
+    ``fn_dungeon_content_versions()`` (migration 239) returns one md5 stamp
+    per scope, computed by Postgres over the full row text. The combined
+    stamp addresses a compiled, pickled ``_ContentCache`` snapshot on local
+    disk, so a boot (or a sibling worker catching up) whose stamp matches an
+    existing snapshot skips the 10-table fetch and the Pydantic rebuild.
+    Because the stamp lives in the DB, every worker converges on the same
+    version without a publish step — ``_content_refresh_loop`` polls it and
+    reloads only the scopes that moved.
+
+Atomicity:
+    Every load builds a complete new ``_ContentCache`` and swaps the module
+    pointer in one assignment. Readers see either the old or the new
+    snapshot, never a half-merged one. Partial reloads copy the top-level
+    dicts of the current cache and replace only the affected keys.
 
 Pattern follows cache_config.py: module-level cache, lazy load, invalidate().
 """
@@ -10,12 +27,23 @@ Pattern follows cache_config.py: module-level cache, lazy load, invalidate().
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import pickle
+import stat
+import tempfile
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
 
+import httpx
 import sentry_sdk
+from postgrest.exceptions import APIError as PostgrestAPIError
 
+from backend.config import settings
 from backend.models.resonance_dungeon import (
     EncounterChoice,
     EncounterTemplate,
@@ -28,6 +56,45 @@ from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
 
+# Scope key prefix for ability schools in fn_dungeon_content_versions().
+# Every other scope key is an archetype name ("The Shadow", ...).
+ABILITY_SCOPE_PREFIX = "ability:"
+
+# How often each worker polls the DB stamp for out-of-band edits
+# (other workers' admin mutations, seed migrations, direct SQL).
+_REFRESH_INTERVAL_SECONDS = 30
+
+# Snapshots kept on disk per kind; older ones are pruned after each write.
+_SNAPSHOT_KEEP = 5
+
+# (cache key, table, order) for the 10 content tables. Archetype-keyed
+# tables carry an ``archetype`` column; choices are scoped through their
+# encounter FK and abilities through ``school``.
+_ARCHETYPE_TABLES: tuple[tuple[str, str, str | None], ...] = (
+    ("banter", "dungeon_banter", "sort_order"),
+    ("enemies", "dungeon_enemy_templates", "sort_order"),
+    ("spawns", "dungeon_spawn_configs", None),
+    ("encounters", "dungeon_encounter_templates", "sort_order"),
+    ("loot", "dungeon_loot_items", "sort_order"),
+    ("anchors", "dungeon_anchor_objects", "sort_order"),
+    ("entrance_texts", "dungeon_entrance_texts", "sort_order"),
+    ("barometer_texts", "dungeon_barometer_texts", "archetype,tier"),
+)
+_CHOICES_TABLE = ("choices", "dungeon_encounter_choices", "sort_order")
+_ABILITIES_TABLE = ("abilities", "combat_abilities", "sort_order")
+
+# _ContentCache fields keyed by archetype (replaced wholesale on a scope reload).
+_ARCHETYPE_FIELDS: tuple[str, ...] = (
+    "banter",
+    "encounters",
+    "enemies",
+    "spawns",
+    "loot",
+    "anchors",
+    "entrance_texts",
+    "barometer_texts",
+)
+
 # ── Cache dataclass ───────────────────────────────────────────────────────
 
 
@@ -45,248 +112,579 @@ class _ContentCache:
     entrance_texts: dict[str, list[dict]] = field(default_factory=dict)
     barometer_texts: dict[str, list[dict]] = field(default_factory=dict)
     abilities: dict[str, list[Ability]] = field(default_factory=dict)
+    # Combined DB stamp ("" when loaded without fn_dungeon_content_versions,
+    # e.g. from YAML packs in tests) and the per-scope stamps it was built from.
+    version: str = ""
+    scope_versions: dict[str, str] = field(default_factory=dict)
 
 
 # ── Module-level cache ────────────────────────────────────────────────────
 
 _content: _ContentCache | None = None
+_reload_lock = asyncio.Lock()
 
 
-# ── Loading ───────────────────────────────────────────────────────────────
+# ── Compiled snapshots (hash-addressed, local disk) ───────────────────────
 
 
-async def load_all_content(supabase: Client) -> None:
-    """Load all dungeon content from DB into memory cache.
+def _schema_fingerprint(*paths: Path) -> str:
+    """Hash the source of the modules whose classes end up in a snapshot.
 
-    Called at app startup (lifespan) and after admin cache reload.
-    Uses service_role client — content tables have public-read RLS
-    but we use admin client for consistency with other startup loads.
+    A snapshot pickled against an older model definition must never be
+    unpickled into a newer one, so the model sources are part of the key.
     """
-    global _content  # noqa: PLW0603
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(str(path).encode())
+    return digest.hexdigest()[:12]
+
+
+_BACKEND_ROOT = Path(__file__).resolve().parents[1]
+_SCHEMA_FINGERPRINT = _schema_fingerprint(
+    Path(__file__).resolve(),
+    _BACKEND_ROOT / "models" / "resonance_dungeon.py",
+    _BACKEND_ROOT / "services" / "combat" / "ability_schools.py",
+)
+
+
+def snapshot_dir() -> Path:
+    """Directory holding compiled content snapshots for this host."""
+    configured = settings.dungeon_content_snapshot_dir
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / f"velgarien-dungeon-content-{os.getuid()}"
+
+
+def _snapshot_path(kind: str, version: str) -> Path:
+    return snapshot_dir() / f"{kind}-{_SCHEMA_FINGERPRINT}-{version}.pickle"
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Owned by this user and not writable by group or others."""
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _private_dir(*, create: bool) -> Path | None:
+    """The snapshot directory, or None unless it is a private directory of ours.
+
+    Snapshots are unpickled, so nobody else may be able to plant a file in
+    the directory: in a shared tempdir another local user could pre-create
+    it, and ``mkdir(exist_ok=True)`` keeps whatever owner and mode it has.
+    """
+    directory = snapshot_dir()
+    try:
+        if create:
+            directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = directory.lstat()
+    except FileNotFoundError:
+        return None
+    except OSError:
+        logger.warning("Content snapshot dir unusable: %s", directory, exc_info=True)
+        return None
+    if not stat.S_ISDIR(st.st_mode) or not _is_private(st):
+        logger.warning("Content snapshot dir %s is not a private directory of this user; snapshots disabled", directory)
+        return None
+    return directory
+
+
+def read_snapshot(kind: str, version: str) -> Any | None:
+    """Return the snapshot stored under (kind, version), or None.
+
+    Only files owned by this user in a private (see ``_private_dir``)
+    directory are read; a corrupt or incompatible file is treated as a miss.
+    """
+    if _private_dir(create=False) is None:
+        return None
+    path = _snapshot_path(kind, version)
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except FileNotFoundError:
+        return None
+    except OSError:
+        logger.warning("Content snapshot unreadable: %s", path)
+        return None
+    with os.fdopen(fd, "rb") as fh:
+        if not _is_private(os.fstat(fh.fileno())):
+            logger.warning("Content snapshot %s is not a private file of this user, ignoring", path)
+            return None
+        payload = fh.read()
+    try:
+        return pickle.loads(payload)  # noqa: S301 — self-written, hash-addressed, ownership-checked
+    except Exception:  # noqa: BLE001 — any unpickle failure is a cache miss
+        logger.warning("Content snapshot corrupt, ignoring: %s", path)
+        return None
 
+
+def write_snapshot(kind: str, version: str, obj: Any) -> None:
+    """Persist ``obj`` under (kind, version) atomically and prune old files.
+
+    Failures are logged and swallowed — the snapshot is an accelerator,
+    never a source of truth.
+    """
+    directory = _private_dir(create=True)
+    if directory is None:
+        return
+    path = _snapshot_path(kind, version)
     try:
-        # Parallel queries for all 10 tables
-        (
-            banter_res,
-            enemy_res,
-            spawn_res,
-            encounter_res,
-            choice_res,
-            loot_res,
-            anchor_res,
-            entrance_res,
-            barometer_res,
-            ability_res,
-        ) = await asyncio.gather(
-            supabase.table("dungeon_banter").select("*").order("sort_order").execute(),
-            supabase.table("dungeon_enemy_templates").select("*").order("sort_order").execute(),
-            supabase.table("dungeon_spawn_configs").select("*").execute(),
-            supabase.table("dungeon_encounter_templates").select("*").order("sort_order").execute(),
-            supabase.table("dungeon_encounter_choices").select("*").order("sort_order").execute(),
-            supabase.table("dungeon_loot_items").select("*").order("sort_order").execute(),
-            supabase.table("dungeon_anchor_objects").select("*").order("sort_order").execute(),
-            supabase.table("dungeon_entrance_texts").select("*").order("sort_order").execute(),
-            supabase.table("dungeon_barometer_texts").select("*").order("archetype,tier").execute(),
-            supabase.table("combat_abilities").select("*").order("sort_order").execute(),
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{kind}-", suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(obj, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+        stale = sorted(
+            (p for p in directory.glob(f"{kind}-*.pickle") if p != path),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
         )
+        for old in stale[_SNAPSHOT_KEEP - 1 :]:
+            old.unlink(missing_ok=True)
+    except OSError:
+        logger.warning("Failed to write content snapshot %s", path, exc_info=True)
 
-        cache = _ContentCache()
-
-        # ── Banter ────────────────────────────────────────────────────────
-        banter_by_arch: dict[str, list[dict]] = defaultdict(list)
-        for row in extract_list(banter_res):
-            banter_by_arch[row["archetype"]].append(row)
-        cache.banter = dict(banter_by_arch)
-
-        # ── Enemy Templates ───────────────────────────────────────────────
-        enemies_by_arch: dict[str, dict[str, EnemyTemplate]] = defaultdict(dict)
-        for row in extract_list(enemy_res):
-            tmpl = EnemyTemplate(**row)
-            enemies_by_arch[row["archetype"]][row["id"]] = tmpl
-        cache.enemies = dict(enemies_by_arch)
-
-        # ── Spawn Configs ─────────────────────────────────────────────────
-        spawns_by_arch: dict[str, dict[str, list[dict]]] = defaultdict(dict)
-        for row in extract_list(spawn_res):
-            spawns_by_arch[row["archetype"]][row["id"]] = row["entries"]
-        cache.spawns = dict(spawns_by_arch)
-
-        # ── Encounter Templates + Choices ─────────────────────────────────
-        # First, group choices by encounter_id
-        choices_by_enc: dict[str, list[dict]] = defaultdict(list)
-        for row in extract_list(choice_res):
-            choices_by_enc[row["encounter_id"]].append(row)
-
-        encounters_by_arch: dict[str, list[EncounterTemplate]] = defaultdict(list)
-        encounter_index: dict[str, EncounterTemplate] = {}
-        for row in extract_list(encounter_res):
-            # Build EncounterChoice objects from joined rows
-            choice_rows = choices_by_enc.get(row["id"], [])
-            choices = [
-                EncounterChoice(
-                    id=c["id"],
-                    label_en=c["label_en"],
-                    label_de=c["label_de"],
-                    requires_aptitude=c.get("requires_aptitude"),
-                    requires_profession=c.get("requires_profession"),
-                    check_aptitude=c.get("check_aptitude"),
-                    check_difficulty=c.get("check_difficulty", 0),
-                    success_effects=c.get("success_effects", {}),
-                    partial_effects=c.get("partial_effects", {}),
-                    fail_effects=c.get("fail_effects", {}),
-                    success_narrative_en=c.get("success_narrative_en", ""),
-                    success_narrative_de=c.get("success_narrative_de", ""),
-                    partial_narrative_en=c.get("partial_narrative_en", ""),
-                    partial_narrative_de=c.get("partial_narrative_de", ""),
-                    fail_narrative_en=c.get("fail_narrative_en", ""),
-                    fail_narrative_de=c.get("fail_narrative_de", ""),
-                )
-                for c in choice_rows
-            ]
-
-            enc = EncounterTemplate(
-                id=row["id"],
-                archetype=row["archetype"],
-                room_type=row["room_type"],
-                min_depth=row.get("min_depth", 0),
-                max_depth=row.get("max_depth", 99),
-                min_difficulty=row.get("min_difficulty", 1),
-                requires_aptitude=row.get("requires_aptitude"),
-                description_en=row.get("description_en", ""),
-                description_de=row.get("description_de", ""),
-                choices=choices,
-                combat_encounter_id=row.get("combat_encounter_id"),
-                is_ambush=row.get("is_ambush", False),
-                ambush_stress=row.get("ambush_stress", 0),
-            )
-            encounters_by_arch[row["archetype"]].append(enc)
-            encounter_index[row["id"]] = enc
-
-        cache.encounters = dict(encounters_by_arch)
-        cache.encounter_index = encounter_index
-
-        # ── Validate narrative coverage ──────────────────────────────────
-        # Choices with check_aptitude can resolve to partial — they MUST have
-        # partial_narrative_en. Log warnings at startup so gaps are visible.
-        for arch, enc_list in encounters_by_arch.items():
-            for enc in enc_list:
-                for choice in enc.choices:
-                    if choice.check_aptitude and not choice.partial_narrative_en:
-                        logger.warning(
-                            "Encounter choice %s (encounter %s, archetype %s) has "
-                            "check_aptitude=%s but no partial_narrative_en",
-                            choice.id,
-                            enc.id,
-                            arch,
-                            choice.check_aptitude,
-                        )
-
-        # ── Loot Items ────────────────────────────────────────────────────
-        loot_by_arch: dict[str, dict[int, list[LootItem]]] = defaultdict(lambda: defaultdict(list))
-        for row in extract_list(loot_res):
-            item = LootItem(**row)
-            loot_by_arch[row["archetype"]][row["tier"]].append(item)
-        cache.loot = {arch: dict(tiers) for arch, tiers in loot_by_arch.items()}
-
-        # ── Anchor Objects ────────────────────────────────────────────────
-        anchors_by_arch: dict[str, list[dict]] = defaultdict(list)
-        for row in extract_list(anchor_res):
-            anchors_by_arch[row["archetype"]].append(
-                {
-                    "id": row["id"],
-                    "phases": row["phases"],
-                }
-            )
-        cache.anchors = dict(anchors_by_arch)
-
-        # ── Entrance Texts ────────────────────────────────────────────────
-        entrance_by_arch: dict[str, list[dict]] = defaultdict(list)
-        for row in extract_list(entrance_res):
-            entrance_by_arch[row["archetype"]].append(
-                {
-                    "text_en": row["text_en"],
-                    "text_de": row["text_de"],
-                }
-            )
-        cache.entrance_texts = dict(entrance_by_arch)
-
-        # ── Barometer Texts ───────────────────────────────────────────────
-        barometer_by_arch: dict[str, list[dict]] = defaultdict(list)
-        for row in extract_list(barometer_res):
-            barometer_by_arch[row["archetype"]].append(
-                {
-                    "tier": row["tier"],
-                    "text_en": row["text_en"],
-                    "text_de": row["text_de"],
-                }
-            )
-        cache.barometer_texts = dict(barometer_by_arch)
-
-        # ── Combat Abilities ──────────────────────────────────────────────
-        abilities_by_school: dict[str, list[Ability]] = defaultdict(list)
-        for row in extract_list(ability_res):
-            ability = Ability(
-                id=row["id"],
-                name_en=row["name_en"],
-                name_de=row["name_de"],
-                school=row["school"],
-                description_en=row.get("description_en", ""),
-                description_de=row.get("description_de", ""),
-                min_aptitude=row.get("min_aptitude", 3),
-                cooldown=row.get("cooldown", 0),
-                effect_type=row.get("effect_type", "damage"),
-                effect_params=row.get("effect_params", {}),
-                is_ultimate=row.get("is_ultimate", False),
-                targets=row.get("targets", "single_enemy"),
+
+def combined_version(scope_versions: dict[str, str]) -> str:
+    """Collapse per-scope stamps into one order-independent content version."""
+    canonical = json.dumps(sorted(scope_versions.items()), separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+# ── Loading ───────────────────────────────────────────────────────────────
+
+
+async def _fetch_scope_versions(supabase: Client) -> dict[str, str] | None:
+    """Read per-scope content stamps from the DB. None if unavailable.
+
+    Unavailable (RPC missing on an un-migrated DB, transient error) degrades
+    to the pre-snapshot behaviour: full load, no incremental refresh.
+    """
+    try:
+        response = await supabase.rpc("fn_dungeon_content_versions").execute()
+    except (PostgrestAPIError, httpx.HTTPError):
+        logger.warning("fn_dungeon_content_versions unavailable — content versioning disabled", exc_info=True)
+        return None
+    data = response.data
+    if not isinstance(data, dict):
+        return None
+    return {str(k): str(v) for k, v in data.items() if v is not None}
+
+
+async def _fetch_all_rows(supabase: Client) -> dict[str, list[dict]]:
+    """Fetch every content table in parallel (10 queries)."""
+    tables = (*_ARCHETYPE_TABLES, _CHOICES_TABLE, _ABILITIES_TABLE)
+
+    def _query(table: str, order: str | None):
+        query = supabase.table(table).select("*")
+        return query.order(order) if order else query
+
+    responses = await asyncio.gather(*(_query(table, order).execute() for _, table, order in tables))
+    return {key: extract_list(res) for (key, _, _), res in zip(tables, responses, strict=True)}
+
+
+async def _fetch_scope_rows(supabase: Client, scope: str) -> dict[str, list[dict]]:
+    """Fetch only the rows belonging to one archetype or ability school."""
+    if scope.startswith(ABILITY_SCOPE_PREFIX):
+        key, table, order = _ABILITIES_TABLE
+        school = scope.removeprefix(ABILITY_SCOPE_PREFIX)
+        res = await supabase.table(table).select("*").eq("school", school).order(order).execute()
+        return {key: extract_list(res)}
+
+    def _query(table: str, order: str | None):
+        query = supabase.table(table).select("*").eq("archetype", scope)
+        return query.order(order) if order else query
+
+    responses = await asyncio.gather(*(_query(table, order).execute() for _, table, order in _ARCHETYPE_TABLES))
+    rows = {key: extract_list(res) for (key, _, _), res in zip(_ARCHETYPE_TABLES, responses, strict=True)}
+
+    encounter_ids = [row["id"] for row in rows["encounters"]]
+    rows["choices"] = []
+    if encounter_ids:
+        key, table, order = _CHOICES_TABLE
+        res = await supabase.table(table).select("*").in_("encounter_id", encounter_ids).order(order).execute()
+        rows[key] = extract_list(res)
+    return rows
+
+
+def _compile(rows: dict[str, list[dict]]) -> _ContentCache:
+    """Turn raw table rows into the typed, archetype-indexed cache shape.
+
+    Tables missing from ``rows`` compile to empty registries, so the same
+    function serves full loads and single-scope reloads.
+    """
+    cache = _ContentCache()
+
+    # ── Banter ────────────────────────────────────────────────────────
+    banter_by_arch: dict[str, list[dict]] = defaultdict(list)
+    for row in rows.get("banter", []):
+        banter_by_arch[row["archetype"]].append(row)
+    cache.banter = dict(banter_by_arch)
+
+    # ── Enemy Templates ───────────────────────────────────────────────
+    enemies_by_arch: dict[str, dict[str, EnemyTemplate]] = defaultdict(dict)
+    for row in rows.get("enemies", []):
+        tmpl = EnemyTemplate(**row)
+        enemies_by_arch[row["archetype"]][row["id"]] = tmpl
+    cache.enemies = dict(enemies_by_arch)
+
+    # ── Spawn Configs ─────────────────────────────────────────────────
+    spawns_by_arch: dict[str, dict[str, list[dict]]] = defaultdict(dict)
+    for row in rows.get("spawns", []):
+        spawns_by_arch[row["archetype"]][row["id"]] = row["entries"]
+    cache.spawns = dict(spawns_by_arch)
+
+    # ── Encounter Templates + Choices ─────────────────────────────────
+    # First, group choices by encounter_id
+    choices_by_enc: dict[str, list[dict]] = defaultdict(list)
+    for row in rows.get("choices", []):
+        choices_by_enc[row["encounter_id"]].append(row)
+
+    encounters_by_arch: dict[str, list[EncounterTemplate]] = defaultdict(list)
+    encounter_index: dict[str, EncounterTemplate] = {}
+    for row in rows.get("encounters", []):
+        # Build EncounterChoice objects from joined rows
+        choice_rows = choices_by_enc.get(row["id"], [])
+        choices = [
+            EncounterChoice(
+                id=c["id"],
+                label_en=c["label_en"],
+                label_de=c["label_de"],
+                requires_aptitude=c.get("requires_aptitude"),
+                requires_profession=c.get("requires_profession"),
+                check_aptitude=c.get("check_aptitude"),
+                check_difficulty=c.get("check_difficulty", 0),
+                success_effects=c.get("success_effects", {}),
+                partial_effects=c.get("partial_effects", {}),
+                fail_effects=c.get("fail_effects", {}),
+                success_narrative_en=c.get("success_narrative_en", ""),
+                success_narrative_de=c.get("success_narrative_de", ""),
+                partial_narrative_en=c.get("partial_narrative_en", ""),
+                partial_narrative_de=c.get("partial_narrative_de", ""),
+                fail_narrative_en=c.get("fail_narrative_en", ""),
+                fail_narrative_de=c.get("fail_narrative_de", ""),
             )
-            abilities_by_school[row["school"]].append(ability)
-        cache.abilities = dict(abilities_by_school)
-
-        # Swap cache atomically (GIL-safe pointer swap)
-        _content = cache
-
-        # Log summary
-        total_banter = sum(len(v) for v in cache.banter.values())
-        total_enemies = sum(len(v) for v in cache.enemies.values())
-        total_encounters = sum(len(v) for v in cache.encounters.values())
-        total_choices = sum(len(e.choices) for el in cache.encounters.values() for e in el)
-        total_loot = sum(len(items) for tiers in cache.loot.values() for items in tiers.values())
-        total_anchors = sum(len(v) for v in cache.anchors.values())
-        total_abilities = sum(len(v) for v in cache.abilities.values())
-        logger.info(
-            "Dungeon content loaded: %d banter, %d enemies, %d encounters (%d choices), "
-            "%d loot, %d anchors, %d abilities",
-            total_banter,
-            total_enemies,
-            total_encounters,
-            total_choices,
-            total_loot,
-            total_anchors,
-            total_abilities,
+            for c in choice_rows
+        ]
+
+        enc = EncounterTemplate(
+            id=row["id"],
+            archetype=row["archetype"],
+            room_type=row["room_type"],
+            min_depth=row.get("min_depth", 0),
+            max_depth=row.get("max_depth", 99),
+            min_difficulty=row.get("min_difficulty", 1),
+            requires_aptitude=row.get("requires_aptitude"),
+            description_en=row.get("description_en", ""),
+            description_de=row.get("description_de", ""),
+            choices=choices,
+            combat_encounter_id=row.get("combat_encounter_id"),
+            is_ambush=row.get("is_ambush", False),
+            ambush_stress=row.get("ambush_stress", 0),
+        )
+        encounters_by_arch[row["archetype"]].append(enc)
+        encounter_index[row["id"]] = enc
+
+    cache.encounters = dict(encounters_by_arch)
+    cache.encounter_index = encounter_index
+
+    # ── Validate narrative coverage ──────────────────────────────────
+    # Choices with check_aptitude can resolve to partial — they MUST have
+    # partial_narrative_en. Log warnings at load so gaps are visible.
+    for arch, enc_list in encounters_by_arch.items():
+        for enc in enc_list:
+            for choice in enc.choices:
+                if choice.check_aptitude and not choice.partial_narrative_en:
+                    logger.warning(
+                        "Encounter choice %s (encounter %s, archetype %s) has "
+                        "check_aptitude=%s but no partial_narrative_en",
+                        choice.id,
+                        enc.id,
+                        arch,
+                        choice.check_aptitude,
+                    )
+
+    # ── Loot Items ────────────────────────────────────────────────────
+    loot_by_arch: dict[str, dict[int, list[LootItem]]] = defaultdict(lambda: defaultdict(list))
+    for row in rows.get("loot", []):
+        item = LootItem(**row)
+        loot_by_arch[row["archetype"]][row["tier"]].append(item)
+    cache.loot = {arch: dict(tiers) for arch, tiers in loot_by_arch.items()}
+
+    # ── Anchor Objects ────────────────────────────────────────────────
+    anchors_by_arch: dict[str, list[dict]] = defaultdict(list)
+    for row in rows.get("anchors", []):
+        anchors_by_arch[row["archetype"]].append(
+            {
+                "id": row["id"],
+                "phases": row["phases"],
+            }
         )
+    cache.anchors = dict(anchors_by_arch)
+
+    # ── Entrance Texts ────────────────────────────────────────────────
+    entrance_by_arch: dict[str, list[dict]] = defaultdict(list)
+    for row in rows.get("entrance_texts", []):
+        entrance_by_arch[row["archetype"]].append(
+            {
+                "text_en": row["text_en"],
+                "text_de": row["text_de"],
+            }
+        )
+    cache.entrance_texts = dict(entrance_by_arch)
+
+    # ── Barometer Texts ───────────────────────────────────────────────
+    barometer_by_arch: dict[str, list[dict]] = defaultdict(list)
+    for row in rows.get("barometer_texts", []):
+        barometer_by_arch[row["archetype"]].append(
+            {
+                "tier": row["tier"],
+                "text_en": row["text_en"],
+                "text_de": row["text_de"],
+            }
+        )
+    cache.barometer_texts = dict(barometer_by_arch)
+
+    # ── Combat Abilities ──────────────────────────────────────────────
+    abilities_by_school: dict[str, list[Ability]] = defaultdict(list)
+    for row in rows.get("abilities", []):
+        ability = Ability(
+            id=row["id"],
+            name_en=row["name_en"],
+            name_de=row["name_de"],
+            school=row["school"],
+            description_en=row.get("description_en", ""),
+            description_de=row.get("description_de", ""),
+            min_aptitude=row.get("min_aptitude", 3),
+            cooldown=row.get("cooldown", 0),
+            effect_type=row.get("effect_type", "damage"),
+            effect_params=row.get("effect_params", {}),
+            is_ultimate=row.get("is_ultimate", False),
+            targets=row.get("targets", "single_enemy"),
+        )
+        abilities_by_school[row["school"]].append(ability)
+    cache.abilities = dict(abilities_by_school)
+
+    return cache
+
 
-        # Warn on empty tables (seed may not have run)
-        if total_banter == 0:
-            logger.warning("dungeon_banter table is empty — seed data may not be applied")
-        if total_encounters == 0:
-            logger.warning("dungeon_encounter_templates table is empty — seed data may not be applied")
+def _merge_scope(base: _ContentCache, partial: _ContentCache, scope: str) -> _ContentCache:
+    """Return a new cache equal to ``base`` with ``scope`` taken from ``partial``.
 
+    ``base`` is never mutated — readers holding the old pointer keep a
+    consistent view. A scope absent from ``partial`` (all its rows were
+    deleted) is dropped from the result.
+    """
+    if scope.startswith(ABILITY_SCOPE_PREFIX):
+        school = scope.removeprefix(ABILITY_SCOPE_PREFIX)
+        abilities = dict(base.abilities)
+        abilities.pop(school, None)
+        if school in partial.abilities:
+            abilities[school] = partial.abilities[school]
+        return replace(base, abilities=abilities)
+
+    updates: dict[str, Any] = {}
+    for name in _ARCHETYPE_FIELDS:
+        registry = dict(getattr(base, name))
+        registry.pop(scope, None)
+        fresh = getattr(partial, name)
+        if scope in fresh:
+            registry[scope] = fresh[scope]
+        updates[name] = registry
+    encounter_index = {eid: enc for eid, enc in base.encounter_index.items() if enc.archetype != scope}
+    encounter_index.update(partial.encounter_index)
+    updates["encounter_index"] = encounter_index
+    return replace(base, **updates)
+
+
+def _log_summary(cache: _ContentCache, *, source: str) -> None:
+    total_banter = sum(len(v) for v in cache.banter.values())
+    total_enemies = sum(len(v) for v in cache.enemies.values())
+    total_encounters = sum(len(v) for v in cache.encounters.values())
+    total_choices = sum(len(e.choices) for el in cache.encounters.values() for e in el)
+    total_loot = sum(len(items) for tiers in cache.loot.values() for items in tiers.values())
+    total_anchors = sum(len(v) for v in cache.anchors.values())
+    total_abilities = sum(len(v) for v in cache.abilities.values())
+    logger.info(
+        "Dungeon content loaded from %s (version %s): %d banter, %d enemies, %d encounters (%d choices), "
+        "%d loot, %d anchors, %d abilities",
+        source,
+        cache.version or "unversioned",
+        total_banter,
+        total_enemies,
+        total_encounters,
+        total_choices,
+        total_loot,
+        total_anchors,
+        total_abilities,
+    )
+
+    # Warn on empty tables (seed may not have run)
+    if total_banter == 0:
+        logger.warning("dungeon_banter table is empty — seed data may not be applied")
+    if total_encounters == 0:
+        logger.warning("dungeon_encounter_templates table is empty — seed data may not be applied")
+
+
+def _capture_load_failure(operation: str) -> None:
+    with sentry_sdk.push_scope() as scope:
+        scope.set_tag("service", "dungeon_content")
+        scope.set_tag("operation", operation)
+        sentry_sdk.capture_exception()
+
+
+async def _load_all_locked(
+    supabase: Client,
+    scope_versions: dict[str, str] | None,
+    *,
+    use_snapshot: bool,
+) -> None:
+    """Full (re)load body. Caller holds ``_reload_lock``.
+
+    ``scope_versions`` must be read BEFORE the rows: an edit landing between
+    the two reads leaves the cache labelled with the older stamp, so the
+    next refresh re-reads that scope instead of missing the edit.
+    """
+    global _content  # noqa: PLW0603
+
+    version = combined_version(scope_versions) if scope_versions is not None else ""
+
+    if use_snapshot and version:
+        if _content is not None and _content.version == version:
+            logger.info("Dungeon content already at version %s", version)
+            return
+        snapshot = await asyncio.to_thread(read_snapshot, "content", version)
+        if isinstance(snapshot, _ContentCache):
+            _content = snapshot
+            _log_summary(snapshot, source="snapshot")
+            return
+
+    rows = await _fetch_all_rows(supabase)
+    cache = _compile(rows)
+    cache.version = version
+    cache.scope_versions = scope_versions or {}
+
+    # Swap cache atomically (GIL-safe pointer swap)
+    _content = cache
+    _log_summary(cache, source="database")
+    if version:
+        await asyncio.to_thread(write_snapshot, "content", version, cache)
+
+
+async def load_all_content(supabase: Client, *, use_snapshot: bool = True) -> None:
+    """Load all dungeon content into the memory cache.
+
+    Called at app startup (lifespan) and from the admin "reload cache"
+    endpoint (with ``use_snapshot=False`` to force a DB rebuild). Uses
+    service_role client — content tables have public-read RLS but we use
+    admin client for consistency with other startup loads.
+
+    With ``use_snapshot`` the DB stamp is read first: a matching in-memory
+    cache is kept as-is, a matching on-disk snapshot is swapped in without
+    touching the content tables, and only a miss pays the full fetch.
+    """
+    try:
+        async with _reload_lock:
+            scope_versions = await _fetch_scope_versions(supabase)
+            await _load_all_locked(supabase, scope_versions, use_snapshot=use_snapshot)
     except Exception:
         logger.exception("Failed to load dungeon content from DB")
-        with sentry_sdk.push_scope() as scope:
-            scope.set_tag("service", "dungeon_content")
-            scope.set_tag("operation", "load_all_content")
-            sentry_sdk.capture_exception()
+        _capture_load_failure("load_all_content")
+        raise
+
+
+async def refresh_content(supabase: Client, *, full_fallback: bool = True) -> list[str]:
+    """Bring the cache up to the DB's current content version.
+
+    Compares per-scope stamps with the ones the cache was built from and
+    reloads only the archetypes / ability schools that changed. Returns
+    the reloaded scope keys (empty when already current, ``["*"]`` after
+    a full load).
+
+    A full load happens when the cache is empty or was built without
+    stamps (YAML packs, un-migrated DB). If the stamp RPC itself is
+    unavailable, ``full_fallback`` decides between a full reload (admin
+    mutations — the edit must become visible) and a no-op (periodic
+    polling — don't re-fetch 10 tables every tick).
+    """
+    global _content  # noqa: PLW0603
+
+    try:
+        async with _reload_lock:
+            scope_versions = await _fetch_scope_versions(supabase)
+            current = _content
+            if scope_versions is None and not full_fallback:
+                return []
+            if scope_versions is None or current is None or not current.version:
+                await _load_all_locked(supabase, scope_versions, use_snapshot=True)
+                return ["*"]
+
+            changed = sorted(
+                scope
+                for scope in scope_versions.keys() | current.scope_versions.keys()
+                if scope_versions.get(scope) != current.scope_versions.get(scope)
+            )
+            if not changed:
+                return []
+
+            version = combined_version(scope_versions)
+            snapshot = await asyncio.to_thread(read_snapshot, "content", version)
+            if isinstance(snapshot, _ContentCache):
+                _content = snapshot
+                logger.info("Dungeon content refreshed from snapshot %s (scopes: %s)", version, ", ".join(changed))
+                return changed
+
+            cache = current
+            for scope in changed:
+                partial = _compile(await _fetch_scope_rows(supabase, scope))
+                cache = _merge_scope(cache, partial, scope)
+            cache = replace(cache, version=version, scope_versions=scope_versions)
+
+            _content = cache
+            logger.info("Dungeon content refreshed to %s (scopes: %s)", version, ", ".join(changed))
+            await asyncio.to_thread(write_snapshot, "content", version, cache)
+            return changed
+
+    except Exception:
+        logger.exception("Failed to refresh dungeon content from DB")
+        _capture_load_failure("refresh_content")
         raise
 
 
+async def _content_refresh_loop() -> None:
+    """Infinite loop: converge this worker on the DB content version."""
+    from backend.utils.supabase_admin_cache import get_admin_supabase_client
+
+    while True:
+        await asyncio.sleep(_REFRESH_INTERVAL_SECONDS)
+        try:
+            admin = await get_admin_supabase_client()
+            await refresh_content(admin, full_fallback=False)
+        except asyncio.CancelledError:
+            logger.info("Dungeon content refresh loop shutting down")
+            raise
+        except Exception:  # noqa: BLE001 — refresh_content already reported to Sentry
+            logger.warning("Dungeon content refresh tick failed; keeping current cache")
+
+
+async def start_content_refresh() -> asyncio.Task:
+    """Launch the content refresh loop. Called from app lifespan."""
+    task = asyncio.create_task(_content_refresh_loop())
+    logger.info("Dungeon content refresh loop started (interval=%ds)", _REFRESH_INTERVAL_SECONDS)
+    return task
+
+
+def get_content_version() -> str:
+    """Combined content version of the live cache ("" if unversioned/unloaded)."""
+    return _content.version if _content is not None else ""
+
+
 def invalidate() -> None:
     """Clear the content cache.
 
     WARNING: After calling this, all getters will raise RuntimeError until
     load_all_content() is called again. For admin CRUD, prefer calling
-    load_all_content() directly — it atomically swaps the cache pointer
-    without a window of unavailability.
+    refresh_content() — it reloads only the changed scopes and atomically
+    swaps the cache pointer without a window of unavailability.
     """
     global _content  # noqa: PLW0603
     _content = None
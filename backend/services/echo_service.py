@@ -1,6 +1,12 @@
 """Service layer for event echo (bleed) operations.
 
 Cross-simulation, uses admin client for writes — does NOT extend BaseService.
+
+Connections, source instability and embassy effectiveness are read from the
+in-process ``MultiverseGraph`` index. The two weights come from materialized
+views and can be up to 60 s stale (the index TTL) on a worker that did not
+run the refresh itself; echo strength and thresholds are probabilistic, so
+that lag is accepted.
 """
 
 from __future__ import annotations
@@ -15,8 +21,9 @@ from fastapi import HTTPException
 from postgrest.exceptions import APIError as PostgrestAPIError
 
 from backend.services.base_service import serialize_for_json
-from backend.services.game_mechanics_service import GameMechanicsService
 from backend.services.journal.hooks import enqueue_bleed_tremor
+from backend.services.multiverse_graph import MultiverseGraph
+from backend.services.simulation_settings_cache import SimulationSettingsCache
 from backend.utils.errors import bad_request, not_found, server_error
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
@@ -193,23 +200,7 @@ class EchoService:
             return []
 
         # Get source sim bleed settings
-        settings_resp = await (
-            supabase.table("simulation_settings")
-            .select("setting_key, setting_value")
-            .eq("simulation_id", sim_str)
-            .eq("category", "world")
-            .in_(
-                "setting_key",
-                [
-                    "bleed_enabled",
-                    "bleed_min_impact",
-                    "bleed_max_depth",
-                    "bleed_strength_decay",
-                ],
-            )
-            .execute()
-        )
-        settings = {s["setting_key"]: s["setting_value"] for s in (extract_list(settings_resp))}
+        settings = await SimulationSettingsCache.get(supabase, sim_str, "world")
 
         if not settings.get("bleed_enabled", True):
             return []
@@ -234,51 +225,22 @@ class EchoService:
         if impact < max(5, base_min_impact - 2):
             return []
 
-        # Get active connections from this simulation
-        conn_resp = await (
-            supabase.table("simulation_connections")
-            .select("*")
-            .eq("is_active", True)
-            .or_(f"simulation_a_id.eq.{sim_str},simulation_b_id.eq.{sim_str}")
-            .execute()
-        )
-        if not conn_resp.data:
+        # Active connections + metric weights from the in-memory graph index
+        edges = await MultiverseGraph.neighbors(supabase, sim_str)
+        if not edges:
             return []
-
-        # Fetch game metrics for threshold modification + strength calculation
-        source_health = await GameMechanicsService.get_simulation_health(
-            supabase,
-            simulation_id,
-        )
-        source_instability = 0.0
-        if source_health:
-            source_instability = max(0.0, 1.0 - source_health.get("overall_health", 0.5))
-
-        # Embassy effectiveness per target simulation (best per target)
-        embassy_data = await GameMechanicsService.list_embassy_effectiveness(
-            supabase,
-            simulation_id,
-        )
-        embassy_map: dict[str, float] = {}
-        for emb in embassy_data:
-            other_sim = (
-                emb.get("simulation_b_id") if emb.get("simulation_a_id") == sim_str else emb.get("simulation_a_id")
-            )
-            if other_sim:
-                embassy_map[other_sim] = max(
-                    embassy_map.get(other_sim, 0.0),
-                    float(emb.get("effectiveness", 0.0)),
-                )
+        source_instability = await MultiverseGraph.instability(supabase, sim_str)
 
         event_tags = event.get("tags") or []
 
         # Build candidate list with per-target threshold + strength
         candidates = []
-        for conn in conn_resp.data:
-            target_sim = conn["simulation_b_id"] if conn["simulation_a_id"] == sim_str else conn["simulation_a_id"]
-            connection_strength = float(conn.get("strength", 0.5))
-            emb_eff = embassy_map.get(target_sim, 0.0)
-            conn_vectors = conn.get("bleed_vectors") or []
+        for edge in edges:
+            target_sim = edge.target
+            conn = edge.connection
+            connection_strength = edge.strength
+            emb_eff = edge.embassy_effectiveness
+            conn_vectors = edge.bleed_vectors
 
             # Per-target threshold modification
             modified_threshold = base_min_impact
@@ -594,39 +556,12 @@ class EchoService:
         """
         sim_str = str(source_simulation_id)
 
-        # Get source instability
-        source_health = await GameMechanicsService.get_simulation_health(
-            supabase,
-            source_simulation_id,
-        )
-        source_instability = 0.0
-        if source_health:
-            source_instability = max(0.0, 1.0 - source_health.get("overall_health", 0.5))
-
-        # Get embassy effectiveness for this pair
-        embassy_data = await GameMechanicsService.list_embassy_effectiveness(
-            supabase,
-            source_simulation_id,
-        )
-        target_str = str(target_simulation_id)
-        emb_eff = 0.0
-        for emb in embassy_data:
-            other = emb.get("simulation_b_id") if emb.get("simulation_a_id") == sim_str else emb.get("simulation_a_id")
-            if other == target_str:
-                emb_eff = max(emb_eff, float(emb.get("effectiveness", 0.0)))
+        source_instability = await MultiverseGraph.instability(supabase, sim_str)
+        emb_eff = await MultiverseGraph.embassy_effectiveness(supabase, sim_str, target_simulation_id)
 
         # Get strength decay
-        settings_resp = await (
-            supabase.table("simulation_settings")
-            .select("setting_value")
-            .eq("simulation_id", sim_str)
-            .eq("category", "world")
-            .eq("setting_key", "bleed_strength_decay")
-            .execute()
-        )
-        strength_decay = 0.6
-        if settings_resp.data:
-            strength_decay = float(settings_resp.data[0].get("setting_value", 0.6))
+        world_settings = await SimulationSettingsCache.get(supabase, sim_str, "world")
+        strength_decay = world_settings.get_float("bleed_strength_decay", 0.6)
 
         tag_resonance = cls.count_tag_resonance(event_tags, echo_vector)
 
@@ -7,6 +7,9 @@ Architecture: Hybrid (eager asyncio timer + polling sweep)
 Both paths converge on fn_check_and_resolve_deadline CAS RPC — only one
 caller wins, the other gets resolved=false. Safe under concurrent workers.
 
+A sweep resolves its due epochs concurrently (bounded) and logs a timing
+report: wall time, DB round trips and per-stage breakdown per epoch.
+
 Follows the ResonanceScheduler pattern (lifespan registration).
 """
 
@@ -14,6 +17,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import UTC, datetime
 from uuid import UUID
 
@@ -24,6 +28,7 @@ from postgrest.exceptions import APIError as PostgrestAPIError
 from backend.dependencies import get_admin_supabase
 from backend.models.epoch import DEFAULT_EPOCH_CONFIG
 from backend.services.battle_log_service import BattleLogService
+from backend.services.query_stats_service import QueryStatsService
 from backend.utils.db import maybe_single_data
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
@@ -33,6 +38,8 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONFIG = DEFAULT_EPOCH_CONFIG
 
 _SWEEP_INTERVAL = 30  # seconds
+# Epochs sharing a deadline resolve concurrently, bounded like heartbeat ticks.
+_MAX_CONCURRENT_RESOLUTIONS = 3
 
 
 class EpochCycleScheduler:
@@ -80,8 +87,14 @@ class EpochCycleScheduler:
             await asyncio.sleep(_SWEEP_INTERVAL)
 
     @classmethod
-    async def _sweep_expired_cycles(cls, admin: Client) -> None:
-        """Query active epochs with expired deadlines."""
+    async def _sweep_expired_cycles(cls, admin: Client) -> list[dict]:
+        """Resolve every epoch whose deadline has passed.
+
+        Epochs are independent, so they resolve concurrently (at most
+        ``_MAX_CONCURRENT_RESOLUTIONS`` at a time) — epochs sharing a
+        deadline no longer wait for each other's pipelines. Returns the
+        pass's timing report (one row per epoch) and logs a summary.
+        """
         now = datetime.now(UTC).isoformat()
         resp = await (
             admin.table("game_epochs")
@@ -91,22 +104,78 @@ class EpochCycleScheduler:
             .lte("cycle_deadline_at", now)
             .execute()
         )
-        for epoch in extract_list(resp):
-            try:
-                await cls._auto_resolve_cycle(admin, epoch)
-            except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError) as exc:
-                logger.exception(
-                    "Auto-resolve failed for epoch %s",
-                    epoch.get("id"),
-                    extra={"epoch_id": epoch.get("id")},
-                )
-                sentry_sdk.capture_exception(exc)
+        epochs = extract_list(resp)
+        if not epochs:
+            return []
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_RESOLUTIONS)
+
+        async def _resolve_with_limit(epoch: dict) -> dict:
+            async with semaphore:
+                try:
+                    return await cls._resolve_timed(admin, epoch)
+                except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError) as exc:
+                    logger.exception(
+                        "Auto-resolve failed for epoch %s",
+                        epoch.get("id"),
+                        extra={"epoch_id": epoch.get("id")},
+                    )
+                    sentry_sdk.capture_exception(exc)
+                    return {"epoch_id": str(epoch.get("id")), "resolved": False, "ok": False}
+
+        t0 = time.perf_counter()
+        report = list(await asyncio.gather(*[_resolve_with_limit(epoch) for epoch in epochs]))
+        cls._log_pass_report(report, time.perf_counter() - t0)
+        return report
+
+    @classmethod
+    async def _resolve_timed(cls, admin: Client, epoch: dict) -> dict:
+        """Auto-resolve one epoch and return its timing report row."""
+        timings: list[dict] = []
+        t0 = time.perf_counter()
+        with QueryStatsService.track("job:cycle_resolution") as calls:
+            resolved = await cls._auto_resolve_cycle(admin, epoch, timings=timings)
+        return {
+            "epoch_id": str(epoch["id"]),
+            "cycle_number": epoch.get("current_cycle"),
+            "resolved": bool(resolved),
+            "ok": True,
+            "ms": round((time.perf_counter() - t0) * 1000, 1),
+            "db_calls": calls.db_calls,
+            "stages": timings,
+        }
+
+    @staticmethod
+    def _log_pass_report(report: list[dict], elapsed_s: float) -> None:
+        resolved = [r for r in report if r.get("resolved")]
+        if not resolved and all(r.get("ok") for r in report):
+            return  # every CAS lost — another worker resolved these epochs
+        slowest = max(resolved, key=lambda r: r["ms"], default=None)
+        logger.info(
+            "Cycle resolution pass: %d epoch(s) in %.0fms",
+            len(resolved),
+            elapsed_s * 1000,
+            extra={
+                "epochs_due": len(report),
+                "epochs_resolved": len(resolved),
+                "epochs_failed": sum(1 for r in report if not r.get("ok")),
+                "pass_ms": round(elapsed_s * 1000, 1),
+                "serial_ms": round(sum(r["ms"] for r in resolved), 1),
+                "db_calls": sum(r["db_calls"] for r in resolved),
+                "slowest_epoch_id": slowest["epoch_id"] if slowest else None,
+                "slowest_stages": {s["phase"]: s["ms"] for s in slowest["stages"]} if slowest else None,
+            },
+        )
 
     # ── Auto-Resolve Pipeline ────────────────────────────────
 
     @classmethod
-    async def _auto_resolve_cycle(cls, admin: Client, epoch: dict) -> None:
-        """Atomic auto-resolve via CAS RPC, then AFK + full pipeline."""
+    async def _auto_resolve_cycle(cls, admin: Client, epoch: dict, *, timings: list[dict] | None = None) -> bool:
+        """Atomic auto-resolve via CAS RPC, then AFK + full pipeline.
+
+        Returns False when another caller won the CAS. ``timings`` collects
+        per-stage profile records (see ``resolve_cycle_full``).
+        """
         epoch_id = epoch["id"]
         current_cycle = epoch["current_cycle"]
 
@@ -118,7 +187,7 @@ class EpochCycleScheduler:
 
         result = check.data
         if not result or not result.get("resolved"):
-            return  # Already resolved or not yet due
+            return False  # Already resolved or not yet due
 
         config = {**DEFAULT_CONFIG, **(epoch.get("config") or {})}
 
@@ -148,7 +217,8 @@ class EpochCycleScheduler:
         # Full resolve pipeline (identical to toggle_ready auto-resolve)
         from backend.services.epoch_service import EpochService
 
-        await EpochService.resolve_cycle_full(admin, UUID(str(epoch_id)), admin)
+        await EpochService.resolve_cycle_full(admin, UUID(str(epoch_id)), admin, timings=timings)
+        return True
 
     # ── Eager Timer ──────────────────────────────────────────
 
@@ -189,7 +259,7 @@ class EpochCycleScheduler:
                 .maybe_single()
             )
             if epoch_data:
-                await cls._auto_resolve_cycle(admin, epoch_data)
+                await cls._resolve_timed(admin, epoch_data)
         except asyncio.CancelledError:
             pass
         except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError) as exc:
@@ -6,6 +6,7 @@ from uuid import UUID
 
 from backend.models.epoch import DEFAULT_EPOCH_CONFIG
 from backend.services.bot_personality import auto_draft
+from backend.utils.data_loader import DataLoaders
 from backend.utils.db import resolve_epoch_sim_names
 from backend.utils.errors import bad_request, conflict, not_found, server_error
 from backend.utils.responses import extract_list
@@ -153,6 +154,8 @@ class EpochParticipationService:
         epoch_id: UUID,
         simulation_id: UUID,
         agent_ids: list[UUID],
+        *,
+        loaders: DataLoaders | None = None,
     ) -> dict:
         """Lock in a draft roster for a participant."""
         from backend.services.epoch_service import EpochService
@@ -167,17 +170,11 @@ class EpochParticipationService:
         if len(agent_ids) > max_agents:
             raise bad_request(f"Cannot draft more than {max_agents} agents.")
 
-        # Verify all agents belong to the participant's simulation
-        for aid in agent_ids:
-            agent_resp = await (
-                supabase.table("agents")
-                .select("id")
-                .eq("id", str(aid))
-                .eq("simulation_id", str(simulation_id))
-                .is_("deleted_at", "null")
-                .execute()
-            )
-            if not agent_resp.data:
+        # Verify all agents belong to the participant's simulation (one batched query)
+        loaders = loaders or DataLoaders(supabase)
+        agents = await loaders.get("agents", select="id, simulation_id, deleted_at").load_many(agent_ids)
+        for aid, agent in zip(agent_ids, agents, strict=True):
+            if not agent or agent["simulation_id"] != str(simulation_id) or agent.get("deleted_at"):
                 raise bad_request(f"Agent {aid} not found in simulation {simulation_id}.")
 
         # Update participant row
@@ -17,6 +17,7 @@ from backend.services.constants import EVENT_STATUSES
 from backend.services.game_mechanics_service import GameMechanicsService
 from backend.services.platform_config_service import PlatformConfigService
 from backend.utils.errors import bad_request, not_found, server_error
+from backend.utils.pagination import CountMode, apply_page
 from backend.utils.responses import extract_list
 from backend.utils.search import apply_search_filter
 from supabase import AsyncClient as Client
@@ -29,6 +30,8 @@ class EventService(BaseService):
 
     table_name = "events"
     view_name = "active_events"
+    list_order_by = "occurred_at"
+    list_order_desc = True
     supports_created_by = False
 
     @classmethod
@@ -45,15 +48,17 @@ class EventService(BaseService):
         date_to: datetime | None = None,
         limit: int = 25,
         offset: int = 0,
+        cursor: str | None = None,
+        count: CountMode = "exact",
         include_deleted: bool = False,
     ) -> tuple[list[dict], int]:
         """List events with optional filters."""
         table = cls._read_table(include_deleted)
         query = (
             supabase.table(table)
-            .select("*", count="exact")
+            .select("*", count=count)
             .eq("simulation_id", str(simulation_id))
-            .order("occurred_at", desc=True)
+            .order(cls.list_order_by, desc=cls.list_order_desc)
         )
 
         if event_type:
@@ -69,7 +74,14 @@ class EventService(BaseService):
         if search:
             query = apply_search_filter(query, search, "search_vector", "title")
 
-        query = query.range(offset, offset + limit - 1)
+        query = apply_page(
+            query,
+            order_by=cls.list_order_by,
+            order_desc=cls.list_order_desc,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
         response = await query.execute()
 
         total = response.count if response.count is not None else len(extract_list(response))
@@ -294,11 +306,7 @@ class EventService(BaseService):
             .limit(1)
             .execute()
         )
-        content_locale = (
-            str(locale_resp.data[0].get("setting_value", "de"))
-            if locale_resp.data
-            else "de"
-        )
+        content_locale = str(locale_resp.data[0].get("setting_value", "de")) if locale_resp.data else "de"
 
         event_id = UUID(event["id"])
         existing = await cls.get_reactions(supabase, simulation_id, event_id)
@@ -15,6 +15,7 @@ import httpx
 
 from backend.config import settings
 from backend.services.circuit_breaker_service import circuit_breaker
+from backend.utils.call_stats import note_llm_call
 from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
@@ -193,6 +194,7 @@ class OpenRouterService:
             extra={"model": model, "purpose": purpose, "max_tokens": max_tokens},
         )
         t0 = time.monotonic()
+        note_llm_call()
 
         for attempt in range(MAX_RETRIES + 1):
             try:
@@ -370,6 +372,7 @@ class OpenRouterService:
             extra={"model": model, "purpose": purpose, "max_tokens": max_tokens},
         )
         t0 = time.monotonic()
+        note_llm_call()
         last_error: Exception | None = None
 
         for attempt in range(MAX_RETRIES + 1):
@@ -545,6 +548,7 @@ class OpenRouterService:
             extra={"model": model, "prompt": prompt[:80], "aspect": aspect_ratio, "size": image_size},
         )
         t0 = time.monotonic()
+        note_llm_call()
 
         last_error: Exception | None = None
         for attempt in range(MAX_RETRIES + 1):
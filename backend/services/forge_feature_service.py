@@ -89,6 +89,23 @@ class ForgeFeatureService:
             update["result"] = result  # type: ignore[assignment]
         await supabase.table("feature_purchases").update(update).eq("id", purchase_id).execute()
 
+    @staticmethod
+    async def report_progress(
+        supabase: Client,
+        purchase_id: str,
+        phase: str,
+        current: int,
+        total: int,
+    ) -> None:
+        """Record progress of a running feature in ``result.progress`` (polled by the client).
+
+        Merged server-side (migration 246) so the rest of ``result`` survives.
+        """
+        await supabase.rpc(
+            "fn_report_feature_progress",
+            {"p_purchase_id": purchase_id, "p_progress": {"phase": phase, "current": current, "total": total}},
+        ).execute()
+
     @staticmethod
     async def fail_feature(
         supabase: Client,
@@ -2,22 +2,53 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass
 from uuid import UUID, uuid4
 
+from backend.config import settings
 from backend.services.ai_usage_service import AIUsageService
 from backend.services.external.replicate import ReplicateService
 from backend.services.generation_service import GenerationService
+from backend.services.image_rendition_service import DUAL_AVIF, EncodedRendition
+from backend.services.image_rendition_service import encode as encode_renditions
 from backend.services.model_resolver import ModelResolver
 from backend.services.style_reference_service import StyleReferenceService
-from backend.utils.image import AVIF_QUALITY, AVIF_QUALITY_THUMB, MAX_IMAGE_DIMENSION, convert_to_avif
+from backend.utils.image import decoded_size_estimate
+from backend.utils.memory_budget import MemoryBudget
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ImagePipeline:
+    """Stage limits shared by the concurrent image jobs of one forge batch.
+
+    Jobs spend most of their time waiting on OpenRouter (prompt) and
+    Replicate (pixels); each provider gets its own slot count. Between
+    stages a job holds only compressed bytes — decoded frames exist only
+    inside the encode stage, which reserves its estimated peak from
+    ``encode_budget`` first, so RAM stays bounded however many jobs run.
+    """
+
+    openrouter: asyncio.Semaphore
+    replicate: asyncio.Semaphore
+    encode_budget: MemoryBudget
+
+    @classmethod
+    def from_settings(cls) -> ImagePipeline:
+        return cls(
+            openrouter=asyncio.Semaphore(settings.forge_openrouter_concurrency),
+            replicate=asyncio.Semaphore(settings.forge_replicate_concurrency),
+            encode_budget=MemoryBudget(settings.forge_image_memory_budget_mb * 1024 * 1024),
+        )
+
+
 class ForgeImageService:
     """Orchestrates image generation: description -> Replicate -> AVIF -> Storage."""
 
@@ -28,8 +59,10 @@ class ForgeImageService:
         replicate_api_key: str | None = None,
         openrouter_api_key: str | None = None,
         world_context: str = "",
+        pipeline: ImagePipeline | None = None,
     ):
         self._supabase = supabase
+        self._pipeline = pipeline
         self._simulation_id = simulation_id
         self._replicate = ReplicateService(api_key=replicate_api_key)
         self._generation = GenerationService(
@@ -41,6 +74,12 @@ class ForgeImageService:
 
         self._model_resolver = ModelResolver(supabase, simulation_id)
 
+    def _stage(self, provider: str) -> AbstractAsyncContextManager:
+        """Provider slot of the batch pipeline; no limit for single requests."""
+        if self._pipeline is None:
+            return nullcontext()
+        return getattr(self._pipeline, provider)
+
     @staticmethod
     def _sanitize_prompt(description: str) -> str:
         """Strip markdown formatting and meta-text from AI-generated image prompts.
@@ -85,13 +124,20 @@ class ForgeImageService:
            (e.g. localhost Supabase storage), so we download the image.
         2. Storage uses AVIF for efficiency, but many Replicate models
            only support PNG/JPEG/WebP — convert to PNG for compatibility.
-        """
-        from PIL import Image
 
+        The AVIF decode + PNG encode runs in a worker thread, off the event
+        loop the other jobs of a forge batch share.
+        """
         from backend.utils.safe_fetch import safe_download
 
         allowed = {"image/png", "image/jpeg", "image/webp", "image/avif", "image/gif"}
         data, _ = await safe_download(url, allowed_content_types=allowed)
+        return await asyncio.to_thread(ForgeImageService._reference_png, data)
+
+    @staticmethod
+    def _reference_png(data: bytes) -> io.BytesIO:
+        from PIL import Image
+
         img = Image.open(io.BytesIO(data))
         buf = io.BytesIO()
         img.save(buf, format="PNG")
@@ -111,23 +157,24 @@ class ForgeImageService:
         replicate_client = ReplicateService(api_key=api_key) if api_key else self._replicate
         data = agent_data or {}
 
-        if description_override:
-            description = description_override
-            logger.debug(
-                "Using description override for agent",
-                extra={"entity_type": "agent", "entity_id": str(agent_id)},
-            )
-        elif data.get("is_ambassador"):
-            description = await self._generate_ambassador_description(
-                agent_name,
-                data,
-            )
-        else:
-            description = await self._generation.generate_portrait_description(
-                agent_name=agent_name,
-                agent_data=agent_data,
-                locale="en",
-            )
+        async with self._stage("openrouter"):
+            if description_override:
+                description = description_override
+                logger.debug(
+                    "Using description override for agent",
+                    extra={"entity_type": "agent", "entity_id": str(agent_id)},
+                )
+            elif data.get("is_ambassador"):
+                description = await self._generate_ambassador_description(
+                    agent_name,
+                    data,
+                )
+            else:
+                description = await self._generation.generate_portrait_description(
+                    agent_name=agent_name,
+                    agent_data=agent_data,
+                    locale="en",
+                )
 
         logger.debug("Portrait description generated", extra={"entity_type": "agent", "entity_id": str(agent_id)})
 
@@ -159,22 +206,24 @@ class ForgeImageService:
             ref_bytes = await self._download_reference_image(ref["url"])
             params = image_model.to_replicate_params()
             params["image"] = ref_bytes  # override URL with file-like object
-            raw_bytes = await replicate_client.generate_image(
-                model=image_model.model,
-                prompt=description,
-                prompt_key=image_model.prompt_param_name,
-                **params,
-            )
+            async with self._stage("replicate"):
+                raw_bytes = await replicate_client.generate_image(
+                    model=image_model.model,
+                    prompt=description,
+                    prompt_key=image_model.prompt_param_name,
+                    **params,
+                )
         else:
             image_model = await self._model_resolver.resolve_image_model(
                 "agent_portrait",
             )
-            raw_bytes = await replicate_client.generate_image(
-                model=image_model.model,
-                prompt=description,
-                prompt_key=image_model.prompt_param_name,
-                **image_model.to_replicate_params(),
-            )
+            async with self._stage("replicate"):
+                raw_bytes = await replicate_client.generate_image(
+                    model=image_model.model,
+                    prompt=description,
+                    prompt_key=image_model.prompt_param_name,
+                    **image_model.to_replicate_params(),
+                )
 
         # 4. Upload dual-resolution AVIF (full-res + thumbnail)
         filename = f"{self._simulation_id}/{agent_id}/{uuid4()}.avif"
@@ -211,23 +260,24 @@ class ForgeImageService:
         replicate_client = ReplicateService(api_key=api_key) if api_key else self._replicate
         data = building_data or {}
 
-        if description_override:
-            description = description_override
-            logger.debug(
-                "Using description override for building",
-                extra={"entity_type": "building", "entity_id": str(building_id)},
-            )
-        elif data.get("special_type") == "embassy":
-            description = await self._generate_embassy_description(
-                building_name,
-                data,
-            )
-        else:
-            description = await self._generation.generate_building_image_description(
-                building_name=building_name,
-                building_type=building_type,
-                building_data=building_data,
-            )
+        async with self._stage("openrouter"):
+            if description_override:
+                description = description_override
+                logger.debug(
+                    "Using description override for building",
+                    extra={"entity_type": "building", "entity_id": str(building_id)},
+                )
+            elif data.get("special_type") == "embassy":
+                description = await self._generate_embassy_description(
+                    building_name,
+                    data,
+                )
+            else:
+                description = await self._generation.generate_building_image_description(
+                    building_name=building_name,
+                    building_type=building_type,
+                    building_data=building_data,
+                )
 
         logger.debug(
             "Building image description generated",
@@ -260,22 +310,24 @@ class ForgeImageService:
             ref_bytes = await self._download_reference_image(ref["url"])
             params = image_model.to_replicate_params()
             params["image"] = ref_bytes
-            raw_bytes = await replicate_client.generate_image(
-                model=image_model.model,
-                prompt=description,
-                prompt_key=image_model.prompt_param_name,
-                **params,
-            )
+            async with self._stage("replicate"):
+                raw_bytes = await replicate_client.generate_image(
+                    model=image_model.model,
+                    prompt=description,
+                    prompt_key=image_model.prompt_param_name,
+                    **params,
+                )
         else:
             image_model = await self._model_resolver.resolve_image_model(
                 "building_image",
             )
-            raw_bytes = await replicate_client.generate_image(
-                model=image_model.model,
-                prompt=description,
-                prompt_key=image_model.prompt_param_name,
-                **image_model.to_replicate_params(),
-            )
+            async with self._stage("replicate"):
+                raw_bytes = await replicate_client.generate_image(
+                    model=image_model.model,
+                    prompt=description,
+                    prompt_key=image_model.prompt_param_name,
+                    **image_model.to_replicate_params(),
+                )
 
         # 4. Upload dual-resolution AVIF (full-res + thumbnail)
         filename = f"{self._simulation_id}/{building_id}/{uuid4()}.avif"
@@ -321,12 +373,13 @@ class ForgeImageService:
         )
         zone_summaries = [f"{z['name']}: {z['description']}" for z in extract_list(zones_resp) if z.get("description")]
 
-        description = await self._generation.generate_banner_description(
-            sim_name=sim_name,
-            sim_description=sim_description,
-            zone_summaries=zone_summaries,
-            anchor_data=anchor_data,
-        )
+        async with self._stage("openrouter"):
+            description = await self._generation.generate_banner_description(
+                sim_name=sim_name,
+                sim_description=sim_description,
+                zone_summaries=zone_summaries,
+                anchor_data=anchor_data,
+            )
 
         description = self._sanitize_prompt(description)
 
@@ -338,11 +391,12 @@ class ForgeImageService:
         params = image_model.to_replicate_params()
         params["aspect_ratio"] = "16:9"
 
-        raw_bytes = await self._replicate.generate_image(
-            model=image_model.model,
-            prompt=description,
-            **params,
-        )
+        async with self._stage("replicate"):
+            raw_bytes = await self._replicate.generate_image(
+                model=image_model.model,
+                prompt=description,
+                **params,
+            )
 
         filename = f"{self._simulation_id}/banner/{uuid4()}.avif"
         url = await self._upload_dual_resolution(
@@ -386,13 +440,14 @@ class ForgeImageService:
         directly as the Replicate prompt — no LLM re-generation needed.
         Falls back to LLM-powered description from section body otherwise.
         """
-        if image_caption:
-            description = image_caption
-        else:
-            description = await self._generation.generate_lore_image_description(
-                section_title=section_title,
-                section_body=section_body,
-            )
+        async with self._stage("openrouter"):
+            if image_caption:
+                description = image_caption
+            else:
+                description = await self._generation.generate_lore_image_description(
+                    section_title=section_title,
+                    section_body=section_body,
+                )
 
         description = self._sanitize_prompt(description)
 
@@ -404,21 +459,19 @@ class ForgeImageService:
         params = image_model.to_replicate_params()
         params["aspect_ratio"] = "3:2"
 
-        raw_bytes = await self._replicate.generate_image(
-            model=image_model.model,
-            prompt=description,
-            prompt_key=image_model.prompt_param_name,
-            **params,
-        )
+        async with self._stage("replicate"):
+            raw_bytes = await self._replicate.generate_image(
+                model=image_model.model,
+                prompt=description,
+                prompt_key=image_model.prompt_param_name,
+                **params,
+            )
 
         # Upload path matches LoreScroll convention: /{sim_slug}/lore/{image_slug}.avif
         path = f"{sim_slug}/lore/{image_slug}.avif"
-        full_avif = convert_to_avif(raw_bytes, max_dimension=None, quality=AVIF_QUALITY)
-        thumb_avif = convert_to_avif(raw_bytes, max_dimension=MAX_IMAGE_DIMENSION, quality=AVIF_QUALITY_THUMB)
-
-        full_path = path.replace(".avif", ".full.avif")
-        await self._upload_to_storage("simulation.assets", full_path, full_avif)
-        url = await self._upload_to_storage("simulation.assets", path, thumb_avif)
+        encoded = await self._encode(raw_bytes)
+        del raw_bytes
+        url = (await self._upload_renditions("simulation.assets", path, encoded))["thumb"]
 
         # Mark section AFTER upload succeeds — prevents orphaned DB state
         # where image_generated_at is set but no file exists in storage.
@@ -606,38 +659,52 @@ class ForgeImageService:
         Full-res file: {uuid}.full.avif (native resolution, quality 85)
         Thumbnail file: {uuid}.avif (max 1024px, quality 80)
         """
-        full_avif = convert_to_avif(
-            raw_bytes,
-            max_dimension=None,
-            quality=AVIF_QUALITY,
-        )
-        thumb_avif = convert_to_avif(
-            raw_bytes,
-            max_dimension=MAX_IMAGE_DIMENSION,
-            quality=AVIF_QUALITY_THUMB,
+        encoded = await self._encode(raw_bytes)
+        return (await self._upload_renditions(bucket, base_path, encoded))["thumb"]
+
+    async def _encode(self, raw_bytes: bytes) -> list[EncodedRendition]:
+        """Encode the dual-AVIF renditions off-loop, inside the pipeline's memory budget."""
+        reservation = (
+            self._pipeline.encode_budget.reserve(decoded_size_estimate(raw_bytes))
+            if self._pipeline is not None
+            else nullcontext()
         )
+        async with reservation:
+            return await encode_renditions(raw_bytes, DUAL_AVIF)
 
-        full_path = base_path.replace(".avif", ".full.avif")
-        await self._upload_to_storage(bucket, full_path, full_avif)
-        thumb_url = await self._upload_to_storage(bucket, base_path, thumb_avif)
-
+    async def _upload_renditions(
+        self,
+        bucket: str,
+        base_path: str,
+        encoded: list[EncodedRendition],
+    ) -> dict[str, str]:
+        """Upload all renditions concurrently. Returns public URL per rendition name."""
+        urls = await asyncio.gather(
+            *(
+                self._upload_to_storage(
+                    bucket, item.rendition.path_for(base_path), item.data, item.rendition.content_type
+                )
+                for item in encoded
+            )
+        )
         logger.debug(
-            "Dual upload complete",
-            extra={"path": base_path, "thumb_bytes": len(thumb_avif), "full_bytes": len(full_avif)},
+            "Rendition upload complete",
+            extra={"path": base_path, "sizes": {item.rendition.name: len(item.data) for item in encoded}},
         )
-        return thumb_url
+        return {item.rendition.name: url for item, url in zip(encoded, urls, strict=True)}
 
     async def _upload_to_storage(
         self,
         bucket: str,
         path: str,
         data: bytes,
+        content_type: str = "image/avif",
     ) -> str:
         """Upload file to Supabase Storage and return the public URL."""
         await self._supabase.storage.from_(bucket).upload(
             path,
             data,
-            {"content-type": "image/avif", "upsert": "true"},
+            {"content-type": content_type, "upsert": "true"},
         )
 
         result = await self._supabase.storage.from_(bucket).get_public_url(path)
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import time
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
 from uuid import UUID
 
 import httpx
@@ -30,7 +33,7 @@ from backend.services.external.openrouter import OpenRouterError
 from backend.services.external.replicate import ReplicateBillingError, ReplicateError
 from backend.services.forge_draft_service import ForgeDraftService
 from backend.services.forge_entity_translation_service import ForgeEntityTranslationService
-from backend.services.forge_image_service import ForgeImageService
+from backend.services.forge_image_service import ForgeImageService, ImagePipeline
 from backend.services.forge_lore_service import ForgeLoreService
 from backend.services.forge_map_service import ForgeMapService
 from backend.services.forge_theme_service import ForgeThemeService
@@ -44,6 +47,15 @@ from supabase import AsyncClient as Client
 logger = logging.getLogger(__name__)
 
 
+class _ImageJob(NamedTuple):
+    """One image of a forge batch: what to log/report and how to run it."""
+
+    entity_type: str
+    entity_id: str
+    entity_name: str
+    run: Callable[[], Awaitable[object]]
+
+
 WORLD_ARCHITECT_PROMPT = (
     "You are a Senior World Architect at the Bureau of Impossible Geography. "
     "Your task is to generate cohesive, high-quality entities for a simulation Shard "
@@ -314,6 +326,7 @@ class ForgeOrchestratorService:
         anchor_data: dict | None = None,
         replicate_api_key: str | None = None,
         openrouter_api_key: str | None = None,
+        pipeline: ImagePipeline | None = None,
     ) -> ForgeImageService:
         """Build a ``ForgeImageService`` with world context from the simulation."""
         world_context = await ForgeOrchestratorService._build_world_context(
@@ -328,6 +341,7 @@ class ForgeOrchestratorService:
             replicate_api_key=replicate_api_key,
             openrouter_api_key=openrouter_api_key,
             world_context=world_context,
+            pipeline=pipeline,
         )
 
     @staticmethod
@@ -1075,6 +1089,158 @@ class ForgeOrchestratorService:
         # Signal transition to image generation phase
         await cls._update_lore_progress(supabase, simulation_id, {"phase": "images"})
 
+    @classmethod
+    async def _run_image_jobs(
+        cls,
+        supabase: Client,
+        simulation_id: UUID,
+        jobs: list[_ImageJob],
+    ) -> tuple[int, int]:
+        """Run image jobs concurrently through the batch pipeline.
+
+        At most ``forge_image_concurrency`` jobs are in flight; provider
+        slots and the encode memory budget live in the jobs' shared
+        ``ImagePipeline``. Progress goes to ``lore_progress`` (phase
+        "images") next to the per-entity counts of ``get_forge_progress``.
+        A Replicate billing error cancels the remaining jobs and is
+        re-raised. Returns ``(succeeded, failed)``.
+        """
+        slots = asyncio.Semaphore(max(1, settings.forge_image_concurrency))
+        progress_lock = asyncio.Lock()
+        counts = {"succeeded": 0, "failed": 0}
+
+        async def _run(job: _ImageJob) -> None:
+            async with slots:
+                logger.info(
+                    "Generating image",
+                    extra={"entity_type": job.entity_type, "entity_name": job.entity_name},
+                )
+                try:
+                    await job.run()
+                    counts["succeeded"] += 1
+                except ReplicateBillingError:
+                    raise
+                except (httpx.HTTPError, ReplicateError, OpenRouterError, KeyError, TypeError, ValueError, OSError):
+                    counts["failed"] += 1
+                    logger.exception(
+                        "Batch image gen failed",
+                        extra={"entity_type": job.entity_type, "entity_id": job.entity_id},
+                    )
+                    with sentry_sdk.push_scope() as scope:
+                        scope.set_tag("forge_phase", "batch_images")
+                        scope.set_tag("entity_type", job.entity_type)
+                        scope.set_context(
+                            "image_generation",
+                            {
+                                "simulation_id": str(simulation_id),
+                                "entity_id": str(job.entity_id),
+                                "entity_name": job.entity_name,
+                            },
+                        )
+                        sentry_sdk.capture_exception()
+
+            async with progress_lock:
+                try:
+                    await cls._update_lore_progress(
+                        supabase,
+                        simulation_id,
+                        {"phase": "images", "current": counts["succeeded"] + counts["failed"], "total": len(jobs)},
+                    )
+                except (PostgrestAPIError, httpx.HTTPError):
+                    logger.warning("Image progress update failed", exc_info=True)
+
+        tasks = [asyncio.create_task(_run(job)) for job in jobs]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return counts["succeeded"], counts["failed"]
+
+    @staticmethod
+    async def _generate_banner_and_boot_art(
+        supabase: Client,
+        simulation_id: UUID,
+        image_service: ForgeImageService,
+        sim_data: dict,
+        anchor_data: dict | None,
+    ) -> None:
+        """Banner image, then the terminal boot art rendered from it.
+
+        Boot art is attempted even when the banner failed (figlet-only
+        fallback); its own failures are logged and never fail the job.
+        """
+        banner_error: Exception | None = None
+        try:
+            await image_service.generate_banner_image(
+                sim_name=sim_data.get("name", "Unknown"),
+                sim_description=sim_data.get("description", ""),
+                anchor_data=anchor_data,
+            )
+        except ReplicateBillingError:
+            raise
+        except (httpx.HTTPError, ReplicateError, OpenRouterError, KeyError, TypeError, ValueError, OSError) as exc:
+            banner_error = exc
+
+        # ── Generate terminal boot art from the banner image ──
+        try:
+            from backend.services.forge_ascii_art_service import ForgeAsciiArtService
+
+            # Find the banner URL from storage
+            banner_resp = await supabase.storage.from_(
+                "simulation.banners",
+            ).list(str(simulation_id))
+            banner_url = None
+            if banner_resp:
+                # Pick the most recent banner file
+                files = sorted(banner_resp, key=lambda f: f.get("created_at", ""), reverse=True)
+                if files:
+                    banner_url = (
+                        f"{supabase.supabase_url}/storage/v1/object/public/"
+                        f"simulation.banners/{simulation_id}/{files[0]['name']}"
+                    )
+
+            sim_name = sim_data.get("name", "Unknown")
+            boot_art = await ForgeAsciiArtService.generate_boot_art(
+                simulation_name=sim_name,
+                banner_url=banner_url,
+            )
+            await (
+                supabase.table("simulation_settings")
+                .upsert(
+                    [
+                        {
+                            "simulation_id": str(simulation_id),
+                            "setting_key": "terminal_boot_art",
+                            "setting_value": boot_art,
+                            "category": "design",
+                        }
+                    ],
+                    on_conflict="simulation_id,category,setting_key",
+                )
+                .execute()
+            )
+            logger.info(
+                "Terminal boot art generated (%d chars, banner=%s)",
+                len(boot_art),
+                "yes" if banner_url else "figlet-only",
+            )
+        except (
+            httpx.HTTPError,
+            ReplicateError,
+            OpenRouterError,
+            ImportError,
+            KeyError,
+            TypeError,
+            ValueError,
+            OSError,
+        ):
+            logger.warning("Terminal boot art generation failed", exc_info=True)
+
+        if banner_error is not None:
+            raise banner_error
+
     @classmethod
     async def run_batch_generation(
         cls,
@@ -1088,8 +1254,9 @@ class ForgeOrchestratorService:
         """Background task: lore generation → image generation.
 
         Runs research + lore + translations first (needed for world_context),
-        then sequential image generation (banner → portraits → buildings → lore).
-        Optimized for 512MB RAM: processes one image at a time.
+        then image generation (banner, portraits, buildings, lore) as
+        concurrent jobs through a memory-budgeted ``ImagePipeline`` — RAM
+        stays bounded on 512MB containers while provider waits overlap.
 
         If entity_types is provided, only regenerate those types
         (e.g. {"lore"}, {"agent", "building"}).
@@ -1255,204 +1422,69 @@ class ForgeOrchestratorService:
             anchor_data,
             replicate_api_key=rep_key,
             openrouter_api_key=or_key,
+            pipeline=ImagePipeline.from_settings(),
         )
 
         _types = entity_types  # None = all types
-        images_succeeded = 0
-        images_failed = 0
-        img_counter = 0
+        jobs: list[_ImageJob] = []
 
-        # Count total images for progress tracking
-        img_total_parts: list[int] = []
+        # 1. Banner (+ terminal boot art derived from it)
         if not _types or "banner" in _types:
-            img_total_parts.append(1)
-        if not _types or "agent" in _types:
-            agent_count_resp = (
-                await supabase.table("agents")
-                .select("id", count="exact")
-                .eq(
-                    "simulation_id",
+            jobs.append(
+                _ImageJob(
+                    "banner",
                     str(simulation_id),
+                    sim_data.get("name", "Unknown"),
+                    functools.partial(
+                        cls._generate_banner_and_boot_art, supabase, simulation_id, image_service, sim_data, anchor_data
+                    ),
                 )
-                .execute()
             )
-            img_total_parts.append(agent_count_resp.count or 0)
-        if not _types or "building" in _types:
-            bldg_count_resp = (
-                await supabase.table("buildings")
-                .select("id", count="exact")
-                .eq(
-                    "simulation_id",
-                    str(simulation_id),
-                )
-                .execute()
-            )
-            img_total_parts.append(bldg_count_resp.count or 0)
-        if not _types or "lore" in _types:
-            lore_count_resp = (
-                await supabase.table("simulation_lore")
-                .select("id", count="exact")
-                .eq(
-                    "simulation_id",
-                    str(simulation_id),
-                )
-                .not_.is_("image_slug", "null")
+
+        # 2. Agent portraits
+        if not _types or "agent" in _types:
+            agents = await (
+                supabase.table("agents")
+                .select("id, name, character, background")
+                .eq("simulation_id", str(simulation_id))
                 .execute()
             )
-            img_total_parts.append(lore_count_resp.count or 0)
-        img_total = sum(img_total_parts)
-
-        try:
-            if not _types or "banner" in _types:
-                img_counter += 1
-                logger.info(
-                    "Generating image",
-                    extra={"entity_type": "banner", "progress": f"{img_counter}/{img_total}"},
-                )
-                try:
-                    await image_service.generate_banner_image(
-                        sim_name=sim_data.get("name", "Unknown"),
-                        sim_description=sim_data.get("description", ""),
-                        anchor_data=anchor_data,
-                    )
-                    images_succeeded += 1
-                except ReplicateBillingError:
-                    raise
-                except (httpx.HTTPError, ReplicateError, OpenRouterError, KeyError, TypeError, ValueError, OSError):
-                    images_failed += 1
-                    logger.exception("Banner generation failed")
-                    with sentry_sdk.push_scope() as scope:
-                        scope.set_tag("forge_phase", "batch_images")
-                        scope.set_tag("entity_type", "banner")
-                        scope.set_context("image_generation", {"simulation_id": str(simulation_id)})
-                        sentry_sdk.capture_exception()
-
-                # ── Generate terminal boot art from the banner image ──
-                try:
-                    from backend.services.forge_ascii_art_service import ForgeAsciiArtService
-
-                    # Find the banner URL from storage
-                    banner_resp = await supabase.storage.from_(
-                        "simulation.banners",
-                    ).list(str(simulation_id))
-                    banner_url = None
-                    if banner_resp:
-                        # Pick the most recent banner file
-                        files = sorted(banner_resp, key=lambda f: f.get("created_at", ""), reverse=True)
-                        if files:
-                            banner_url = (
-                                f"{supabase.supabase_url}/storage/v1/object/public/"
-                                f"simulation.banners/{simulation_id}/{files[0]['name']}"
-                            )
-
-                    sim_name = sim_data.get("name", "Unknown")
-                    boot_art = await ForgeAsciiArtService.generate_boot_art(
-                        simulation_name=sim_name,
-                        banner_url=banner_url,
-                    )
-                    await (
-                        supabase.table("simulation_settings")
-                        .upsert(
-                            [
-                                {
-                                    "simulation_id": str(simulation_id),
-                                    "setting_key": "terminal_boot_art",
-                                    "setting_value": boot_art,
-                                    "category": "design",
-                                }
-                            ],
-                            on_conflict="simulation_id,category,setting_key",
-                        )
-                        .execute()
-                    )
-                    logger.info(
-                        "Terminal boot art generated (%d chars, banner=%s)",
-                        len(boot_art),
-                        "yes" if banner_url else "figlet-only",
-                    )
-                except (
-                    httpx.HTTPError,
-                    ReplicateError,
-                    OpenRouterError,
-                    ImportError,
-                    KeyError,
-                    TypeError,
-                    ValueError,
-                    OSError,
-                ):
-                    logger.warning("Terminal boot art generation failed", exc_info=True)
-
-            # 2. Agent portraits
-            if not _types or "agent" in _types:
-                agents = await (
-                    supabase.table("agents")
-                    .select("id, name, character, background")
-                    .eq("simulation_id", str(simulation_id))
-                    .execute()
-                )
-                for agent_row in extract_list(agents):
-                    img_counter += 1
-                    logger.info(
-                        "Generating image",
-                        extra={
-                            "entity_type": "agent",
-                            "progress": f"{img_counter}/{img_total}",
-                            "entity_name": agent_row["name"],
-                        },
-                    )
-                    try:
-                        await image_service.generate_agent_portrait(
+            for agent_row in extract_list(agents):
+                jobs.append(
+                    _ImageJob(
+                        "agent",
+                        agent_row["id"],
+                        agent_row["name"],
+                        functools.partial(
+                            image_service.generate_agent_portrait,
                             agent_id=agent_row["id"],
                             agent_name=agent_row["name"],
                             agent_data={"character": agent_row["character"], "background": agent_row["background"]},
-                        )
-                        images_succeeded += 1
-                    except ReplicateBillingError:
-                        raise
-                    except (httpx.HTTPError, ReplicateError, OpenRouterError, KeyError, TypeError, ValueError, OSError):
-                        images_failed += 1
-                        logger.exception(
-                            "Batch image gen failed for agent",
-                            extra={"entity_type": "agent", "entity_id": agent_row["id"]},
-                        )
-                        with sentry_sdk.push_scope() as scope:
-                            scope.set_tag("forge_phase", "batch_images")
-                            scope.set_tag("entity_type", "agent")
-                            scope.set_context(
-                                "image_generation",
-                                {
-                                    "simulation_id": str(simulation_id),
-                                    "entity_id": str(agent_row["id"]),
-                                    "entity_name": agent_row["name"],
-                                },
-                            )
-                            sentry_sdk.capture_exception()
-
-            # 3. Building images
-            if not _types or "building" in _types:
-                buildings = await (
-                    supabase.table("buildings")
-                    .select(
-                        "id, name, description, building_type, building_condition,"
-                        " style, special_type, construction_year,"
-                        " population_capacity, zones(name)"
+                        ),
                     )
-                    .eq("simulation_id", str(simulation_id))
-                    .execute()
                 )
-                for building in extract_list(buildings):
-                    img_counter += 1
-                    logger.info(
-                        "Generating image",
-                        extra={
-                            "entity_type": "building",
-                            "progress": f"{img_counter}/{img_total}",
-                            "entity_name": building["name"],
-                        },
-                    )
-                    zone_data = building.get("zones") or {}
-                    try:
-                        await image_service.generate_building_image(
+
+        # 3. Building images
+        if not _types or "building" in _types:
+            buildings = await (
+                supabase.table("buildings")
+                .select(
+                    "id, name, description, building_type, building_condition,"
+                    " style, special_type, construction_year,"
+                    " population_capacity, zones(name)"
+                )
+                .eq("simulation_id", str(simulation_id))
+                .execute()
+            )
+            for building in extract_list(buildings):
+                zone_data = building.get("zones") or {}
+                jobs.append(
+                    _ImageJob(
+                        "building",
+                        building["id"],
+                        building["name"],
+                        functools.partial(
+                            image_service.generate_building_image,
                             building_id=building["id"],
                             building_name=building["name"],
                             building_type=building["building_type"],
@@ -1465,81 +1497,44 @@ class ForgeOrchestratorService:
                                 "population_capacity": building.get("population_capacity", ""),
                                 "zone_name": zone_data.get("name", ""),
                             },
-                        )
-                        images_succeeded += 1
-                    except ReplicateBillingError:
-                        raise
-                    except (httpx.HTTPError, ReplicateError, OpenRouterError, KeyError, TypeError, ValueError, OSError):
-                        images_failed += 1
-                        logger.exception(
-                            "Batch image gen failed for building",
-                            extra={"entity_type": "building", "entity_id": building["id"]},
-                        )
-                        with sentry_sdk.push_scope() as scope:
-                            scope.set_tag("forge_phase", "batch_images")
-                            scope.set_tag("entity_type", "building")
-                            scope.set_context(
-                                "image_generation",
-                                {
-                                    "simulation_id": str(simulation_id),
-                                    "entity_id": str(building["id"]),
-                                    "entity_name": building["name"],
-                                },
-                            )
-                            sentry_sdk.capture_exception()
-
-            # 4. Lore images (sections with image_slug)
-            if not _types or "lore" in _types:
-                sim_slug = sim_data.get("slug", str(simulation_id))
-                lore_sections = await (
-                    supabase.table("simulation_lore")
-                    .select("id, title, body, image_slug, image_caption")
-                    .eq("simulation_id", str(simulation_id))
-                    .not_.is_("image_slug", "null")
-                    .order("sort_order")
-                    .execute()
-                )
-                for section in extract_list(lore_sections):
-                    img_counter += 1
-                    logger.info(
-                        "Generating image",
-                        extra={
-                            "entity_type": "lore",
-                            "progress": f"{img_counter}/{img_total}",
-                            "entity_name": section["title"],
-                        },
+                        ),
                     )
-                    try:
-                        await image_service.generate_lore_image(
+                )
+
+        # 4. Lore images (sections with image_slug)
+        if not _types or "lore" in _types:
+            sim_slug = sim_data.get("slug", str(simulation_id))
+            lore_sections = await (
+                supabase.table("simulation_lore")
+                .select("id, title, body, image_slug, image_caption")
+                .eq("simulation_id", str(simulation_id))
+                .not_.is_("image_slug", "null")
+                .order("sort_order")
+                .execute()
+            )
+            for section in extract_list(lore_sections):
+                jobs.append(
+                    _ImageJob(
+                        "lore",
+                        section["id"],
+                        section["title"],
+                        functools.partial(
+                            image_service.generate_lore_image,
                             section_title=section["title"],
                             section_body=section["body"],
                             image_slug=section["image_slug"],
                             sim_slug=sim_slug,
                             section_id=section["id"],
                             image_caption=section.get("image_caption"),
-                        )
-                        images_succeeded += 1
-                    except ReplicateBillingError:
-                        raise
-                    except (httpx.HTTPError, ReplicateError, KeyError, TypeError, ValueError, OSError):
-                        images_failed += 1
-                        logger.exception(
-                            "Lore image gen failed",
-                            extra={"entity_type": "lore_section", "entity_id": section["id"]},
-                        )
-                        with sentry_sdk.push_scope() as scope:
-                            scope.set_tag("forge_phase", "batch_images")
-                            scope.set_tag("entity_type", "lore")
-                            scope.set_context(
-                                "image_generation",
-                                {
-                                    "simulation_id": str(simulation_id),
-                                    "entity_id": str(section["id"]),
-                                    "entity_name": section["title"],
-                                },
-                            )
-                            sentry_sdk.capture_exception()
+                        ),
+                    )
+                )
 
+        img_total = len(jobs)
+        images_succeeded = 0
+        images_failed = 0
+        try:
+            images_succeeded, images_failed = await cls._run_image_jobs(supabase, simulation_id, jobs)
         except ReplicateBillingError:
             logger.error(
                 "Replicate billing error — aborting all image generation. "
@@ -1547,14 +1542,7 @@ class ForgeOrchestratorService:
             )
             with sentry_sdk.push_scope() as scope:
                 scope.set_tag("forge_phase", "batch_images")
-                scope.set_context(
-                    "forge",
-                    {
-                        "simulation_id": str(simulation_id),
-                        "images_succeeded": images_succeeded,
-                        "images_failed": images_failed,
-                    },
-                )
+                scope.set_context("forge", {"simulation_id": str(simulation_id), "img_total": img_total})
                 sentry_sdk.capture_exception()
 
         phase_b_s = time.monotonic() - t_b
@@ -3,6 +3,7 @@
 import logging
 from uuid import UUID
 
+from backend.services.game_metrics_refresher import GameMetricsRefresher
 from backend.utils.db import maybe_single_data
 from backend.utils.errors import server_error
 from backend.utils.responses import extract_list
@@ -133,7 +134,7 @@ class GameInstanceService:
     @classmethod
     async def _refresh_game_metrics(cls, admin_supabase: Client) -> None:
         """Refresh all game materialized views after cloning via ``refresh_all_game_metrics`` (migration 031)."""
-        await admin_supabase.rpc("refresh_all_game_metrics", {}).execute()
+        await GameMetricsRefresher.refresh(admin_supabase)
         logger.debug("Refreshed game materialized views")
 
     @classmethod
@@ -6,7 +6,8 @@ for reads (materialized views don't have per-row RLS) and filters
 by simulation_id in the query.
 
 Views: ``mv_simulation_health``, ``mv_building_readiness``, ``mv_zone_stability``,
-``mv_embassy_effectiveness``. Refreshed via ``refresh_all_game_metrics`` RPC.
+``mv_embassy_effectiveness``. Refreshed via ``refresh_all_game_metrics`` RPC,
+coalesced by ``game_metrics_refresher``.
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ from uuid import UUID
 
 from fastapi import HTTPException
 
+from backend.services.game_metrics_refresher import GameMetricsRefresher
 from backend.utils.errors import not_found
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
@@ -365,6 +367,7 @@ class GameMechanicsService:
     async def refresh_metrics(supabase: Client) -> None:
         """Trigger a full refresh of all game mechanics materialized views.
 
-        Uses a Postgres RPC call to the refresh function.
+        Coalesced via ``GameMetricsRefresher``: concurrent callers share one
+        refresh that starts after their request (read-after-write preserved).
         """
-        await supabase.rpc("refresh_all_game_metrics", {}).execute()
+        await GameMetricsRefresher.refresh(supabase)
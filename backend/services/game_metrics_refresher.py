@@ -0,0 +1,111 @@
+"""Coalesced refresh of the game-metrics materialized views.
+
+``refresh_all_game_metrics`` (migration 031) runs ``REFRESH MATERIALIZED VIEW
+CONCURRENTLY`` on all four game MVs, which rebuilds them for EVERY
+simulation — Postgres cannot refresh a materialized view per row or per
+simulation. Running it once per simulation tick therefore cost N full
+rebuilds per heartbeat loop (N sims × all sims' rows).
+
+Two entry points replace the per-caller RPC:
+
+- ``mark_dirty(sim_id)`` + ``flush(admin)`` — the heartbeat marks each ticked
+  simulation dirty (phase 10) and flushes once after the whole loop, so a loop
+  with N due simulations costs exactly one refresh.
+- ``refresh(admin)`` — on-demand refresh for read-after-write paths (event
+  edits, zone actions, threshold checks, the admin button). Single-flight with
+  one trailing run: callers that arrive while a refresh is in flight share ONE
+  follow-up refresh that starts after their request, so every caller still
+  sees its own writes, and any burst of concurrent callers costs at most two
+  refreshes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from uuid import UUID
+
+from backend.services.multiverse_graph import MultiverseGraph
+from supabase import AsyncClient as Client
+
+logger = logging.getLogger(__name__)
+
+
+class GameMetricsRefresher:
+    """Process-wide coalescer for ``refresh_all_game_metrics``."""
+
+    _lock: asyncio.Lock | None = None
+    _requested: int = 0  # generation of the latest refresh request
+    _completed: int = 0  # latest request generation covered by a finished refresh
+    _dirty: set[str] = set()
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop all coalescing state (tests)."""
+        cls._lock = None
+        cls._requested = 0
+        cls._completed = 0
+        cls._dirty = set()
+
+    # ── Dirty tracking (heartbeat) ──────────────────────────────
+
+    @classmethod
+    def mark_dirty(cls, simulation_id: UUID | str) -> None:
+        """Record that a simulation's metric inputs changed; refreshed on the next flush."""
+        cls._dirty.add(str(simulation_id))
+
+    @classmethod
+    def dirty_simulations(cls) -> frozenset[str]:
+        return frozenset(cls._dirty)
+
+    @classmethod
+    async def flush(cls, admin: Client) -> int:
+        """Refresh once if any simulation is dirty. Returns the number of sims covered.
+
+        On failure the dirty set is restored, so the next flush retries.
+        """
+        if not cls._dirty:
+            return 0
+        flushed, cls._dirty = cls._dirty, set()
+        try:
+            await cls.refresh(admin)
+        except BaseException:
+            cls._dirty |= flushed
+            raise
+        return len(flushed)
+
+    # ── Single-flight refresh ───────────────────────────────────
+
+    @classmethod
+    async def refresh(cls, admin: Client) -> bool:
+        """Refresh all game MVs, sharing a run with concurrent callers.
+
+        Returns True if this call ran the RPC, False if a refresh that started
+        after this request already covered it.
+        """
+        cls._requested += 1
+        generation = cls._requested
+        async with cls._get_lock():
+            if cls._completed >= generation:
+                return False
+            # Everything requested up to now is covered by the run below.
+            covers = cls._requested
+            started = time.perf_counter()
+            await admin.rpc("refresh_all_game_metrics", {}).execute()
+            cls._completed = covers
+            MultiverseGraph.invalidate_metrics()
+            logger.debug(
+                "Refreshed game metrics materialized views",
+                extra={
+                    "coalesced_requests": covers - generation + 1,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            )
+            return True
@@ -0,0 +1,90 @@
+"""Heartbeat tick profiling — per-phase timing records and their rolling percentiles.
+
+Every ``_run_phase`` call appends one record to the tick's profile:
+wall time, PostgREST round trips and rows (``backend.utils.call_stats``),
+LLM requests, and whether the phase succeeded. The profile is stored in
+``simulation_heartbeats.summary.profile``; the admin dashboard aggregates
+the most recent ticks into p50/p95 per phase, platform-wide and per
+simulation.
+
+``start_cprofile()`` / ``stop_cprofile()`` wrap a single forced tick in
+cProfile for a function-level breakdown. cProfile sees the whole
+event-loop thread, so requests served while the tick runs show up in the
+report too.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import math
+import pstats
+from collections import defaultdict
+
+from backend.utils.call_stats import CallStats
+
+_PROFILE_TOP_FUNCTIONS = 40
+
+
+def phase_record(phase: str, elapsed_s: float, calls: CallStats, *, ok: bool) -> dict:
+    """One entry of ``summary.profile.phases``."""
+    return {"phase": phase, "ms": round(elapsed_s * 1000, 1), "ok": ok, **calls.as_dict()}
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (``q`` in 0..100) of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def aggregate_phases(profiles: list[dict]) -> list[dict]:
+    """Rolling per-phase statistics over tick profiles, in pipeline order."""
+    by_phase: dict[str, list[dict]] = defaultdict(list)
+    for profile in profiles:
+        for record in profile.get("phases") or []:
+            by_phase[record["phase"]].append(record)
+
+    rows = []
+    for phase, records in by_phase.items():
+        ms = [r["ms"] for r in records]
+        count = len(records)
+        rows.append(
+            {
+                "phase": phase,
+                "samples": count,
+                "p50_ms": percentile(ms, 50),
+                "p95_ms": percentile(ms, 95),
+                "avg_db_calls": round(sum(r.get("db_calls", 0) for r in records) / count, 1),
+                "avg_db_rows": round(sum(r.get("db_rows", 0) for r in records) / count, 1),
+                "avg_llm_calls": round(sum(r.get("llm_calls", 0) for r in records) / count, 2),
+                "failures": sum(1 for r in records if not r.get("ok", True)),
+            }
+        )
+    return rows
+
+
+def aggregate_ticks(profiles: list[dict]) -> dict:
+    """Tick-level wall-time percentiles plus the per-phase breakdown."""
+    tick_ms = [p["tick_ms"] for p in profiles if p.get("tick_ms") is not None]
+    return {
+        "samples": len(tick_ms),
+        "tick_p50_ms": percentile(tick_ms, 50) if tick_ms else None,
+        "tick_p95_ms": percentile(tick_ms, 95) if tick_ms else None,
+        "phases": aggregate_phases(profiles),
+    }
+
+
+def start_cprofile() -> cProfile.Profile:
+    """Start a cProfile session. Raises ValueError if another profiler is active (3.12+)."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def stop_cprofile(profiler: cProfile.Profile) -> str:
+    """Stop the session and return the top functions by cumulative time."""
+    profiler.disable()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(_PROFILE_TOP_FUNCTIONS)
+    return out.getvalue()
@@ -18,7 +18,10 @@ import asyncio
 import json
 import logging
 import random
+import time
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID, uuid4
 
 import httpx
@@ -37,13 +40,18 @@ from backend.services.attunement_service import AttunementService
 from backend.services.autonomous_event_service import AutonomousEventService
 from backend.services.bond.whisper_service import WhisperService
 from backend.services.bureau_response_service import BureauResponseService
-from backend.services.game_mechanics_service import GameMechanicsService
+from backend.services.game_metrics_refresher import GameMetricsRefresher
 from backend.services.heartbeat_entry_builder import make_heartbeat_entry
+from backend.services.heartbeat_profiler import aggregate_ticks, phase_record, start_cprofile, stop_cprofile
 from backend.services.narrative_arc_service import NarrativeArcService
 from backend.services.platform_config_service import PlatformConfigService
+from backend.services.query_stats_service import QueryStatsService
+from backend.services.simulation_settings_cache import SimulationSettingsCache
+from backend.services.weather_provider import WeatherProvider
+from backend.utils.call_stats import track_calls
 from backend.utils.db import maybe_single_data
 from backend.utils.encryption import decrypt
-from backend.utils.errors import not_found
+from backend.utils.errors import conflict, not_found
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
 
@@ -60,53 +68,63 @@ async def _run_phase(
     sim_id: UUID,
     tick_number: int,
     sim_name: str,
+    timings: list[dict] | None = None,
 ):
     """Execute a tick phase with error isolation, timing, and Sentry tagging.
 
     If the phase raises, the exception is captured (Sentry + logger) but the
     tick continues — partial results are better than a permanently stuck sim.
+    When ``timings`` is given, the phase's profile record (wall time, DB
+    round trips/rows, LLM calls) is appended to it.
 
     Returns the coroutine's result on success, or None on failure.
     The caller must handle None gracefully (``if result is not None:``).
     """
-    t0 = datetime.now(UTC)
-    try:
-        result = await coro
-        elapsed = (datetime.now(UTC) - t0).total_seconds()
-        logger.debug(
-            "Heartbeat phase %s completed in %.2fs for %s",
-            phase_name, elapsed, sim_name,
-            extra={
-                "simulation_id": str(sim_id),
-                "tick_number": tick_number,
-                "phase": phase_name,
-                "elapsed_s": elapsed,
-            },
-        )
-        return result
-    except Exception:
-        elapsed = (datetime.now(UTC) - t0).total_seconds()
-        logger.exception(
-            "Heartbeat phase %s failed after %.2fs for %s (tick #%d) — continuing",
-            phase_name, elapsed, sim_name, tick_number,
-            extra={
-                "simulation_id": str(sim_id),
-                "tick_number": tick_number,
-                "phase": phase_name,
-                "elapsed_s": elapsed,
-            },
-        )
-        with sentry_sdk.push_scope() as scope:
-            scope.set_tag("heartbeat.phase", phase_name)
-            scope.set_tag("simulation_id", str(sim_id))
-            scope.set_context("heartbeat", {
-                "tick_number": tick_number,
-                "simulation_name": sim_name,
-                "phase": phase_name,
-                "elapsed_s": elapsed,
-            })
-            sentry_sdk.capture_exception()
-        return None
+    t0 = time.perf_counter()
+    with track_calls() as calls:
+        try:
+            result = await coro
+        except Exception:
+            elapsed = time.perf_counter() - t0
+            if timings is not None:
+                timings.append(phase_record(phase_name, elapsed, calls, ok=False))
+            logger.exception(
+                "Heartbeat phase %s failed after %.2fs for %s (tick #%d) — continuing",
+                phase_name, elapsed, sim_name, tick_number,
+                extra={
+                    "simulation_id": str(sim_id),
+                    "tick_number": tick_number,
+                    "phase": phase_name,
+                    "elapsed_s": elapsed,
+                },
+            )
+            with sentry_sdk.push_scope() as scope:
+                scope.set_tag("heartbeat.phase", phase_name)
+                scope.set_tag("simulation_id", str(sim_id))
+                scope.set_context("heartbeat", {
+                    "tick_number": tick_number,
+                    "simulation_name": sim_name,
+                    "phase": phase_name,
+                    "elapsed_s": elapsed,
+                })
+                sentry_sdk.capture_exception()
+            return None
+
+    elapsed = time.perf_counter() - t0
+    if timings is not None:
+        timings.append(phase_record(phase_name, elapsed, calls, ok=True))
+    logger.debug(
+        "Heartbeat phase %s completed in %.2fs for %s",
+        phase_name, elapsed, sim_name,
+        extra={
+            "simulation_id": str(sim_id),
+            "tick_number": tick_number,
+            "phase": phase_name,
+            "elapsed_s": elapsed,
+            **calls.as_dict(),
+        },
+    )
+    return result
 
 
 # Defaults (overridable via platform_settings)
@@ -119,6 +137,7 @@ _DEFAULT_EVENT_AGING_RULES = {
     "resolved_to_archived": 8,
 }
 _MAX_CONCURRENT_TICKS = 3
+_PROFILE_WINDOW_TICKS = 500  # recent completed ticks aggregated on the admin dashboard
 _SYSTEM_ACTOR = UUID("00000000-0000-0000-0000-000000000000")
 
 
@@ -238,21 +257,17 @@ class HeartbeatService:
             prefix="heartbeat_",
         )
 
+    @staticmethod
+    def _weather_enabled(overrides: Mapping[str, Any]) -> bool:
+        """Phase 9.5 is opt-in per simulation (``weather_enabled``, default off)."""
+        return str(overrides.get("weather_enabled", "false")).lower() in ("true", "1")
+
     @classmethod
     async def _load_sim_overrides(cls, admin: Client, sim_id: UUID) -> dict:
         """Load per-simulation heartbeat overrides from simulation_settings."""
         overrides: dict = {}
         try:
-            _resp = await (
-                admin.table("simulation_settings")
-                .select("setting_key, setting_value")
-                .eq("simulation_id", str(sim_id))
-                .eq("category", "heartbeat")
-                .execute()
-            )
-            rows = extract_list(_resp)
-            for row in rows:
-                overrides[row["setting_key"]] = row["setting_value"]
+            overrides = dict(await SimulationSettingsCache.get(admin, sim_id, "heartbeat"))
         except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError):
             logger.warning(
                 "Failed to load sim heartbeat overrides for %s",
@@ -303,17 +318,62 @@ class HeartbeatService:
             extra={"due_count": len(due_sims)},
         )
 
+        # Per-sim heartbeat overrides: one query for every due sim instead of
+        # one per tick. On failure each tick loads its own.
+        try:
+            await SimulationSettingsCache.preload(admin, [sim["id"] for sim in due_sims], ["heartbeat"])
+        except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError):
+            logger.warning("Heartbeat settings preload failed", exc_info=True)
+
+        # One batched Open-Meteo request warms the weather cells of every due
+        # sim that runs phase 9.5, so those ticks read from cache instead of
+        # fetching per sim. Never raises — cold cells are fetched (or fall
+        # back) per tick; without preloaded settings nothing is prefetched.
+        weather_sims = [
+            sim
+            for sim in due_sims
+            if cls._weather_enabled(SimulationSettingsCache.peek(sim["id"], "heartbeat") or {})
+        ]
+        if weather_sims:
+            await WeatherProvider.prefetch([AmbientWeatherService._resolve_coordinates(sim) for sim in weather_sims])
+
         # Tick with concurrency limit
         semaphore = asyncio.Semaphore(_MAX_CONCURRENT_TICKS)
 
         async def _tick_with_limit(sim: dict) -> None:
             async with semaphore:
-                await cls._tick_simulation(admin, sim, interval)
+                with QueryStatsService.track("job:heartbeat_tick"):
+                    await cls._tick_simulation(admin, sim, interval)
 
         await asyncio.gather(
             *[_tick_with_limit(sim) for sim in due_sims],
             return_exceptions=True,
         )
+        await cls._flush_game_metrics(admin)
+
+    @classmethod
+    async def _flush_game_metrics(cls, admin: Client) -> None:
+        """Run the coalesced MV refresh for every sim ticked since the last flush.
+
+        Failure is non-fatal (same isolation as a tick phase): the dirty set is
+        kept and the next loop retries.
+        """
+        t0 = datetime.now(UTC)
+        try:
+            flushed = await GameMetricsRefresher.flush(admin)
+        except (PostgrestAPIError, httpx.HTTPError) as exc:
+            logger.exception("Heartbeat: game metrics refresh failed — retrying next loop")
+            with sentry_sdk.push_scope() as scope:
+                scope.set_tag("heartbeat.phase", "mv_refresh")
+                sentry_sdk.capture_exception(exc)
+            return
+        if flushed:
+            logger.info(
+                "Heartbeat: refreshed game metrics for %d simulation(s) in %.2fs",
+                flushed,
+                (datetime.now(UTC) - t0).total_seconds(),
+                extra={"phase": "mv_refresh", "simulation_count": flushed},
+            )
 
     # ── Core Tick Pipeline ──────────────────────────────────────
 
@@ -325,6 +385,7 @@ class HeartbeatService:
         interval: int,
     ) -> None:
         """Execute the full tick pipeline for one simulation."""
+        tick_t0 = time.perf_counter()
         sim_id = UUID(sim["id"])
         tick_number = (sim.get("last_heartbeat_tick") or 0) + 1
         sim_name = sim.get("name", "Unknown")
@@ -441,7 +502,8 @@ class HeartbeatService:
             "cascade_events_spawned": 0,
             "convergence_detected": False,
         }
-        _ctx = {"sim_id": sim_id, "tick_number": tick_number, "sim_name": sim_name}
+        phase_timings: list[dict] = []
+        _ctx = {"sim_id": sim_id, "tick_number": tick_number, "sim_name": sim_name, "timings": phase_timings}
 
         try:
             # Phase 1: Expire zone actions
@@ -588,8 +650,7 @@ class HeartbeatService:
             tick_stats["autonomy"] = autonomy_stats
 
             # Phase 9.5: Ambient weather events (real-world weather → zone narratives + moodlets)
-            weather_enabled = str(overrides.get("weather_enabled", "false")).lower() in ("true", "1")
-            if weather_enabled:
+            if cls._weather_enabled(overrides):
                 weather_result = await _run_phase(
                     "weather",
                     AmbientWeatherService.process_tick(
@@ -639,12 +700,10 @@ class HeartbeatService:
                     )
             tick_stats["bond_whispers"] = bond_whispers_generated
 
-            # Phase 10: Refresh materialized views
-            await _run_phase(
-                "mv_refresh",
-                GameMechanicsService.refresh_metrics(admin),
-                **_ctx,
-            )
+            # Phase 10: Mark game-metric MVs dirty. The refresh itself is
+            # coalesced: _tick_due_simulations flushes ONCE after all due sims
+            # ticked (refresh_all_game_metrics rebuilds every sim anyway).
+            GameMetricsRefresher.mark_dirty(sim_id)
 
             # Phase 11: Produce chronicle entries (peacetime content if quiet)
             if not entries:
@@ -686,6 +745,10 @@ class HeartbeatService:
                 "weather_events": tick_stats.pop("weather_events", 0),
                 "weather": tick_stats.pop("weather", {}),
                 "bond_whispers": tick_stats.pop("bond_whispers", 0),
+                "profile": {
+                    "tick_ms": round((time.perf_counter() - tick_t0) * 1000, 1),
+                    "phases": phase_timings,
+                },
             }
             await (
                 admin.table("simulation_heartbeats")
@@ -725,6 +788,7 @@ class HeartbeatService:
                     "tick_number": tick_number,
                     "entry_count": len(entries),
                     "stats": tick_stats,
+                    "tick_ms": summary_data["profile"]["tick_ms"],
                 },
             )
 
@@ -1367,6 +1431,20 @@ class HeartbeatService:
             sid = resp_row["simulation_id"]
             pending_counts[sid] = pending_counts.get(sid, 0) + 1
 
+        # Rolling phase timings over the most recent completed ticks (all sims).
+        profile_resp = await (
+            admin.table("simulation_heartbeats")
+            .select("simulation_id, profile:summary->profile")
+            .eq("status", "completed")
+            .order("created_at", desc=True)
+            .limit(_PROFILE_WINDOW_TICKS)
+            .execute()
+        )
+        profiles_by_sim: dict[str, list[dict]] = {}
+        for row in extract_list(profile_resp):
+            if row.get("profile"):
+                profiles_by_sim.setdefault(row["simulation_id"], []).append(row["profile"])
+
         sim_data = []
         for sim in sims:
             sid = sim["id"]
@@ -1384,6 +1462,7 @@ class HeartbeatService:
                     "active_arcs": arc_counts.get(sid, 0),
                     "scar_tissue_level": round(total_scar, 4),
                     "pending_responses": pending_counts.get(sid, 0),
+                    "timings": aggregate_ticks(profiles_by_sim.get(sid, [])),
                 }
             )
 
@@ -1392,6 +1471,7 @@ class HeartbeatService:
             "interval_seconds": interval,
             "active_systems": active_systems,
             "simulations": sim_data,
+            "timings": aggregate_ticks([p for profiles in profiles_by_sim.values() for p in profiles]),
         }
 
     # ── Daily Briefing ────────────────────────────────────────
@@ -1458,8 +1538,12 @@ class HeartbeatService:
     # ── Force Tick (Admin) ──────────────────────────────────────
 
     @classmethod
-    async def force_tick(cls, admin: Client, sim_id: UUID) -> dict:
-        """Manually trigger a tick for a simulation (admin action)."""
+    async def force_tick(cls, admin: Client, sim_id: UUID, *, profile: bool = False) -> dict:
+        """Manually trigger a tick for a simulation (admin action).
+
+        With ``profile``, the tick runs under cProfile and the report is
+        returned as ``cprofile`` next to the heartbeat record.
+        """
         response = await (
             admin.table("simulations")
             .select("id, name, slug, last_heartbeat_tick, next_heartbeat_at")
@@ -1472,7 +1556,19 @@ class HeartbeatService:
 
         sim = response.data[0]
         _, interval = await cls._load_config(admin)
-        await cls._tick_simulation(admin, sim, interval)
+        report: dict = {}
+        profiler = None
+        if profile:
+            try:
+                profiler = start_cprofile()
+            except ValueError as exc:
+                raise conflict(f"Profiler unavailable: {exc}") from exc
+        try:
+            await cls._tick_simulation(admin, sim, interval)
+        finally:
+            if profiler is not None:
+                report["cprofile"] = stop_cprofile(profiler)
+        await cls._flush_game_metrics(admin)
 
         # Return the completed heartbeat record
         tick_number = (sim.get("last_heartbeat_tick") or 0) + 1
@@ -1484,7 +1580,8 @@ class HeartbeatService:
             .limit(1)
             .execute()
         )
-        return result.data[0] if result.data else {"tick_number": tick_number, "status": "completed"}
+        record = result.data[0] if result.data else {"tick_number": tick_number, "status": "completed"}
+        return {**record, **report}
 
     # ── Peacetime Content ──────────────────────────────────────
 
@@ -0,0 +1,228 @@
+"""Off-loop multi-rendition image encoding.
+
+Every generated image is stored in several renditions (native-resolution
+original, display thumbnail, optionally other formats). Encoding each one
+with ``convert_to_avif`` decoded the source again per rendition, and AVIF
+encoding of a 2K frame is several hundred milliseconds of CPU that ran on
+the event loop.
+
+``encode()`` decodes the source once, converts it to RGB once, and derives
+every requested :class:`Rendition` (max edge × format × quality) from that
+frame — inside a worker process, so the API loop keeps serving requests.
+The pool follows ``instagram_render_pool``: spawned lazily, sized by
+``IMAGE_ENCODE_WORKERS`` (default 0 = default thread pool), and a broken
+pool is discarded with the job retried in a thread.
+
+Per-rendition encode times are logged with every job and exposed via
+``encode_stats()`` (``GET /api/v1/admin/ops/render-stats``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+
+import sentry_sdk
+
+from backend.config import settings
+from backend.utils.image import AVIF_QUALITY, AVIF_QUALITY_THUMB, MAX_IMAGE_DIMENSION
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = {"AVIF": "image/avif", "WEBP": "image/webp", "JPEG": "image/jpeg", "PNG": "image/png"}
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """One stored variant of an image.
+
+    ``suffix`` replaces the ``.avif`` extension of the base storage path:
+    ``".avif"`` keeps the base path, ``".full.avif"`` / ``".webp"`` sit next to it.
+    """
+
+    name: str
+    suffix: str
+    max_dimension: int | None
+    format: str = "AVIF"
+    quality: int = AVIF_QUALITY
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[self.format]
+
+    def path_for(self, base_path: str) -> str:
+        return base_path.removesuffix(".avif") + self.suffix
+
+
+@dataclass(frozen=True)
+class EncodedRendition:
+    rendition: Rendition
+    data: bytes
+    encode_ms: float
+
+
+# Native-resolution original ({uuid}.full.avif) + display thumbnail ({uuid}.avif).
+DUAL_AVIF = (
+    Rendition("full", ".full.avif", None, quality=AVIF_QUALITY),
+    Rendition("thumb", ".avif", MAX_IMAGE_DIMENSION, quality=AVIF_QUALITY_THUMB),
+)
+
+_pool: ProcessPoolExecutor | None = None
+
+
+# ── Worker side ──────────────────────────────────────────────────────────
+
+
+def _fit(size: tuple[int, int], max_dimension: int) -> tuple[int, int]:
+    width, height = size
+    scale = max_dimension / max(width, height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _encode_all(image_bytes: bytes, renditions: tuple[Rendition, ...]) -> tuple[list[tuple[bytes, float]], float]:
+    """Decode once and encode every rendition.
+
+    Returns ([(bytes, encode_seconds), ...] in rendition order, decode_seconds).
+    Without Pillow every rendition is the raw input (same as ``convert_to_avif``).
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        logger.warning("Pillow not installed — returning raw image bytes")
+        return [(image_bytes, 0.0) for _ in renditions], 0.0
+
+    started = time.perf_counter()
+    source = Image.open(io.BytesIO(image_bytes))
+    source.load()
+    if source.mode not in ("RGB", "L"):
+        source = source.convert("RGB")
+    decode_s = time.perf_counter() - started
+
+    results: list[tuple[bytes, float]] = []
+    for rendition in renditions:
+        started = time.perf_counter()
+        img = source
+        if rendition.max_dimension is not None and max(img.size) > rendition.max_dimension:
+            # Same filter as Image.thumbnail(), without copying the full frame first.
+            img = source.resize(_fit(source.size, rendition.max_dimension), Image.Resampling.BICUBIC, reducing_gap=2.0)
+        output = io.BytesIO()
+        img.save(output, format=rendition.format, quality=rendition.quality)
+        results.append((output.getvalue(), time.perf_counter() - started))
+    return results, decode_s
+
+
+# ── Metrics ──────────────────────────────────────────────────────────────
+
+
+@dataclass
+class EncodeStats:
+    count: int = 0
+    encode_ms_total: float = 0.0
+    encode_ms_max: float = 0.0
+    bytes_total: int = 0
+
+    def record(self, encode_ms: float, nbytes: int) -> None:
+        self.count += 1
+        self.encode_ms_total += encode_ms
+        self.encode_ms_max = max(self.encode_ms_max, encode_ms)
+        self.bytes_total += nbytes
+
+
+_stats: dict[str, EncodeStats] = {}
+
+
+def encode_stats() -> dict[str, dict]:
+    """Per-rendition encode metrics since process start (averages in ms)."""
+    out: dict[str, dict] = {}
+    for key, s in _stats.items():
+        row = asdict(s)
+        row["encode_ms_avg"] = round(s.encode_ms_total / s.count, 1) if s.count else 0.0
+        out[key] = row
+    return out
+
+
+def reset_encode_stats() -> None:
+    _stats.clear()
+
+
+# ── Pool lifecycle ───────────────────────────────────────────────────────
+
+
+def get_encode_pool() -> ProcessPoolExecutor | None:
+    """Return the shared process pool, creating it on first use (None = disabled)."""
+    global _pool  # noqa: PLW0603
+    if settings.image_encode_workers <= 0:
+        return None
+    if _pool is None:
+        # spawn, not fork — see instagram_render_pool.
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.image_encode_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info("Started image encode pool", extra={"workers": settings.image_encode_workers})
+    return _pool
+
+
+def shutdown_encode_pool() -> None:
+    """Stop the pool (lifespan shutdown). Pending jobs are cancelled."""
+    global _pool  # noqa: PLW0603
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool  # noqa: PLW0603
+    if _pool is pool:
+        _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ── Public API ───────────────────────────────────────────────────────────
+
+
+async def encode(image_bytes: bytes, renditions: tuple[Rendition, ...] = DUAL_AVIF) -> list[EncodedRendition]:
+    """Encode ``image_bytes`` into every rendition off the event loop.
+
+    Decode/encode errors propagate unchanged.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_encode_pool()
+    mode = "process" if pool is not None else "thread"
+    started = time.perf_counter()
+    try:
+        results, decode_s = await loop.run_in_executor(pool, _encode_all, image_bytes, renditions)
+    except BrokenProcessPool as exc:
+        logger.warning("Image encode pool broken — retrying in thread")
+        sentry_sdk.capture_exception(exc)
+        _discard_broken_pool(pool)
+        mode = "thread"
+        results, decode_s = await loop.run_in_executor(None, _encode_all, image_bytes, renditions)
+
+    encoded = [
+        EncodedRendition(rendition, data, encode_s * 1000)
+        for rendition, (data, encode_s) in zip(renditions, results, strict=True)
+    ]
+    for item in encoded:
+        key = f"{item.rendition.name}.{item.rendition.format.lower()}"
+        _stats.setdefault(key, EncodeStats()).record(item.encode_ms, len(item.data))
+
+    work_ms = decode_s * 1000 + sum(item.encode_ms for item in encoded)
+    logger.info(
+        "Encoded image renditions",
+        extra={
+            "mode": mode,
+            "decode_ms": round(decode_s * 1000, 1),
+            "encode_ms": {item.rendition.name: round(item.encode_ms, 1) for item in encoded},
+            "wait_ms": round(max(0.0, (time.perf_counter() - started) * 1000 - work_ms), 1),
+            "input_size": len(image_bytes),
+            "output_size": sum(len(item.data) for item in encoded),
+        },
+    )
+    return encoded
@@ -8,10 +8,14 @@ from __future__ import annotations
 
 import io
 import math
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from PIL.Image import Image as PILImage
 
 # ── Instagram image specs ─────────────────────────────────────────────────
@@ -319,16 +323,154 @@ def add_noise_grain(
     sigma: int = 15,
     opacity: float = 0.08,
 ) -> PILImage:
-    """Add film grain noise overlay."""
-    import numpy as np
-    from PIL import Image
+    """Add film grain noise overlay.
+
+    The grain field for a given (size, sigma, opacity) is generated once and
+    cached as a signed uint8 layer (noise + 128); each call rolls it by a
+    random offset so consecutive images still get distinct grain. The add is
+    a per-band uint8 ``ImageChops.add`` with a -128 offset — clip(v + noise)
+    in one C pass, no int16 copy of the image.
+    """
+    import random
+
+    from PIL import Image, ImageChops
+
+    grain = grain_layer(img.width, img.height, sigma, opacity)
+    grain = ImageChops.offset(grain, random.randrange(img.width), random.randrange(img.height))  # noqa: S311
+
+    bands = list(img.split())
+    for i in range(min(3, len(bands))):
+        bands[i] = ImageChops.add(bands[i], grain, scale=1.0, offset=-128)
+    return Image.merge(img.mode, bands)
+
+
+# ── Precomputed layer cache ───────────────────────────────────────────────
+#
+# Vignettes, gradients, scan-line overlays and grain fields depend only on
+# canvas size and a few parameters — a small fixed set (two canvas sizes,
+# eight archetype accents, a handful of simulation colors). Layers are
+# memoized in a byte-bounded LRU keyed by (effect, width, height, *params).
+# Returned images are SHARED: composite them onto another image (read-only)
+# or ``.copy()`` before drawing on them.
+
+LAYER_CACHE_MAX_BYTES = 96 * 1024 * 1024  # ~11 full-size story RGBA layers
+
+
+class LayerCache:
+    """Thread-safe LRU of precomputed effect layers, bounded by pixel bytes."""
+
+    def __init__(self, max_bytes: int = LAYER_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._layers: OrderedDict[tuple, PILImage] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _size_of(img: PILImage) -> int:
+        return img.width * img.height * len(img.getbands())
+
+    def get(self, key: tuple, build: Callable[[], PILImage]) -> PILImage:
+        with self._lock:
+            layer = self._layers.get(key)
+            if layer is not None:
+                self._layers.move_to_end(key)
+                self.hits += 1
+                return layer
+            self.misses += 1
+
+        # Build outside the lock — a concurrent miss on the same key builds
+        # twice, which is cheaper than serializing every render thread.
+        layer = build()
+        size = self._size_of(layer)
+        with self._lock:
+            if key not in self._layers:
+                self._layers[key] = layer
+                self._bytes += size
+            while self._bytes > self.max_bytes and len(self._layers) > 1:
+                _, old = self._layers.popitem(last=False)
+                self._bytes -= self._size_of(old)
+                self.evictions += 1
+        return layer
+
+    def clear(self) -> None:
+        with self._lock:
+            self._layers.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._layers),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+layer_cache = LayerCache()
+
+
+def vignette_layer(w: int, h: int, intensity: float) -> PILImage:
+    """Cached ``create_vignette`` — read-only shared layer."""
+    return layer_cache.get(("vignette", w, h, intensity), lambda: create_vignette(w, h, intensity=intensity))
+
+
+def gradient_layer(
+    w: int,
+    h: int,
+    top_color: tuple[int, ...],
+    bottom_color: tuple[int, ...],
+) -> PILImage:
+    """Cached ``create_gradient`` — read-only shared layer."""
+    key = ("gradient", w, h, tuple(top_color), tuple(bottom_color))
+    return layer_cache.get(key, lambda: create_gradient(w, h, top_color, bottom_color))
+
+
+def scan_line_layer(
+    w: int,
+    h: int,
+    accent: tuple[int, int, int],
+    spacing: int,
+    alpha: int,
+) -> PILImage:
+    """Cached transparent overlay with one accent-colored row every ``spacing`` px."""
+
+    def build() -> PILImage:
+        import numpy as np
+        from PIL import Image
 
-    arr = np.array(img).astype(np.int16)
-    noise = np.random.default_rng().normal(0, sigma, arr.shape[:2])
-    scaled = (noise * opacity).astype(np.int16)
-    for c in range(min(3, arr.shape[2])):
-        arr[:, :, c] = np.clip(arr[:, :, c] + scaled, 0, 255)
-    return Image.fromarray(arr.astype(np.uint8), img.mode)
+        arr = np.zeros((h, w, 4), dtype=np.uint8)
+        arr[::spacing, :] = (*accent, alpha)
+        return Image.fromarray(arr, "RGBA")
+
+    return layer_cache.get(("scan_lines", w, h, tuple(accent), spacing, alpha), build)
+
+
+def grain_layer(w: int, h: int, sigma: int, opacity: float) -> PILImage:
+    """Cached "L" grain field, encoded as ``trunc(N(0, sigma) * opacity) + 128``."""
+
+    def build() -> PILImage:
+        import numpy as np
+        from PIL import Image
+
+        noise = np.random.default_rng().normal(0, sigma, (h, w)).astype(np.float32)
+        noise *= opacity
+        np.trunc(noise, out=noise)
+        np.clip(noise, -128, 127, out=noise)
+        noise += 128
+        return Image.fromarray(noise.astype(np.uint8), "L")
+
+    return layer_cache.get(("grain", w, h, sigma, opacity), build)
+
+
+def clear_layer_caches() -> None:
+    """Drop all cached layers (tests, memory pressure)."""
+    layer_cache.clear()
 
 
 def add_bokeh_dots(
@@ -422,15 +564,9 @@ def draw_scan_lines_rgba(
 ) -> None:
     """Draw scan lines via alpha compositing (correct for RGBA images).
 
-    Uses NumPy array slicing instead of per-line draw calls for performance.
+    The overlay is built once per (size, accent, spacing, alpha) and cached.
     """
-    import numpy as np
-    from PIL import Image
-
-    arr = np.zeros((img.height, img.width, 4), dtype=np.uint8)
-    arr[::spacing, :] = (*accent, alpha)
-    overlay = Image.fromarray(arr, "RGBA")
-    img.alpha_composite(overlay)
+    img.alpha_composite(scan_line_layer(img.width, img.height, tuple(accent), spacing, alpha))
 
 
 # ── Film Processing Effects ──────────────────────────────────────────────
@@ -464,6 +600,26 @@ def chromatic_aberration(
     return Image.merge("RGB", (r, g, b))
 
 
+_SHADOW_SUM_LIMIT = math.ceil(0.25 * 3 * 255)  # R+G+B below this → mean < 0.25
+
+
+@lru_cache(maxsize=4)
+def _bleach_luts(highlight_rolloff: float):
+    """(base, shadow) 256-entry uint8 LUTs for bleach_bypass step 3.
+
+    Same float32 math the full-image path used, evaluated once per value:
+    highlight compression above ``highlight_rolloff``; the shadow LUT adds
+    the +0.025 cold blue lift.
+    """
+    import numpy as np
+
+    v = np.arange(256, dtype=np.float32) / 255.0
+    v = np.where(v > highlight_rolloff, highlight_rolloff + (v - highlight_rolloff) * 0.3, v)
+    base = np.clip(v * 255, 0, 255).astype(np.uint8)
+    shadow = np.clip((v + 0.025) * 255, 0, 255).astype(np.uint8)
+    return base, shadow
+
+
 def bleach_bypass(
     img: PILImage,
     desaturation: float = 0.6,
@@ -481,11 +637,10 @@ def bleach_bypass(
     - contrast 1.3 adds punch without crushing shadows
     - highlight_rolloff 0.88 prevents blown-out whites
     """
-    import numpy as np
     from PIL import Image, ImageEnhance
 
-    # Work in RGB for ImageEnhance
-    work = img.convert("RGB") if img.mode != "RGB" else img.copy()
+    # Work in RGB for ImageEnhance (enhance() returns new images — no copy needed)
+    work = img.convert("RGB") if img.mode != "RGB" else img
 
     # Step 1: Partial desaturation (0.0 = grayscale, 1.0 = full color)
     work = ImageEnhance.Color(work).enhance(desaturation)
@@ -493,22 +648,19 @@ def bleach_bypass(
     # Step 2: Contrast boost
     work = ImageEnhance.Contrast(work).enhance(contrast_boost)
 
-    # Step 3: Highlight rolloff + cold shadow tint (NumPy)
-    arr = np.array(work).astype(np.float32) / 255.0
-
-    # Compress highlights above rolloff threshold
-    arr = np.where(
-        arr > highlight_rolloff,
-        highlight_rolloff + (arr - highlight_rolloff) * 0.3,
-        arr,
-    )
-
-    # Subtle blue-channel lift in shadows (cold institutional tone)
-    shadow_mask = arr.mean(axis=2, keepdims=True) < 0.25
-    arr[:, :, 2] = np.where(shadow_mask[:, :, 0], arr[:, :, 2] + 0.025, arr[:, :, 2])
+    # Step 3: Highlight rolloff + cold shadow tint — per-value LUTs applied
+    # to the uint8 pixels directly (no full-image float32 copy).
+    import numpy as np
 
-    arr = np.clip(arr * 255, 0, 255).astype(np.uint8)
-    result = Image.fromarray(arr, "RGB")
+    arr = np.asarray(work)
+    lut, shadow_lut = _bleach_luts(highlight_rolloff)
+    out = lut[arr]
+    # Shadow = channel mean < 0.25. Rolloff only touches values above the
+    # threshold (≥ 0.75 in practice), which already lifts the mean past 0.25,
+    # so the mask can be taken from the pre-LUT pixels.
+    shadow_mask = arr.sum(axis=2, dtype=np.uint16) < _SHADOW_SUM_LIMIT
+    np.copyto(out[:, :, 2], shadow_lut[arr[:, :, 2]], where=shadow_mask)
+    result = Image.fromarray(out, "RGB")
 
     # Preserve alpha if input was RGBA
     if img.mode == "RGBA":
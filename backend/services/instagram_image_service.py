@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import io
 import logging
+import math
 from uuid import uuid4
 
 import httpx
@@ -64,8 +65,10 @@ from backend.services.instagram_image_helpers import (
     load_italic_font,
     load_monospace_font,
     text_with_glow,
+    vignette_layer,
     wrap_text,
 )
+from backend.services.instagram_render_pool import render
 from backend.services.instagram_story_composer import StoryComposer
 from supabase import AsyncClient as Client
 
@@ -137,8 +140,9 @@ class InstagramImageService:
             },
         )
         raw_bytes = await self._download_image(portrait_url)
-        return self._compose_with_overlay(
-            raw_bytes,
+        return await render(
+            "overlay",
+            image_bytes=raw_bytes,
             title=f"PERSONNEL FILE — {agent_name}",
             subtitle=f"SHARD: {simulation_name}",
             color_primary=color_primary,
@@ -169,8 +173,9 @@ class InstagramImageService:
             },
         )
         raw_bytes = await self._download_image(image_url)
-        return self._compose_with_overlay(
-            raw_bytes,
+        return await render(
+            "overlay",
+            image_bytes=raw_bytes,
             title=f"SHARD SURVEILLANCE — {building_name}",
             subtitle=f"LOCATION: {simulation_name}",
             color_primary=color_primary,
@@ -209,8 +214,9 @@ class InstagramImageService:
         else:
             raw_bytes = generate_solid_background(color_background)
 
-        return self._compose_with_overlay(
-            raw_bytes,
+        return await render(
+            "overlay",
+            image_bytes=raw_bytes,
             title=f"DISPATCH [{dispatch_number:04d}]",
             subtitle=f"RE: {simulation_name}",
             color_primary=color_primary,
@@ -246,6 +252,14 @@ class InstagramImageService:
 
     # ── Story Template Delegation ─────────────────────────────────────────
 
+    async def render_story(self, template: str, **kwargs) -> bytes:
+        """Render a story template off the event loop (instagram_render_pool).
+
+        ``template`` is one of detection / classification / impact / advisory /
+        subsiding; kwargs are those of the matching ``compose_story_*`` method.
+        """
+        return await render(f"story_{template}", **kwargs)
+
     def compose_story_detection(self, **kwargs) -> bytes:
         """Story 1: SUBSTRATE ANOMALY DETECTED. Delegates to StoryComposer."""
         return self._story.compose_story_detection(**kwargs)
@@ -281,10 +295,14 @@ class InstagramImageService:
         Detects near-solid images by sampling pixel variance and adds subtle
         grid lines and centered seal text to fill the otherwise empty space.
         """
-        import numpy as np
-
-        arr = np.array(img)
-        if arr.std() > 20:
+        from PIL import ImageStat
+
+        # Std-dev over all bands pooled, from per-band histogram sums —
+        # no full-image array copy.
+        stat = ImageStat.Stat(img)
+        n = sum(stat.count)
+        mean = sum(stat.sum) / n
+        if math.sqrt(max(0.0, sum(stat.sum2) / n - mean * mean)) > 20:
             return  # real image — skip decoration
 
         grid_color = (*primary_rgb, 25) if img.mode == "RGBA" else tuple(min(c + 15, 255) for c in primary_rgb)
@@ -366,8 +384,7 @@ class InstagramImageService:
                 content_img, ImageDraw.Draw(content_img),
                 primary_rgb, width, FEED_CONTENT_HEIGHT,
             )
-            vignette = create_vignette(width, FEED_CONTENT_HEIGHT, intensity=0.3)
-            content_img.alpha_composite(vignette)
+            content_img.alpha_composite(vignette_layer(width, FEED_CONTENT_HEIGHT, 0.3))
             content_img = add_noise_grain(content_img, sigma=10, opacity=0.04)
             content_img = bleach_bypass(
                 content_img, desaturation=0.65,
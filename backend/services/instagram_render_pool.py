@@ -0,0 +1,208 @@
+"""Off-loop rendering pool for Instagram feed and story composition.
+
+Pillow/NumPy composition is CPU-bound: a 1080×1920 story takes several
+hundred milliseconds, and a story batch blocked every request on the same
+worker for seconds. ``render()`` runs a named composition job in a process
+pool instead. Each pool worker preloads fonts and warms the static layer
+cache (vignette / gradient / grain) once at start, so per-job cost is
+the composition itself.
+
+Jobs are addressed by name so that only plain data (strings, numbers, bytes,
+lists of dicts) crosses the process boundary:
+
+- ``"overlay"`` → ``InstagramImageService._compose_with_overlay``
+- ``"story_<template>"`` → ``StoryComposer.compose_story_<template>``
+
+``INSTAGRAM_RENDER_WORKERS`` sizes the process pool, which is started on the
+first render. The default 0 runs jobs in the default thread pool instead
+(still off the event loop, but sharing the GIL) and spawns no processes.
+A broken pool (worker OOM-killed) is discarded, the job falls back to a
+thread, and the next call starts a fresh pool.
+
+Per-job render metrics (count, failures, render and queue time) are logged
+on every render and exposed via ``render_stats()`` (``GET
+/api/v1/admin/ops/render-stats``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import sentry_sdk
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+STORY_TEMPLATES = ("detection", "classification", "impact", "advisory", "subsiding")
+
+_pool: ProcessPoolExecutor | None = None
+
+
+# ── Worker side ──────────────────────────────────────────────────────────
+
+
+def _warm_worker() -> None:
+    """Pool initializer: preload fonts and the common static layers."""
+    from backend.services import instagram_image_helpers as h
+
+    font_sizes = {
+        h.FONT_H1, h.FONT_H2, h.FONT_BODY, h.FONT_CAPTION, h.FONT_STAT, h.FONT_MAGNITUDE,
+        h.FONT_CTA, h.FONT_FEED_TITLE, h.FONT_FEED_BADGE, h.FONT_FEED_SEAL, h.FONT_FEED_FOOTER,
+    }
+    for size in font_sizes:
+        h.load_monospace_font(size)
+        h.load_bold_font(size)
+        h.load_italic_font(size)
+    h.get_text_measure_draw()
+
+    h.vignette_layer(h.IG_WIDTH, h.FEED_CONTENT_HEIGHT, 0.3)
+    h.vignette_layer(h.IG_WIDTH, h.IG_HEIGHT_STORY, 0.5)
+    h.gradient_layer(h.IG_WIDTH, h.IG_HEIGHT_STORY, (0, 0, 0, 0), (0, 0, 0, 220))
+    h.grain_layer(h.IG_WIDTH, h.FEED_CONTENT_HEIGHT, 10, 0.04)
+    h.grain_layer(h.IG_WIDTH, h.IG_HEIGHT_STORY, 12, 0.05)
+
+
+def _resolve_job(job: str):
+    from backend.services.instagram_image_service import InstagramImageService
+    from backend.services.instagram_story_composer import StoryComposer
+
+    if job == "overlay":
+        # No Supabase in the worker — _compose_with_overlay is pure rendering.
+        return InstagramImageService(None)._compose_with_overlay  # type: ignore[arg-type]
+    template = job.removeprefix("story_")
+    if job.startswith("story_") and template in STORY_TEMPLATES:
+        return getattr(StoryComposer(), f"compose_story_{template}")
+    raise ValueError(f"Unknown render job: {job}")
+
+
+def _run_job(job: str, kwargs: dict[str, Any]) -> tuple[bytes, float]:
+    """Execute one job. Returns (jpeg_bytes, render_seconds)."""
+    fn = _resolve_job(job)
+    started = time.perf_counter()
+    result = fn(**kwargs)
+    return result, time.perf_counter() - started
+
+
+# ── Metrics ──────────────────────────────────────────────────────────────
+
+
+@dataclass
+class RenderStats:
+    count: int = 0
+    failures: int = 0
+    render_ms_total: float = 0.0
+    render_ms_max: float = 0.0
+    wait_ms_total: float = 0.0
+
+    def record(self, render_ms: float, wait_ms: float) -> None:
+        self.count += 1
+        self.render_ms_total += render_ms
+        self.render_ms_max = max(self.render_ms_max, render_ms)
+        self.wait_ms_total += wait_ms
+
+
+_stats: dict[str, RenderStats] = {}
+
+
+def render_stats() -> dict[str, dict]:
+    """Per-job render metrics since process start (averages in ms)."""
+    out: dict[str, dict] = {}
+    for job, s in _stats.items():
+        row = asdict(s)
+        row["render_ms_avg"] = round(s.render_ms_total / s.count, 1) if s.count else 0.0
+        row["wait_ms_avg"] = round(s.wait_ms_total / s.count, 1) if s.count else 0.0
+        out[job] = row
+    return out
+
+
+def reset_render_stats() -> None:
+    _stats.clear()
+
+
+# ── Pool lifecycle ───────────────────────────────────────────────────────
+
+
+def get_render_pool() -> ProcessPoolExecutor | None:
+    """Return the shared process pool, creating it on first use (None = disabled)."""
+    global _pool  # noqa: PLW0603
+    if settings.instagram_render_workers <= 0:
+        return None
+    if _pool is None:
+        # spawn, not fork: the parent runs an event loop plus httpx/sentry
+        # threads, none of which survive a fork safely.
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.instagram_render_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+        logger.info(
+            "Started Instagram render pool",
+            extra={"workers": settings.instagram_render_workers},
+        )
+    return _pool
+
+
+def shutdown_render_pool() -> None:
+    """Stop the pool (lifespan shutdown). Pending jobs are cancelled."""
+    global _pool  # noqa: PLW0603
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool  # noqa: PLW0603
+    if _pool is pool:
+        _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ── Public API ───────────────────────────────────────────────────────────
+
+
+async def render(job: str, **kwargs: Any) -> bytes:
+    """Run a composition job off the event loop and return the JPEG bytes.
+
+    Composition errors propagate unchanged (the job functions already log
+    and report them); callers keep their existing error handling.
+    """
+    loop = asyncio.get_running_loop()
+    stats = _stats.setdefault(job, RenderStats())
+    pool = get_render_pool()
+    mode = "process" if pool is not None else "thread"
+    started = time.perf_counter()
+    try:
+        try:
+            result, render_s = await loop.run_in_executor(pool, _run_job, job, kwargs)
+        except BrokenProcessPool as exc:
+            logger.warning("Instagram render pool broken — retrying in thread", extra={"job": job})
+            sentry_sdk.capture_exception(exc)
+            _discard_broken_pool(pool)
+            mode = "thread"
+            result, render_s = await loop.run_in_executor(None, _run_job, job, kwargs)
+    except Exception:
+        stats.failures += 1
+        raise
+
+    render_ms = render_s * 1000
+    wait_ms = max(0.0, (time.perf_counter() - started) * 1000 - render_ms)
+    stats.record(render_ms, wait_ms)
+    logger.info(
+        "Rendered Instagram image",
+        extra={
+            "job": job,
+            "mode": mode,
+            "render_ms": round(render_ms, 1),
+            "wait_ms": round(wait_ms, 1),
+            "output_size": len(result),
+        },
+    )
+    return result
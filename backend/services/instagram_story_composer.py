@@ -64,8 +64,6 @@ from backend.services.instagram_image_helpers import (
     WATERMARK_SYMBOL_Y,
     add_bokeh_dots,
     add_noise_grain,
-    create_gradient,
-    create_vignette,
     crop_to_circle,
     draw_accent_bars,
     draw_archetype_symbol,
@@ -74,12 +72,14 @@ from backend.services.instagram_image_helpers import (
     draw_magnitude_arc,
     draw_scan_lines_rgba,
     draw_story_footer,
+    gradient_layer,
     hex_to_rgb,
     image_to_jpeg,
     load_bold_font,
     load_italic_font,
     load_monospace_font,
     text_with_glow,
+    vignette_layer,
     wrap_text,
 )
 
@@ -122,9 +122,9 @@ class StoryComposer:
         w, h = IG_WIDTH, IG_HEIGHT_STORY
 
         if background == "gradient":
-            img = create_gradient(w, h, (*accent, 50), (0, 0, 0, 255))
+            img = gradient_layer(w, h, (*accent, 50), (0, 0, 0, 255)).copy()
         elif background == "faint_gradient":
-            img = create_gradient(w, h, (*accent, 12), (0, 0, 0, 255))
+            img = gradient_layer(w, h, (*accent, 12), (0, 0, 0, 255)).copy()
         else:
             img = Image.new("RGBA", (w, h), (10, 12, 18, 255))
 
@@ -187,8 +187,7 @@ class StoryComposer:
         from PIL import ImageDraw
 
         w, h = img.size
-        vignette = create_vignette(w, h, intensity=vignette_intensity)
-        img.alpha_composite(vignette)
+        img.alpha_composite(vignette_layer(w, h, vignette_intensity))
 
         draw = ImageDraw.Draw(img)
         draw_accent_bars(draw, w, h, accent)
@@ -703,13 +702,12 @@ class StoryComposer:
                 img = bg.convert("RGBA")
             except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError, OSError):
                 logger.warning("Banner processing failed -- using gradient fallback")
-                img = create_gradient(w, h, (*sim_color, 30), (0, 0, 0, 255))
+                img = gradient_layer(w, h, (*sim_color, 30), (0, 0, 0, 255)).copy()
         else:
-            img = create_gradient(w, h, (*sim_color, 30), (0, 0, 0, 255))
+            img = gradient_layer(w, h, (*sim_color, 30), (0, 0, 0, 255)).copy()
 
         # Gradient overlay: transparent top -> black bottom (text readability)
-        gradient_overlay = create_gradient(w, h, (0, 0, 0, 0), (0, 0, 0, 220))
-        img.alpha_composite(gradient_overlay)
+        img.alpha_composite(gradient_layer(w, h, (0, 0, 0, 0), (0, 0, 0, 220)))
 
         # Light grain
         img = add_noise_grain(img, sigma=12, opacity=0.06)
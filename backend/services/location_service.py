@@ -24,18 +24,24 @@ class CityService(BaseService):
     table_name = "cities"
     view_name = None
     supports_created_by = False
+    list_order_by = "name"
+    list_order_desc = False
 
 
 class ZoneService(BaseService):
     table_name = "zones"
     view_name = None
     supports_created_by = False
+    list_order_by = "name"
+    list_order_desc = False
 
 
 class StreetService(BaseService):
     table_name = "city_streets"
     view_name = None
     supports_created_by = False
+    list_order_by = "name"
+    list_order_desc = False
 
 
 class LocationService:
@@ -50,14 +56,15 @@ class LocationService:
         simulation_id: UUID,
         limit: int = 25,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> tuple[list[dict], int]:
         return await CityService.list(
             supabase,
             simulation_id,
-            order_by="name",
-            order_desc=False,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            count="estimated" if cursor else "exact",
         )
 
     @classmethod
@@ -88,16 +95,17 @@ class LocationService:
         city_id: UUID | None = None,
         limit: int = 25,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> tuple[list[dict], int]:
         filters = {"city_id": str(city_id)} if city_id else None
         return await ZoneService.list(
             supabase,
             simulation_id,
             filters=filters,
-            order_by="name",
-            order_desc=False,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            count="estimated" if cursor else "exact",
         )
 
     @classmethod
@@ -129,6 +137,7 @@ class LocationService:
         zone_id: UUID | None = None,
         limit: int = 25,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> tuple[list[dict], int]:
         filters: dict = {}
         if city_id:
@@ -139,10 +148,10 @@ class LocationService:
             supabase,
             simulation_id,
             filters=filters or None,
-            order_by="name",
-            order_desc=False,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            count="estimated" if cursor else "exact",
         )
 
     @classmethod
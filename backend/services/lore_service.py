@@ -60,7 +60,6 @@ class LoreService:
         )
         if sim:
             schedule_auto_translation(
-                supabase,
                 TABLE,
                 section["id"],
                 section,
@@ -106,7 +105,6 @@ class LoreService:
             )
             if sim:
                 schedule_auto_translation(
-                    supabase,
                     TABLE,
                     section["id"],
                     section,
@@ -8,7 +8,7 @@ from uuid import UUID
 
 from backend.services.constants import PLATFORM_DEFAULT_MODELS
 from backend.services.platform_model_config import get_platform_model
-from backend.utils.responses import extract_list
+from backend.services.simulation_settings_cache import SimulationSettingsCache
 from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
@@ -208,18 +208,10 @@ class ModelResolver:
         if self._settings_cache is not None:
             return self._settings_cache
 
-        response = await (
-            self._supabase.table("simulation_settings")
-            .select("setting_key, setting_value")
-            .eq("simulation_id", str(self._simulation_id))
-            .eq("category", "ai")
-            .execute()
-        )
+        ai_settings = await SimulationSettingsCache.get(self._supabase, self._simulation_id, "ai")
 
         self._settings_cache = {}
-        for row in extract_list(response):
-            key = row["setting_key"]
-            value = row["setting_value"]
+        for key, value in ai_settings.items():
             # Strip surrounding quotes from JSON string values
             if isinstance(value, str) and value.startswith('"') and value.endswith('"'):
                 self._settings_cache[key] = value[1:-1]
@@ -0,0 +1,250 @@
+"""In-memory index of the multiverse connection graph.
+
+Echo evaluation (every high-impact event) and the Cartographer's Map used to
+rebuild the same graph from the database on every call: active
+``simulation_connections``, best embassy effectiveness per simulation pair
+(``mv_embassy_effectiveness``) and source instability
+(``mv_simulation_health``). This module keeps all three in process memory:
+
+- **Adjacency** — ``simulation → {connection key → neighbour}`` over active
+  connections, with the connection rows (including the joined simulation
+  summaries the map renders).
+- **Weights** — embassy effectiveness per unordered pair and instability per
+  simulation, read at query time so a metrics reload never touches the
+  adjacency.
+
+Updates are incremental: ``ConnectionService`` writes call
+``upsert_connection`` / ``remove_connection``, and ``GameMetricsRefresher``
+marks the weights stale after each MV refresh (reloaded lazily on the next
+query — two reads). Both halves also expire after ``_TTL_SECONDS`` so edits
+made by another worker converge.
+
+Every loaded source is visible to any client (active connections are public
+for the map, the MVs are granted to anon/authenticated), so loads use the
+caller's client without leaking across roles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from backend.utils.responses import extract_list
+from supabase import AsyncClient as Client
+
+logger = logging.getLogger(__name__)
+
+_TTL_SECONDS = 60.0
+
+CONNECTION_SELECT = (
+    "*, simulation_a:simulations!simulation_a_id(id, name, slug, theme, banner_url, description),"
+    " simulation_b:simulations!simulation_b_id(id, name, slug, theme, banner_url, description)"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class GraphEdge:
+    """One active connection seen from ``source``."""
+
+    source: str
+    target: str
+    connection: dict
+    strength: float
+    embassy_effectiveness: float
+
+    @property
+    def bleed_vectors(self) -> list[str]:
+        return self.connection.get("bleed_vectors") or []
+
+
+def _connection_key(row: dict) -> str:
+    return str(row.get("id") or f"{row['simulation_a_id']}|{row['simulation_b_id']}")
+
+
+def _pair(a: str, b: str) -> tuple[str, str]:
+    return (a, b) if a <= b else (b, a)
+
+
+class MultiverseGraph:
+    """Process-wide adjacency + weight index over simulation connections."""
+
+    _connections: dict[str, dict] = {}
+    _adjacency: dict[str, dict[str, str]] = {}
+    _embassy: dict[tuple[str, str], float] = {}
+    _instability: dict[str, float] = {}
+    _connections_loaded_at: float | None = None
+    _metrics_loaded_at: float | None = None
+    _lock: asyncio.Lock | None = None
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the whole index (tests)."""
+        cls._connections = {}
+        cls._adjacency = {}
+        cls._embassy = {}
+        cls._instability = {}
+        cls._connections_loaded_at = None
+        cls._metrics_loaded_at = None
+        cls._lock = None
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    # ── Loading ─────────────────────────────────────────────────
+
+    @classmethod
+    def _is_fresh(cls, loaded_at: float | None) -> bool:
+        return loaded_at is not None and time.monotonic() - loaded_at < _TTL_SECONDS
+
+    @classmethod
+    async def ensure_loaded(cls, supabase: Client) -> None:
+        """Load whichever half of the index is missing or expired (single-flight)."""
+        if cls._is_fresh(cls._connections_loaded_at) and cls._is_fresh(cls._metrics_loaded_at):
+            return
+        async with cls._get_lock():
+            if not cls._is_fresh(cls._connections_loaded_at):
+                await cls._load_connections(supabase)
+            if not cls._is_fresh(cls._metrics_loaded_at):
+                await cls._load_metrics(supabase)
+
+    @classmethod
+    async def _load_connections(cls, supabase: Client) -> None:
+        resp = await (
+            supabase.table("simulation_connections")
+            .select(CONNECTION_SELECT)
+            .eq("is_active", True)
+            .order("created_at", desc=False)
+            .execute()
+        )
+        cls._connections = {}
+        cls._adjacency = {}
+        for row in extract_list(resp):
+            cls._link(row)
+        cls._connections_loaded_at = time.monotonic()
+
+    @classmethod
+    async def _load_metrics(cls, supabase: Client) -> None:
+        health_resp, embassy_resp = await asyncio.gather(
+            supabase.table("mv_simulation_health").select("simulation_id, overall_health").execute(),
+            supabase.table("mv_embassy_effectiveness")
+            .select("simulation_a_id, simulation_b_id, effectiveness")
+            .execute(),
+        )
+        instability: dict[str, float] = {}
+        for row in extract_list(health_resp):
+            sim = row.get("simulation_id")
+            if sim:
+                health = row.get("overall_health")
+                instability[sim] = max(0.0, 1.0 - float(0.5 if health is None else health))
+        embassy: dict[tuple[str, str], float] = {}
+        for row in extract_list(embassy_resp):
+            a, b = row.get("simulation_a_id"), row.get("simulation_b_id")
+            if a and b:
+                key = _pair(a, b)
+                embassy[key] = max(embassy.get(key, 0.0), float(row.get("effectiveness") or 0.0))
+        cls._instability = instability
+        cls._embassy = embassy
+        cls._metrics_loaded_at = time.monotonic()
+
+    # ── Incremental updates ─────────────────────────────────────
+
+    @classmethod
+    def _link(cls, row: dict) -> None:
+        key = _connection_key(row)
+        a, b = str(row["simulation_a_id"]), str(row["simulation_b_id"])
+        cls._connections[key] = row
+        cls._adjacency.setdefault(a, {})[key] = b
+        cls._adjacency.setdefault(b, {})[key] = a
+
+    @classmethod
+    def _unlink(cls, key: str) -> None:
+        row = cls._connections.pop(key, None)
+        if row is None:
+            return
+        for sim in (str(row["simulation_a_id"]), str(row["simulation_b_id"])):
+            neighbours = cls._adjacency.get(sim)
+            if neighbours is not None:
+                neighbours.pop(key, None)
+                if not neighbours:
+                    del cls._adjacency[sim]
+
+    @classmethod
+    def upsert_connection(cls, row: dict) -> None:
+        """Apply a created/updated connection row to the adjacency."""
+        if cls._connections_loaded_at is None:
+            return  # not loaded yet — the first query reads the row from the DB
+        key = _connection_key(row)
+        previous = cls._connections.get(key)
+        cls._unlink(key)
+        if not row.get("is_active", True):
+            return
+        merged = dict(row)
+        # Write responses lack the joined simulation summaries the map renders.
+        for side in ("simulation_a", "simulation_b"):
+            if side not in merged and previous is not None and previous.get(f"{side}_id") == row.get(f"{side}_id"):
+                merged[side] = previous.get(side)
+        if "simulation_a" not in merged or "simulation_b" not in merged:
+            cls._connections_loaded_at = None  # new endpoints — reload with joins next query
+        cls._link(merged)
+
+    @classmethod
+    def remove_connection(cls, connection_id: UUID | str) -> None:
+        cls._unlink(str(connection_id))
+
+    @classmethod
+    def invalidate_metrics(cls) -> None:
+        """Embassy / health MVs were refreshed — reload weights on next query."""
+        cls._metrics_loaded_at = None
+
+    # ── Queries ─────────────────────────────────────────────────
+
+    @classmethod
+    def _edges_from(cls, sim: str) -> list[GraphEdge]:
+        edges = []
+        for key, target in cls._adjacency.get(sim, {}).items():
+            row = cls._connections[key]
+            edges.append(
+                GraphEdge(
+                    source=sim,
+                    target=target,
+                    connection=row,
+                    strength=float(row.get("strength", 0.5)),
+                    embassy_effectiveness=cls._embassy.get(_pair(sim, target), 0.0),
+                )
+            )
+        return edges
+
+    @classmethod
+    async def neighbors(cls, supabase: Client, simulation_id: UUID | str) -> list[GraphEdge]:
+        """Active connections of one simulation with their embassy weights."""
+        await cls.ensure_loaded(supabase)
+        return cls._edges_from(str(simulation_id))
+
+    @classmethod
+    async def instability(cls, supabase: Client, simulation_id: UUID | str) -> float:
+        """``1 - overall_health`` clamped at 0 (0.0 for simulations without metrics)."""
+        await cls.ensure_loaded(supabase)
+        return cls._instability.get(str(simulation_id), 0.0)
+
+    @classmethod
+    async def embassy_effectiveness(cls, supabase: Client, sim_a: UUID | str, sim_b: UUID | str) -> float:
+        """Best embassy effectiveness between two simulations (0.0 if none)."""
+        await cls.ensure_loaded(supabase)
+        return cls._embassy.get(_pair(str(sim_a), str(sim_b)), 0.0)
+
+    @classmethod
+    async def connections_among(cls, supabase: Client, simulation_ids: set[str]) -> list[dict]:
+        """Active connection rows whose endpoints are both in ``simulation_ids``."""
+        await cls.ensure_loaded(supabase)
+        rows = [
+            row
+            for row in cls._connections.values()
+            if str(row["simulation_a_id"]) in simulation_ids and str(row["simulation_b_id"]) in simulation_ids
+        ]
+        return sorted(rows, key=lambda r: r.get("created_at") or "")
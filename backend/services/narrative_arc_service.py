@@ -1,12 +1,22 @@
 """Narrative Arc Service — detects escalation, cascade, and convergence patterns.
 
 Called from HeartbeatService Phase 4. Pure DB computations, no AI.
+
+Set-based: a tick loads the simulation's tracked arcs and active events in
+two bulk reads (plus the cascade rules / convergence pairs when a phase has
+candidates), evaluates every phase in memory against that snapshot, and
+writes each phase's result in one batch — one upsert for all arc
+transitions, one insert per phase for new arcs, one update for triggered
+rule cooldowns. Round trips no longer grow with arcs × rules.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from uuid import UUID, uuid4
 
@@ -20,6 +30,45 @@ from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
 
+_OPEN_STATUSES = ("building", "active", "climax")
+_TRACKED_STATUSES = (*_OPEN_STATUSES, "resolving")
+
+# Columns owned by arc advancement. The batched transition upsert writes only
+# these (identity + NOT NULL columns included so the upsert's INSERT arm is
+# valid), leaving scar tissue and spawned-event bookkeeping untouched.
+_TRANSITION_COLUMNS = (
+    "id",
+    "simulation_id",
+    "arc_type",
+    "primary_signature",
+    "status",
+    "pressure",
+    "peak_pressure",
+    "last_active_tick",
+    "ticks_active",
+    "climax_start_tick",
+)
+
+
+@dataclass
+class _ArcSnapshot:
+    """One simulation's arc-engine inputs, loaded in bulk once per tick.
+
+    ``arcs`` holds every arc in a tracked status and is updated in place as
+    phases run (transitions applied, new arcs appended), so each phase sees
+    exactly the state it would previously have re-queried from the database.
+    """
+
+    arcs: list[dict]
+    events: list[dict]
+
+    def arcs_of(self, arc_type: str, statuses: tuple[str, ...]) -> list[dict]:
+        return [a for a in self.arcs if a.get("arc_type") == arc_type and a["status"] in statuses]
+
+    def events_tagged(self) -> Counter[str]:
+        """Active events per tag (an event counts once per tag, like ``contains``)."""
+        return Counter(tag for e in self.events for tag in set(e.get("tags") or []))
+
 
 class NarrativeArcService:
     """Detects and advances narrative arcs during heartbeat ticks."""
@@ -37,47 +86,64 @@ class NarrativeArcService:
     ) -> tuple[list[dict], int, bool]:
         """Run arc detection and advancement. Returns (entries, cascade_spawned, convergence_detected)."""
         entries: list[dict] = []
-        cascade_spawned = 0
-        convergence_detected = False
+        snapshot = await cls._load_snapshot(admin, sim_id)
 
         # Advance existing arcs
-        advance_entries = await cls._advance_arcs(admin, sim_id, tick_number, heartbeat_id)
+        advance_entries = await cls._advance_arcs(admin, snapshot, sim_id, tick_number, heartbeat_id)
         entries.extend(advance_entries)
 
         # Detect escalation
-        esc_entries = await cls._detect_escalation(admin, sim_id, tick_number, heartbeat_id, config)
+        esc_entries = await cls._detect_escalation(admin, snapshot, sim_id, tick_number, heartbeat_id, config)
         entries.extend(esc_entries)
 
         # Detect cascade
-        cas_entries, spawned = await cls._detect_cascade(
+        cas_entries, cascade_spawned = await cls._detect_cascade(
             admin,
+            snapshot,
             sim_id,
             tick_number,
             heartbeat_id,
             config,
         )
         entries.extend(cas_entries)
-        cascade_spawned = spawned
 
         # Detect convergence
-        conv_entries, detected = await cls._detect_convergence(
+        conv_entries, convergence_detected = await cls._detect_convergence(
             admin,
+            snapshot,
             sim_id,
             tick_number,
             heartbeat_id,
-            config,
         )
         entries.extend(conv_entries)
-        convergence_detected = detected
 
         return entries, cascade_spawned, convergence_detected
 
+    @classmethod
+    async def _load_snapshot(cls, admin: Client, sim_id: UUID) -> _ArcSnapshot:
+        """Bulk-load tracked arcs and active events (two concurrent reads)."""
+        arcs_resp, events_resp = await asyncio.gather(
+            admin.table("narrative_arcs")
+            .select("*")
+            .eq("simulation_id", str(sim_id))
+            .in_("status", list(_TRACKED_STATUSES))
+            .execute(),
+            admin.table("events")
+            .select("id, title, tags, event_status")
+            .eq("simulation_id", str(sim_id))
+            .is_("deleted_at", "null")
+            .in_("event_status", ["active", "escalating"])
+            .execute(),
+        )
+        return _ArcSnapshot(arcs=extract_list(arcs_resp), events=extract_list(events_resp))
+
     # ── Escalation Detection ────────────────────────────────────
 
     @classmethod
     async def _detect_escalation(
         cls,
         admin: Client,
+        snapshot: _ArcSnapshot,
         sim_id: UUID,
         tick_number: int,
         heartbeat_id: UUID,
@@ -87,47 +153,24 @@ class NarrativeArcService:
         entries: list[dict] = []
         threshold = config.get("escalation_threshold", 3)
 
-        # Get active events with resonance tags
-        response = await (
-            admin.table("events")
-            .select("id, title, tags, event_status")
-            .eq("simulation_id", str(sim_id))
-            .is_("deleted_at", "null")
-            .in_("event_status", ["active", "escalating"])
-            .execute()
-        )
-        events = extract_list(response)
-        if not events:
+        if not snapshot.events:
             return entries
 
         # Group by resonance signature tag
         sig_events: dict[str, list[dict]] = {}
-        for event in events:
+        for event in snapshot.events:
             tags = event.get("tags") or []
             for tag in tags:
                 if tag in RESONANCE_SIGNATURES:
                     sig_events.setdefault(tag, []).append(event)
 
+        # Signatures already tracked — advancement happens in _advance_arcs
+        tracked = {a.get("primary_signature") for a in snapshot.arcs_of("escalation", _OPEN_STATUSES)}
+        new_arcs: list[dict] = []
+
         # Check each signature against threshold
         for signature, sig_event_list in sig_events.items():
-            if len(sig_event_list) < threshold:
-                continue
-
-            # Check if an escalation arc already exists for this signature
-            _resp = await (
-                admin.table("narrative_arcs")
-                .select("id, status, pressure")
-                .eq("simulation_id", str(sim_id))
-                .eq("arc_type", "escalation")
-                .eq("primary_signature", signature)
-                .in_("status", ["building", "active", "climax"])
-                .limit(1)
-                .execute()
-            )
-            existing = _resp.data
-
-            if existing:
-                # Arc already tracked — advancement happens in _advance_arcs
+            if len(sig_event_list) < threshold or signature in tracked:
                 continue
 
             # Create new escalation arc
@@ -135,24 +178,20 @@ class NarrativeArcService:
             arc_id = uuid4()
             initial_pressure = round(min(1.0, 0.1 * (len(sig_event_list) - threshold + 1)), 4)
 
-            await (
-                admin.table("narrative_arcs")
-                .insert(
-                    {
-                        "id": str(arc_id),
-                        "simulation_id": str(sim_id),
-                        "arc_type": "escalation",
-                        "primary_signature": signature,
-                        "status": "building",
-                        "pressure": initial_pressure,
-                        "peak_pressure": initial_pressure,
-                        "started_at_tick": tick_number,
-                        "last_active_tick": tick_number,
-                        "ticks_active": 1,
-                        "source_event_ids": event_ids,
-                    }
-                )
-                .execute()
+            new_arcs.append(
+                {
+                    "id": str(arc_id),
+                    "simulation_id": str(sim_id),
+                    "arc_type": "escalation",
+                    "primary_signature": signature,
+                    "status": "building",
+                    "pressure": initial_pressure,
+                    "peak_pressure": initial_pressure,
+                    "started_at_tick": tick_number,
+                    "last_active_tick": tick_number,
+                    "ticks_active": 1,
+                    "source_event_ids": event_ids,
+                }
             )
 
             entries.append(
@@ -184,6 +223,10 @@ class NarrativeArcService:
                 extra={"simulation_id": str(sim_id), "arc_id": str(arc_id)},
             )
 
+        if new_arcs:
+            await admin.table("narrative_arcs").insert(new_arcs).execute()
+            snapshot.arcs.extend(new_arcs)
+
         return entries
 
     # ── Cascade Detection ───────────────────────────────────────
@@ -192,6 +235,7 @@ class NarrativeArcService:
     async def _detect_cascade(
         cls,
         admin: Client,
+        snapshot: _ArcSnapshot,
         sim_id: UUID,
         tick_number: int,
         heartbeat_id: UUID,
@@ -202,18 +246,10 @@ class NarrativeArcService:
         spawned = 0
         trigger = config.get("cascade_pressure_trigger", 0.60)
 
-        # Get active arcs above trigger
-        _resp = await (
-            admin.table("narrative_arcs")
-            .select("id, primary_signature, pressure, status")
-            .eq("simulation_id", str(sim_id))
-            .eq("arc_type", "escalation")
-            .in_("status", ["active", "climax"])
-            .gte("pressure", trigger)
-            .execute()
-        )
-        arcs = extract_list(_resp)
-
+        # Active arcs above trigger
+        arcs = [
+            a for a in snapshot.arcs_of("escalation", ("active", "climax")) if float(a.get("pressure", 0)) >= trigger
+        ]
         if not arcs:
             return entries, spawned
 
@@ -224,15 +260,22 @@ class NarrativeArcService:
         if not rules:
             return entries, spawned
 
+        rules_by_source: dict[str, list[dict]] = defaultdict(list)
+        for rule in rules:
+            rules_by_source[rule["source_signature"]].append(rule)
+
+        open_cascades = snapshot.arcs_of("cascade", _OPEN_STATUSES)
+        existing_pairs = {(a.get("primary_signature"), a.get("secondary_signature")) for a in open_cascades}
+        depth_count = len(open_cascades)
+
         now = datetime.now(UTC)
+        new_arcs: list[dict] = []
+        triggered_rule_ids: list[str] = []
 
         for arc in arcs:
             source_sig = arc["primary_signature"]
 
-            for rule in rules:
-                if rule["source_signature"] != source_sig:
-                    continue
-
+            for rule in rules_by_source.get(source_sig, []):
                 target_sig = rule["target_signature"]
 
                 # Check cooldown
@@ -247,33 +290,10 @@ class NarrativeArcService:
                         pass
 
                 # Check if cascade arc already exists
-                _resp = await (
-                    admin.table("narrative_arcs")
-                    .select("id")
-                    .eq("simulation_id", str(sim_id))
-                    .eq("arc_type", "cascade")
-                    .eq("primary_signature", source_sig)
-                    .eq("secondary_signature", target_sig)
-                    .in_("status", ["building", "active", "climax"])
-                    .limit(1)
-                    .execute()
-                )
-                existing_cascade = _resp.data
-                if existing_cascade:
+                if (source_sig, target_sig) in existing_pairs:
                     continue
 
                 # Check depth cap
-                depth_count = len(
-                    (
-                        await admin.table("narrative_arcs")
-                        .select("id")
-                        .eq("simulation_id", str(sim_id))
-                        .eq("arc_type", "cascade")
-                        .in_("status", ["building", "active", "climax"])
-                        .execute()
-                    ).data
-                    or []
-                )
                 if depth_count >= rule.get("depth_cap", 5):
                     continue
 
@@ -282,37 +302,27 @@ class NarrativeArcService:
                 child_pressure = round(float(arc["pressure"]) * transfer, 4)
                 cascade_id = uuid4()
 
-                await (
-                    admin.table("narrative_arcs")
-                    .insert(
-                        {
-                            "id": str(cascade_id),
-                            "simulation_id": str(sim_id),
-                            "arc_type": "cascade",
-                            "primary_signature": source_sig,
-                            "secondary_signature": target_sig,
-                            "status": "building",
-                            "pressure": child_pressure,
-                            "peak_pressure": child_pressure,
-                            "started_at_tick": tick_number,
-                            "last_active_tick": tick_number,
-                            "ticks_active": 1,
-                        }
-                    )
-                    .execute()
+                new_arcs.append(
+                    {
+                        "id": str(cascade_id),
+                        "simulation_id": str(sim_id),
+                        "arc_type": "cascade",
+                        "primary_signature": source_sig,
+                        "secondary_signature": target_sig,
+                        "status": "building",
+                        "pressure": child_pressure,
+                        "peak_pressure": child_pressure,
+                        "started_at_tick": tick_number,
+                        "last_active_tick": tick_number,
+                        "ticks_active": 1,
+                    }
                 )
+                existing_pairs.add((source_sig, target_sig))
+                depth_count += 1
 
-                # Update cooldown on rule
-                await (
-                    admin.table("resonance_cascade_rules")
-                    .update(
-                        {
-                            "last_triggered_at": now.isoformat(),
-                        }
-                    )
-                    .eq("id", rule["id"])
-                    .execute()
-                )
+                # Cooldown starts now (persisted below in one update)
+                rule["last_triggered_at"] = now.isoformat()
+                triggered_rule_ids.append(rule["id"])
 
                 spawned += 1
 
@@ -347,6 +357,20 @@ class NarrativeArcService:
                     extra={"simulation_id": str(sim_id), "cascade_id": str(cascade_id)},
                 )
 
+        if new_arcs:
+            await admin.table("narrative_arcs").insert(new_arcs).execute()
+            snapshot.arcs.extend(new_arcs)
+            await (
+                admin.table("resonance_cascade_rules")
+                .update(
+                    {
+                        "last_triggered_at": now.isoformat(),
+                    }
+                )
+                .in_("id", triggered_rule_ids)
+                .execute()
+            )
+
         return entries, spawned
 
     # ── Convergence Detection ───────────────────────────────────
@@ -355,15 +379,19 @@ class NarrativeArcService:
     async def _detect_convergence(
         cls,
         admin: Client,
+        snapshot: _ArcSnapshot,
         sim_id: UUID,
         tick_number: int,
         heartbeat_id: UUID,
-        config: dict,
     ) -> tuple[list[dict], bool]:
         """Detect archetype convergence pairings."""
         entries: list[dict] = []
         detected = False
 
+        active_arcs = [a for a in snapshot.arcs if a["status"] in ("active", "climax")]
+        if len(active_arcs) < 2:
+            return entries, detected
+
         # Get convergence pairs config
         try:
             _resp = await (
@@ -383,19 +411,6 @@ class NarrativeArcService:
             logger.warning("Failed to load convergence pairs config")
             return entries, detected
 
-        # Get active arcs with archetypes
-        _resp = await (
-            admin.table("narrative_arcs")
-            .select("id, primary_archetype, secondary_archetype, status")
-            .eq("simulation_id", str(sim_id))
-            .in_("status", ["active", "climax"])
-            .execute()
-        )
-        active_arcs = extract_list(_resp)
-
-        if len(active_arcs) < 2:
-            return entries, detected
-
         # Collect all active archetypes
         active_archetypes: set[str] = set()
         for arc in active_arcs:
@@ -407,6 +422,14 @@ class NarrativeArcService:
                 name = arc["secondary_archetype"].replace("The ", "")
                 active_archetypes.add(name)
 
+        existing_pairs = {
+            (a.get("primary_archetype"), a.get("secondary_archetype"))
+            for a in active_arcs
+            if a.get("arc_type") == "convergence"
+        }
+        new_arcs: list[dict] = []
+        lore: list[tuple[str, str, str, str]] = []
+
         # Check convergence pairs
         for pair_key, pair_data in pairs.items():
             parts = pair_key.split("+")
@@ -414,86 +437,68 @@ class NarrativeArcService:
                 continue
 
             arch_a, arch_b = parts[0].strip(), parts[1].strip()
-            if arch_a in active_archetypes and arch_b in active_archetypes:
-                # Check if convergence already exists for this tick
-                _resp = await (
-                    admin.table("narrative_arcs")
-                    .select("id")
-                    .eq("simulation_id", str(sim_id))
-                    .eq("arc_type", "convergence")
-                    .eq("primary_archetype", arch_a)
-                    .eq("secondary_archetype", arch_b)
-                    .in_("status", ["active", "climax"])
-                    .limit(1)
-                    .execute()
-                )
-                existing = _resp.data
-                if existing:
-                    continue
-
-                conv_name = pair_data.get("name", f"{arch_a} + {arch_b}")
-                conv_id = uuid4()
+            if arch_a not in active_archetypes or arch_b not in active_archetypes:
+                continue
+            if (arch_a, arch_b) in existing_pairs:
+                continue
 
-                await (
-                    admin.table("narrative_arcs")
-                    .insert(
-                        {
-                            "id": str(conv_id),
-                            "simulation_id": str(sim_id),
-                            "arc_type": "convergence",
-                            "primary_archetype": arch_a,
-                            "secondary_archetype": arch_b,
-                            "status": "active",
-                            "pressure": 0.5,
-                            "peak_pressure": 0.5,
-                            "started_at_tick": tick_number,
-                            "last_active_tick": tick_number,
-                            "ticks_active": 1,
-                        }
-                    )
-                    .execute()
-                )
+            conv_name = pair_data.get("name", f"{arch_a} + {arch_b}")
+            conv_id = uuid4()
+
+            new_arcs.append(
+                {
+                    "id": str(conv_id),
+                    "simulation_id": str(sim_id),
+                    "arc_type": "convergence",
+                    "primary_archetype": arch_a,
+                    "secondary_archetype": arch_b,
+                    "status": "active",
+                    "pressure": 0.5,
+                    "peak_pressure": 0.5,
+                    "started_at_tick": tick_number,
+                    "last_active_tick": tick_number,
+                    "ticks_active": 1,
+                }
+            )
+            existing_pairs.add((arch_a, arch_b))
 
-                detected = True
-                effects = pair_data.get("effects", {})
-                effects_desc = ", ".join(f"{k}: {v:+.2f}" for k, v in effects.items())
+            detected = True
+            effects = pair_data.get("effects", {})
+            effects_desc = ", ".join(f"{k}: {v:+.2f}" for k, v in effects.items())
 
-                entries.append(
-                    make_heartbeat_entry(
-                        heartbeat_id,
-                        sim_id,
-                        tick_number,
-                        "convergence",
-                        f"CONVERGENCE DETECTED: The {arch_a} + The {arch_b} = '{conv_name}'. {effects_desc}.",
-                        f"KONVERGENZ ERKANNT: Der {arch_a} + Der {arch_b} = '{conv_name}'. {effects_desc}.",
-                        severity="critical",
-                        metadata={
-                            "arc_id": str(conv_id),
-                            "convergence_name": conv_name,
-                            "archetype_a": arch_a,
-                            "archetype_b": arch_b,
-                            "effects": effects,
-                        },
-                    )
+            entries.append(
+                make_heartbeat_entry(
+                    heartbeat_id,
+                    sim_id,
+                    tick_number,
+                    "convergence",
+                    f"CONVERGENCE DETECTED: The {arch_a} + The {arch_b} = '{conv_name}'. {effects_desc}.",
+                    f"KONVERGENZ ERKANNT: Der {arch_a} + Der {arch_b} = '{conv_name}'. {effects_desc}.",
+                    severity="critical",
+                    metadata={
+                        "arc_id": str(conv_id),
+                        "convergence_name": conv_name,
+                        "archetype_a": arch_a,
+                        "archetype_b": arch_b,
+                        "effects": effects,
+                    },
                 )
+            )
 
-                logger.info(
-                    "Convergence detected: %s + %s = '%s'",
-                    arch_a,
-                    arch_b,
-                    conv_name,
-                    extra={"simulation_id": str(sim_id), "convergence_id": str(conv_id)},
-                )
+            logger.info(
+                "Convergence detected: %s + %s = '%s'",
+                arch_a,
+                arch_b,
+                conv_name,
+                extra={"simulation_id": str(sim_id), "convergence_id": str(conv_id)},
+            )
+            lore.append((arch_a, arch_b, conv_name, effects_desc))
 
-                # Generate new lore section from convergence (world evolution)
-                await cls._create_convergence_lore(
-                    admin,
-                    sim_id,
-                    arch_a,
-                    arch_b,
-                    conv_name,
-                    effects_desc,
-                )
+        if new_arcs:
+            await admin.table("narrative_arcs").insert(new_arcs).execute()
+            snapshot.arcs.extend(new_arcs)
+            # Generate new lore sections from convergences (world evolution)
+            await cls._create_convergence_lore(admin, sim_id, lore)
 
         return entries, detected
 
@@ -502,12 +507,9 @@ class NarrativeArcService:
         cls,
         admin: Client,
         sim_id: UUID,
-        arch_a: str,
-        arch_b: str,
-        conv_name: str,
-        effects_desc: str,
+        convergences: list[tuple[str, str, str, str]],
     ) -> None:
-        """Create a new lore section when a convergence is detected."""
+        """Create one lore section per detected convergence ``(arch_a, arch_b, name, effects_desc)``."""
         try:
             # Find next sort_order
             existing = (
@@ -520,36 +522,35 @@ class NarrativeArcService:
             ).data
             next_order = (existing[0]["sort_order"] + 1) if existing else 0
 
-            await (
-                admin.table("simulation_lore")
-                .insert(
-                    {
-                        "simulation_id": str(sim_id),
-                        "sort_order": next_order,
-                        "chapter": "Echoes of Convergence",
-                        "arcanum": f"The {conv_name}",
-                        "title": conv_name,
-                        "epigraph": f"When The {arch_a} met The {arch_b}, the substrate trembled.",
-                        "body": (
-                            f"The convergence of The {arch_a} and The {arch_b} reshaped the fabric "
-                            f"of this simulation. Known as '{conv_name}', this moment marked a turning "
-                            f"point in the world's history. {effects_desc}"
-                        ),
-                    }
+            rows = [
+                {
+                    "simulation_id": str(sim_id),
+                    "sort_order": next_order + i,
+                    "chapter": "Echoes of Convergence",
+                    "arcanum": f"The {conv_name}",
+                    "title": conv_name,
+                    "epigraph": f"When The {arch_a} met The {arch_b}, the substrate trembled.",
+                    "body": (
+                        f"The convergence of The {arch_a} and The {arch_b} reshaped the fabric "
+                        f"of this simulation. Known as '{conv_name}', this moment marked a turning "
+                        f"point in the world's history. {effects_desc}"
+                    ),
+                }
+                for i, (arch_a, arch_b, conv_name, effects_desc) in enumerate(convergences)
+            ]
+            await admin.table("simulation_lore").insert(rows).execute()
+
+            for row in rows:
+                logger.info(
+                    "Convergence lore created: '%s' (order %d)",
+                    row["title"],
+                    row["sort_order"],
+                    extra={"simulation_id": str(sim_id), "convergence_name": row["title"]},
                 )
-                .execute()
-            )
-
-            logger.info(
-                "Convergence lore created: '%s' (order %d)",
-                conv_name,
-                next_order,
-                extra={"simulation_id": str(sim_id), "convergence_name": conv_name},
-            )
         except (PostgrestAPIError, httpx.HTTPError, KeyError):
             logger.warning(
-                "Failed to create convergence lore for '%s'",
-                conv_name,
+                "Failed to create convergence lore for %s",
+                ", ".join(f"'{c[2]}'" for c in convergences),
                 extra={"simulation_id": str(sim_id)},
                 exc_info=True,
             )
@@ -560,23 +561,18 @@ class NarrativeArcService:
     async def _advance_arcs(
         cls,
         admin: Client,
+        snapshot: _ArcSnapshot,
         sim_id: UUID,
         tick_number: int,
         heartbeat_id: UUID,
     ) -> list[dict]:
         """Increment ticks, update pressure, check climax, age dormant arcs."""
         entries: list[dict] = []
+        event_counts = snapshot.events_tagged()
+        transitions: list[dict] = []
+        scarring: list[dict] = []
 
-        _resp = await (
-            admin.table("narrative_arcs")
-            .select("*")
-            .eq("simulation_id", str(sim_id))
-            .in_("status", ["building", "active", "climax", "resolving"])
-            .execute()
-        )
-        active_arcs = extract_list(_resp)
-
-        for arc in active_arcs:
+        for arc in snapshot.arcs:
             arc_id = arc["id"]
             arc_status = arc["status"]
             arc_type = arc.get("arc_type", "escalation")
@@ -610,19 +606,7 @@ class NarrativeArcService:
                 # Pressure growth for escalation arcs
                 if arc_type == "escalation":
                     # Count matching events
-                    sig = arc.get("primary_signature", "")
-                    event_count = len(
-                        (
-                            await admin.table("events")
-                            .select("id")
-                            .eq("simulation_id", str(sim_id))
-                            .is_("deleted_at", "null")
-                            .in_("event_status", ["active", "escalating"])
-                            .contains("tags", [sig])
-                            .execute()
-                        ).data
-                        or []
-                    )
+                    event_count = event_counts[arc.get("primary_signature", "")]
                     pressure = round(min(1.0, pressure + 0.1 * max(0, event_count - 2)), 4)
 
                 update_data["pressure"] = pressure
@@ -687,15 +671,15 @@ class NarrativeArcService:
 
                     # Scar zones if peak pressure was significant
                     if peak > 0.5:
-                        await cls._scar_affected_zones(
-                            admin,
-                            sim_id,
-                            arc,
-                            arc_type,
-                            sig,
-                        )
+                        scarring.append(arc)
+
+            arc.update(update_data)
+            transitions.append({col: arc.get(col) for col in _TRANSITION_COLUMNS})
 
-            await admin.table("narrative_arcs").update(update_data).eq("id", arc_id).execute()
+        if transitions:
+            await admin.table("narrative_arcs").upsert(transitions, on_conflict="id").execute()
+        if scarring:
+            await cls._scar_affected_zones(admin, sim_id, scarring)
 
         return entries
 
@@ -706,61 +690,73 @@ class NarrativeArcService:
         cls,
         admin: Client,
         sim_id: UUID,
-        arc: dict,
-        arc_type: str,
-        signature: str,
+        arcs: list[dict],
     ) -> None:
-        """Append scar description to zones affected by a resolved high-pressure arc."""
+        """Append scar descriptions to zones affected by resolved high-pressure arcs.
+
+        Links and zones for all arcs are read in one query each; only zones
+        whose description actually changes are written.
+        """
+        arcs = [a for a in arcs if a.get("source_event_ids")]
+        if not arcs:
+            return
         try:
-            source_event_ids = arc.get("source_event_ids") or []
-            if not source_event_ids:
-                return
+            event_ids = list(dict.fromkeys(eid for a in arcs for eid in a["source_event_ids"]))
 
-            # Find zones linked to the arc's source events
+            # Find zones linked to the arcs' source events
             zone_links = (
-                await admin.table("event_zone_links").select("zone_id").in_("event_id", source_event_ids).execute()
+                await admin.table("event_zone_links").select("event_id, zone_id").in_("event_id", event_ids).execute()
             ).data or []
-
-            seen_zones: set[str] = set()
-            scar_suffix = f" The district still bears marks of the {arc_type} of {signature}."
-
+            zones_by_event: dict[str, list[str]] = defaultdict(list)
             for link in zone_links:
-                zone_id = link["zone_id"]
-                if zone_id in seen_zones:
-                    continue
-                seen_zones.add(zone_id)
-
-                zone = (await admin.table("zones").select("id, description").eq("id", zone_id).limit(1).execute()).data
-                if zone:
-                    current_desc = zone[0].get("description") or ""
-                    if scar_suffix not in current_desc:
-                        await (
-                            admin.table("zones")
-                            .update(
-                                {
-                                    "description": current_desc + scar_suffix,
-                                }
-                            )
-                            .eq("id", zone_id)
-                            .execute()
-                        )
+                zones_by_event[link["event_id"]].append(link["zone_id"])
 
-            if seen_zones:
-                logger.info(
-                    "Scarred %d zone(s) from resolved %s/%s arc",
-                    len(seen_zones),
-                    arc_type,
-                    signature,
-                    extra={
-                        "simulation_id": str(sim_id),
-                        "arc_id": arc.get("id"),
-                        "zones_scarred": len(seen_zones),
-                    },
+            zone_ids = list(dict.fromkeys(link["zone_id"] for link in zone_links))
+            if not zone_ids:
+                return
+            zones = (await admin.table("zones").select("id, description").in_("id", zone_ids).execute()).data or []
+            descriptions = {z["id"]: z.get("description") or "" for z in zones}
+            changed: dict[str, str] = {}
+
+            for arc in arcs:
+                arc_type = arc.get("arc_type", "escalation")
+                signature = arc.get("primary_signature", "unknown")
+                scar_suffix = f" The district still bears marks of the {arc_type} of {signature}."
+                arc_zones = dict.fromkeys(z for eid in arc["source_event_ids"] for z in zones_by_event.get(eid, []))
+
+                for zone_id in arc_zones:
+                    if zone_id in descriptions and scar_suffix not in descriptions[zone_id]:
+                        descriptions[zone_id] += scar_suffix
+                        changed[zone_id] = descriptions[zone_id]
+
+                if arc_zones:
+                    logger.info(
+                        "Scarred %d zone(s) from resolved %s/%s arc",
+                        len(arc_zones),
+                        arc_type,
+                        signature,
+                        extra={
+                            "simulation_id": str(sim_id),
+                            "arc_id": arc.get("id"),
+                            "zones_scarred": len(arc_zones),
+                        },
+                    )
+
+            for zone_id, description in changed.items():
+                await (
+                    admin.table("zones")
+                    .update(
+                        {
+                            "description": description,
+                        }
+                    )
+                    .eq("id", zone_id)
+                    .execute()
                 )
         except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError):
             logger.warning(
-                "Failed to scar zones for arc %s",
-                arc.get("id"),
+                "Failed to scar zones for arcs %s",
+                [a.get("id") for a in arcs],
                 extra={"simulation_id": str(sim_id)},
                 exc_info=True,
             )
@@ -1,9 +1,10 @@
 """Operative mission execution: deploy, resolve, recall, and fortification logic."""
 
 import asyncio
-import json
 import logging
+import random
 import secrets
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
@@ -19,9 +20,10 @@ from backend.services.constants import (
     OPERATIVE_DEPLOY_CYCLES,
     OPERATIVE_MISSION_CYCLES,
     OPERATIVE_RP_COSTS,
-    SECURITY_LEVEL_MAP,
 )
 from backend.services.epoch_service import EpochService
+from backend.services.success_modifier_table import SuccessModifierTable, success_probability
+from backend.utils.data_loader import DataLoaders
 from backend.utils.db import maybe_single_data
 from backend.utils.errors import bad_request, conflict, forbidden, not_found, server_error
 from backend.utils.responses import extract_list
@@ -29,6 +31,24 @@ from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
 
+_FAILURE_RESULTS = {
+    "detected": {"outcome": "detected", "narrative": "The operative was detected."},
+    "failed": {"outcome": "failed", "narrative": "The mission failed quietly."},
+}
+
+
+def roll_mission_outcome(success_prob: float, detection_threshold: float, rng: random.Random) -> str:
+    """Roll one mission: ``success``, ``detected`` or ``failed``.
+
+    Detection uses a SEPARATE probability from success (configurable via
+    ``detection_on_failure`` in EpochConfig). This avoids the old bug where
+    a highly skilled operative (high success_prob) was paradoxically MORE
+    detectable when failing.
+    """
+    if rng.random() <= success_prob:
+        return "success"
+    return "detected" if rng.random() < detection_threshold else "failed"
+
 
 class OperativeMissionService:
     """Service for deploying, resolving, recalling operatives, and zone fortification."""
@@ -43,6 +63,8 @@ class OperativeMissionService:
         simulation_id: UUID,
         body: OperativeDeploy,
         admin_supabase: Client | None = None,
+        *,
+        loaders: DataLoaders | None = None,
     ) -> dict:
         """Deploy an operative agent on a mission.
 
@@ -160,6 +182,8 @@ class OperativeMissionService:
             admin_supabase=admin_supabase,
             epoch_config=config,
             resonance_surge_bonus=resonance_surge_bonus,
+            epoch_id=epoch_id,
+            cycle=epoch.get("current_cycle", 1),
         )
 
         # Calculate resolve time
@@ -197,6 +221,8 @@ class OperativeMissionService:
             raise server_error("Failed to create operative mission.")
 
         mission = resp.data[0]
+        if body.operative_type == "guardian" and mission_data["status"] == "active":
+            SuccessModifierTable.note_guardians(epoch_id, simulation_id, +1)
 
         # Build context from data already available in this method
         # Agent name already fetched at line 172 (validation query)
@@ -205,22 +231,22 @@ class OperativeMissionService:
             "target_sim_name": None,
             "target_zone_name": None,
         }
+        # Target names through the loaders: concurrent, and cached across
+        # the several deployments a bot makes per cycle.
+        loaders = loaders or DataLoaders(supabase)
         try:
-            if body.target_simulation_id:
-                sim_data = await maybe_single_data(
-                    supabase.table("simulations")
-                    .select("name")
-                    .eq("id", str(body.target_simulation_id))
-                    .maybe_single()
-                )
-                if sim_data:
-                    context["target_sim_name"] = sim_data["name"]
-            if body.target_zone_id:
-                zone_data = await maybe_single_data(
-                    supabase.table("zones").select("name").eq("id", str(body.target_zone_id)).maybe_single()
-                )
-                if zone_data:
-                    context["target_zone_name"] = zone_data["name"]
+            sim_data, zone_data = await asyncio.gather(
+                loaders.get("simulations", select="id, name").load(body.target_simulation_id)
+                if body.target_simulation_id
+                else asyncio.sleep(0),
+                loaders.get("zones", select="id, name").load(body.target_zone_id)
+                if body.target_zone_id
+                else asyncio.sleep(0),
+            )
+            if sim_data:
+                context["target_sim_name"] = sim_data["name"]
+            if zone_data:
+                context["target_zone_name"] = zone_data["name"]
         except (PostgrestAPIError, httpx.HTTPError):
             logger.debug("Context lookup failed", exc_info=True)
 
@@ -256,154 +282,40 @@ class OperativeMissionService:
         *,
         epoch_config: dict | None = None,
         resonance_surge_bonus: float = 0.0,
+        epoch_id: UUID | None = None,
+        cycle: int | None = None,
     ) -> float:
         """Calculate mission success probability using configurable parameters.
 
         All balance values read from epoch_config (EpochConfig fields) with
-        sensible fallbacks matching the canonical defaults.
-
-        Formula:
-          base_success_probability
-          + agent_aptitude x aptitude_modifier_pp
-          - target_zone_security x 0.05
-          - min(guardian_defense_cap_pp, guardian_count x guardian_per_unit_pp)
-          + embassy_effectiveness x embassy_bonus_pp
-          + resonance_pressure (0.00 to +0.04)
-          + resonance_operative_mod (-0.04 to +0.04)
-          + attacker_pressure_penalty (-0.04 to 0.00)
-          + convergence_mod + mood_modifier
-          Clamped to [probability_floor, probability_ceiling]
+        sensible fallbacks matching the canonical defaults; the formula is
+        ``success_probability``. With ``epoch_id`` the target-side inputs come
+        from the epoch's ``SuccessModifierTable`` for ``cycle`` — only the
+        agent's aptitude and mood are looked up per deploy.
         """
-        cfg = epoch_config or {}
-        base = cfg.get("base_success_probability", 0.55)
-
-        # Admin client for cross-sim reads (target zones/guardians/embassies
-        # may be in a game instance the user's JWT can't access via RLS)
         admin = admin_supabase or supabase
-
-        # ── Batch 1: Independent data lookups (parallel) ─────────
-        # Aptitude, zone security, guardian count, embassy — all independent.
-        # Running concurrently cuts latency from ~4 sequential queries to ~1.
-
-        async def _fetch_aptitude() -> int:
-            return await AptitudeService.get_aptitude_for_operative(supabase, body.agent_id, body.operative_type)
-
-        async def _fetch_zone_security() -> float:
-            if not body.target_zone_id:
-                return 5.0  # default moderate
-            zone_data = await maybe_single_data(
-                admin.table("zones").select("security_level").eq("id", str(body.target_zone_id)).maybe_single()
-            )
-            if zone_data:
-                return SECURITY_LEVEL_MAP.get(zone_data.get("security_level", "moderate"), 5.0)
-            return 5.0
-
-        async def _fetch_guardian_count() -> int:
-            if not body.target_simulation_id:
-                return 0
-            guardians_resp = await (
-                admin.table("operative_missions")
-                .select("id", count="exact")
-                .eq("operative_type", "guardian")
-                .eq("source_simulation_id", str(body.target_simulation_id))
-                .in_("status", ["active"])
-                .execute()
-            )
-            return guardians_resp.count or 0
-
-        async def _fetch_embassy_eff() -> float:
-            if not body.embassy_id:
-                return 0.5
-            emb_data = await maybe_single_data(
-                admin.table("embassies")
-                .select("id, infiltration_penalty, infiltration_penalty_expires_at")
-                .eq("id", str(body.embassy_id))
-                .maybe_single()
-            )
-            if not emb_data:
-                return 0.5
-            base_eff = 0.6
-            penalty = float(emb_data.get("infiltration_penalty") or 0)
-            expires_at = emb_data.get("infiltration_penalty_expires_at")
-            if penalty > 0 and expires_at:
-                if datetime.fromisoformat(expires_at.replace("Z", "+00:00")) > datetime.now(UTC):
-                    base_eff *= 1.0 - penalty
-                else:
-                    # Penalty expired — clear it lazily (fire-and-forget)
-                    await admin.table("embassies").update(
-                        {"infiltration_penalty": 0, "infiltration_penalty_expires_at": None}
-                    ).eq("id", str(body.embassy_id)).execute()
-            return base_eff
-
-        aptitude, zone_security, guardian_count, embassy_eff = await asyncio.gather(
-            _fetch_aptitude(), _fetch_zone_security(), _fetch_guardian_count(), _fetch_embassy_eff(),
+        aptitude, mood_modifier, target_inputs = await asyncio.gather(
+            AptitudeService.get_aptitude_for_operative(supabase, body.agent_id, body.operative_type),
+            cls._get_mood_modifier(supabase, body.agent_id),
+            SuccessModifierTable.target_inputs(admin, body, source_simulation_id, epoch_id=epoch_id, cycle=cycle),
         )
+        inputs = replace(
+            target_inputs,
+            aptitude=aptitude,
+            mood_modifier=mood_modifier,
+            surge_bonus=resonance_surge_bonus,
+        )
+        return success_probability(inputs, epoch_config)
 
-        # Guardian penalty: configurable per-unit and cap
-        guardian_cap = cfg.get("guardian_defense_cap_pp", 0.15)
-        guardian_per = cfg.get("guardian_per_unit_pp", 0.06)
-        guardian_penalty = min(guardian_cap, guardian_count * guardian_per)
-
-        # ── Batch 2: Resonance modifiers (parallel, target-sim dependent) ──
-        resonance_pressure = 0.0
-        resonance_operative_mod = 0.0
-        attacker_pressure_penalty = 0.0
-        if body.target_simulation_id:
-            resonance_pressure, resonance_operative_mod, attacker_pressure_penalty = await asyncio.gather(
-                cls._get_target_zone_pressure(admin, str(body.target_simulation_id), body.target_zone_id),
-                cls._get_resonance_operative_modifier(admin, str(body.target_simulation_id), body.operative_type),
-                cls._get_attacker_pressure_penalty(admin, str(source_simulation_id)),
-            )
-
-        # ── Heartbeat integration: convergence operative modifiers ──
-        convergence_mod = 0.0
-        try:
-            if body.target_simulation_id:
-                _resp = await (
-                    admin.table("narrative_arcs")
-                    .select("id, primary_archetype, secondary_archetype")
-                    .eq("simulation_id", str(body.target_simulation_id))
-                    .eq("arc_type", "convergence")
-                    .in_("status", ["active", "climax"])
-                    .execute()
-                )
-                convergences = extract_list(_resp)
-
-                if convergences:
-                    # Load convergence pairs config
-                    _resp = await (
-                        admin.table("platform_settings")
-                        .select("setting_value")
-                        .eq("setting_key", "heartbeat_convergence_pairs")
-                        .limit(1)
-                        .execute()
-                    )
-                    pairs_row = _resp.data
-                    if pairs_row:
-                        pairs = pairs_row[0]["setting_value"]
-                        if isinstance(pairs, str):
-                            pairs = json.loads(pairs)
-
-                        for conv in convergences:
-                            a = conv.get("primary_archetype", "")
-                            b = conv.get("secondary_archetype", "")
-                            pair_key = f"{a}+{b}"
-                            pair_data = pairs.get(pair_key) or pairs.get(f"{b}+{a}")
-                            if pair_data:
-                                effects = pair_data.get("effects", {})
-                                op_type = body.operative_type
-                                if op_type in effects:
-                                    convergence_mod += float(effects[op_type])
-        except (PostgrestAPIError, httpx.HTTPError, json.JSONDecodeError, KeyError, TypeError, ValueError):
-            logger.debug("Convergence modifiers unavailable (tables may not exist yet)")
-
-        # ── Agent autonomy: mood affects operative effectiveness ──
+    @staticmethod
+    async def _get_mood_modifier(supabase: Client, agent_id: UUID) -> float:
+        """Agent autonomy: mood affects operative effectiveness (-0.06 to +0.03)."""
         mood_modifier = 0.0
         try:
             mood_data = await maybe_single_data(
                 supabase.table("agent_mood")
                 .select("mood_score, stress_level")
-                .eq("agent_id", str(body.agent_id))
+                .eq("agent_id", str(agent_id))
                 .maybe_single()
             )
             if mood_data:
@@ -420,81 +332,7 @@ class OperativeMissionService:
                     mood_modifier -= 0.03
         except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError):
             logger.debug("Agent mood data unavailable for operative calculation")
-
-        apt_mod = cfg.get("aptitude_modifier_pp", 0.03)
-        emb_bonus = cfg.get("embassy_bonus_pp", 0.15)
-        prob_floor = cfg.get("probability_floor", 0.05)
-        prob_ceiling = cfg.get("probability_ceiling", 0.95)
-
-        probability = (
-            base
-            + aptitude * apt_mod
-            - zone_security * 0.05
-            - guardian_penalty
-            + embassy_eff * emb_bonus
-            + resonance_pressure
-            + resonance_operative_mod
-            + attacker_pressure_penalty
-            + convergence_mod
-            + mood_modifier
-            + resonance_surge_bonus  # Surge Riding: +0.08 when exploiting aligned resonance
-        )
-
-        return max(prob_floor, min(prob_ceiling, probability))
-
-    # ── Resonance Helpers ─────────────────────────────────
-
-    @staticmethod
-    async def _get_target_zone_pressure(admin: Client, target_sim_id: str, target_zone_id: UUID | None = None) -> float:
-        """Get zone pressure modifier: pressured zones are easier to infiltrate.
-
-        Uses Postgres ``fn_target_zone_pressure`` (migration 078).
-        Returns +0.00 to +0.04 (pressure * cap).
-        """
-        try:
-            result = await admin.rpc(
-                "fn_target_zone_pressure",
-                {"p_simulation_id": target_sim_id, "p_zone_id": str(target_zone_id) if target_zone_id else None},
-            ).execute()
-            return float(result.data) if result.data is not None else 0.0
-        except (PostgrestAPIError, httpx.HTTPError, TypeError, ValueError):
-            logger.debug("Zone pressure lookup failed, defaulting to 0.0", exc_info=True)
-            return 0.0
-
-    @staticmethod
-    async def _get_resonance_operative_modifier(admin: Client, target_sim_id: str, operative_type: str) -> float:
-        """Get net resonance archetype modifier for an operative type.
-
-        Uses Postgres ``fn_resonance_operative_modifier`` (migration 078).
-        Returns clamped [-0.04, +0.04] based on active resonances.
-        Subsiding resonances apply at 50% strength.
-        """
-        try:
-            result = await admin.rpc(
-                "fn_resonance_operative_modifier",
-                {"p_simulation_id": target_sim_id, "p_operative_type": operative_type},
-            ).execute()
-            return float(result.data) if result.data is not None else 0.0
-        except (PostgrestAPIError, httpx.HTTPError, TypeError, ValueError):
-            logger.debug("Resonance operative modifier lookup failed, defaulting to 0.0", exc_info=True)
-            return 0.0
-
-    @staticmethod
-    async def _get_attacker_pressure_penalty(admin: Client, source_sim_id: str) -> float:
-        """Get attacker's own pressure penalty: own instability hurts outbound ops.
-
-        Uses Postgres ``fn_attacker_pressure_penalty`` (migration 078).
-        Returns -0.04 to 0.00 (defender compensation).
-        """
-        try:
-            result = await admin.rpc(
-                "fn_attacker_pressure_penalty",
-                {"p_simulation_id": source_sim_id},
-            ).execute()
-            return float(result.data) if result.data is not None else 0.0
-        except (PostgrestAPIError, httpx.HTTPError, TypeError, ValueError):
-            logger.debug("Attacker pressure penalty lookup failed, defaulting to 0.0", exc_info=True)
-            return 0.0
+        return mood_modifier
 
     # ── Resolve ───────────────────────────────────────────
 
@@ -506,7 +344,16 @@ class OperativeMissionService:
         *,
         epoch_config: dict | None = None,
     ) -> list[dict]:
-        """Resolve all missions that have passed their resolves_at time."""
+        """Resolve all missions that have passed their resolves_at time.
+
+        Outcomes are rolled in memory and persisted through batched RPCs
+        (migration 245): one transition for all deploying missions, one
+        compare-and-swap write that claims every rolled outcome, one
+        participant lookup for the betrayal check. Success effects run only
+        for the missions that write claimed, one at a time and in order —
+        several missions may hit the same target zone — and their results are
+        recorded in one more write.
+        """
         now = datetime.now(UTC).isoformat()
 
         # Find missions ready to resolve
@@ -518,144 +365,141 @@ class OperativeMissionService:
             .lte("resolves_at", now)
             .execute()
         )
+        # Guardians are permanent
+        due = [m for m in extract_list(resp) if m["operative_type"] != "guardian"]
+
+        # Advance deploying -> active (atomic compare-and-swap, migration 245)
+        deploying = [m["id"] for m in due if m["status"] == "deploying"]
+        if deploying:
+            await supabase.rpc(
+                "fn_transition_missions_batch",
+                {"p_mission_ids": deploying, "p_from_status": "deploying", "p_to_status": "active"},
+            ).execute()
 
-        results = []
-        for mission in extract_list(resp):
-            # Skip guardians (permanent)
-            if mission["operative_type"] == "guardian":
-                continue
-
-            # Advance deploying -> active (atomic compare-and-swap, migration 148)
-            if mission["status"] == "deploying":
-                await supabase.rpc(
-                    "fn_transition_mission_status",
-                    {
-                        "p_mission_id": mission["id"],
-                        "p_from_status": "deploying",
-                        "p_to_status": "active",
-                    },
-                ).execute()
-                continue
-
-            # Resolve active missions
-            result = await cls._resolve_mission(supabase, mission, epoch_config=epoch_config)
-            results.append(result)
-
-        return results
+        active = [m for m in due if m["status"] == "active"]
+        if not active:
+            return []
 
-    @classmethod
-    async def _resolve_mission(
-        cls, supabase: Client, mission: dict, *, epoch_config: dict | None = None
-    ) -> dict:
-        """Resolve a single mission -- roll for success/failure.
-
-        Detection uses a SEPARATE probability from success (configurable via
-        ``detection_on_failure`` in EpochConfig). This avoids the old bug where
-        a highly skilled operative (high success_prob) was paradoxically MORE
-        detectable when failing.
-        """
         cfg = epoch_config or {}
-        success_prob = float(mission.get("success_probability") or 0.5)
         detection_threshold = cfg.get("detection_on_failure", 0.45)
+        rng = secrets.SystemRandom()
+        outcomes: list[dict] = []
+
+        for mission in active:
+            success_prob = float(mission.get("success_probability") or 0.5)
+            outcome = roll_mission_outcome(success_prob, detection_threshold, rng)
+            if outcome == "success":
+                # Filled in by the success effect once the mission is claimed
+                mission_result = {}
+            else:
+                mission_result = dict(_FAILURE_RESULTS[outcome])
+                # Surge Riding failure penalty: double resonance pressure on own zones.
+                # The actual pressure doubling is handled by the heartbeat — we flag
+                # it here via a tag that the heartbeat Phase 3 can detect.
+                if mission.get("resonance_op") == "surge_riding" and mission.get("source_simulation_id"):
+                    mission_result["surge_riding_penalty"] = "Resonance pressure doubled on source zones"
+
+            outcomes.append({
+                "id": mission["id"],
+                "status": outcome,
+                "mission_result": {**mission_result, "outcome": outcome},
+            })
+
+        # Claim: persist every outcome in one compare-and-swap write. Only
+        # missions still active are updated and returned — effects below run
+        # for those alone, so a concurrent resolver never applies them twice.
+        resp = await supabase.rpc("fn_resolve_missions_batch", {"p_results": outcomes}).execute()
+        resolved = extract_list(resp)
+        if len(resolved) < len(outcomes):
+            logger.warning(
+                "Skipped missions resolved concurrently",
+                extra={"epoch_id": str(epoch_id), "skipped": len(outcomes) - len(resolved)},
+            )
 
-        roll = secrets.SystemRandom().random()
+        by_id = {m["id"]: m for m in active}
+        claimed = [({**by_id[r["id"]], **r}, r) for r in resolved if r["id"] in by_id]
 
-        res_op = mission.get("resonance_op")
+        surge_penalties = [
+            {
+                "simulation_id": mission["source_simulation_id"],
+                "resonance_signature": "surge_riding_penalty",
+                "effective_magnitude": 0.5,
+                "was_mitigated": False,
+            }
+            for mission, row in claimed
+            if "surge_riding_penalty" in (row.get("mission_result") or {})
+        ]
+        if surge_penalties:
+            try:
+                await supabase.table("resonance_memory").insert(surge_penalties).execute()
+            except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError):
+                logger.warning("Surge Riding penalty recording failed (non-fatal)")
 
-        if roll <= success_prob:
-            # Success
-            outcome = "success"
-            final_status = "success"
+        effects: list[dict] = []
+        for mission, row in claimed:
+            if row["status"] != "success":
+                continue
             mission_result = await cls._apply_success_effect(supabase, mission)
-
             # Substrate Tap: atomically steal 1 RP from target on success
-            if res_op == "substrate_tap" and mission.get("target_simulation_id"):
-                try:
-                    transfer_resp = await supabase.rpc(
-                        "fn_transfer_rp_atomic",
-                        {
-                            "p_epoch_id": mission["epoch_id"],
-                            "p_from_simulation_id": mission["target_simulation_id"],
-                            "p_to_simulation_id": mission["source_simulation_id"],
-                            "p_amount": 1,
-                        },
-                    ).execute()
-                    if transfer_resp.data:
-                        mission_result["substrate_tap"] = "1 RP stolen from target"
-                    else:
-                        mission_result["substrate_tap"] = "Target had insufficient RP"
-                except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError):
-                    logger.warning("Substrate Tap RP transfer failed (non-fatal)")
-        else:
-            # Failure — independent detection roll against configurable threshold
-            detection_roll = secrets.SystemRandom().random()
-            if detection_roll < detection_threshold:
-                outcome = "detected"
-                final_status = "detected"
-                mission_result = {"outcome": "detected", "narrative": "The operative was detected."}
-            else:
-                outcome = "failed"
-                final_status = "failed"
-                mission_result = {"outcome": "failed", "narrative": "The mission failed quietly."}
-
-            # Surge Riding failure penalty: double resonance pressure on own zones
-            if res_op == "surge_riding" and mission.get("source_simulation_id"):
-                mission_result["surge_riding_penalty"] = "Resonance pressure doubled on source zones"
-                # The actual pressure doubling is handled by the heartbeat — we flag
-                # it here via a tag that the heartbeat Phase 3 can detect.
-                try:
-                    await supabase.table("resonance_memory").insert({
-                        "simulation_id": mission["source_simulation_id"],
-                        "resonance_signature": "surge_riding_penalty",
-                        "effective_magnitude": 0.5,
-                        "was_mitigated": False,
-                    }).execute()
-                except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError):
-                    logger.warning("Surge Riding penalty recording failed (non-fatal)")
-
-        # Update mission
-        update_data = {
-            "status": final_status,
-            "resolved_at": datetime.now(UTC).isoformat(),
-            "mission_result": {**mission_result, "outcome": outcome},
-        }
-        resp = await supabase.table("operative_missions").update(update_data).eq("id", mission["id"]).execute()
-        if not resp.data:
-            logger.error("Mission %s update returned empty response", mission["id"])
+            if mission.get("resonance_op") == "substrate_tap" and mission.get("target_simulation_id"):
+                await cls._apply_substrate_tap(supabase, mission, mission_result)
+            row["mission_result"] = {**mission_result, "outcome": "success"}
+            effects.append({"id": row["id"], "mission_result": row["mission_result"]})
+        if effects:
+            await supabase.rpc("fn_record_mission_results", {"p_results": effects}).execute()
 
-        # Check for betrayal (same-team attack)
-        await cls._check_betrayal(supabase, mission, outcome)
+        await cls._check_betrayals(supabase, epoch_id, [(mission, row["status"]) for mission, row in claimed])
+        return resolved
 
-        return resp.data[0] if resp.data else {**mission, **update_data}
+    @classmethod
+    async def _apply_substrate_tap(cls, supabase: Client, mission: dict, mission_result: dict) -> None:
+        try:
+            transfer_resp = await supabase.rpc(
+                "fn_transfer_rp_atomic",
+                {
+                    "p_epoch_id": mission["epoch_id"],
+                    "p_from_simulation_id": mission["target_simulation_id"],
+                    "p_to_simulation_id": mission["source_simulation_id"],
+                    "p_amount": 1,
+                },
+            ).execute()
+            if transfer_resp.data:
+                mission_result["substrate_tap"] = "1 RP stolen from target"
+            else:
+                mission_result["substrate_tap"] = "Target had insufficient RP"
+        except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError):
+            logger.warning("Substrate Tap RP transfer failed (non-fatal)")
 
     @classmethod
-    async def _check_betrayal(cls, supabase: Client, mission: dict, outcome: str) -> None:
-        """Detect betrayal when a mission targets an ally. On detection,
-        dissolve the alliance and apply a -25% diplomatic penalty."""
-        if not mission.get("target_simulation_id"):
+    async def _check_betrayals(cls, supabase: Client, epoch_id: UUID, resolved: list[tuple[dict, str]]) -> None:
+        """Detect betrayal for a batch of resolved missions (missions targeting an ally).
+
+        One participant lookup covers the batch; on detection the alliance is
+        dissolved and the betrayer gets a -25% diplomatic penalty.
+        """
+        targeted = [(m, outcome) for m, outcome in resolved if m.get("target_simulation_id")]
+        if not targeted:
             return
 
-        source_p = await maybe_single_data(
-            supabase.table("epoch_participants")
-            .select("team_id")
-            .eq("epoch_id", mission["epoch_id"])
-            .eq("simulation_id", mission["source_simulation_id"])
-            .maybe_single()
-        )
-        target_p = await maybe_single_data(
+        resp = await (
             supabase.table("epoch_participants")
-            .select("team_id")
-            .eq("epoch_id", mission["epoch_id"])
-            .eq("simulation_id", mission["target_simulation_id"])
-            .maybe_single()
+            .select("simulation_id, team_id")
+            .eq("epoch_id", str(epoch_id))
+            .execute()
         )
+        teams = {p["simulation_id"]: p.get("team_id") for p in extract_list(resp)}
 
-        source_team = source_p.get("team_id") if source_p else None
-        target_team = target_p.get("team_id") if target_p else None
-
-        if not (source_team and target_team and source_team == target_team):
-            return
+        for mission, outcome in targeted:
+            source_team = teams.get(mission["source_simulation_id"])
+            if not (source_team and source_team == teams.get(mission["target_simulation_id"])):
+                continue
+            await cls._apply_betrayal(supabase, mission, outcome, source_team)
+            if outcome in ("detected", "captured"):
+                # The alliance is gone for the rest of the batch too
+                teams = {sim: (None if team == source_team else team) for sim, team in teams.items()}
 
+    @classmethod
+    async def _apply_betrayal(cls, supabase: Client, mission: dict, outcome: str, team_id: str) -> None:
         is_detected = outcome in ("detected", "captured")
 
         # Fetch epoch for cycle number
@@ -679,7 +523,7 @@ class OperativeMissionService:
                 supabase.table("epoch_participants")
                 .update({"team_id": None})
                 .eq("epoch_id", mission["epoch_id"])
-                .eq("team_id", source_team)
+                .eq("team_id", team_id)
                 .execute()
             )
 
@@ -875,6 +719,9 @@ class OperativeMissionService:
                     "old_level": rpc_data.get("old_level", target_zone["security_level"]),
                     "new_level": rpc_data.get("new_level", target_zone["security_level"]),
                 }
+                SuccessModifierTable.set_zone_security(
+                    mission.get("epoch_id"), target_zone["id"], rpc_data.get("new_level")
+                )
 
         # Generate crisis event from sabotage (feeds event->pressure->cascade pipeline)
         # Diminishing returns: impact decreases with existing active sabotage events
@@ -1035,6 +882,9 @@ class OperativeMissionService:
             .eq("id", mission["target_entity_id"])
             .execute()
         )
+        SuccessModifierTable.set_embassy_penalty(
+            mission["epoch_id"], mission["target_entity_id"], penalty, expires_at.isoformat()
+        )
 
         return {
             "outcome": "success",
@@ -1087,6 +937,8 @@ class OperativeMissionService:
             .eq("id", str(mission_id))
             .execute()
         )
+        if op_type == "guardian" and mission["status"] == "active":
+            SuccessModifierTable.note_guardians(mission["epoch_id"], mission["source_simulation_id"], -1)
         return resp.data[0] if resp.data else mission
 
     # ── Counter-Intelligence ──────────────────────────────
@@ -1260,6 +1112,7 @@ class OperativeMissionService:
         fortification_id = result.get("fortification_id")
         if not fortification_id:
             raise server_error("Zone fortification failed: unexpected RPC response.")
+        SuccessModifierTable.set_zone_security(epoch_id, zone_id, result.get("new_security_level"))
 
         # Hidden battle_log event — side-effect outside atomicity boundary.
         # Fetch zone name for the narrative; best-effort logging (a failed
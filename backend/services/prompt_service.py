@@ -7,6 +7,7 @@ import re
 from dataclasses import dataclass
 from uuid import UUID
 
+from backend.services.simulation_settings_cache import SimulationSettingsCache
 from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
@@ -183,20 +184,8 @@ class PromptResolver:
             self._sim_locale = "en"
             return "en"
 
-        response = await (
-            self._supabase.table("simulation_settings")
-            .select("setting_value")
-            .eq("simulation_id", str(self._simulation_id))
-            .eq("setting_key", "general.content_locale")
-            .limit(1)
-            .execute()
-        )
-
-        if response and response.data:
-            row = response.data[0] if isinstance(response.data, list) else response.data
-            self._sim_locale = str(row.get("setting_value", "en"))
-        else:
-            self._sim_locale = "en"
+        locale = await SimulationSettingsCache.find(self._supabase, self._simulation_id, "general.content_locale")
+        self._sim_locale = "en" if locale is None else str(locale)
 
         return self._sim_locale
 
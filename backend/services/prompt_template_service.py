@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from uuid import UUID
 
+from backend.services.chat_context_cache import ChatContextCache
 from backend.utils.errors import bad_request, not_found, server_error
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
@@ -108,6 +109,7 @@ class PromptTemplateService:
 
         if not response.data:
             raise server_error("Failed to create prompt template.")
+        ChatContextCache.invalidate_simulation(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -132,6 +134,7 @@ class PromptTemplateService:
 
         if not response.data:
             raise not_found(detail=f"Template '{template_id}' not found in simulation.")
+        ChatContextCache.invalidate_simulation(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -152,4 +155,5 @@ class PromptTemplateService:
 
         if not response.data:
             raise not_found(detail=f"Template '{template_id}' not found.")
+        ChatContextCache.invalidate_simulation(simulation_id)
         return response.data[0]
@@ -0,0 +1,116 @@
+"""Process-wide rollup of PostgREST round trips per HTTP route and background job.
+
+``LoggingContextMiddleware`` records every request under its route template
+(``GET /api/v1/public/simulations/{simulation_id}``); background jobs wrap
+their unit of work in ``QueryStatsService.track("job:<name>")``. The counts
+themselves come from ``backend.utils.call_stats``.
+
+Each key keeps the last ``_WINDOW`` samples, so the admin endpoint reports
+recent behaviour rather than lifetime averages. The rollup is per worker
+process — with several uvicorn workers, each reports its own share of the
+traffic.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from backend.services.heartbeat_profiler import percentile
+from backend.utils.call_stats import CallStats, track_calls
+
+logger = logging.getLogger(__name__)
+
+_WINDOW = 200
+# Route templates and job names are a bounded set; the cap only guards
+# against an unexpected source of unique keys.
+_MAX_KEYS = 512
+# A route with an N+1 pattern repeats it on every request; warn once per key
+# per interval and count the samples in between.
+_WARN_INTERVAL_S = 300.0
+
+
+@dataclass
+class _KeyStats:
+    samples: deque[tuple[int, float, int]] = field(default_factory=lambda: deque(maxlen=_WINDOW))
+    total: int = 0
+    n_plus_one: Counter[str] = field(default_factory=Counter)
+    tables: Counter[str] = field(default_factory=Counter)
+    warned_at: float | None = None
+    unreported: int = 0
+
+
+class QueryStatsService:
+    """Rolling per-route / per-job DB round-trip statistics."""
+
+    _keys: dict[str, _KeyStats] = {}
+
+    @classmethod
+    def record(cls, key: str, stats: CallStats) -> None:
+        entry = cls._keys.get(key)
+        if entry is None:
+            if len(cls._keys) >= _MAX_KEYS:
+                return
+            entry = cls._keys[key] = _KeyStats()
+        entry.samples.append((stats.db_calls, stats.db_ms, stats.db_bytes))
+        entry.total += 1
+        entry.tables.update(stats.tables)
+        shapes = stats.n_plus_one()
+        entry.n_plus_one.update(shapes)
+        if not shapes:
+            return
+        now = time.monotonic()
+        if entry.warned_at is not None and now - entry.warned_at < _WARN_INTERVAL_S:
+            entry.unreported += 1
+            return
+        logger.warning(
+            "N+1 query pattern",
+            extra={"key": key, "shapes": shapes, "db_calls": stats.db_calls, "suppressed": entry.unreported},
+        )
+        entry.warned_at = now
+        entry.unreported = 0
+
+    @classmethod
+    @contextmanager
+    def track(cls, key: str) -> Iterator[CallStats]:
+        """Count the round trips of a background job and record them under ``key``."""
+        with track_calls() as stats:
+            try:
+                yield stats
+            finally:
+                cls.record(key, stats)
+
+    @classmethod
+    def snapshot(cls) -> list[dict]:
+        """Per-key statistics over the rolling window, most round trips first."""
+        rows = []
+        for key, entry in cls._keys.items():
+            if not entry.samples:
+                continue
+            calls = [float(s[0]) for s in entry.samples]
+            count = len(entry.samples)
+            rows.append(
+                {
+                    "key": key,
+                    "samples": count,
+                    "total": entry.total,
+                    "avg_db_calls": round(sum(calls) / count, 1),
+                    "p95_db_calls": percentile(calls, 95),
+                    "max_db_calls": int(max(calls)),
+                    "p50_db_ms": round(percentile([s[1] for s in entry.samples], 50), 1),
+                    "p95_db_ms": round(percentile([s[1] for s in entry.samples], 95), 1),
+                    "avg_db_bytes": round(sum(s[2] for s in entry.samples) / count),
+                    "top_tables": dict(entry.tables.most_common(5)),
+                    "n_plus_one": dict(entry.n_plus_one.most_common(5)),
+                }
+            )
+        rows.sort(key=lambda r: r["avg_db_calls"] * r["samples"], reverse=True)
+        return rows
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._keys.clear()
@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 from backend.services.base_service import BaseService
+from backend.services.chat_context_cache import ChatContextCache
 from backend.utils.errors import bad_request, not_found
 from backend.utils.responses import extract_list
 from supabase import AsyncClient as Client
@@ -21,6 +22,11 @@ class RelationshipService(BaseService):
     view_name = None
     supports_created_by = False
 
+    @classmethod
+    def _after_write(cls, simulation_id: UUID) -> None:
+        # Chat turns reuse the agent's relationship context for a few minutes.
+        ChatContextCache.invalidate_simulation(simulation_id)
+
     _agent_select = (
         "*, source_agent:agents!source_agent_id(id, name, portrait_image_url, system),"
         " target_agent:agents!target_agent_id(id, name, portrait_image_url, system)"
@@ -99,6 +105,7 @@ class RelationshipService(BaseService):
         response = await supabase.table(cls.table_name).insert(insert_data).execute()
         if not response.data:
             raise bad_request("Failed to create relationship.")
+        cls._after_write(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -124,6 +131,7 @@ class RelationshipService(BaseService):
         )
         if not response.data:
             raise not_found("relationship", relationship_id)
+        cls._after_write(simulation_id)
         return response.data[0]
 
     @classmethod
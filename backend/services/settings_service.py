@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 from backend.models.settings import is_sensitive_key
+from backend.services.simulation_settings_cache import SimulationSettingsCache
 from backend.utils.db import maybe_single_data
 from backend.utils.encryption import decrypt, encrypt, mask
 from backend.utils.errors import not_found, server_error
@@ -90,6 +91,7 @@ class SettingsService:
         if not response.data:
             raise server_error("Failed to save setting.")
 
+        SimulationSettingsCache.invalidate(simulation_id, data["category"])
         return _mask_if_encrypted(response.data[0])
 
     @staticmethod
@@ -128,6 +130,7 @@ class SettingsService:
         )
         if not response.data:
             raise not_found(detail=f"Setting '{setting_id}' not found.")
+        SimulationSettingsCache.invalidate(simulation_id, response.data[0].get("category"))
         return response.data[0]
 
     # ── Dungeon Override Queries ────────────────────────────────────────
@@ -0,0 +1,243 @@
+"""Streaming simulation data export (NDJSON / CSV / ZIP).
+
+Exports never hold a whole simulation in memory: every table is read in
+keyset pages ordered by ``id`` and each page is encoded and handed to the
+response before the next one is fetched, so worker memory is bounded by
+one page regardless of simulation size.
+
+Exports are resumable. Tables are always exported in ``EXPORT_TABLES``
+order and rows in ``id`` order, so ``"<table>:<last id>"`` identifies how
+far an export got. NDJSON streams emit it as ``{"checkpoint": ...}`` after
+every page; CSV exports cover one table and ZIP members one table each, so
+the last complete line's ``id`` (a truncated ZIP still reads member by
+member from its local headers) gives the same token. Passing it back as
+``resume`` continues with the next row. Each export ends with a manifest
+(NDJSON trailer line, ``manifest.json`` in ZIPs) of per-table row counts.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zipfile
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Literal
+from uuid import UUID
+
+from backend.utils.errors import bad_request
+from supabase import AsyncClient as Client
+
+ExportFormat = Literal["ndjson", "csv", "zip"]
+
+MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "zip": "application/zip",
+}
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    name: str
+    select: str = "*"
+    soft_delete: bool = False
+
+
+EXPORT_TABLES: dict[str, ExportTable] = {
+    t.name: t
+    for t in (
+        ExportTable("agents", soft_delete=True),
+        ExportTable("buildings", soft_delete=True),
+        ExportTable("events", soft_delete=True),
+        ExportTable("simulation_lore"),
+        ExportTable("agent_relationships"),
+        # Embeddings are derived data (1536 floats per row) — not exported.
+        ExportTable(
+            "agent_memories",
+            "id, agent_id, simulation_id, memory_type, content, content_de, importance,"
+            " source_type, source_id, created_at, last_accessed_at",
+        ),
+    )
+}
+
+
+@dataclass
+class _TableProgress:
+    name: str
+    rows: int = 0
+    last_id: str | None = None
+
+
+class _ZipSink(io.RawIOBase):
+    """Write-only, unseekable sink so ``zipfile`` streams (data descriptors)."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def _json_line(obj: dict) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode() + b"\n"
+
+
+def _csv_value(value):
+    if isinstance(value, dict | list):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+class SimulationExportService:
+    """Keyset-paged, constant-memory exports of a simulation's content tables."""
+
+    page_size = 500
+
+    @staticmethod
+    def resolve_tables(tables: list[str] | None, export_format: ExportFormat) -> list[str]:
+        """Validate the requested tables and return them in export order."""
+        requested = tables or list(EXPORT_TABLES)
+        unknown = sorted(set(requested) - set(EXPORT_TABLES))
+        if unknown:
+            raise bad_request(f"Unknown export table(s): {', '.join(unknown)}.")
+        ordered = [name for name in EXPORT_TABLES if name in requested]
+        if export_format == "csv" and len(ordered) != 1:
+            raise bad_request("CSV exports cover exactly one table; use zip for several.")
+        return ordered
+
+    @staticmethod
+    def parse_resume(resume: str | None, tables: list[str]) -> tuple[int, str | None]:
+        """Return ``(table index, last exported id)`` for a resume token."""
+        if not resume:
+            return 0, None
+        table, _, last_id = resume.partition(":")
+        if table not in tables or not last_id:
+            raise bad_request("Invalid resume token for this export.")
+        try:
+            UUID(last_id)
+        except ValueError:
+            raise bad_request("Invalid resume token for this export.") from None
+        return tables.index(table), last_id
+
+    @classmethod
+    async def iter_pages(
+        cls,
+        supabase: Client,
+        simulation_id: UUID,
+        table: ExportTable,
+        *,
+        after: str | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """Yield the table's rows for one simulation, one keyset page at a time."""
+        while True:
+            query = supabase.table(table.name).select(table.select).eq("simulation_id", str(simulation_id))
+            if table.soft_delete:
+                query = query.is_("deleted_at", "null")
+            if after is not None:
+                query = query.gt("id", after)
+            response = await query.order("id").limit(cls.page_size).execute()
+            rows = response.data or []
+            if rows:
+                yield rows
+                after = str(rows[-1]["id"])
+            if len(rows) < cls.page_size:
+                return
+
+    @classmethod
+    async def _iter_tables(
+        cls,
+        supabase: Client,
+        simulation_id: UUID,
+        tables: list[str],
+        resume: str | None,
+        progress: list[_TableProgress],
+    ) -> AsyncIterator[tuple[_TableProgress, list[dict]]]:
+        start, after = cls.parse_resume(resume, tables)
+        for index, name in enumerate(tables):
+            entry = _TableProgress(name)
+            progress.append(entry)
+            if index < start:
+                continue
+            entry.last_id = after if index == start else None
+            async for rows in cls.iter_pages(supabase, simulation_id, EXPORT_TABLES[name], after=entry.last_id):
+                entry.rows += len(rows)
+                entry.last_id = str(rows[-1]["id"])
+                yield entry, rows
+
+    @staticmethod
+    def _manifest(
+        simulation_id: UUID,
+        export_format: ExportFormat,
+        resume: str | None,
+        progress: list[_TableProgress],
+    ) -> dict:
+        return {
+            "simulation_id": str(simulation_id),
+            "format": export_format,
+            "exported_at": datetime.now(UTC).isoformat(),
+            "resumed_from": resume,
+            "tables": [{"name": p.name, "rows": p.rows} for p in progress],
+        }
+
+    @classmethod
+    async def stream(
+        cls,
+        supabase: Client,
+        simulation_id: UUID,
+        export_format: ExportFormat,
+        tables: list[str],
+        *,
+        resume: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Encode the export incrementally; ``tables`` from ``resolve_tables``."""
+        progress: list[_TableProgress] = []
+        pages = cls._iter_tables(supabase, simulation_id, tables, resume, progress)
+
+        if export_format == "ndjson":
+            async for entry, rows in pages:
+                yield b"".join(_json_line({"table": entry.name, "row": row}) for row in rows) + _json_line(
+                    {"checkpoint": f"{entry.name}:{entry.last_id}"}
+                )
+            yield _json_line({"manifest": cls._manifest(simulation_id, export_format, resume, progress)})
+
+        elif export_format == "csv":
+            writer: csv.DictWriter | None = None
+            buf = io.StringIO()
+            async for _entry, rows in pages:
+                if writer is None:
+                    writer = csv.DictWriter(buf, fieldnames=list(rows[0]), extrasaction="ignore")
+                    if resume is None:
+                        writer.writeheader()
+                writer.writerows({k: _csv_value(v) for k, v in row.items()} for row in rows)
+                yield buf.getvalue().encode()
+                buf.seek(0)
+                buf.truncate()
+
+        else:
+            sink = _ZipSink()
+            with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+                member, member_table = None, None
+                async for entry, rows in pages:
+                    if entry.name != member_table:
+                        if member is not None:
+                            member.close()
+                        member = zf.open(f"{entry.name}.ndjson", "w", force_zip64=True)
+                        member_table = entry.name
+                    member.write(b"".join(_json_line(row) for row in rows))
+                    yield sink.drain()
+                if member is not None:
+                    member.close()
+                manifest = cls._manifest(simulation_id, export_format, resume, progress)
+                zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+            yield sink.drain()
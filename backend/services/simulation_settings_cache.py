@@ -0,0 +1,295 @@
+"""Process-wide cache of ``simulation_settings``, keyed by (simulation_id, category).
+
+Settings rows change rarely but were read on every hot-path operation — the
+heartbeat's per-sim overrides, echo bleed evaluation, model resolution on
+every chat turn, bond gates, world-map theme hints. All of those now read
+through this cache.
+
+Freshness, in three layers:
+
+- **Local writes** — ``SettingsService`` invalidates the touched
+  (simulation, category) immediately.
+- **Other workers / direct SQL** — every insert/update/delete on
+  ``simulation_settings`` bumps a per-simulation version stamp in
+  ``simulation_settings_versions`` (migration 240, trigger). The refresh loop
+  polls the stamps changed in the last few minutes (one indexed query,
+  usually zero rows) and drops every cached category of a simulation whose
+  stamp moved, so all workers converge within ``_POLL_INTERVAL_SECONDS``.
+- **TTL backstop** — entries expire after ``_TTL_SECONDS`` regardless.
+
+A load that races an invalidation is discarded (per-simulation generation
+counter) instead of re-caching the pre-write rows.
+
+Entries are shared by every request in the process, so a load must see ALL
+rows of the category: pass the service-role client, or a member-scoped
+client behind the router's simulation access check (RLS on
+``simulation_settings`` is all-or-nothing per simulation; anon sees only
+``design`` / ``anchor``). Consumers use the values for internal
+configuration and never return them raw.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import httpx
+from cachetools import TTLCache
+from postgrest.exceptions import APIError as PostgrestAPIError
+
+from backend.utils.responses import extract_list
+from backend.utils.settings import parse_setting_bool
+from supabase import AsyncClient as Client
+
+logger = logging.getLogger(__name__)
+
+_TTL_SECONDS = 300
+_MAX_ENTRIES = 4096
+_POLL_INTERVAL_SECONDS = 10
+# Stamps changed within this window are re-checked on every poll. Covers
+# app↔DB clock skew and transactions that commit after a later poll started.
+_VERSION_WINDOW_SECONDS = 120
+
+
+class SettingsView(Mapping[str, Any]):
+    """Read-only ``{setting_key: setting_value}`` for one (simulation, category).
+
+    Values are the raw jsonb payloads; the typed getters coerce and fall back
+    to ``default`` when a key is missing or unparseable.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any] | None = None):
+        self._data = dict(data or {})
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"SettingsView({self._data!r})"
+
+    def get_str(self, key: str, default: str = "") -> str:
+        value = self._data.get(key)
+        return default if value is None else str(value)
+
+    def get_int(self, key: str, default: int) -> int:
+        try:
+            return int(self._data.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_float(self, key: str, default: float) -> float:
+        try:
+            return float(self._data.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_bool(self, key: str, default: bool) -> bool:
+        """Missing → ``default``; present → ``parse_setting_bool`` (fail-closed)."""
+        if key not in self._data:
+            return default
+        return parse_setting_bool(self._data[key])
+
+
+EMPTY_SETTINGS = SettingsView()
+
+_Key = tuple[str, str]
+
+
+class SimulationSettingsCache:
+    """Process-wide (simulation_id, category) → ``SettingsView`` cache."""
+
+    _entries: TTLCache[_Key, SettingsView] = TTLCache(maxsize=_MAX_ENTRIES, ttl=_TTL_SECONDS)
+    # Simulations loaded across ALL categories (absent category == no rows).
+    _complete: TTLCache[str, dict[str, SettingsView]] = TTLCache(maxsize=_MAX_ENTRIES // 4, ttl=_TTL_SECONDS)
+    _generations: dict[str, int] = {}
+    _seen_versions: dict[str, int] = {}
+    hits: int = 0
+    misses: int = 0
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every entry and all stamp bookkeeping (tests)."""
+        cls._entries.clear()
+        cls._complete.clear()
+        cls._generations = {}
+        cls._seen_versions = {}
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {"entries": len(cls._entries), "hits": cls.hits, "misses": cls.misses}
+
+    # ── Reads ───────────────────────────────────────────────────
+
+    @classmethod
+    def peek(cls, simulation_id: UUID | str, category: str) -> SettingsView | None:
+        """Return the cached view without loading (None on miss)."""
+        sim = str(simulation_id)
+        view = cls._entries.get((sim, category))
+        if view is None and (complete := cls._complete.get(sim)) is not None:
+            view = complete.get(category, EMPTY_SETTINGS)
+        return view
+
+    @classmethod
+    async def get(cls, supabase: Client, simulation_id: UUID | str, category: str) -> SettingsView:
+        """Settings of one category for one simulation (one query on miss)."""
+        view = cls.peek(simulation_id, category)
+        if view is not None:
+            cls.hits += 1
+            return view
+        cls.misses += 1
+        sim = str(simulation_id)
+        generation = cls._generations.get(sim, 0)
+        response = await (
+            supabase.table("simulation_settings")
+            .select("setting_key, setting_value")
+            .eq("simulation_id", sim)
+            .eq("category", category)
+            .execute()
+        )
+        view = SettingsView({row["setting_key"]: row["setting_value"] for row in extract_list(response)})
+        if cls._generations.get(sim, 0) == generation:
+            cls._entries[(sim, category)] = view
+        return view
+
+    @classmethod
+    async def get_all(cls, supabase: Client, simulation_id: UUID | str) -> dict[str, SettingsView]:
+        """Every category of one simulation (one query on miss)."""
+        sim = str(simulation_id)
+        complete = cls._complete.get(sim)
+        if complete is not None:
+            cls.hits += 1
+            return complete
+        cls.misses += 1
+        await cls.preload(supabase, [sim])
+        return cls._complete.get(sim) or {}
+
+    @classmethod
+    async def find(cls, supabase: Client, simulation_id: UUID | str, setting_key: str) -> Any:
+        """Value of ``setting_key`` in whichever category holds it (None if absent)."""
+        for view in (await cls.get_all(supabase, simulation_id)).values():
+            if setting_key in view:
+                return view[setting_key]
+        return None
+
+    @classmethod
+    async def preload(
+        cls,
+        supabase: Client,
+        simulation_ids: Iterable[UUID | str],
+        categories: Iterable[str] | None = None,
+    ) -> None:
+        """Bulk-load many simulations in one query.
+
+        With ``categories``, every requested (simulation, category) pair is
+        cached — pairs without rows as empty views. Without, each simulation
+        is cached across all categories.
+        """
+        sims = list(dict.fromkeys(str(s) for s in simulation_ids))
+        if not sims:
+            return
+        wanted = list(dict.fromkeys(categories)) if categories is not None else None
+        generations = {sim: cls._generations.get(sim, 0) for sim in sims}
+
+        query = (
+            supabase.table("simulation_settings")
+            .select("simulation_id, category, setting_key, setting_value")
+            .in_("simulation_id", sims)
+        )
+        if wanted is not None:
+            query = query.in_("category", wanted)
+        rows = extract_list(await query.execute())
+
+        grouped: dict[str, dict[str, dict[str, Any]]] = {sim: {} for sim in sims}
+        for row in rows:
+            grouped.setdefault(row["simulation_id"], {}).setdefault(row["category"], {})[row["setting_key"]] = row[
+                "setting_value"
+            ]
+
+        for sim in sims:
+            if cls._generations.get(sim, 0) != generations[sim]:
+                continue  # invalidated mid-load — don't cache pre-write rows
+            by_category = {category: SettingsView(values) for category, values in grouped[sim].items()}
+            if wanted is None:
+                cls._complete[sim] = by_category
+            else:
+                for category in wanted:
+                    cls._entries[(sim, category)] = by_category.get(category, EMPTY_SETTINGS)
+
+    # ── Invalidation ────────────────────────────────────────────
+
+    @classmethod
+    def invalidate(cls, simulation_id: UUID | str, category: str | None = None) -> None:
+        """Drop one category (or every category) of a simulation."""
+        sim = str(simulation_id)
+        cls._generations[sim] = cls._generations.get(sim, 0) + 1
+        cls._complete.pop(sim, None)
+        if category is not None:
+            cls._entries.pop((sim, category), None)
+            return
+        for key in [k for k in cls._entries if k[0] == sim]:
+            cls._entries.pop(key, None)
+
+    @classmethod
+    async def poll_versions(cls, admin: Client) -> int:
+        """Invalidate simulations whose version stamp moved. Returns how many.
+
+        Uses admin client: the stamp table is service-role only and the
+        poll is a system task with no user context.
+        """
+        since = datetime.now(UTC) - timedelta(seconds=_VERSION_WINDOW_SECONDS)
+        response = await (
+            admin.table("simulation_settings_versions")
+            .select("simulation_id, version")
+            .gte("changed_at", since.isoformat())
+            .execute()
+        )
+        current = {row["simulation_id"]: int(row["version"]) for row in extract_list(response)}
+        changed = [sim for sim, version in current.items() if cls._seen_versions.get(sim) != version]
+        for sim in changed:
+            cls.invalidate(sim)
+        # Only stamps inside the window can still move unseen; forget the rest.
+        cls._seen_versions = current
+        if changed:
+            logger.info(
+                "Simulation settings changed on another writer — cache invalidated",
+                extra={"simulation_count": len(changed)},
+            )
+        return len(changed)
+
+
+async def _settings_refresh_loop() -> None:
+    """Infinite loop: converge this worker on the DB settings stamps."""
+    from backend.utils.supabase_admin_cache import get_admin_supabase_client
+
+    while True:
+        await asyncio.sleep(_POLL_INTERVAL_SECONDS)
+        try:
+            admin = await get_admin_supabase_client()
+            await SimulationSettingsCache.poll_versions(admin)
+        except asyncio.CancelledError:
+            logger.info("Simulation settings refresh loop shutting down")
+            raise
+        except (PostgrestAPIError, httpx.HTTPError, KeyError, TypeError, ValueError):
+            # Stale entries still expire via TTL; next poll retries.
+            logger.warning("Simulation settings version poll failed", exc_info=True)
+
+
+async def start_settings_cache_refresh() -> asyncio.Task:
+    """Launch the version-stamp poll loop. Called from app lifespan."""
+    task = asyncio.create_task(_settings_refresh_loop())
+    logger.info("Simulation settings refresh loop started (interval=%ds)", _POLL_INTERVAL_SECONDS)
+    return task
@@ -718,7 +718,7 @@ class SocialStoryService:
 
         try:
             if story_type == "detection":
-                jpeg_bytes = cls._compose_detection(composer, story, accent_hex, magnitude)
+                jpeg_bytes = await cls._compose_detection(composer, story, accent_hex, magnitude)
             elif story_type == "classification":
                 jpeg_bytes = await cls._compose_classification(
                     composer,
@@ -734,7 +734,7 @@ class SocialStoryService:
                     accent_hex,
                 )
             elif story_type == "advisory":
-                jpeg_bytes = cls._compose_advisory(composer, story, accent_hex)
+                jpeg_bytes = await cls._compose_advisory(composer, story, accent_hex)
             elif story_type == "subsiding":
                 jpeg_bytes = await cls._compose_subsiding(composer, admin, story, accent_hex)
             else:
@@ -820,7 +820,7 @@ class SocialStoryService:
     # ── Compose Helpers ───────────────────────────────────────────────────
 
     @staticmethod
-    def _compose_detection(
+    async def _compose_detection(
         composer: InstagramImageService,
         story: dict,
         accent_hex: str,
@@ -828,7 +828,8 @@ class SocialStoryService:
     ) -> bytes:
         """Compose detection alert image."""
         archetype = story.get("archetype") or ""
-        return composer.compose_story_detection(
+        return await composer.render_story(
+            "detection",
             archetype=archetype,
             signature=archetype.lower().replace("the ", "").replace(" ", "_"),
             magnitude=magnitude,
@@ -869,7 +870,8 @@ class SocialStoryService:
         highest = impacts[0] if impacts else {}
         sim_data = highest.get("simulations") or {}
 
-        return composer.compose_story_classification(
+        return await composer.render_story(
+            "classification",
             archetype=archetype,
             source_category=res_data.get("source_category", "unknown"),
             affected_shard_count=len(impacts),
@@ -1005,7 +1007,8 @@ class SocialStoryService:
                     }
                 )
 
-        return composer.compose_story_impact(
+        return await composer.render_story(
+            "impact",
             simulation_name=sim_name,
             effective_magnitude=eff_mag,
             events_spawned=event_titles,
@@ -1018,7 +1021,7 @@ class SocialStoryService:
         )
 
     @staticmethod
-    def _compose_advisory(
+    async def _compose_advisory(
         composer: InstagramImageService,
         story: dict,
         accent_hex: str,
@@ -1026,7 +1029,8 @@ class SocialStoryService:
         """Compose operative advisory image."""
         archetype = story.get("archetype") or ""
         alignment = ARCHETYPE_OPERATIVE_ALIGNMENT.get(archetype, {})
-        return composer.compose_story_advisory(
+        return await composer.render_story(
+            "advisory",
             archetype=archetype,
             aligned_types=alignment.get("aligned", []),
             opposed_types=alignment.get("opposed", []),
@@ -1059,7 +1063,8 @@ class SocialStoryService:
             shards_affected = len(impacts)
             events_total = sum(len(imp.get("spawned_event_ids") or []) for imp in impacts)
 
-        return composer.compose_story_subsiding(
+        return await composer.render_story(
+            "subsiding",
             archetype=archetype,
             events_spawned_total=events_total,
             shards_affected=shards_affected,
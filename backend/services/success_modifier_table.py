@@ -0,0 +1,470 @@
+"""Per-epoch, per-cycle inputs of the operative success formula.
+
+Every deploy used to look up the target side of the formula on its own —
+zone security, guardian count, embassy effectiveness, zone pressure,
+resonance modifier, attacker pressure penalty and convergence modifiers —
+so the burst of deploys at a cycle boundary (players plus every bot) ran
+the same handful of queries over and over against the same few simulations.
+
+``SuccessModifierTable.materialize`` loads those inputs for every
+participant of an epoch in a few batched round trips at cycle start (the
+cycle pipeline calls it right before bots act); deploys then read from the
+table. Values the batch does not cover — a zone-specific pressure, the
+resonance modifier of one operative type — are looked up on first use and
+kept for the rest of the cycle.
+
+Freshness, in three layers:
+
+- **Cycle boundary** — a table belongs to one cycle; the first lookup for a
+  later cycle rebuilds it.
+- **Local events** — guardian deploys/recalls, zone security changes
+  (sabotage, fortification) and embassy infiltration update the table in
+  place.
+- **TTL backstop** — tables expire after ``_TTL_SECONDS``, covering writes
+  by other workers and the heartbeat's pressure/resonance drift.
+
+Agent-specific inputs (aptitude, mood) stay per deploy. The formula itself
+is the pure ``success_probability``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from uuid import UUID
+
+import httpx
+from cachetools import TTLCache
+from postgrest.exceptions import APIError as PostgrestAPIError
+
+from backend.models.epoch import OperativeDeploy
+from backend.services.constants import SECURITY_LEVEL_MAP
+from backend.utils.db import maybe_single_data
+from backend.utils.responses import extract_list
+from supabase import AsyncClient as Client
+
+logger = logging.getLogger(__name__)
+
+_TTL_SECONDS = 300
+_MAX_EPOCHS = 256
+_DEFAULT_ZONE_SECURITY = 5.0  # moderate
+_DEFAULT_EMBASSY_EFFECTIVENESS = 0.5  # no embassy on record
+_EMBASSY_BASE_EFFECTIVENESS = 0.6
+
+_LOOKUP_ERRORS = (PostgrestAPIError, httpx.HTTPError, TypeError, ValueError)
+
+
+@dataclass(frozen=True)
+class SuccessInputs:
+    """Everything the success formula depends on, already looked up."""
+
+    aptitude: int = 6
+    zone_security: float = _DEFAULT_ZONE_SECURITY
+    guardian_count: int = 0
+    embassy_effectiveness: float = _DEFAULT_EMBASSY_EFFECTIVENESS
+    zone_pressure: float = 0.0
+    resonance_modifier: float = 0.0
+    attacker_penalty: float = 0.0
+    convergence_modifier: float = 0.0
+    mood_modifier: float = 0.0
+    surge_bonus: float = 0.0
+
+
+def success_probability(inputs: SuccessInputs, epoch_config: dict | None = None) -> float:
+    """Mission success probability from ``inputs`` and the epoch's balance values.
+
+    Formula:
+      base_success_probability
+      + agent_aptitude x aptitude_modifier_pp
+      - target_zone_security x 0.05
+      - min(guardian_defense_cap_pp, guardian_count x guardian_per_unit_pp)
+      + embassy_effectiveness x embassy_bonus_pp
+      + resonance_pressure (0.00 to +0.04)
+      + resonance_operative_mod (-0.04 to +0.04)
+      + attacker_pressure_penalty (-0.04 to 0.00)
+      + convergence_mod + mood_modifier + surge bonus
+      Clamped to [probability_floor, probability_ceiling]
+    """
+    cfg = epoch_config or {}
+    guardian_penalty = min(
+        cfg.get("guardian_defense_cap_pp", 0.15),
+        inputs.guardian_count * cfg.get("guardian_per_unit_pp", 0.06),
+    )
+    probability = (
+        cfg.get("base_success_probability", 0.55)
+        + inputs.aptitude * cfg.get("aptitude_modifier_pp", 0.03)
+        - inputs.zone_security * 0.05
+        - guardian_penalty
+        + inputs.embassy_effectiveness * cfg.get("embassy_bonus_pp", 0.15)
+        + inputs.zone_pressure
+        + inputs.resonance_modifier
+        + inputs.attacker_penalty
+        + inputs.convergence_modifier
+        + inputs.mood_modifier
+        + inputs.surge_bonus  # Surge Riding: +0.08 when exploiting aligned resonance
+    )
+    return max(cfg.get("probability_floor", 0.05), min(cfg.get("probability_ceiling", 0.95), probability))
+
+
+def _penalty_active(expires_at: str) -> bool:
+    return datetime.fromisoformat(expires_at.replace("Z", "+00:00")) > datetime.now(UTC)
+
+
+def _convergence_by_type(convergences: list[dict], pairs: dict) -> dict[str, float]:
+    """Sum the convergence pair effects per operative type."""
+    totals: dict[str, float] = {}
+    for conv in convergences:
+        a = conv.get("primary_archetype", "")
+        b = conv.get("secondary_archetype", "")
+        pair_data = pairs.get(f"{a}+{b}") or pairs.get(f"{b}+{a}")
+        if pair_data:
+            for op_type, effect in pair_data.get("effects", {}).items():
+                totals[op_type] = totals.get(op_type, 0.0) + float(effect)
+    return totals
+
+
+async def _rpc_float(admin: Client, fn: str, params: dict) -> float:
+    try:
+        result = await admin.rpc(fn, params).execute()
+        return float(result.data) if result.data is not None else 0.0
+    except _LOOKUP_ERRORS:
+        logger.debug("%s lookup failed, defaulting to 0.0", fn, exc_info=True)
+        return 0.0
+
+
+@dataclass
+class _CycleModifiers:
+    """Target-side inputs of one epoch for one cycle; filled lazily on miss."""
+
+    cycle: int | None
+    zones: dict[str, float] = field(default_factory=dict)
+    guardians: dict[str, int] = field(default_factory=dict)
+    embassies: dict[str, tuple[float, str | None]] = field(default_factory=dict)
+    pressure: dict[tuple[str, str | None], float] = field(default_factory=dict)
+    resonance: dict[tuple[str, str], float] = field(default_factory=dict)
+    attacker: dict[str, float] = field(default_factory=dict)
+    convergence: dict[str, dict[str, float]] = field(default_factory=dict)
+    convergence_pairs: dict | None = None
+
+    # ── Batch loads (cycle start) ───────────────────────────────
+
+    async def load(self, admin: Client, sims: list[str]) -> None:
+        await asyncio.gather(
+            self._load_zones(admin, sims),
+            self._load_guardians(admin, sims),
+            self._load_embassies(admin, sims),
+            self._load_convergence(admin, sims),
+            *(self.zone_pressure(admin, sim, None) for sim in sims),
+            *(self.attacker_penalty(admin, sim) for sim in sims),
+        )
+
+    async def _load_zones(self, admin: Client, sims: list[str]) -> None:
+        try:
+            resp = await admin.table("zones").select("id, security_level").in_("simulation_id", sims).execute()
+        except (PostgrestAPIError, httpx.HTTPError):
+            logger.debug("Zone security batch load failed", exc_info=True)
+            return
+        for zone in extract_list(resp):
+            self.zones[zone["id"]] = SECURITY_LEVEL_MAP.get(zone.get("security_level", "moderate"), 5.0)
+
+    async def _load_guardians(self, admin: Client, sims: list[str]) -> None:
+        try:
+            resp = await (
+                admin.table("operative_missions")
+                .select("source_simulation_id")
+                .eq("operative_type", "guardian")
+                .in_("source_simulation_id", sims)
+                .in_("status", ["active"])
+                .execute()
+            )
+        except (PostgrestAPIError, httpx.HTTPError):
+            logger.debug("Guardian batch load failed", exc_info=True)
+            return
+        counts = dict.fromkeys(sims, 0)
+        for mission in extract_list(resp):
+            counts[mission["source_simulation_id"]] = counts.get(mission["source_simulation_id"], 0) + 1
+        self.guardians.update(counts)
+
+    async def _load_embassies(self, admin: Client, sims: list[str]) -> None:
+        # A participant may sit on either side of an embassy (the other side
+        # need not be in the epoch), so match both columns.
+        ids = ",".join(sims)
+        try:
+            resp = await (
+                admin.table("embassies")
+                .select("id, infiltration_penalty, infiltration_penalty_expires_at")
+                .or_(f"simulation_a_id.in.({ids}),simulation_b_id.in.({ids})")
+                .execute()
+            )
+        except (PostgrestAPIError, httpx.HTTPError):
+            logger.debug("Embassy batch load failed", exc_info=True)
+            return
+        for emb in extract_list(resp):
+            self.embassies[emb["id"]] = (
+                float(emb.get("infiltration_penalty") or 0),
+                emb.get("infiltration_penalty_expires_at"),
+            )
+
+    async def _load_convergence(self, admin: Client, sims: list[str]) -> None:
+        try:
+            resp = await (
+                admin.table("narrative_arcs")
+                .select("simulation_id, primary_archetype, secondary_archetype")
+                .in_("simulation_id", sims)
+                .eq("arc_type", "convergence")
+                .in_("status", ["active", "climax"])
+                .execute()
+            )
+            arcs = extract_list(resp)
+            pairs = await self._pairs(admin) if arcs else {}
+            for sim in sims:
+                self.convergence[sim] = _convergence_by_type([a for a in arcs if a["simulation_id"] == sim], pairs)
+        except (PostgrestAPIError, httpx.HTTPError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            logger.debug("Convergence modifiers unavailable (tables may not exist yet)")
+
+    # ── Lookups (table first, one query on miss) ────────────────
+
+    async def zone_security(self, admin: Client, zone_id: str | None) -> float:
+        if not zone_id:
+            return _DEFAULT_ZONE_SECURITY
+        if zone_id not in self.zones:
+            zone_data = await maybe_single_data(
+                admin.table("zones").select("security_level").eq("id", zone_id).maybe_single()
+            )
+            self.zones[zone_id] = (
+                SECURITY_LEVEL_MAP.get(zone_data.get("security_level", "moderate"), 5.0)
+                if zone_data
+                else _DEFAULT_ZONE_SECURITY
+            )
+        return self.zones[zone_id]
+
+    async def guardian_count(self, admin: Client, simulation_id: str | None) -> int:
+        if not simulation_id:
+            return 0
+        if simulation_id not in self.guardians:
+            resp = await (
+                admin.table("operative_missions")
+                .select("id", count="exact")
+                .eq("operative_type", "guardian")
+                .eq("source_simulation_id", simulation_id)
+                .in_("status", ["active"])
+                .execute()
+            )
+            self.guardians[simulation_id] = resp.count or 0
+        return self.guardians[simulation_id]
+
+    async def embassy_effectiveness(self, admin: Client, embassy_id: str | None) -> float:
+        if not embassy_id:
+            return _DEFAULT_EMBASSY_EFFECTIVENESS
+        if embassy_id not in self.embassies:
+            emb_data = await maybe_single_data(
+                admin.table("embassies")
+                .select("id, infiltration_penalty, infiltration_penalty_expires_at")
+                .eq("id", embassy_id)
+                .maybe_single()
+            )
+            if not emb_data:
+                return _DEFAULT_EMBASSY_EFFECTIVENESS
+            self.embassies[embassy_id] = (
+                float(emb_data.get("infiltration_penalty") or 0),
+                emb_data.get("infiltration_penalty_expires_at"),
+            )
+        penalty, expires_at = self.embassies[embassy_id]
+        if penalty > 0 and expires_at:
+            if _penalty_active(expires_at):
+                return _EMBASSY_BASE_EFFECTIVENESS * (1.0 - penalty)
+            # Penalty expired — clear it lazily, once per table
+            self.embassies[embassy_id] = (0.0, None)
+            await (
+                admin.table("embassies")
+                .update({"infiltration_penalty": 0, "infiltration_penalty_expires_at": None})
+                .eq("id", embassy_id)
+                .execute()
+            )
+        return _EMBASSY_BASE_EFFECTIVENESS
+
+    async def zone_pressure(self, admin: Client, simulation_id: str, zone_id: str | None) -> float:
+        """Pressured zones are easier to infiltrate: +0.00 to +0.04 (``fn_target_zone_pressure``, migration 078)."""
+        key = (simulation_id, zone_id)
+        if key not in self.pressure:
+            self.pressure[key] = await _rpc_float(
+                admin, "fn_target_zone_pressure", {"p_simulation_id": simulation_id, "p_zone_id": zone_id}
+            )
+        return self.pressure[key]
+
+    async def resonance_modifier(self, admin: Client, simulation_id: str, operative_type: str) -> float:
+        """Net resonance archetype modifier, clamped [-0.04, +0.04] (``fn_resonance_operative_modifier``)."""
+        key = (simulation_id, operative_type)
+        if key not in self.resonance:
+            self.resonance[key] = await _rpc_float(
+                admin,
+                "fn_resonance_operative_modifier",
+                {"p_simulation_id": simulation_id, "p_operative_type": operative_type},
+            )
+        return self.resonance[key]
+
+    async def attacker_penalty(self, admin: Client, simulation_id: str) -> float:
+        """Own instability hurts outbound ops: -0.04 to 0.00 (``fn_attacker_pressure_penalty``)."""
+        if simulation_id not in self.attacker:
+            self.attacker[simulation_id] = await _rpc_float(
+                admin, "fn_attacker_pressure_penalty", {"p_simulation_id": simulation_id}
+            )
+        return self.attacker[simulation_id]
+
+    async def convergence_modifier(self, admin: Client, simulation_id: str, operative_type: str) -> float:
+        if simulation_id not in self.convergence:
+            try:
+                resp = await (
+                    admin.table("narrative_arcs")
+                    .select("id, primary_archetype, secondary_archetype")
+                    .eq("simulation_id", simulation_id)
+                    .eq("arc_type", "convergence")
+                    .in_("status", ["active", "climax"])
+                    .execute()
+                )
+                convergences = extract_list(resp)
+                pairs = await self._pairs(admin) if convergences else {}
+                self.convergence[simulation_id] = _convergence_by_type(convergences, pairs)
+            except (PostgrestAPIError, httpx.HTTPError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+                logger.debug("Convergence modifiers unavailable (tables may not exist yet)")
+                return 0.0
+        return self.convergence[simulation_id].get(operative_type, 0.0)
+
+    async def _pairs(self, admin: Client) -> dict:
+        if self.convergence_pairs is None:
+            resp = await (
+                admin.table("platform_settings")
+                .select("setting_value")
+                .eq("setting_key", "heartbeat_convergence_pairs")
+                .limit(1)
+                .execute()
+            )
+            pairs = resp.data[0]["setting_value"] if resp.data else {}
+            self.convergence_pairs = json.loads(pairs) if isinstance(pairs, str) else pairs
+        return self.convergence_pairs
+
+
+class SuccessModifierTable:
+    """Process-wide epoch_id → target-side success inputs of the current cycle."""
+
+    _tables: TTLCache[str, _CycleModifiers] = TTLCache(maxsize=_MAX_EPOCHS, ttl=_TTL_SECONDS)
+    _locks: dict[str, asyncio.Lock] = {}
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every table (tests)."""
+        cls._tables.clear()
+        cls._locks = {}
+
+    @classmethod
+    async def materialize(cls, admin: Client, epoch_id: UUID | str, cycle: int) -> _CycleModifiers:
+        """Batch-load the inputs for every participant of the epoch (cycle start).
+
+        Uses admin client: targets live in other simulations' game instances.
+        A failed batch leaves its inputs to the per-key fallback lookups.
+        """
+        key = str(epoch_id)
+        table = _CycleModifiers(cycle=cycle)
+        try:
+            resp = await admin.table("epoch_participants").select("simulation_id").eq("epoch_id", key).execute()
+            sims = [p["simulation_id"] for p in extract_list(resp)]
+        except (PostgrestAPIError, httpx.HTTPError):
+            logger.warning("Success modifier table: participant lookup failed", extra={"epoch_id": key})
+            sims = []
+        if sims:
+            await table.load(admin, sims)
+        cls._tables[key] = table
+        return table
+
+    @classmethod
+    async def _current(cls, admin: Client, epoch_id: UUID | str, cycle: int | None) -> _CycleModifiers:
+        key = str(epoch_id)
+        table = cls._tables.get(key)
+        if table is not None and (cycle is None or table.cycle == cycle):
+            return table
+        # One materialization per epoch and cycle, however many deploys arrive at once.
+        if len(cls._locks) >= _MAX_EPOCHS:
+            # Drop the locks of epochs whose table has expired or been evicted.
+            cls._locks = {k: lock for k, lock in cls._locks.items() if k in cls._tables or lock.locked()}
+        async with cls._locks.setdefault(key, asyncio.Lock()):
+            table = cls._tables.get(key)
+            if table is None or (cycle is not None and table.cycle != cycle):
+                table = await cls.materialize(admin, epoch_id, cycle)
+        return table
+
+    @classmethod
+    async def target_inputs(
+        cls,
+        admin: Client,
+        body: OperativeDeploy,
+        source_simulation_id: UUID | str,
+        *,
+        epoch_id: UUID | str | None = None,
+        cycle: int | None = None,
+    ) -> SuccessInputs:
+        """Target-side inputs for a deploy (aptitude and mood left at their defaults).
+
+        Without ``epoch_id`` every input is looked up fresh.
+        """
+        table = await cls._current(admin, epoch_id, cycle) if epoch_id is not None else _CycleModifiers(cycle=cycle)
+        target = str(body.target_simulation_id) if body.target_simulation_id else None
+        zone_id = str(body.target_zone_id) if body.target_zone_id else None
+
+        zone_security, guardian_count, embassy_eff = await asyncio.gather(
+            table.zone_security(admin, zone_id),
+            table.guardian_count(admin, target),
+            table.embassy_effectiveness(admin, str(body.embassy_id) if body.embassy_id else None),
+        )
+        if not target:
+            return SuccessInputs(
+                zone_security=zone_security, guardian_count=guardian_count, embassy_effectiveness=embassy_eff
+            )
+
+        zone_pressure, resonance_mod, attacker_penalty, convergence_mod = await asyncio.gather(
+            table.zone_pressure(admin, target, zone_id),
+            table.resonance_modifier(admin, target, body.operative_type),
+            table.attacker_penalty(admin, str(source_simulation_id)),
+            table.convergence_modifier(admin, target, body.operative_type),
+        )
+        return SuccessInputs(
+            zone_security=zone_security,
+            guardian_count=guardian_count,
+            embassy_effectiveness=embassy_eff,
+            zone_pressure=zone_pressure,
+            resonance_modifier=resonance_mod,
+            attacker_penalty=attacker_penalty,
+            convergence_modifier=convergence_mod,
+        )
+
+    # ── Events ──────────────────────────────────────────────────
+
+    @classmethod
+    def note_guardians(cls, epoch_id: UUID | str, simulation_id: UUID | str, delta: int) -> None:
+        """A guardian of ``simulation_id`` went active (+1) or left (-1)."""
+        table = cls._tables.get(str(epoch_id))
+        sim = str(simulation_id)
+        if table is not None and sim in table.guardians:
+            table.guardians[sim] = max(0, table.guardians[sim] + delta)
+
+    @classmethod
+    def set_zone_security(cls, epoch_id: UUID | str, zone_id: UUID | str, level: str | None) -> None:
+        """A zone's security tier changed (``None``: unknown — re-read on next use)."""
+        table = cls._tables.get(str(epoch_id))
+        if table is None:
+            return
+        if level is None:
+            table.zones.pop(str(zone_id), None)
+        else:
+            table.zones[str(zone_id)] = SECURITY_LEVEL_MAP.get(level, _DEFAULT_ZONE_SECURITY)
+
+    @classmethod
+    def set_embassy_penalty(
+        cls, epoch_id: UUID | str, embassy_id: UUID | str, penalty: float, expires_at: str | None
+    ) -> None:
+        """An infiltrator compromised an embassy."""
+        table = cls._tables.get(str(epoch_id))
+        if table is not None:
+            table.embassies[str(embassy_id)] = (float(penalty), expires_at)
@@ -0,0 +1,221 @@
+"""Durable, coalescing auto-translation queue (migration 243).
+
+``schedule_auto_translation`` only records what needs translating: one
+pending entry per (table, entity, EN field) in an in-process buffer, where
+a newer write of the same field replaces the older text. Every tick this
+per-worker loop
+
+1. flushes the buffer into ``translation_jobs`` with one upsert (the same
+   coalescing key, so edits on other workers collapse too);
+2. claims a batch with ``fn_claim_translation_jobs`` — texts already in
+   ``translation_memory`` come back translated;
+3. translates each remaining *unique* text once, packing texts that share
+   a context into DeepL / LLM batch calls up to the backend's size limits,
+   with at most ``translation_concurrency`` calls in flight;
+4. writes every result with one ``fn_complete_translation_jobs`` call.
+
+A restart loses at most the buffer of the last tick (it is flushed on
+shutdown as well). A failed batch releases its jobs for the next tick;
+a crashed worker's claims are picked up again after five minutes. A job
+that failed five times is dropped instead of claimed again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+from uuid import UUID
+
+import sentry_sdk
+
+from backend.config import settings
+from backend.models.translation import TranslationContext
+from backend.services.social.scheduler_base import BaseSchedulerMixin
+from backend.services.translation_service import TRANSLATABLE_FIELDS, TranslationService
+from supabase import AsyncClient as Client
+
+logger = logging.getLogger(__name__)
+
+_TICK_INTERVAL_SECONDS = 2
+_CLAIM_LIMIT = 200
+_MAX_CLAIMS_PER_TICK = 5
+
+# Per-call batch limits: DeepL accepts 50 texts / 128 KiB per request; LLM
+# batches stay small enough for reliable structured output.
+_BATCH_LIMITS: dict[str, tuple[int, int]] = {
+    "deepl": (50, 100_000),
+    "claude": (25, 12_000),
+}
+
+
+def text_hash(text: str) -> str:
+    """Key of a source text in ``translation_memory`` (EN → DE)."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def pack_batches[T](items: list[T], max_items: int, max_chars: int, *, size: Callable[[T], int] = len) -> list[list[T]]:
+    """Split items into consecutive batches within the item and size limits."""
+    batches: list[list[T]] = []
+    current: list[T] = []
+    total = 0
+    for item in items:
+        if current and (len(current) >= max_items or total + size(item) > max_chars):
+            batches.append(current)
+            current, total = [], 0
+        current.append(item)
+        total += size(item)
+    if current:
+        batches.append(current)
+    return batches
+
+
+class TranslationQueueService(BaseSchedulerMixin):
+    """Per-worker loop draining the shared translation job queue."""
+
+    _scheduler_name = "translation_queue"
+    _buffer: dict[tuple[str, str, str], dict] = {}
+
+    # ── Enqueue ─────────────────────────────────────────────────
+
+    @classmethod
+    def enqueue(
+        cls,
+        table: str,
+        entity_id: UUID | str,
+        entity_data: dict,
+        context: TranslationContext,
+    ) -> int:
+        """Buffer the entity's non-empty translatable fields. Returns jobs buffered."""
+        field_map = TRANSLATABLE_FIELDS.get(table, {})
+        context_data = context.model_dump(exclude_none=True)
+        queued = 0
+        for en_field in field_map:
+            value = entity_data.get(en_field)
+            if not (value and isinstance(value, str) and value.strip()):
+                continue
+            cls._buffer[(table, str(entity_id), en_field)] = {
+                "table_name": table,
+                "entity_id": str(entity_id),
+                "field": en_field,
+                "source_text": value,
+                "text_hash": text_hash(value),
+                "context": context_data,
+                "attempts": 0,
+                "claimed_at": None,
+            }
+            queued += 1
+        return queued
+
+    @classmethod
+    async def flush(cls, admin: Client) -> int:
+        """Persist buffered jobs in one upsert. Failed rows stay buffered."""
+        if not cls._buffer:
+            return 0
+        pending, cls._buffer = cls._buffer, {}
+        try:
+            await (
+                admin.table("translation_jobs")
+                .upsert(list(pending.values()), on_conflict="table_name,entity_id,field")
+                .execute()
+            )
+        except BaseException:
+            # Keep anything written since the snapshot — it is newer.
+            cls._buffer = {**pending, **cls._buffer}
+            raise
+        return len(pending)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop buffered jobs (tests)."""
+        cls._buffer = {}
+
+    # ── Drain ───────────────────────────────────────────────────
+
+    @classmethod
+    async def _load_config(cls, admin: Client) -> dict:
+        return {"enabled": True, "interval": _TICK_INTERVAL_SECONDS}
+
+    @classmethod
+    async def _process_tick(cls, admin: Client, config: dict) -> None:
+        await cls.flush(admin)
+        for _ in range(_MAX_CLAIMS_PER_TICK):
+            if await cls.drain(admin) < _CLAIM_LIMIT:
+                break
+
+    @classmethod
+    async def drain(cls, admin: Client, *, limit: int = _CLAIM_LIMIT) -> int:
+        """Claim, translate and complete one batch of jobs. Returns jobs claimed."""
+        response = await admin.rpc("fn_claim_translation_jobs", {"p_limit": limit}).execute()
+        jobs = response.data or []
+        if not jobs:
+            return 0
+
+        translated: dict[str, str] = {job["text_hash"]: job["cached"] for job in jobs if job.get("cached")}
+
+        # Unique untranslated texts, grouped by the context they are sent with.
+        # Texts keep their field name: the LLM prompt uses it as a header.
+        groups: dict[tuple, dict[str, tuple[str, str]]] = defaultdict(dict)
+        for job in jobs:
+            if job["text_hash"] in translated:
+                continue
+            ctx = job.get("context") or {}
+            key = (
+                ctx.get("simulation_name", ""),
+                ctx.get("simulation_theme", ""),
+                ctx.get("entity_type", ""),
+                ctx.get("entity_name"),
+            )
+            groups[key][job["text_hash"]] = (job["field"], job["source_text"])
+
+        max_items, max_chars = _BATCH_LIMITS.get(settings.translation_backend, _BATCH_LIMITS["claude"])
+        semaphore = asyncio.Semaphore(max(1, settings.translation_concurrency))
+
+        async def _translate(key: tuple, items: list[tuple[str, str]]) -> None:
+            context = TranslationContext(
+                simulation_name=key[0], simulation_theme=key[1], entity_type=key[2], entity_name=key[3]
+            )
+            names = {f"{field}:{i}": text for i, (field, text) in enumerate(items)}
+            async with semaphore:
+                result = await TranslationService.translate_fields(names, context=context)
+            for name, text in names.items():
+                if result.get(name):
+                    translated[text_hash(text)] = result[name]
+
+        batches = [
+            (key, batch)
+            for key, items in groups.items()
+            for batch in pack_batches(list(items.values()), max_items, max_chars, size=lambda item: len(item[1]))
+        ]
+        outcomes = await asyncio.gather(*(_translate(key, batch) for key, batch in batches), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                # One failed batch (provider error, budget block, malformed
+                # output) must not discard the others' results.
+                logger.warning("Translation batch failed; jobs released for retry", exc_info=outcome)
+                sentry_sdk.capture_exception(outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+
+        done = [
+            {"id": job["id"], "hash": job["text_hash"], "text": translated[job["text_hash"]]}
+            for job in jobs
+            if job["text_hash"] in translated
+        ]
+        if done:
+            written = await admin.rpc("fn_complete_translation_jobs", {"p_results": done}).execute()
+            logger.info(
+                "Auto-translated fields",
+                extra={
+                    "entity_count": written.data,
+                    "jobs": len(done),
+                    "cached": sum(1 for job in jobs if job.get("cached")),
+                    "batches": len(batches),
+                },
+            )
+        failed = [job["id"] for job in jobs if job["text_hash"] not in translated]
+        if failed:
+            await admin.table("translation_jobs").update({"claimed_at": None}).in_("id", failed).execute()
+        return len(jobs)
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from uuid import UUID
 
 import deepl
-import httpx
-import sentry_sdk
 from pydantic_ai import Agent
 
 from backend.config import settings
@@ -16,7 +15,6 @@ from backend.dependencies import get_admin_supabase
 from backend.models.translation import TranslationContext, TranslationResult
 from backend.services.ai_utils import get_openrouter_model, run_ai
 from backend.services.platform_model_config import get_platform_model
-from supabase import AsyncClient as Client
 
 logger = logging.getLogger(__name__)
 
@@ -220,15 +218,13 @@ class TranslationService:
         """Single-text translation via DeepL API.
 
         Runs the synchronous DeepL SDK call in a thread to avoid blocking
-        the asyncio event loop. Translator is created inside the thread
-        to ensure thread-safety of the HTTP session.
+        the asyncio event loop (see ``_deepl_translator`` for session reuse).
         """
         deepl_context = _build_deepl_context(context)
         target = _deepl_target(target_lang)
 
         def _run() -> str:
-            translator = deepl.Translator(settings.deepl_api_key)
-            return translator.translate_text(
+            return _deepl_translator().translate_text(
                 text,
                 source_lang=source_lang.upper(),
                 target_lang=target,
@@ -247,8 +243,7 @@ class TranslationService:
         """Batch field translation via DeepL (one call with multiple texts).
 
         Runs the synchronous DeepL SDK call in a thread to avoid blocking
-        the asyncio event loop. Translator is created inside the thread
-        to ensure thread-safety of the HTTP session.
+        the asyncio event loop (see ``_deepl_translator`` for session reuse).
         """
         deepl_context = _build_deepl_context(context)
         names = list(fields.keys())
@@ -256,8 +251,7 @@ class TranslationService:
         target = _deepl_target(target_lang)
 
         def _run() -> list:
-            translator = deepl.Translator(settings.deepl_api_key)
-            return translator.translate_text(
+            return _deepl_translator().translate_text(
                 texts,
                 source_lang=source_lang.upper(),
                 target_lang=target,
@@ -268,6 +262,24 @@ class TranslationService:
         return {name: r.text for name, r in zip(names, results, strict=False)}
 
 
+_deepl_local = threading.local()
+
+
+def _deepl_translator() -> deepl.Translator:
+    """DeepL translator of the calling thread, created once and reused.
+
+    The SDK's HTTP session is not shared across threads, so each
+    ``asyncio.to_thread`` worker keeps its own — and its open connection —
+    instead of a new translator (and TLS handshake) per call.
+    """
+    translator = getattr(_deepl_local, "translator", None)
+    if translator is None or getattr(_deepl_local, "api_key", None) != settings.deepl_api_key:
+        translator = deepl.Translator(settings.deepl_api_key)
+        _deepl_local.translator = translator
+        _deepl_local.api_key = settings.deepl_api_key
+    return translator
+
+
 def _deepl_target(lang: str) -> str:
     """Map generic language codes to DeepL target codes."""
     mapping = {"de": "DE", "en": "EN-US", "fr": "FR", "es": "ES"}
@@ -303,68 +315,7 @@ def null_de_fields_for_update(table: str, update_data: dict) -> dict:
     return nulls
 
 
-async def _run_auto_translate(
-    supabase: Client,
-    table: str,
-    entity_id: str,
-    entity_data: dict,
-    context: TranslationContext,
-) -> None:
-    """Translate fields and write _de columns back. Meant to run as background task."""
-    field_map = TRANSLATABLE_FIELDS.get(table, {})
-    if not field_map:
-        return
-
-    # Collect non-empty EN fields that need translation
-    to_translate: dict[str, str] = {}
-    for en_field, _de_field in field_map.items():
-        value = entity_data.get(en_field)
-        if value and isinstance(value, str) and value.strip():
-            to_translate[en_field] = value
-
-    if not to_translate:
-        return
-
-    try:
-        translated = await TranslationService.translate_fields(to_translate, context=context)
-    except (httpx.HTTPError, KeyError, TypeError, ValueError) as exc:
-        logger.exception("Auto-translation failed", extra={"entity_type": table, "entity_id": entity_id})
-        sentry_sdk.capture_exception(exc)
-        return
-
-    # Map back to _de column names
-    update_data: dict[str, str] = {}
-    for en_field, translated_text in translated.items():
-        de_field = field_map.get(en_field)
-        if de_field and translated_text:
-            update_data[de_field] = translated_text
-
-    if not update_data:
-        return
-
-    try:
-        await supabase.table(table).update(update_data).eq("id", entity_id).execute()
-        logger.info(
-            "Auto-translated fields",
-            extra={"entity_type": table, "entity_id": entity_id, "entity_count": len(update_data)},
-        )
-    except (httpx.HTTPError, KeyError, TypeError, ValueError) as exc:
-        logger.exception("Failed to persist auto-translation", extra={"entity_type": table, "entity_id": entity_id})
-        sentry_sdk.capture_exception(exc)
-
-
-def _on_translate_task_done(task: asyncio.Task[None]) -> None:
-    """Log and report unhandled exceptions from background translation tasks."""
-    if task.cancelled():
-        return
-    exc = task.exception()
-    if exc:
-        logger.exception("Background translation task failed unexpectedly", exc_info=exc)
-        sentry_sdk.capture_exception(exc)
-
-
 def schedule_auto_translation(
-    supabase: Client,
     table: str,
     entity_id: UUID | str,
     entity_data: dict,
@@ -372,18 +323,19 @@ def schedule_auto_translation(
     simulation_theme: str,
     entity_type: str | None = None,
 ) -> None:
-    """Fire-and-forget background translation for an entity.
+    """Queue background translation of an entity's translatable fields.
 
-    Safe to call from sync or async context — creates a background task
-    with an error callback to prevent silent exception swallowing.
+    Synchronous and non-blocking: the fields are handed to the durable
+    translation queue (``TranslationQueueService``), which coalesces repeated
+    edits, batches provider calls and writes the ``_de`` columns with the
+    service-role client.
     """
+    from backend.services.translation_queue_service import TranslationQueueService
+
     context = TranslationContext(
         simulation_name=simulation_name,
         simulation_theme=simulation_theme,
         entity_type=entity_type or table,
         entity_name=entity_data.get("name"),
     )
-    task = asyncio.create_task(
-        _run_auto_translate(supabase, table, str(entity_id), entity_data, context),
-    )
-    task.add_done_callback(_on_translate_task_done)
+    TranslationQueueService.enqueue(table, entity_id, entity_data, context)
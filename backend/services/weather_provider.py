@@ -0,0 +1,225 @@
+"""Open-Meteo weather provider — geo-cell cache + batched multi-location fetch.
+
+AmbientWeatherService used to open a fresh ``httpx.AsyncClient`` and make one
+Open-Meteo request per simulation per tick. Simulations share a handful of
+theme-default coordinates, so most of those calls fetched the same data.
+
+This layer:
+
+- Quantizes (lat, lon) to ``CELL_DEGREES`` cells (~11 km — finer than the
+  Open-Meteo model grid outside Europe, coarse enough to merge simulations
+  that sit on the same city).
+- Caches each cell's payload until the next Open-Meteo "current" update slot
+  (the API refreshes current conditions every 15 minutes), plus a small grace.
+- Batches cache misses into multi-location requests (Open-Meteo accepts
+  comma-separated ``latitude`` / ``longitude`` lists and returns one object per
+  location) on a single pooled client.
+- Dedupes in-flight fetches: a tick that asks for a cell while the heartbeat's
+  ``prefetch`` is still fetching it awaits the same request.
+- Keeps each simulation's last weather summary (the Plan B data and 7-bag
+  state), so a tick reads it from memory instead of querying the previous
+  heartbeat; only the first tick after a restart loads it from the database.
+
+Failures raise ``httpx.HTTPError`` / ``ValueError`` — the Plan B / Plan C
+fallbacks stay in ``AmbientWeatherService.fetch_conditions``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+
+import httpx
+from cachetools import LRUCache, TLRUCache
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+CELL_DEGREES = 0.1
+_UPDATE_CADENCE_SECONDS = 15 * 60  # Open-Meteo "current" refresh interval
+_CADENCE_GRACE_SECONDS = 60  # model data lands shortly after the slot boundary
+_BATCH_SIZE = 50  # locations per request — keeps the query string well under URL limits
+_TIMEOUT = 10.0  # seconds
+
+_CURRENT_FIELDS = (
+    "temperature_2m,relative_humidity_2m,wind_speed_10m,"
+    "precipitation,cloud_cover,weather_code,visibility,is_day"
+)
+
+Cell = tuple[float, float]
+
+
+def cell_for(lat: float, lon: float) -> Cell:
+    """Quantize coordinates to the centre of their ``CELL_DEGREES`` cell."""
+    return (
+        round((math.floor(lat / CELL_DEGREES) + 0.5) * CELL_DEGREES, 4),
+        round((math.floor(lon / CELL_DEGREES) + 0.5) * CELL_DEGREES, 4),
+    )
+
+
+def _expires_at(_key, _value, now: float) -> float:
+    """TLRU time-to-use: the next update slot boundary plus grace."""
+    slot_end = (math.floor(now / _UPDATE_CADENCE_SECONDS) + 1) * _UPDATE_CADENCE_SECONDS
+    return slot_end + _CADENCE_GRACE_SECONDS
+
+
+class WeatherProvider:
+    """Process-wide Open-Meteo client with a per-cell conditions cache."""
+
+    _cache: TLRUCache[Cell, dict] = TLRUCache(maxsize=1024, ttu=_expires_at, timer=time.time)
+    _inflight: dict[Cell, asyncio.Future] = {}
+    _summaries: LRUCache[str, dict] = LRUCache(maxsize=1024)
+    _client: httpx.AsyncClient | None = None
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        return cls._client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the pooled client (lifespan shutdown). Idempotent."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop cached cells, summaries and in-flight bookkeeping (tests)."""
+        cls._cache.clear()
+        cls._summaries.clear()
+        cls._inflight = {}
+
+    # ── Public API ──────────────────────────────────────────────
+
+    @classmethod
+    async def get(cls, lat: float, lon: float) -> dict:
+        """Return the Open-Meteo payload (``current`` + ``daily``) for a location.
+
+        Raises on fetch failure so callers can fall back.
+        """
+        cell = cell_for(lat, lon)
+        results = await cls._get_cells([cell])
+        payload = results.get(cell)
+        if payload is None:
+            raise ValueError(f"Open-Meteo returned no data for cell {cell}")
+        return payload
+
+    @classmethod
+    async def prefetch(cls, coords: list[tuple[float, float]]) -> int:
+        """Warm the cache for many locations in batched requests.
+
+        Never raises — a failed prefetch just leaves the cells cold and each
+        tick retries (then falls back) individually. Returns cells fetched.
+        """
+        cells = list(dict.fromkeys(cell_for(lat, lon) for lat, lon in coords))
+        missing = [c for c in cells if c not in cls._cache and c not in cls._inflight]
+        if not missing:
+            return 0
+        try:
+            results = await cls._get_cells(missing)
+        except (httpx.HTTPError, KeyError, TypeError, ValueError):
+            logger.warning("Weather prefetch failed", extra={"cell_count": len(missing)}, exc_info=True)
+            return 0
+        return sum(1 for c in missing if results.get(c) is not None)
+
+    @classmethod
+    def last_summary(cls, simulation_id: str) -> dict | None:
+        """The simulation's last weather summary, or None if not seen since startup."""
+        return cls._summaries.get(str(simulation_id))
+
+    @classmethod
+    def remember_summary(cls, simulation_id: str, summary: dict) -> None:
+        cls._summaries[str(simulation_id)] = summary
+
+    # ── Internals ───────────────────────────────────────────────
+
+    @classmethod
+    async def _get_cells(cls, cells: list[Cell]) -> dict[Cell, dict | None]:
+        results: dict[Cell, dict | None] = {}
+        waiting: dict[Cell, asyncio.Future] = {}
+        to_fetch: list[Cell] = []
+        for cell in cells:
+            cached = cls._cache.get(cell)
+            if cached is not None:
+                results[cell] = cached
+            elif cell in cls._inflight:
+                waiting[cell] = cls._inflight[cell]
+            else:
+                to_fetch.append(cell)
+
+        if to_fetch:
+            loop = asyncio.get_running_loop()
+            futures = {cell: loop.create_future() for cell in to_fetch}
+            cls._inflight.update(futures)
+            try:
+                fetched = await cls._fetch_batched(to_fetch)
+            except Exception as exc:
+                for fut in futures.values():
+                    fut.set_exception(exc)
+                    fut.exception()  # mark retrieved — there may be no waiters
+                raise
+            except BaseException:
+                for fut in futures.values():
+                    fut.cancel()
+                raise
+            finally:
+                for cell in to_fetch:
+                    cls._inflight.pop(cell, None)
+            for cell, fut in futures.items():
+                payload = fetched.get(cell)
+                if payload is not None:
+                    cls._cache[cell] = payload
+                fut.set_result(payload)
+                results[cell] = payload
+
+        for cell, fut in waiting.items():
+            results[cell] = await asyncio.shield(fut)
+        return results
+
+    @classmethod
+    async def _fetch_batched(cls, cells: list[Cell]) -> dict[Cell, dict]:
+        chunks = [cells[i : i + _BATCH_SIZE] for i in range(0, len(cells), _BATCH_SIZE)]
+        responses = await asyncio.gather(*(cls._fetch_chunk(chunk) for chunk in chunks))
+        merged: dict[Cell, dict] = {}
+        for part in responses:
+            merged.update(part)
+        return merged
+
+    @classmethod
+    async def _fetch_chunk(cls, cells: list[Cell]) -> dict[Cell, dict]:
+        started = time.perf_counter()
+        resp = await cls._get_client().get(
+            settings.open_meteo_url,
+            params={
+                "latitude": ",".join(str(lat) for lat, _ in cells),
+                "longitude": ",".join(str(lon) for _, lon in cells),
+                "current": _CURRENT_FIELDS,
+                "daily": "sunrise,sunset",
+                "timezone": "auto",
+                "forecast_days": 1,
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        # Single location → one object; several → a list in request order.
+        locations = data if isinstance(data, list) else [data]
+        if len(locations) != len(cells):
+            raise ValueError(f"Open-Meteo returned {len(locations)} locations for {len(cells)} requested")
+        logger.info(
+            "Fetched Open-Meteo batch",
+            extra={"cell_count": len(cells), "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)},
+        )
+        return {
+            cell: {"current": loc.get("current", {}), "daily": loc.get("daily", {})}
+            for cell, loc in zip(cells, locations, strict=True)
+        }
+
+
+async def close_weather_client() -> None:
+    """Close the shared Open-Meteo client (lifespan shutdown)."""
+    await WeatherProvider.aclose()
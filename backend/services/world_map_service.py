@@ -33,6 +33,7 @@ from backend.models.world_map import (
     WorldMapThemeHints,
     WorldMapZone,
 )
+from backend.services.simulation_settings_cache import SimulationSettingsCache
 from backend.utils.db import maybe_single_data
 from supabase import AsyncClient as Client
 
@@ -266,15 +267,8 @@ class WorldMapService:
         Returns a flat key→value dict. Missing keys are simply absent — the
         caller defaults them to None via Pydantic.
         """
-        resp = await (
-            admin.table("simulation_settings")
-            .select("setting_key, setting_value")
-            .eq("simulation_id", str(sim_id))
-            .eq("category", "design")
-            .in_("setting_key", list(_THEME_HINT_KEYS))
-            .execute()
-        )
-        return {r["setting_key"]: r["setting_value"] for r in (resp.data or [])}
+        design = await SimulationSettingsCache.get(admin, sim_id, "design")
+        return {key: design[key] for key in _THEME_HINT_KEYS if key in design}
 
     @staticmethod
     async def _resolve_geometry_version(
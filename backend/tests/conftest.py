@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
@@ -8,6 +9,7 @@ from backend.app import app
 from backend.dependencies import get_current_user
 from backend.models.common import CurrentUser
 from backend.services import dungeon_content_service as _dcs
+from backend.utils.call_stats import track_calls
 
 MOCK_USER_ID = UUID("11111111-1111-1111-1111-111111111111")
 MOCK_USER_EMAIL = "test@velgarien.dev"
@@ -129,3 +131,97 @@ def _reset_admin_supabase_cache():
 
     reset_admin_supabase_cache()
     yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_simulation_settings_cache():
+    """Drop the process-wide simulation settings cache between tests.
+
+    Entries are keyed by simulation id, and many tests reuse the same
+    fixture UUIDs with different mocked settings rows.
+    """
+    from backend.services.simulation_settings_cache import SimulationSettingsCache
+
+    SimulationSettingsCache.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_chat_context_cache():
+    """Drop warm chat contexts cached by earlier conversation tests."""
+    from backend.services.chat_context_cache import ChatContextCache
+
+    ChatContextCache.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_weather_provider():
+    """Drop weather cells and per-simulation summaries cached by earlier ticks."""
+    from backend.services.weather_provider import WeatherProvider
+
+    WeatherProvider.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_multiverse_graph():
+    """Drop the process-wide connection graph index between tests."""
+    from backend.services.multiverse_graph import MultiverseGraph
+
+    MultiverseGraph.reset()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_translation_queue():
+    """Drop auto-translations buffered by earlier tests' entity writes."""
+    from backend.services.translation_queue_service import TranslationQueueService
+
+    TranslationQueueService.reset()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_query_stats():
+    """Drop the per-route round-trip rollup recorded by earlier requests."""
+    from backend.services.query_stats_service import QueryStatsService
+
+    QueryStatsService.reset()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_success_modifier_table():
+    """Drop per-epoch success inputs materialized by earlier cycle/deploy tests."""
+    from backend.services.success_modifier_table import SuccessModifierTable
+
+    SuccessModifierTable.clear()
+    yield
+
+
+@pytest.fixture()
+def query_budget():
+    """Assert an upper bound on the PostgREST round trips made inside a block.
+
+    Usage::
+
+        with query_budget(2) as stats:
+            await client.get("/api/v1/public/simulations")
+
+    Counts only calls through an instrumented client
+    (``backend.utils.call_stats.instrument_client``) issued in the test's
+    own context — drive the app through ``httpx.ASGITransport``, not the
+    threaded ``TestClient``. Any N+1 query shape fails the budget too.
+    """
+
+    @contextmanager
+    def _budget(max_db_calls: int):
+        with track_calls() as stats:
+            yield stats
+        assert stats.db_calls <= max_db_calls, (
+            f"{stats.db_calls} round trips, budget {max_db_calls}: {stats.summary()}"
+        )
+        assert not stats.n_plus_one(), f"N+1 query pattern: {stats.n_plus_one()}"
+
+    return _budget
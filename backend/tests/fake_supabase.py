@@ -0,0 +1,728 @@
+"""In-memory PostgREST backend for fast service-level tests and benchmarks.
+
+``FakeSupabase`` holds tables as lists of dicts and answers PostgREST's
+HTTP protocol through an httpx transport, so services run against a real
+supabase-py client: the query builders, response parsing, error mapping
+and ``backend.utils.call_stats`` hooks are all the production code paths.
+
+Supported subset (what this codebase uses):
+
+- ``select`` with column lists, aliases (``alias:col``), casts (``::``),
+  JSON paths (``col->key``, ``col->>key``), ``count="exact"``, and embedded
+  relations: ``agents(name)``, ``agents!inner(...)``,
+  ``agents!source_agent_id(...)``, ``agents!<table>_<col>_fkey(...)``,
+  ``alias:fk_column(...)`` and ``relation(count)``;
+- filters ``eq neq gt gte lt lte like ilike is in cs ov``, ``not.<op>``,
+  ``or=(...)`` / ``and(...)``;
+- ``order`` (multi-column, ``nullsfirst``/``nullslast``), ``limit``,
+  ``offset`` / ``range``, ``single()`` / ``maybe_single()``;
+- ``insert``, ``upsert`` (``on_conflict``, merge or ignore duplicates),
+  ``update``, ``delete``, with ``returning`` representation or minimal;
+- ``rpc`` through registered Python implementations (``@fake.rpc(name)``),
+  with ports of ``fn_age_events_batch``, ``fn_compute_cycle_scores`` and
+  ``retrieve_agent_memories`` preinstalled; unregistered functions raise
+  PGRST202 unless an ``unknown_rpc(name, params)`` fallback is given.
+
+Many-to-one embeds are resolved from ``<singular>_id`` columns, one-to-many
+embeds from the child's ``<singular parent>_id``; anything else is declared
+with ``relate()``. Filters on embedded columns and RLS are not modelled.
+
+Usage::
+
+    fake = FakeSupabase({"agents": [...]}, latency_ms=2)
+    client = await fake.client()
+    await SomeService.run(client, ...)
+    assert fake.tables["agents"][0]["name"] == ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import fnmatch
+import json
+import math
+import re
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+
+from backend.utils.call_stats import instrument_client
+from supabase import AsyncClient, AsyncClientOptions, create_async_client
+
+Row = dict[str, Any]
+RpcImpl = Callable[["FakeSupabase", dict[str, Any]], Any]
+
+# Structurally valid JWT; the transport never checks it.
+_KEY = "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoic2VydmljZV9yb2xlIn0.signature"
+_REST_PREFIX = "/rest/v1/"
+_OBJECT = "application/vnd.pgrst.object+json"
+_RESERVED = frozenset({"select", "order", "limit", "offset", "on_conflict", "columns", "or", "and"})
+_EMBED = re.compile(r"^(?:(?P<alias>\w+):)?(?P<name>\w+)(?:!(?P<hint>\w+))?\((?P<inner>.*)\)$", re.DOTALL)
+_JSON_PATH = re.compile(r"(->>?)")
+
+
+class FakePostgrestError(Exception):
+    """Raised inside the fake; answered as a PostgREST error body."""
+
+    def __init__(self, status: int, code: str, message: str, details: str | None = None):
+        super().__init__(message)
+        self.status = status
+        self.body = {"code": code, "message": message, "details": details, "hint": None}
+
+
+# ── Parsing helpers ──────────────────────────────────────────────────────
+
+
+def _split_top(text: str, sep: str = ",") -> list[str]:
+    """Split on ``sep`` outside parentheses and double quotes."""
+    parts, depth, quoted, current = [], 0, False, []
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        if ch == sep and depth == 0 and not quoted:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    if current or parts:
+        parts.append("".join(current).strip())
+    return [p for p in parts if p]
+
+
+def _unquote(value: str) -> str:
+    return value[1:-1] if len(value) >= 2 and value[0] == value[-1] == '"' else value
+
+
+def _singular(name: str) -> str:
+    if name.endswith("ies"):
+        return name[:-3] + "y"
+    return name[:-1] if name.endswith("s") else name
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _resolve(row: Row, column: str) -> Any:
+    """Column value, following ``->`` / ``->>`` JSON paths."""
+    parts = _JSON_PATH.split(column.split("::", 1)[0])
+    value = row.get(parts[0].strip())
+    for i in range(1, len(parts), 2):
+        key = parts[i + 1].strip().strip("'")
+        if isinstance(value, dict):
+            value = value.get(key)
+        elif isinstance(value, list) and key.lstrip("-").isdigit():
+            idx = int(key)
+            value = value[idx] if -len(value) <= idx < len(value) else None
+        else:
+            value = None
+        if parts[i] == "->>" and value is not None and not isinstance(value, str):
+            value = json.dumps(value)
+    return value
+
+
+def _as_datetime(value: Any) -> datetime | None:
+    if not isinstance(value, str) or len(value) < 10 or value[4] != "-":
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _coerce(value: Any, text: str) -> tuple[Any, Any]:
+    """Comparable pair for a stored value and a filter literal."""
+    if isinstance(value, bool):
+        return value, text.lower() == "true"
+    if isinstance(value, int | float):
+        try:
+            return value, float(text)
+        except ValueError:
+            return str(value), text
+    left, right = _as_datetime(value), _as_datetime(text)
+    if left is not None and right is not None:
+        return left, right
+    if isinstance(value, dict | list):
+        return value, json.loads(text) if text[:1] in "[{" else text
+    return ("" if value is None else str(value)), text
+
+
+def _like(value: Any, pattern: str, *, insensitive: bool) -> bool:
+    if value is None:
+        return False
+    glob = pattern.replace("%", "*")
+    return (
+        fnmatch.fnmatchcase(str(value).lower(), glob.lower()) if insensitive else fnmatch.fnmatchcase(str(value), glob)
+    )
+
+
+def _array_literal(text: str) -> list[str]:
+    body = text.strip()
+    if body[:1] in "{(" and body[-1:] in "})":
+        body = body[1:-1]
+    return [_unquote(v) for v in _split_top(body)] if body else []
+
+
+def _compare(value: Any, op: str, arg: str) -> bool:
+    if op == "is":
+        lowered = arg.lower()
+        if lowered == "null":
+            return value is None
+        if lowered in ("true", "false"):
+            return value is (lowered == "true")
+        return value is None if lowered == "unknown" else False
+    if op == "in":
+        return value is not None and any(_eq(value, v) for v in _array_literal(arg))
+    if op in ("like", "ilike"):
+        return _like(value, _unquote(arg), insensitive=op == "ilike")
+    if op == "cs":
+        if isinstance(value, dict):
+            wanted = json.loads(arg)
+            return all(value.get(k) == v for k, v in wanted.items())
+        items = {str(v) for v in (value or [])}
+        wanted_items = json.loads(arg) if arg.startswith("[") else _array_literal(arg)
+        return {str(v) for v in wanted_items} <= items
+    if op == "ov":
+        return bool({str(v) for v in (value or [])} & set(_array_literal(arg)))
+    if value is None:
+        return False
+    if op == "eq":
+        return _eq(value, arg)
+    if op == "neq":
+        return not _eq(value, arg)
+    left, right = _coerce(value, _unquote(arg))
+    try:
+        if op == "gt":
+            return left > right
+        if op == "gte":
+            return left >= right
+        if op == "lt":
+            return left < right
+        if op == "lte":
+            return left <= right
+    except TypeError:
+        return False
+    raise FakePostgrestError(400, "PGRST100", f"Unsupported operator: {op}")
+
+
+def _eq(value: Any, arg: str) -> bool:
+    left, right = _coerce(value, _unquote(arg))
+    return left == right
+
+
+def _condition(expr: str) -> Callable[[Row], bool]:
+    """One ``or``/``and`` list item: ``col.op.value``, ``and(...)``, ``not.or(...)``."""
+    negate = expr.startswith("not.")
+    if negate:
+        expr = expr[4:]
+    for group in ("and", "or"):
+        if expr.startswith(f"{group}(") and expr.endswith(")"):
+            predicate = _group(group, expr[len(group) + 1 : -1])
+            break
+    else:
+        column, op_value = expr.split(".", 1)
+        predicate = _filter(column, op_value)
+    return (lambda row: not predicate(row)) if negate else predicate
+
+
+def _group(kind: str, body: str) -> Callable[[Row], bool]:
+    conditions = [_condition(item) for item in _split_top(body)]
+    combine = all if kind == "and" else any
+    return lambda row: combine(c(row) for c in conditions)
+
+
+def _filter(column: str, op_value: str) -> Callable[[Row], bool]:
+    negate = op_value.startswith("not.")
+    if negate:
+        op_value = op_value[4:]
+    op, _, arg = op_value.partition(".")
+    column = _unquote(column)
+
+    def _predicate(row: Row) -> bool:
+        result = _compare(_resolve(row, column), op, arg)
+        return not result if negate else result
+
+    return _predicate
+
+
+def _sort_key(value: Any) -> tuple[int, Any]:
+    if isinstance(value, bool):
+        return (1, int(value))
+    if isinstance(value, int | float):
+        return (1, value)
+    parsed = _as_datetime(value)
+    if parsed is not None:
+        return (2, parsed.timestamp())
+    return (3, json.dumps(value, sort_keys=True) if isinstance(value, dict | list) else str(value))
+
+
+def _apply_order(rows: list[Row], spec: str) -> list[Row]:
+    for term in reversed(_split_top(spec)):
+        parts = term.split(".")
+        column, desc = parts[0], "desc" in parts[1:]
+        nulls_first = "nullsfirst" in parts[1:] or ("nullslast" not in parts[1:] and desc)
+        present = [r for r in rows if _resolve(r, column) is not None]
+        missing = [r for r in rows if _resolve(r, column) is None]
+        present.sort(key=lambda r: _sort_key(_resolve(r, column)), reverse=desc)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+
+# ── The fake ─────────────────────────────────────────────────────────────
+
+
+class FakeSupabase:
+    """In-memory tables + RPCs behind a PostgREST-compatible httpx transport."""
+
+    def __init__(
+        self,
+        tables: dict[str, Iterable[Row]] | None = None,
+        *,
+        latency_ms: float | Callable[[httpx.Request], float] = 0.0,
+        unknown_rpc: Callable[[str, dict[str, Any]], Any] | None = None,
+    ):
+        self.tables: dict[str, list[Row]] = defaultdict(list)
+        for name, rows in (tables or {}).items():
+            self.tables[name] = [copy.deepcopy(dict(row)) for row in rows]
+        self.latency_ms = latency_ms
+        self.requests = 0
+        self._rpcs: dict[str, RpcImpl] = dict(_BUILTIN_RPCS)
+        self._unknown_rpc = unknown_rpc
+        self._relations: dict[tuple[str, str], tuple[str, str, bool]] = {}
+
+    # ── configuration ──
+
+    def rpc(self, name: str) -> Callable[[RpcImpl], RpcImpl]:
+        """Register a Python implementation: ``impl(fake, params) -> result``."""
+
+        def _register(impl: RpcImpl) -> RpcImpl:
+            self._rpcs[name] = impl
+            return impl
+
+        return _register
+
+    def relate(self, table: str, column: str, target: str, *, embed_as: str | None = None) -> None:
+        """Declare ``table.column`` → ``target.id`` when the naming convention does not reveal it."""
+        self._relations[(table, embed_as or target)] = (column, target, False)
+        self._relations[(target, table)] = (column, table, True)
+
+    async def client(self) -> AsyncClient:
+        """A real, instrumented supabase-py client bound to this fake."""
+        http = httpx.AsyncClient(transport=_FakeTransport(self))
+        client = await create_async_client("http://supabase.test", _KEY, options=AsyncClientOptions(httpx_client=http))
+        return instrument_client(client)
+
+    # ── request handling ──
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        latency = self.latency_ms(request) if callable(self.latency_ms) else self.latency_ms
+        if latency:
+            await asyncio.sleep(latency / 1000)
+        try:
+            return self._dispatch(request)
+        except FakePostgrestError as exc:
+            return httpx.Response(exc.status, json=exc.body)
+
+    def _dispatch(self, request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.split(_REST_PREFIX, 1)[-1]
+        params = request.url.params
+        body = json.loads(request.content) if request.content else None
+        prefer = request.headers.get("prefer", "")
+
+        if resource.startswith("rpc/"):
+            rpc_params = dict(params) if request.method == "GET" else (body or {})
+            return self._respond(request, self._call_rpc(resource[4:], rpc_params), prefer)
+
+        if request.method in ("GET", "HEAD"):
+            rows = self._select(resource, params)
+        elif request.method == "POST":
+            rows = self._insert(resource, body, params, prefer)
+        elif request.method == "PATCH":
+            rows = self._update(resource, body or {}, params)
+        elif request.method == "DELETE":
+            rows = self._delete(resource, params)
+        else:
+            raise FakePostgrestError(405, "PGRST105", f"Unsupported method {request.method}")
+
+        if request.method != "GET" and "select" in params:
+            rows = [self._project(resource, row, params["select"]) for row in rows]
+        elif request.method != "GET":
+            rows = [copy.deepcopy(row) for row in rows]
+        if request.method != "GET" and "return=minimal" in prefer:
+            return httpx.Response(204 if request.method != "POST" else 201)
+        return self._respond(request, rows, prefer, total=getattr(rows, "total", None))
+
+    def _respond(self, request: httpx.Request, data: Any, prefer: str, total: int | None = None) -> httpx.Response:
+        if request.headers.get("accept") == _OBJECT:
+            rows = data if isinstance(data, list) else [data]
+            if len(rows) != 1:
+                raise FakePostgrestError(
+                    406,
+                    "PGRST116",
+                    "JSON object requested, multiple (or no) rows returned",
+                    f"The result contains {len(rows)} rows",
+                )
+            return httpx.Response(200, json=rows[0])
+        headers = {}
+        if isinstance(data, list):
+            count = (total if total is not None else len(data)) if "count=" in prefer else "*"
+            headers["content-range"] = f"0-{len(data) - 1}/{count}" if data else f"*/{count}"
+        if request.method == "HEAD":
+            return httpx.Response(200, headers=headers)
+        is_rpc = request.url.path.split(_REST_PREFIX, 1)[-1].startswith("rpc/")
+        status = 201 if request.method == "POST" and not is_rpc else 200
+        return httpx.Response(status, content=json.dumps(data, default=str), headers=headers)
+
+    # ── reads ──
+
+    def _matching(self, table: str, params: httpx.QueryParams) -> list[Row]:
+        predicates = []
+        for key, value in params.multi_items():
+            if key in ("or", "and"):
+                predicates.append(_group(key, value[1:-1]))
+            elif key not in _RESERVED and "." not in key:
+                predicates.append(_filter(key, value))
+        return [row for row in self.tables[table] if all(p(row) for p in predicates)]
+
+    def _select(self, table: str, params: httpx.QueryParams) -> list[Row]:
+        rows = self._matching(table, params)
+        select = params.get("select", "*")
+        projected = [self._project(table, row, select) for row in rows]
+        # !inner embeds drop rows whose embed is empty.
+        pairs = [(row, proj) for row, proj in zip(rows, projected, strict=True) if not proj.pop("__drop__", False)]
+        if "order" in params:
+            ordered_rows = _apply_order([row for row, _ in pairs], params["order"])
+            index = {id(row): proj for row, proj in pairs}
+            pairs = [(row, index[id(row)]) for row in ordered_rows]
+        total = len(pairs)
+        offset = int(params.get("offset", 0))
+        limit = params.get("limit")
+        pairs = pairs[offset : offset + int(limit)] if limit is not None else pairs[offset:]
+        result = _RowList(proj for _, proj in pairs)
+        result.total = total
+        return result
+
+    def _project(self, table: str, row: Row, select: str) -> Row:
+        out: Row = {}
+        for item in _split_top(select):
+            embed = _EMBED.match(item)
+            if embed:
+                key, value, drop = self._embed(table, row, embed)
+                out[key] = value
+                if drop:
+                    out["__drop__"] = True
+                continue
+            if item == "*":
+                out.update(copy.deepcopy(row))
+                continue
+            alias, _, column = item.rpartition(":") if ":" in item.split("::")[0] else ("", "", item)
+            column = column.strip()
+            name = alias or _JSON_PATH.split(column.split("::", 1)[0])[-1].strip().strip("'")
+            out[name] = copy.deepcopy(_resolve(row, column))
+        return out
+
+    def _relation(self, table: str, name: str, hint: str | None, sample: Row) -> tuple[str, str, bool]:
+        """``(fk_column, target_table, one_to_many)`` for an embed of ``name`` in ``table``."""
+        if hint and hint.endswith("_fkey"):
+            hint = hint.removesuffix("_fkey").removeprefix(f"{table}_")
+        if hint and hint != "inner" and (hint in sample or hint.endswith("_id")):
+            return hint, name, False
+        if (table, name) in self._relations:
+            return self._relations[(table, name)]
+        fk = f"{_singular(name)}_id"
+        if fk in sample or not self.tables.get(name):
+            if fk in sample or f"{_singular(table)}_id" not in self._columns(name):
+                return fk, name, False
+        return f"{_singular(table)}_id", name, True
+
+    def _columns(self, table: str) -> set[str]:
+        rows = self.tables.get(table) or []
+        return set(rows[0]) if rows else set()
+
+    def _embed(self, table: str, row: Row, match: re.Match) -> tuple[str, Any, bool]:
+        alias, name, hint, inner = match["alias"], match["name"], match["hint"], match["inner"]
+        if alias and name.endswith("_id") and name not in self.tables:
+            # ``simulations:target_simulation_id(...)`` — alias names the table, name the FK column.
+            hint, name, alias = name, alias, alias
+        fk, target, one_to_many = self._relation(table, name, hint, row)
+        key = alias or name
+        if one_to_many:
+            children = [r for r in self.tables[target] if r.get(fk) == row.get("id")]
+            if inner.strip() == "count":
+                return key, [{"count": len(children)}], False
+            return key, [self._project(target, c, inner or "*") for c in children], hint == "inner" and not children
+        parent_id = row.get(fk)
+        parent = next((r for r in self.tables[target] if r.get("id") == parent_id), None) if parent_id else None
+        value = self._project(target, parent, inner or "*") if parent is not None else None
+        if value is not None:
+            value.pop("__drop__", None)
+        return key, value, hint == "inner" and value is None
+
+    # ── writes ──
+
+    def _prepare(self, table: str, record: Row) -> Row:
+        row = {k: (_now() if v == "now()" else v) for k, v in record.items()}
+        row.setdefault("id", str(uuid.uuid4()))
+        row.setdefault("created_at", _now())
+        return row
+
+    def _insert(self, table: str, body: Any, params: httpx.QueryParams, prefer: str) -> list[Row]:
+        records = body if isinstance(body, list) else [body]
+        upsert = "resolution=" in prefer
+        ignore = "resolution=ignore-duplicates" in prefer
+        keys = [k.strip() for k in params.get("on_conflict", "id").split(",")]
+        affected: list[Row] = []
+        for record in records:
+            existing = None
+            if all(k in record for k in keys):
+                existing = next(
+                    (r for r in self.tables[table] if all(r.get(k) == record[k] for k in keys)),
+                    None,
+                )
+            if existing is not None and not upsert:
+                raise FakePostgrestError(409, "23505", f'duplicate key value violates unique constraint on "{table}"')
+            if existing is not None:
+                if not ignore:
+                    existing.update({k: (_now() if v == "now()" else v) for k, v in record.items()})
+                    affected.append(existing)
+                continue
+            row = self._prepare(table, record)
+            self.tables[table].append(row)
+            affected.append(row)
+        return affected
+
+    def _update(self, table: str, changes: Row, params: httpx.QueryParams) -> list[Row]:
+        rows = self._matching(table, params)
+        for row in rows:
+            row.update({k: (_now() if v == "now()" else copy.deepcopy(v)) for k, v in changes.items()})
+        return rows
+
+    def _delete(self, table: str, params: httpx.QueryParams) -> list[Row]:
+        doomed = self._matching(table, params)
+        ids = {id(row) for row in doomed}
+        self.tables[table] = [row for row in self.tables[table] if id(row) not in ids]
+        return doomed
+
+    # ── rpc ──
+
+    def _call_rpc(self, name: str, params: dict[str, Any]) -> Any:
+        impl = self._rpcs.get(name)
+        if impl is None and self._unknown_rpc is not None:
+            return self._unknown_rpc(name, params)
+        if impl is None:
+            raise FakePostgrestError(404, "PGRST202", f"Could not find the function public.{name}")
+        return impl(self, params)
+
+
+class _RowList(list):
+    total: int | None = None
+
+
+class _FakeTransport(httpx.AsyncBaseTransport):
+    def __init__(self, fake: FakeSupabase):
+        self._fake = fake
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        return await self._fake.handle(request)
+
+
+# ── Built-in RPC ports ───────────────────────────────────────────────────
+# Python ports of the SQL functions the heartbeat, scoring and chat
+# pipelines call most. Keep them in step with their migrations.
+
+
+def _age_events_batch(fake: FakeSupabase, p: dict[str, Any]) -> list[Row]:
+    """Port of ``fn_age_events_batch`` (migration 133)."""
+    thresholds = {
+        "active": (p.get("p_active_to_escalating", 4), "escalating", 1.3),
+        "escalating": (p.get("p_escalating_to_resolving", 6), "resolving", 0.9),
+        "resolving": (p.get("p_resolving_to_resolved", 3), "resolved", 1.0),
+        "resolved": (p.get("p_resolved_to_archived", 8), "archived", 1.0),
+    }
+    result = []
+    for event in fake.tables["events"]:
+        if (
+            event.get("simulation_id") != p["p_sim_id"]
+            or event.get("deleted_at") is not None
+            or event.get("event_status") == "archived"
+        ):
+            continue
+        old_status = event.get("event_status")
+        ticks = (event.get("ticks_in_status") or 0) + 1
+        threshold, next_status, multiplier = thresholds.get(old_status, (999, old_status, 1.0))
+        new_status = old_status
+        if ticks >= threshold:
+            new_status, ticks = next_status, 0
+        event["ticks_in_status"] = ticks
+        if new_status != old_status:
+            event["event_status"] = new_status
+            event["heartbeat_pressure"] = round((event.get("heartbeat_pressure") or 0) * multiplier, 4)
+        if new_status != old_status or (old_status in ("active", "escalating") and threshold - ticks <= 2):
+            result.append(
+                {
+                    "event_id": event["id"],
+                    "title": event.get("title"),
+                    "title_de": event.get("title_de"),
+                    "old_status": old_status,
+                    "new_status": new_status,
+                    "ticks_in_status": ticks,
+                    "transitioned": new_status != old_status,
+                    "remaining": max(0, threshold - ticks),
+                }
+            )
+    return result
+
+
+_DEFAULT_WEIGHTS = {"stability": 25, "influence": 20, "sovereignty": 20, "diplomatic": 15, "military": 20}
+_INBOUND_PENALTY = {"spy": 2, "propagandist": 6, "infiltrator": 8, "saboteur": 8, "assassin": 12}
+_OUTBOUND_POINTS = {"spy": 3, "saboteur": 5, "propagandist": 4, "assassin": 8, "infiltrator": 6}
+
+
+def _compute_cycle_scores(fake: FakeSupabase, p: dict[str, Any]) -> list[Row]:
+    """Port of ``fn_compute_cycle_scores`` (migration 197); materialized views are plain tables here."""
+    epoch_id, cycle = p["p_epoch_id"], p["p_cycle_number"]
+    weights = {**_DEFAULT_WEIGHTS, **(p.get("p_score_weights") or {})}
+    participants = [r for r in fake.tables["epoch_participants"] if r.get("epoch_id") == epoch_id]
+    missions = [m for m in fake.tables["operative_missions"] if m.get("epoch_id") == epoch_id]
+
+    def _guardians(sim_id: Any) -> int:
+        return sum(
+            1
+            for m in missions
+            if m.get("source_simulation_id") == sim_id
+            and m.get("operative_type") == "guardian"
+            and m.get("status") == "active"
+        )
+
+    raw: dict[Any, dict[str, float]] = {}
+    for participant in participants:
+        sim_id = participant["simulation_id"]
+        zones = [z["stability"] for z in fake.tables["mv_zone_stability"] if z.get("simulation_id") == sim_id]
+        base_stability = sum(zones) / len(zones) * 100 if zones else 50.0
+        propaganda = sum(
+            1
+            for e in fake.tables["events"]
+            if e.get("simulation_id") == sim_id and e.get("data_source") == "propagandist"
+        )
+        inbound = [m for m in missions if m.get("target_simulation_id") == sim_id]
+        inbound_success = [m for m in inbound if m.get("status") == "success"]
+        outbound = [m for m in missions if m.get("source_simulation_id") == sim_id]
+        wins = defaultdict(int)
+        military = 0.0
+        for mission in outbound:
+            status, kind = mission.get("status"), mission.get("operative_type")
+            if status == "success":
+                wins[kind] += 1
+                military += _OUTBOUND_POINTS.get(kind, 2) + min(4, _guardians(mission.get("target_simulation_id")) * 2)
+            elif status in ("detected", "captured"):
+                military -= 3
+        echo_sum = sum(
+            e.get("echo_strength") or 0
+            for e in fake.tables["event_echoes"]
+            if e.get("source_simulation_id") == sim_id and e.get("status") == "completed"
+        )
+        effectiveness = sum(
+            e.get("effectiveness") or 0
+            for e in fake.tables["mv_embassy_effectiveness"]
+            if sim_id in (e.get("simulation_a_id"), e.get("simulation_b_id"))
+        )
+        embassies = sum(
+            1
+            for e in fake.tables["embassies"]
+            if e.get("status") == "active" and sim_id in (e.get("simulation_a_id"), e.get("simulation_b_id"))
+        )
+        team_id = participant.get("team_id")
+        allies = sum(1 for r in participants if team_id and r.get("team_id") == team_id) - 1 if team_id else 0
+        diplomatic = (effectiveness if effectiveness else embassies * 0.5) * 10 + wins["spy"]
+        diplomatic *= (1.0 + 0.15 * allies) * (1.0 - (participant.get("betrayal_penalty") or 0))
+        raw[sim_id] = {
+            "stability": max(
+                0.0,
+                base_stability
+                - propaganda * 3
+                - sum(1 for m in inbound_success if m.get("operative_type") == "saboteur") * 6
+                - sum(1 for m in inbound_success if m.get("operative_type") == "assassin") * 5,
+            ),
+            "influence": wins["propagandist"] * 5 + wins["spy"] * 2 + wins["infiltrator"] * 3 + echo_sum,
+            "sovereignty": max(
+                0.0,
+                min(
+                    100.0,
+                    100.0
+                    - sum(_INBOUND_PENALTY.get(m.get("operative_type"), 5) for m in inbound_success)
+                    + sum(1 for m in inbound if m.get("status") in ("detected", "captured")) * 3
+                    + _guardians(sim_id) * 4,
+                ),
+            ),
+            "diplomatic": diplomatic,
+            "military": max(0.0, military),
+        }
+
+    maxes = {dim: max([s[dim] for s in raw.values()] + [1]) for dim in _DEFAULT_WEIGHTS}
+    rows = []
+    for sim_id, scores in raw.items():
+        composite = sum(scores[dim] / maxes[dim] * 100 * float(weights[dim]) / 100 for dim in _DEFAULT_WEIGHTS)
+        rows.append(
+            {
+                "epoch_id": epoch_id,
+                "simulation_id": sim_id,
+                "cycle_number": cycle,
+                **{f"{dim}_score": scores[dim] for dim in _DEFAULT_WEIGHTS},
+                "composite_score": round(composite, 2),
+                "computed_at": _now(),
+            }
+        )
+    params = httpx.QueryParams({"on_conflict": "epoch_id,simulation_id,cycle_number"})
+    return [copy.deepcopy(r) for r in fake._insert("epoch_scores", rows, params, "resolution=merge-duplicates")]
+
+
+def _cosine_distance(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b, strict=False))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return 1 - dot / norm if norm else 1.0
+
+
+def _retrieve_agent_memories(fake: FakeSupabase, p: dict[str, Any]) -> list[Row]:
+    """Port of ``retrieve_agent_memories`` (migration 067)."""
+    query = p.get("p_query_embedding")
+    query = json.loads(query) if isinstance(query, str) else query
+    now = datetime.now(UTC)
+    scored = []
+    for memory in fake.tables["agent_memories"]:
+        if memory.get("agent_id") != p["p_agent_id"]:
+            continue
+        embedding = memory.get("embedding")
+        embedding = json.loads(embedding) if isinstance(embedding, str) else embedding
+        similarity = 0.4 * (1 - _cosine_distance(embedding, query)) if query and embedding else 0.0
+        created = _as_datetime(memory.get("created_at")) or now
+        age_days = (now - created).total_seconds() / 86400
+        score = similarity + 0.4 * (memory.get("importance") or 0) / 10 + 0.2 / (1 + age_days)
+        scored.append(
+            {
+                **{k: memory.get(k) for k in ("id", "memory_type", "content", "content_de", "importance")},
+                "source_type": memory.get("source_type"),
+                "created_at": memory.get("created_at"),
+                "retrieval_score": score,
+            }
+        )
+    scored.sort(key=lambda m: m["retrieval_score"], reverse=True)
+    return scored[: p.get("p_top_k", 10)]
+
+
+_BUILTIN_RPCS: dict[str, RpcImpl] = {
+    "fn_age_events_batch": _age_events_batch,
+    "fn_compute_cycle_scores": _compute_cycle_scores,
+    "retrieve_agent_memories": _retrieve_agent_memories,
+}
@@ -0,0 +1,323 @@
+"""Query-budget regression suite for hot endpoints and background jobs.
+
+Each scenario runs the real handler — through the ASGI app where there is
+one — against the in-memory PostgREST backend (``FakeSupabase``) and reports, per scenario:
+
+- p50 / p95 wall time over ``_RUNS`` iterations (after one warm-up);
+- peak traced allocation of one iteration (tracemalloc);
+- PostgREST round trips of one iteration (``backend.utils.call_stats``).
+
+Results are compared with ``baselines/hot_paths.json``. The gate is the
+round-trip count: one more iteration runs under the ``query_budget``
+fixture with the baseline as its budget, so a scenario fails when it makes
+more round trips than recorded or issues an N+1 query shape. Wall time is
+only reported — it depends on the host — unless ``PERF_ENFORCE_P95=1``
+also fails p95s above ``baseline × PERF_P95_TOLERANCE`` (default 3.0).
+Caches that would hide round trips after the first iteration are cleared,
+and the RNG reseeded, before each one.
+
+Fewer round trips than the baseline passes but is reported, so the
+baseline can be tightened. Regenerate after an intentional change with::
+
+    UPDATE_PERF_BASELINES=1 pytest backend/tests/performance/test_hot_path_budgets.py -s
+
+External HTTP (embeddings, LLMs, weather) is stubbed and any real socket
+connection fails the test; only the fake Supabase backend answers.
+
+Markers:
+    slow: Tests that may take several seconds; excluded from fast CI runs.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+from httpx import ASGITransport
+
+from backend.app import app
+from backend.dependencies import get_admin_supabase, get_anon_supabase
+from backend.middleware.rate_limit import limiter
+from backend.models.combat import AgentCombatState
+from backend.models.resonance_dungeon import DungeonInstance, RoomNode
+from backend.services.chat_ai_service import ChatAIService
+from backend.services.chat_context_cache import ChatContextCache
+from backend.services.connection_service import ConnectionService
+from backend.services.dungeon_engine_service import DungeonEngineService
+from backend.services.dungeon_instance_store import store as dungeon_store
+from backend.services.heartbeat_profiler import percentile
+from backend.services.heartbeat_service import HeartbeatService
+from backend.services.multiverse_graph import MultiverseGraph
+from backend.services.simulation_settings_cache import SimulationSettingsCache
+from backend.tests.fake_supabase import FakeSupabase
+from backend.utils import supabase_admin_cache
+from backend.utils.call_stats import track_calls
+
+BASELINES = Path(__file__).parent / "baselines" / "hot_paths.json"
+ENFORCE_P95 = os.environ.get("PERF_ENFORCE_P95") == "1"
+P95_TOLERANCE = float(os.environ.get("PERF_P95_TOLERANCE", "3.0"))
+# Sub-millisecond p95s jitter by more than any ratio; below this, time is not judged.
+P95_FLOOR_MS = 5.0
+UPDATE = os.environ.get("UPDATE_PERF_BASELINES") == "1"
+_RUNS = 15
+
+SIM_ID = "00000000-0000-4000-a000-000000000001"
+OTHER_SIM_ID = "00000000-0000-4000-a000-000000000002"
+EPOCH_ID = "00000000-0000-4000-a000-0000000000e1"
+AGENT_ID = "00000000-0000-4000-a000-0000000000a1"
+CONVERSATION_ID = "00000000-0000-4000-a000-0000000000c1"
+PLAYER_ID = UUID("00000000-0000-4000-a000-0000000000b1")
+RUN_ID = UUID("00000000-0000-4000-a000-0000000000d1")
+
+_SIMULATIONS = [
+    {
+        "id": sim_id,
+        "name": name,
+        "slug": name.lower(),
+        "status": "active",
+        "simulation_type": "template",
+        "content_locale": "en",
+        "theme": "dystopian",
+        "last_heartbeat_tick": 41,
+    }
+    for sim_id, name in ((SIM_ID, "Velgarien"), (OTHER_SIM_ID, "Gaslit"))
+]
+_AGENTS = [
+    {
+        "id": AGENT_ID if i == 0 else f"00000000-0000-4000-a000-0000000001{i:02d}",
+        "simulation_id": SIM_ID,
+        "name": f"Agent {i}",
+        "slug": f"agent-{i}",
+        "character": "A careful archivist.",
+        "background": "Grew up in the lower wards.",
+    }
+    for i in range(25)
+]
+
+TABLES: dict = {
+    "simulations": _SIMULATIONS,
+    "simulation_dashboard": [
+        {"simulation_id": s["id"], "agent_count": 25, "building_count": 8, "event_count": 40, "member_count": 2}
+        for s in _SIMULATIONS
+    ],
+    "agents": _AGENTS,
+    "game_epochs": [{"id": EPOCH_ID, "name": "Epoch 1", "status": "competition", "current_cycle": 4, "config": {}}],
+    "epoch_scores": [
+        {
+            "id": f"00000000-0000-4000-a000-0000000005{i:02d}",
+            "epoch_id": EPOCH_ID,
+            "simulation_id": sim["id"],
+            "cycle_number": 3,
+            "stability_score": 50.0,
+            "influence_score": 40.0,
+            "sovereignty_score": 30.0,
+            "diplomatic_score": 20.0,
+            "military_score": 10.0,
+            "composite_score": 150.0 - i,
+            "simulations": {"name": sim["name"], "slug": sim["slug"]},
+        }
+        for i, sim in enumerate(_SIMULATIONS)
+    ],
+    "chat_conversations": [{"id": CONVERSATION_ID, "simulation_id": SIM_ID, "agent_id": AGENT_ID}],
+    "chat_messages": [
+        {"id": str(i), "sender_role": "user" if i % 2 else "assistant", "content": f"Message {i}"} for i in range(20)
+    ],
+    "simulation_heartbeats": [{"id": "00000000-0000-4000-a000-0000000000f1", "status": "processing"}],
+}
+
+
+# ── Scenarios ────────────────────────────────────────────────────────────
+
+
+def _http(path: str) -> Callable[[httpx.AsyncClient], Awaitable[None]]:
+    async def _get(http: httpx.AsyncClient) -> None:
+        resp = await http.get(path)
+        assert resp.status_code == 200, resp.text
+
+    return _get
+
+
+async def _chat_context(_http_client: httpx.AsyncClient) -> None:
+    admin = await supabase_admin_cache.get_admin_supabase_client()
+    service = ChatAIService(admin, UUID(SIM_ID))
+    context = await service._prepare_single_context(UUID(CONVERSATION_ID), "What happened at the archive?")
+    assert context["agent"]["id"] == AGENT_ID
+
+
+def _dungeon_instance() -> DungeonInstance:
+    rooms = [
+        RoomNode(
+            index=i,
+            depth=i,
+            room_type="entrance" if i == 0 else "rest",
+            connections=[c for c in (i - 1, i + 1) if 0 <= c < 6],
+            cleared=i == 0,
+            revealed=i <= 1,
+        )
+        for i in range(6)
+    ]
+    party = [
+        AgentCombatState(
+            agent_id=UUID(agent["id"]),
+            agent_name=agent["name"],
+            aptitudes={"spy": 5, "guardian": 3},
+            personality={"openness": 0.7, "neuroticism": 0.3},
+            resilience=0.5,
+        )
+        for agent in _AGENTS[:3]
+    ]
+    return DungeonInstance(
+        run_id=RUN_ID,
+        simulation_id=UUID(SIM_ID),
+        archetype="The Shadow",
+        signature="shadow_conflict",
+        difficulty=3,
+        rooms=rooms,
+        party=party,
+        player_ids=[PLAYER_ID],
+        archetype_state={"visibility": 3, "max_visibility": 3, "rooms_since_vp_loss": 0},
+        phase="exploring",
+    )
+
+
+async def _dungeon_move(_http_client: httpx.AsyncClient) -> None:
+    dungeon_store.put(RUN_ID, _dungeon_instance())
+    admin = await supabase_admin_cache.get_admin_supabase_client()
+    result = await DungeonEngineService.move_to_room(admin, RUN_ID, 1, user_id=PLAYER_ID)
+    assert result.state is not None
+
+
+async def _heartbeat_tick(_http_client: httpx.AsyncClient) -> None:
+    admin = await supabase_admin_cache.get_admin_supabase_client()
+    await HeartbeatService._tick_simulation(admin, dict(_SIMULATIONS[0]), 3600)
+
+
+SCENARIOS: dict[str, Callable[[httpx.AsyncClient], Awaitable[None]]] = {
+    "public_simulation_list": _http("/api/v1/public/simulations"),
+    "map_data": _http("/api/v1/public/map-data"),
+    "world_map": _http(f"/api/v1/public/simulations/{SIM_ID}/map"),
+    "leaderboard": _http(f"/api/v1/public/epochs/{EPOCH_ID}/leaderboard"),
+    "agent_list": _http(f"/api/v1/public/simulations/{SIM_ID}/agents"),
+    "chat_context_build": _chat_context,
+    "dungeon_move": _dungeon_move,
+    "heartbeat_tick": _heartbeat_tick,
+}
+
+
+# Functions without a Python port answer ``null``, like a no-op stored procedure.
+_BACKEND = FakeSupabase(TABLES, unknown_rpc=lambda name, params: None)
+_BACKEND.rpc("fn_fulfill_agent_need")(lambda db, params: 60.0)
+
+
+def _reset() -> None:
+    """Seeded tables, cold caches and a fixed RNG seed, so every iteration makes the same round trips."""
+    random.seed(0)
+    _BACKEND.tables.clear()
+    _BACKEND.tables.update({name: copy.deepcopy(rows) for name, rows in TABLES.items()})
+    ConnectionService.invalidate_map_cache()
+    MultiverseGraph.reset()
+    SimulationSettingsCache.clear()
+    ChatContextCache.clear()
+    dungeon_store.clear()
+
+
+# ── Harness ──────────────────────────────────────────────────────────────
+
+
+async def _measure(scenario: Callable[[httpx.AsyncClient], Awaitable[None]], http: httpx.AsyncClient) -> dict:
+    _reset()
+    await scenario(http)  # warm-up: lazy imports and singletons
+
+    samples: list[float] = []
+    db_calls = 0
+    for _ in range(_RUNS):
+        _reset()
+        with track_calls() as stats:
+            started = time.perf_counter()
+            await scenario(http)
+            samples.append((time.perf_counter() - started) * 1000)
+        db_calls = max(db_calls, stats.db_calls)
+
+    _reset()
+    tracemalloc.start()
+    try:
+        await scenario(http)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "db_calls": db_calls,
+        "p50_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "peak_kib": round(peak / 1024),
+    }
+
+
+@pytest.fixture()
+async def http(monkeypatch):
+    client = await _BACKEND.client()
+    monkeypatch.setattr(supabase_admin_cache, "_client", client)
+    monkeypatch.setattr(limiter, "enabled", False)
+    app.dependency_overrides[get_anon_supabase] = lambda: client
+    app.dependency_overrides[get_admin_supabase] = lambda: client
+
+    async def _no_network(self, request):
+        raise AssertionError(f"Benchmark attempted a real HTTP request: {request.method} {request.url}")
+
+    with (
+        patch.object(httpx.AsyncHTTPTransport, "handle_async_request", _no_network),
+        patch("backend.services.agent_memory_service.EmbeddingService.embed", AsyncMock(return_value=[0.0] * 8)),
+    ):
+        async with httpx.AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as http_client:
+            yield http_client
+    app.dependency_overrides.clear()
+    _reset()
+
+
+@pytest.fixture(scope="module")
+def baselines():
+    recorded = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    results: dict[str, dict] = {}
+    yield recorded, results
+    if UPDATE and results:
+        BASELINES.parent.mkdir(exist_ok=True)
+        BASELINES.write_text(json.dumps({**recorded, **results}, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("name", list(SCENARIOS))
+async def test_hot_path_budget(name, http, baselines, query_budget):
+    recorded, results = baselines
+    result = await _measure(SCENARIOS[name], http)
+    results[name] = result
+    print(  # noqa: T201
+        f"  {name:<24} {result['db_calls']:3d} calls  p50 {result['p50_ms']:7.2f} ms"
+        f"  p95 {result['p95_ms']:7.2f} ms  peak {result['peak_kib']:6d} KiB"
+    )
+    if UPDATE:
+        return
+
+    baseline = recorded.get(name)
+    assert baseline is not None, f"No baseline for {name}; run with UPDATE_PERF_BASELINES=1"
+    _reset()
+    with query_budget(baseline["db_calls"]):
+        await SCENARIOS[name](http)
+    if result["db_calls"] < baseline["db_calls"]:
+        print(f"  {name}: {baseline['db_calls'] - result['db_calls']} round trips below baseline")  # noqa: T201
+    ceiling = max(baseline["p95_ms"] * P95_TOLERANCE, P95_FLOOR_MS)
+    if result["p95_ms"] > ceiling:
+        message = f"{name} p95 {result['p95_ms']:.1f} ms exceeds {ceiling:.1f} ms"
+        assert not ENFORCE_P95, message
+        print(f"  {name}: {message} (report only; PERF_ENFORCE_P95=1 to fail)")  # noqa: T201
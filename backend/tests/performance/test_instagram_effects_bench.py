@@ -0,0 +1,166 @@
+"""Micro-benchmarks for the instagram_image_helpers effects.
+
+Each helper runs at the real canvas sizes (1080×1920 story, 1080×1120 feed
+content zone). The assertions are structural — warm calls hit the layer
+cache instead of rebuilding, the cache stays within its byte bound at real
+layer sizes, and effects stay in uint8 — so a return to per-image layer
+rebuilds or full-image dtype conversions fails on any host. Timings are
+only reported: absolute milliseconds depend on the runner.
+
+Run with ``-s`` to see the per-helper timings.
+
+Markers:
+    slow: Tests that may take several seconds; excluded from fast CI runs.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from backend.services import instagram_image_helpers as h
+
+STORY = (h.IG_WIDTH, h.IG_HEIGHT_STORY)
+FEED = (h.IG_WIDTH, h.FEED_CONTENT_HEIGHT)
+ACCENT = (74, 144, 217)
+
+
+def _median_ms(fn, *, runs: int = 5) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _report(name: str, ms: float) -> None:
+    print(f"  {name:<36} {ms:8.2f} ms")  # noqa: T201
+
+
+def _timed_without_rebuilds(name: str, fn, *, runs: int = 5) -> None:
+    """Report ``fn``'s median time and assert warm calls build no layers."""
+    fn()  # warm
+    misses = h.layer_cache.stats()["misses"]
+    _report(name, _median_ms(fn, runs=runs))
+    assert h.layer_cache.stats()["misses"] == misses, f"{name} rebuilt a cached layer"
+
+
+@pytest.fixture(autouse=True)
+def _cold_cache():
+    h.clear_layer_caches()
+    yield
+    h.clear_layer_caches()
+
+
+@pytest.fixture()
+def story_canvas() -> Image.Image:
+    return Image.new("RGBA", STORY, (10, 12, 18, 255))
+
+
+@pytest.mark.slow
+class TestLayerCacheBenchmarks:
+    @pytest.mark.parametrize(
+        ("name", "cached", "mode"),
+        [
+            ("vignette", lambda: h.vignette_layer(*STORY, 0.5), "RGBA"),
+            ("gradient", lambda: h.gradient_layer(*STORY, (*ACCENT, 50), (0, 0, 0, 255)), "RGBA"),
+            ("scan_lines", lambda: h.scan_line_layer(*STORY, ACCENT, 4, 18), "RGBA"),
+            ("grain", lambda: h.grain_layer(*STORY, 12, 0.05), "L"),
+        ],
+    )
+    def test_layer_is_built_once_and_shared(self, name, cached, mode):
+        started = time.perf_counter()
+        layer = cached()
+        build_ms = (time.perf_counter() - started) * 1000
+        hit_ms = _median_ms(cached, runs=20)
+
+        _report(f"{name} build", build_ms)
+        _report(f"{name} hit", hit_ms)
+        assert cached() is layer
+        assert (layer.mode, layer.size) == (mode, STORY)
+        assert np.asarray(layer).dtype == np.uint8
+        stats = h.layer_cache.stats()
+        assert (stats["misses"], stats["entries"]) == (1, 1)
+        assert stats["hits"] == 21
+
+    def test_story_layers_stay_within_the_byte_bound(self):
+        story_bytes = STORY[0] * STORY[1] * 4
+        extra = 4
+        count = h.LAYER_CACHE_MAX_BYTES // story_bytes + extra
+        for intensity in range(count):
+            h.vignette_layer(*STORY, intensity / 100)
+
+        stats = h.layer_cache.stats()
+        assert stats["bytes"] <= h.LAYER_CACHE_MAX_BYTES
+        assert stats["evictions"] >= extra
+        assert stats["entries"] == h.LAYER_CACHE_MAX_BYTES // story_bytes
+        # The oldest layer was evicted, the newest is still a hit.
+        h.vignette_layer(*STORY, (count - 1) / 100)
+        assert h.layer_cache.stats()["misses"] == count
+        h.vignette_layer(*STORY, 0.0)
+        assert h.layer_cache.stats()["misses"] == count + 1
+
+
+@pytest.mark.slow
+class TestEffectBenchmarks:
+    def test_add_noise_grain_story(self, story_canvas):
+        out = h.add_noise_grain(story_canvas, sigma=12, opacity=0.05)
+
+        assert (out.mode, out.size) == ("RGBA", STORY)
+        _timed_without_rebuilds("add_noise_grain (story, warm)", lambda: h.add_noise_grain(story_canvas))
+
+    def test_draw_scan_lines_story(self, story_canvas):
+        _timed_without_rebuilds(
+            "draw_scan_lines_rgba (story, warm)",
+            lambda: h.draw_scan_lines_rgba(story_canvas, ACCENT, alpha=18),
+        )
+        assert story_canvas.mode == "RGBA"
+
+    def test_vignette_composite_story(self, story_canvas):
+        _timed_without_rebuilds(
+            "vignette composite (story, warm)",
+            lambda: story_canvas.alpha_composite(h.vignette_layer(*STORY, 0.5)),
+        )
+
+    def test_create_gradient_story(self):
+        gradient = h.create_gradient(*STORY, (*ACCENT, 50), (0, 0, 0, 255))
+
+        assert np.asarray(gradient).dtype == np.uint8
+        _report(
+            "create_gradient (story)",
+            _median_ms(lambda: h.create_gradient(*STORY, (*ACCENT, 50), (0, 0, 0, 255))),
+        )
+
+    def test_create_vignette_story(self):
+        assert np.asarray(h.create_vignette(*STORY, intensity=0.5)).dtype == np.uint8
+        _report("create_vignette (story)", _median_ms(lambda: h.create_vignette(*STORY, intensity=0.5)))
+
+    def test_bleach_bypass_feed(self):
+        img = Image.new("RGBA", FEED, (90, 70, 60, 255))
+
+        def bleach():
+            return h.bleach_bypass(img, desaturation=0.65, contrast_boost=1.25, highlight_rolloff=0.90)
+
+        out = bleach()
+        assert (out.mode, out.size) == ("RGBA", FEED)
+        assert np.asarray(out).dtype == np.uint8
+        _report("bleach_bypass (feed)", _median_ms(bleach))
+
+    def test_chromatic_aberration_feed(self):
+        img = Image.new("RGBA", FEED, (90, 70, 60, 255))
+
+        out = h.chromatic_aberration(img)
+        assert (out.mode, out.size) == ("RGBA", FEED)
+        assert np.asarray(out).dtype == np.uint8
+        _report("chromatic_aberration (feed)", _median_ms(lambda: h.chromatic_aberration(img)))
+
+    def test_draw_atmospheric_filler_story(self, story_canvas):
+        _timed_without_rebuilds(
+            "draw_atmospheric_filler (story)",
+            lambda: h.draw_atmospheric_filler(story_canvas, 600, 1500, ACCENT, "The Tower"),
+        )
@@ -290,6 +290,12 @@ class TestFarewellAgentBonds:
         count = await BondService.farewell_agent_bonds(sb, MOCK_AGENT)
         assert count == 0
 
+    async def test_many_skips_the_db_without_agents(self):
+        sb = _mock_supabase(table_data=[])
+
+        assert await BondService.farewell_agent_bonds_many(sb, []) == 0
+        sb.table.assert_not_called()
+
 
 # ── Whisper Template Service ───────────────────────────────────────────────
 
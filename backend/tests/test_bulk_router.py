@@ -0,0 +1,100 @@
+"""Tests for the bulk entity endpoints (POST/PATCH /bulk, POST /bulk/delete)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app import app
+from backend.dependencies import get_current_user, get_effective_supabase, get_supabase
+from backend.models.common import BulkItemResult, BulkResult, CurrentUser
+from backend.tests.conftest import MOCK_USER_EMAIL, MOCK_USER_ID
+
+SIM_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+AGENT_A = "bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb"
+AGENT_B = "cccccccc-cccc-cccc-cccc-cccccccccccc"
+
+BASE_URL = f"/api/v1/simulations/{SIM_ID}"
+
+
+def _mock_supabase_with_role(role: str = "editor") -> MagicMock:
+    mock = MagicMock()
+    builder = MagicMock()
+    builder.select.return_value = builder
+    builder.eq.return_value = builder
+    builder.limit.return_value = builder
+    builder.execute = AsyncMock(return_value=MagicMock(data=[{"member_role": role}]))
+    mock.table.return_value = builder
+    return mock
+
+
+def _client(role: str):
+    user = CurrentUser(id=MOCK_USER_ID, email=MOCK_USER_EMAIL, access_token="mock-token")
+    mock_sb = _mock_supabase_with_role(role)
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_effective_supabase] = lambda: mock_sb
+    app.dependency_overrides[get_supabase] = lambda: mock_sb
+    return TestClient(app)
+
+
+@pytest.fixture()
+def client():
+    yield _client("editor")
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def viewer_client():
+    yield _client("viewer")
+    app.dependency_overrides.clear()
+
+
+class TestBulkCreate:
+    @patch("backend.routers.agents.SimulationService.get_simulation_context", new_callable=AsyncMock)
+    @patch("backend.routers.agents.AuditService.safe_log_many", new_callable=AsyncMock)
+    @patch("backend.routers.agents.AgentService.create_many", new_callable=AsyncMock)
+    def test_reports_rows_and_audits_once(self, mock_create, mock_audit, mock_sim, client):
+        mock_sim.return_value = None
+        mock_create.return_value = BulkResult.from_items(
+            [
+                BulkItemResult(index=0, ok=True, id=AGENT_A, data={"id": AGENT_A, "name": "Ada"}),
+                BulkItemResult(index=1, ok=False, error="name: Field required"),
+            ]
+        )
+
+        resp = client.post(f"{BASE_URL}/agents/bulk", json={"items": [{"name": "Ada"}, {}]})
+
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        assert (data["succeeded"], data["failed"]) == (1, 1)
+        assert data["results"][1]["error"] == "name: Field required"
+        mock_audit.assert_awaited_once()
+        assert mock_audit.call_args[0][4] == [AGENT_A]
+
+    def test_rejects_oversized_batch(self, client):
+        resp = client.post(f"{BASE_URL}/events/bulk", json={"items": [{"title": "x"}] * 501})
+        assert resp.status_code == 422
+
+    def test_viewer_is_forbidden(self, viewer_client):
+        resp = viewer_client.post(f"{BASE_URL}/buildings/bulk", json={"items": [{"name": "x"}]})
+        assert resp.status_code == 403
+
+
+class TestBulkDelete:
+    @patch("backend.routers.agents.AuditService.safe_log_many", new_callable=AsyncMock)
+    @patch("backend.routers.agents.BondService.farewell_agent_bonds_many", new_callable=AsyncMock)
+    @patch("backend.routers.agents.AgentService.soft_delete_many", new_callable=AsyncMock)
+    def test_farewells_bonds_of_deleted_agents_only(self, mock_delete, mock_farewell, mock_audit, client):
+        mock_delete.return_value = BulkResult.from_items(
+            [
+                BulkItemResult(index=0, ok=True, id=AGENT_A),
+                BulkItemResult(index=1, ok=False, id=AGENT_B, error="agents not found or already deleted."),
+            ]
+        )
+
+        resp = client.post(f"{BASE_URL}/agents/bulk/delete", json={"ids": [AGENT_A, AGENT_B]})
+
+        assert resp.status_code == 200
+        mock_farewell.assert_awaited_once()
+        assert mock_farewell.call_args[0][1] == [UUID(AGENT_A)]
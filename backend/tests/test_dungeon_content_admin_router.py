@@ -229,7 +229,7 @@ class TestGetContentItem:
 @pytest.mark.integration
 class TestUpdateContentItem:
     @patch(
-        "backend.routers.dungeon_content_admin.load_all_content",
+        "backend.routers.dungeon_content_admin.refresh_content",
         new_callable=AsyncMock,
     )
     @patch(
@@ -246,7 +246,7 @@ class TestUpdateContentItem:
         assert r.status_code == 200
         assert r.json()["data"]["name_en"] == "Updated"
         mock_update.assert_called_once()
-        mock_reload.assert_called_once()  # Cache reloaded
+        mock_reload.assert_called_once()  # Changed scope refreshed
 
 
 # ===========================================================================
@@ -257,7 +257,7 @@ class TestUpdateContentItem:
 @pytest.mark.integration
 class TestCreateContentItem:
     @patch(
-        "backend.routers.dungeon_content_admin.load_all_content",
+        "backend.routers.dungeon_content_admin.refresh_content",
         new_callable=AsyncMock,
     )
     @patch(
@@ -285,7 +285,7 @@ class TestCreateContentItem:
 @pytest.mark.integration
 class TestDeleteContentItem:
     @patch(
-        "backend.routers.dungeon_content_admin.load_all_content",
+        "backend.routers.dungeon_content_admin.refresh_content",
         new_callable=AsyncMock,
     )
     @patch(
@@ -319,6 +319,7 @@ class TestReloadCache:
         body = r.json()
         assert body["data"]["message"] == "Cache reloaded."
         mock_reload.assert_called_once()
+        assert mock_reload.call_args.kwargs == {"use_snapshot": False}
 
 
 # ===========================================================================
@@ -0,0 +1,127 @@
+"""DB round-trip instrumentation — query shapes, N+1 detection, per-route rollup, endpoint budgets.
+
+Endpoints run against a real supabase-py client backed by ``FakeSupabase``,
+so every round trip passes through the same hooks as in production.
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from httpx import ASGITransport
+
+from backend.app import app
+from backend.dependencies import get_admin_supabase, get_anon_supabase, get_current_user
+from backend.models.common import CurrentUser
+from backend.services.query_stats_service import QueryStatsService
+from backend.tests.conftest import MOCK_ADMIN_EMAIL, MOCK_USER_ID
+from backend.tests.fake_supabase import FakeSupabase
+from backend.utils.call_stats import note_db_call, track_calls
+
+SIM_IDS = [f"00000000-0000-0000-0000-00000000000{i}" for i in range(1, 7)]
+
+
+async def _fake_client():
+    fake = FakeSupabase(
+        {
+            "simulations": [
+                {
+                    "id": sid,
+                    "name": f"Sim {sid[-1]}",
+                    "slug": f"sim-{sid[-1]}",
+                    "status": "active",
+                    "simulation_type": "template",
+                }
+                for sid in SIM_IDS
+            ],
+            "simulation_dashboard": [{"simulation_id": sid, "agent_count": 3} for sid in SIM_IDS],
+        }
+    )
+    return await fake.client()
+
+
+@pytest.fixture()
+async def api():
+    client = await _fake_client()
+    app.dependency_overrides[get_anon_supabase] = lambda: client
+    async with httpx.AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as http:
+        yield http, client
+    app.dependency_overrides.clear()
+
+
+class TestCallShapes:
+    async def test_repeated_lookup_by_id_is_flagged(self):
+        client = await _fake_client()
+
+        with track_calls() as stats:
+            for sid in SIM_IDS:
+                await client.table("agents").select("*").eq("simulation_id", sid).execute()
+            await client.table("agents").select("*").in_("simulation_id", SIM_IDS).execute()
+
+        assert stats.db_calls == 7
+        assert stats.tables == {"agents": 7}
+        assert stats.db_bytes == 7 * len(b"[]")
+        assert stats.n_plus_one() == ["GET agents (simulation_id)"]
+
+    async def test_rpc_and_writes_are_separate_shapes(self):
+        client = await _fake_client()
+
+        with track_calls() as stats:
+            await client.rpc("fn_age_events_batch", {"p_ids": SIM_IDS}).execute()
+            await client.table("events").update({"impact_level": 1}).eq("id", SIM_IDS[0]).execute()
+
+        assert dict(stats.tables) == {"rpc/fn_age_events_batch": 1, "events": 1}
+        assert stats.n_plus_one() == []
+
+
+class TestEndpointBudgets:
+    async def test_public_simulation_list(self, api, query_budget):
+        http, _ = api
+        with query_budget(2) as stats:
+            resp = await http.get("/api/v1/public/simulations")
+
+        assert resp.status_code == 200
+        assert [s["agent_count"] for s in resp.json()["data"]] == [3] * len(SIM_IDS)
+        assert dict(stats.tables) == {"simulations": 1, "simulation_dashboard": 1}
+
+    async def test_middleware_records_route_template(self, api):
+        http, _ = api
+        for _ in range(3):
+            await http.get(f"/api/v1/public/simulations/{SIM_IDS[0]}/agents")
+
+        (row,) = QueryStatsService.snapshot()
+        assert row["key"] == "GET /api/v1/public/simulations/{simulation_id}/agents"
+        assert row["samples"] == 3
+        assert row["top_tables"]
+
+
+class TestRollup:
+    def test_n_plus_one_warning_is_rate_limited_per_key(self, caplog):
+        with track_calls() as stats:
+            for sid in SIM_IDS:
+                note_db_call(table="agents", shape="GET agents (id)", params=f"id=eq.{sid}")
+
+        for key in ("GET /a", "GET /a", "GET /a", "GET /b"):
+            QueryStatsService.record(key, stats)
+
+        warnings = [r for r in caplog.records if r.getMessage() == "N+1 query pattern"]
+        assert [(r.key, r.suppressed) for r in warnings] == [("GET /a", 0), ("GET /b", 0)]
+        assert QueryStatsService.snapshot()[0]["n_plus_one"] == {"GET agents (id)": 3}
+
+
+class TestAdminEndpoint:
+    async def test_lists_job_rollup_with_n_plus_one(self, api):
+        http, client = api
+        admin = CurrentUser(id=MOCK_USER_ID, email=MOCK_ADMIN_EMAIL, access_token="mock-token")
+        app.dependency_overrides[get_current_user] = lambda: admin
+        app.dependency_overrides[get_admin_supabase] = lambda: client
+
+        with QueryStatsService.track("job:heartbeat_tick"):
+            for sid in SIM_IDS:
+                await client.table("agents").select("*").eq("id", sid).execute()
+        resp = await http.get("/api/v1/admin/ops/query-stats")
+
+        assert resp.status_code == 200
+        (row,) = resp.json()["data"]
+        assert (row["key"], row["max_db_calls"]) == ("job:heartbeat_tick", 6)
+        assert row["n_plus_one"] == {"GET agents (id)": 1}
@@ -1,4 +1,4 @@
-"""Tests for BaseService — supports_created_by flag and create() behavior."""
+"""Tests for BaseService — supports_created_by flag, create() and bulk operations."""
 
 from __future__ import annotations
 
@@ -8,6 +8,8 @@ from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
+from postgrest.exceptions import APIError as PostgrestAPIError
+from pydantic import BaseModel
 
 from backend.services.base_service import BaseService
 
@@ -220,3 +222,129 @@ class TestBaseServiceLogging:
         warning_records = [r for r in caplog.records if r.levelno == logging.WARNING]
         assert len(warning_records) >= 1
         assert warning_records[0].entity_id == str(entity_id)
+
+
+class _ChunkedService(_ServiceWithoutCreatedBy):
+    bulk_chunk_size = 2
+
+
+class _EventRow(BaseModel):
+    title: str
+    impact_level: int | None = None
+
+
+class TestBulkOperations:
+    """create_many / update_many / soft_delete_many report per-row outcomes."""
+
+    async def test_create_many_chunks_and_reports_invalid_rows(self):
+        sim_id = uuid4()
+        mock_sb = MagicMock()
+        insert = mock_sb.table.return_value.insert
+        insert.return_value.execute = AsyncMock(
+            side_effect=[
+                MagicMock(data=[{"id": "e1", "title": "A"}, {"id": "e2", "title": "B"}]),
+                MagicMock(data=[{"id": "e3", "title": "C"}]),
+            ]
+        )
+
+        result = await _ChunkedService.create_many(
+            mock_sb,
+            sim_id,
+            uuid4(),
+            [{"title": "A"}, {"impact_level": 3}, {"title": "B"}, {"title": "C"}],
+            schema=_EventRow,
+        )
+
+        assert insert.call_count == 2
+        assert [row["title"] for row in insert.call_args_list[0][0][0]] == ["A", "B"]
+        assert (result.succeeded, result.failed) == (3, 1)
+        assert [(r.index, r.ok, r.id) for r in result.results] == [
+            (0, True, "e1"),
+            (1, False, None),
+            (2, True, "e2"),
+            (3, True, "e3"),
+        ]
+        assert "title" in result.results[1].error
+
+    async def test_create_many_fails_whole_chunk_on_db_error(self):
+        mock_sb = MagicMock()
+        mock_sb.table.return_value.insert.return_value.execute = AsyncMock(
+            side_effect=[
+                PostgrestAPIError({"message": "duplicate key", "code": "23505"}),
+                MagicMock(data=[{"id": "e3"}]),
+            ]
+        )
+
+        result = await _ChunkedService.create_many(mock_sb, uuid4(), uuid4(), [{"title": t} for t in "ABC"])
+
+        assert [r.ok for r in result.results] == [False, False, True]
+        assert result.results[0].error == "duplicate key"
+
+    async def test_update_many_sends_aligned_patches_through_rpc(self):
+        ids = [str(uuid4()) for _ in range(3)]
+        mock_sb = MagicMock()
+        mock_sb.rpc.return_value.execute = AsyncMock(
+            side_effect=[
+                MagicMock(data=[{"id": ids[0], "title": "A2"}, None]),
+                MagicMock(data=[{"id": ids[2], "title": "C2"}]),
+            ]
+        )
+
+        result = await _ChunkedService.update_many(
+            mock_sb,
+            uuid4(),
+            [{"id": ids[0], "title": "A2"}, {"id": ids[1], "title": "B2"}, {"id": "nope"}, {"id": ids[2], "title": "C2"}],
+            schema=_EventRow,
+            prepare=lambda data: {**data, "title_de": None},
+        )
+
+        name, params = mock_sb.rpc.call_args_list[0][0]
+        assert name == "fn_bulk_update_entities"
+        assert params["p_table"] == "events"
+        assert params["p_patches"][0] == {"id": ids[0], "title": "A2", "title_de": None}
+        assert [(r.index, r.ok) for r in result.results] == [(0, True), (1, False), (2, False), (3, True)]
+        assert result.results[1].error == "events not found."
+        assert "UUID" in result.results[2].error
+
+    async def test_update_many_reports_optimistic_lock_conflicts(self):
+        ids = [str(uuid4()), str(uuid4())]
+        stamp = "2026-10-19T10:00:00+00:00"
+        mock_sb = MagicMock()
+        mock_sb.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=["conflict", {"id": ids[1]}]))
+
+        result = await _ChunkedService.update_many(
+            mock_sb,
+            uuid4(),
+            [{"id": ids[0], "title": "A2", "if_updated_at": stamp}, {"id": ids[1], "title": "B2"}],
+            schema=_EventRow,
+        )
+
+        patches = mock_sb.rpc.call_args[0][1]["p_patches"]
+        assert patches == [{"id": ids[0], "title": "A2", "if_updated_at": stamp}, {"id": ids[1], "title": "B2"}]
+        assert [r.ok for r in result.results] == [False, True]
+        assert result.results[0].error.startswith("Conflict")
+
+    async def test_update_many_rejects_empty_patch(self):
+        mock_sb = MagicMock()
+
+        result = await _ChunkedService.update_many(mock_sb, uuid4(), [{"id": str(uuid4())}])
+
+        assert result.failed == 1
+        mock_sb.rpc.assert_not_called()
+
+    async def test_soft_delete_many_reports_missing_ids(self):
+        ids = [uuid4(), uuid4(), uuid4()]
+        mock_sb = MagicMock()
+        chain = mock_sb.table.return_value.update.return_value
+        chain.eq.return_value = chain
+        chain.in_.return_value = chain
+        chain.is_.return_value = chain
+        chain.execute = AsyncMock(
+            side_effect=[MagicMock(data=[{"id": str(ids[1])}]), MagicMock(data=[{"id": str(ids[2])}])]
+        )
+
+        result = await _ChunkedService.soft_delete_many(mock_sb, uuid4(), ids)
+
+        assert chain.in_.call_args_list[0][0] == ("id", [str(ids[0]), str(ids[1])])
+        assert [r.ok for r in result.results] == [False, True, True]
+        assert "already deleted" in result.results[0].error
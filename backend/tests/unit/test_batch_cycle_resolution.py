@@ -0,0 +1,243 @@
+"""Batched mission resolution and the concurrent epoch sweep (migration 245).
+
+Mission resolution runs against ``FakeSupabase`` with Python ports of the
+two batch RPCs, so the round-trip counts are those of the real client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.services.battle_log_service import BattleLogService
+from backend.services.epoch_cycle_scheduler import EpochCycleScheduler
+from backend.services.operative_mission_service import OperativeMissionService, roll_mission_outcome
+from backend.tests.fake_supabase import FakeSupabase
+from backend.utils.call_stats import track_calls
+
+EPOCH_ID = str(uuid4())
+SIM_A, SIM_B, SIM_C = (str(uuid4()) for _ in range(3))
+PAST = "2020-01-01T00:00:00+00:00"
+
+
+def _mission(status: str = "active", *, target: str = SIM_B, operative_type: str = "spy", **extra) -> dict:
+    return {
+        "id": str(uuid4()),
+        "epoch_id": EPOCH_ID,
+        "source_simulation_id": SIM_A,
+        "target_simulation_id": target,
+        "operative_type": operative_type,
+        "status": status,
+        "success_probability": 1e-9,  # 0 would fall back to the 0.5 default
+        "resolves_at": PAST,
+        **extra,
+    }
+
+
+def _backend(missions: list[dict], participants: list[dict] | None = None) -> FakeSupabase:
+    fake = FakeSupabase(
+        {
+            "operative_missions": missions,
+            "epoch_participants": participants
+            or [{"epoch_id": EPOCH_ID, "simulation_id": sim, "team_id": None} for sim in (SIM_A, SIM_B, SIM_C)],
+            "game_epochs": [{"id": EPOCH_ID, "current_cycle": 4}],
+        }
+    )
+
+    @fake.rpc("fn_transition_missions_batch")
+    def _transition(db, p):
+        rows = [
+            m
+            for m in db.tables["operative_missions"]
+            if m["id"] in p["p_mission_ids"] and m["status"] == p["p_from_status"]
+        ]
+        for m in rows:
+            m["status"] = p["p_to_status"]
+        return len(rows)
+
+    @fake.rpc("fn_resolve_missions_batch")
+    def _resolve(db, p):
+        by_id = {r["id"]: r for r in p["p_results"]}
+        updated = []
+        for m in db.tables["operative_missions"]:
+            result = by_id.get(m["id"])
+            if result and m["status"] == "active":
+                m.update(status=result["status"], mission_result=result["mission_result"], resolved_at="now")
+                updated.append(dict(m))
+        return updated
+
+    @fake.rpc("fn_record_mission_results")
+    def _record(db, p):
+        by_id = {r["id"]: r for r in p["p_results"]}
+        rows = [m for m in db.tables["operative_missions"] if m["id"] in by_id and m["status"] == "success"]
+        for m in rows:
+            m["mission_result"] = by_id[m["id"]]["mission_result"]
+        return len(rows)
+
+    return fake
+
+
+class TestRollMissionOutcome:
+    def test_success_then_independent_detection_roll(self):
+        rng = random.Random(3)  # noqa: S311 — deterministic test rolls
+        outcomes = [roll_mission_outcome(0.5, 0.45, rng) for _ in range(2000)]
+
+        assert {"success", "detected", "failed"} == set(outcomes)
+        assert 0.45 < outcomes.count("success") / 2000 < 0.55
+        assert roll_mission_outcome(1.0, 0.0, rng) == "success"
+        assert roll_mission_outcome(0.0, 1.0, rng) == "detected"
+
+
+class TestResolvePendingMissions:
+    async def test_round_trips_do_not_grow_with_mission_count(self):
+        missions = [_mission() for _ in range(8)] + [_mission("deploying") for _ in range(3)]
+        missions.append(_mission(operative_type="guardian"))
+        fake = _backend(missions)
+        client = await fake.client()
+
+        with track_calls() as stats:
+            resolved = await OperativeMissionService.resolve_pending_missions(
+                client, EPOCH_ID, epoch_config={"detection_on_failure": 0.0}
+            )
+
+        # select + transition batch + resolve batch + participant lookup
+        assert stats.db_calls == 4
+        assert stats.n_plus_one() == []
+        assert [r["status"] for r in resolved] == ["failed"] * 8
+        statuses = [m["status"] for m in fake.tables["operative_missions"]]
+        assert statuses == ["failed"] * 8 + ["active"] * 3 + ["active"]
+
+    async def test_missions_resolved_concurrently_are_skipped(self):
+        missions = [_mission(), _mission()]
+        fake = _backend(missions)
+        client = await fake.client()
+        original = fake._rpcs["fn_resolve_missions_batch"]
+
+        def _race(db, p):
+            db.tables["operative_missions"][0]["status"] = "success"  # another worker won
+            return original(db, p)
+
+        fake.rpc("fn_resolve_missions_batch")(_race)
+
+        resolved = await OperativeMissionService.resolve_pending_missions(client, EPOCH_ID)
+
+        assert [r["id"] for r in resolved] == [missions[1]["id"]]
+
+    async def test_success_effects_run_only_for_claimed_missions(self):
+        missions = [_mission(success_probability=1.0), _mission(success_probability=1.0)]
+        fake = _backend(missions)
+        client = await fake.client()
+        original = fake._rpcs["fn_resolve_missions_batch"]
+
+        def _race(db, p):
+            db.tables["operative_missions"][0]["status"] = "success"  # another worker won
+            return original(db, p)
+
+        fake.rpc("fn_resolve_missions_batch")(_race)
+        effect = AsyncMock(return_value={"narrative": "Intel gathered."})
+
+        with patch.object(OperativeMissionService, "_apply_success_effect", effect):
+            resolved = await OperativeMissionService.resolve_pending_missions(client, EPOCH_ID)
+
+        assert [call.args[1]["id"] for call in effect.await_args_list] == [missions[1]["id"]]
+        assert resolved[0]["mission_result"] == {"narrative": "Intel gathered.", "outcome": "success"}
+        assert fake.tables["operative_missions"][1]["mission_result"] == resolved[0]["mission_result"]
+        assert "mission_result" not in fake.tables["operative_missions"][0]
+
+    async def test_detected_betrayal_dissolves_alliance_once(self):
+        participants = [
+            {"epoch_id": EPOCH_ID, "simulation_id": SIM_A, "team_id": "team-1"},
+            {"epoch_id": EPOCH_ID, "simulation_id": SIM_B, "team_id": "team-1"},
+            {"epoch_id": EPOCH_ID, "simulation_id": SIM_C, "team_id": "team-2"},
+        ]
+        fake = _backend([_mission(), _mission(), _mission(target=SIM_C)], participants)
+        client = await fake.client()
+
+        with patch.object(BattleLogService, "log_betrayal", new_callable=AsyncMock) as log_betrayal:
+            await OperativeMissionService.resolve_pending_missions(
+                client, EPOCH_ID, epoch_config={"detection_on_failure": 1.0}
+            )
+
+        # Second mission against the former ally is no longer a betrayal
+        log_betrayal.assert_awaited_once()
+        assert log_betrayal.call_args.args[2] == 4
+        teams = {
+            p["simulation_id"]: (p["team_id"], p.get("betrayal_penalty")) for p in fake.tables["epoch_participants"]
+        }
+        assert teams == {SIM_A: (None, 0.25), SIM_B: (None, None), SIM_C: ("team-2", None)}
+
+    async def test_battle_log_entries_are_one_insert(self):
+        fake = FakeSupabase()
+        client = await fake.client()
+        resolved = [
+            {**_mission(), "mission_result": {"outcome": "detected", "narrative": "Seen."}},
+            {**_mission(target=None), "mission_result": {"outcome": "success", "narrative": "Done."}},
+        ]
+
+        with track_calls() as stats:
+            entries = await BattleLogService.log_mission_results(client, uuid4(), 2, resolved)
+
+        assert stats.db_calls == 1
+        assert [(e["event_type"], e["is_public"]) for e in entries] == [("detected", True), ("mission_success", False)]
+        assert "target_simulation_id" not in fake.tables["battle_log"][1]
+
+
+class TestConcurrentSweep:
+    @staticmethod
+    def _admin(epochs: list[dict]) -> MagicMock:
+        admin = MagicMock()
+        chain = MagicMock()
+        for method in ("select", "in_", "lte"):
+            getattr(chain, method).return_value = chain
+        chain.not_.is_.return_value = chain
+        chain.execute = AsyncMock(return_value=MagicMock(data=epochs))
+        admin.table.return_value = chain
+        return admin
+
+    async def test_due_epochs_resolve_concurrently_with_report(self):
+        epochs = [{"id": str(uuid4()), "current_cycle": i, "config": {}} for i in range(3)]
+
+        async def _slow_resolve(admin, epoch, *, timings):
+            timings.append({"phase": "missions", "ms": 50.0, "ok": True})
+            await asyncio.sleep(0.05)
+            return True
+
+        started = time.perf_counter()
+        with patch.object(EpochCycleScheduler, "_auto_resolve_cycle", side_effect=_slow_resolve):
+            report = await EpochCycleScheduler._sweep_expired_cycles(self._admin(epochs))
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.12  # serial would be >= 0.15
+        assert [r["epoch_id"] for r in report] == [e["id"] for e in epochs]
+        assert all(r["resolved"] and r["stages"][0]["phase"] == "missions" for r in report)
+
+    async def test_concurrency_is_bounded(self):
+        epochs = [{"id": str(uuid4()), "current_cycle": 1, "config": {}} for _ in range(7)]
+        running = peak = 0
+
+        async def _track(admin, epoch, *, timings):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        with patch.object(EpochCycleScheduler, "_auto_resolve_cycle", side_effect=_track):
+            await EpochCycleScheduler._sweep_expired_cycles(self._admin(epochs))
+
+        assert peak == 3
+
+    @pytest.mark.parametrize("resolved", [True, False])
+    async def test_pass_report_logged_only_when_work_was_done(self, resolved, caplog):
+        epochs = [{"id": str(uuid4()), "current_cycle": 1, "config": {}}]
+
+        with patch.object(EpochCycleScheduler, "_auto_resolve_cycle", new_callable=AsyncMock, return_value=resolved):
+            await EpochCycleScheduler._sweep_expired_cycles(self._admin(epochs))
+
+        assert any("Cycle resolution pass" in r.getMessage() for r in caplog.records) is resolved
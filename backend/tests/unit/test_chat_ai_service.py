@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
-from backend.services.chat_ai_service import ChatAIService
+from backend.services.agent_service import AgentService
+from backend.services.chat_ai_service import ChatAIService, SSEEvent
+from backend.services.chat_context_cache import ChatContextCache
 from backend.services.prompt_service import HARDCODED_FALLBACKS, ResolvedPrompt
+from backend.services.prompt_template_service import PromptTemplateService
+from backend.services.relationship_service import RelationshipService
+from backend.tests.fake_supabase import FakeSupabase
 
 # ---------------------------------------------------------------------------
 # _build_agent_variables (static, no mocks needed)
@@ -194,6 +200,210 @@ class TestBuildEventContext:
         assert "Second event." in result
 
 
+# ---------------------------------------------------------------------------
+# _prepare_single_context (dependency graph + warm per-conversation cache)
+# ---------------------------------------------------------------------------
+
+
+class TestPrepareSingleContext:
+    """Context assembly runs independent loads concurrently and reuses warm context."""
+
+    @staticmethod
+    def _wire(svc: ChatAIService, *, agent_id: str = "agent-1") -> dict[str, AsyncMock]:
+        model = MagicMock(model_id="anthropic/claude-sonnet")
+        mocks = {
+            "conversation": AsyncMock(return_value={"id": "c", "agent_id": agent_id}),
+            "agent": AsyncMock(return_value={"id": str(uuid4()), "name": "Ava"}),
+            "simulation": AsyncMock(return_value={"name": "Velgarien"}),
+            "locale": AsyncMock(return_value="en"),
+            "relationships": AsyncMock(return_value="Relationships:\n- ally of Bo"),
+            "prompt": AsyncMock(return_value=_make_resolved_prompt("You are {agent_name}.")),
+            "model": AsyncMock(return_value=model),
+            "history": AsyncMock(return_value=[{"sender_role": "user", "content": "hi"}]),
+        }
+        svc._load_conversation = mocks["conversation"]
+        svc._load_agent = mocks["agent"]
+        svc._load_simulation = mocks["simulation"]
+        svc._get_locale = mocks["locale"]
+        svc._build_relationship_context = mocks["relationships"]
+        svc._prompt_resolver.resolve = mocks["prompt"]
+        svc._model_resolver.resolve_text_model = mocks["model"]
+        svc._load_history = mocks["history"]
+        return mocks
+
+    async def test_second_turn_reuses_warm_context(self, chat_service):
+        mocks = self._wire(chat_service)
+        conv_id = uuid4()
+        with patch(
+            "backend.services.chat_ai_service.AgentMemoryService.retrieve",
+            new=AsyncMock(return_value=[]),
+        ) as retrieve:
+            first = await chat_service._prepare_single_context(conv_id, "hello")
+            second = await chat_service._prepare_single_context(conv_id, "again")
+
+        for name in ("conversation", "agent", "simulation", "relationships", "prompt"):
+            assert mocks[name].await_count == 1, name
+        # Per-turn data is always fresh.
+        assert mocks["history"].await_count == 2
+        assert mocks["model"].await_count == 2
+        assert retrieve.await_count == 2
+        assert first["agent"] is second["agent"]
+        assert second["history_messages"][-1] == {"role": "user", "content": "again"}
+        assert second["relationship_context"].startswith("Relationships:")
+
+    @pytest.mark.parametrize("writer", ["agent", "relationship", "prompt_template"])
+    async def test_writes_to_context_inputs_drop_the_warm_context(self, chat_service, writer):
+        mocks = self._wire(chat_service)
+        sim_id = chat_service._simulation_id
+        row_id = str(uuid4())
+        fake = FakeSupabase(
+            {
+                "agents": [{"id": row_id, "simulation_id": str(sim_id), "name": "Ava"}],
+                "agent_relationships": [{"id": row_id, "simulation_id": str(sim_id), "intensity": 3}],
+                "prompt_templates": [{"id": row_id, "simulation_id": str(sim_id), "is_active": True}],
+            }
+        )
+        client = await fake.client()
+        writes = {
+            "agent": lambda: AgentService.update(client, sim_id, row_id, {"character": "Wary"}),
+            "relationship": lambda: RelationshipService.update_relationship(client, sim_id, row_id, {"intensity": 7}),
+            "prompt_template": lambda: PromptTemplateService.deactivate(client, sim_id, row_id),
+        }
+        conv_id = uuid4()
+        with patch("backend.services.chat_ai_service.AgentMemoryService.retrieve", new=AsyncMock(return_value=[])):
+            await chat_service._prepare_single_context(conv_id, "hello")
+            await writes[writer]()
+            await chat_service._prepare_single_context(conv_id, "again")
+
+        assert mocks["agent"].await_count == 2
+        assert mocks["relationships"].await_count == 2
+
+    async def test_other_simulations_keep_their_warm_context(self, chat_service):
+        ChatContextCache.put(chat_service._simulation_id, "c1", "warm")
+        ChatContextCache.put("other-sim", "c2", "warm")
+
+        ChatContextCache.invalidate_simulation(chat_service._simulation_id)
+
+        assert ChatContextCache.get(chat_service._simulation_id, "c1") is None
+        assert ChatContextCache.get("other-sim", "c2") == "warm"
+
+    async def test_memory_retrieval_overlaps_history_load(self, chat_service):
+        mocks = self._wire(chat_service)
+        history_started = asyncio.Event()
+        memory_started = asyncio.Event()
+
+        async def _history(*_a, **_kw):
+            history_started.set()
+            await asyncio.wait_for(memory_started.wait(), timeout=1)
+            return []
+
+        async def _retrieve(*_a, **_kw):
+            memory_started.set()
+            await asyncio.wait_for(history_started.wait(), timeout=1)
+            return []
+
+        mocks["history"].side_effect = _history
+        with patch("backend.services.chat_ai_service.AgentMemoryService.retrieve", new=_retrieve):
+            ctx = await chat_service._prepare_single_context(uuid4(), "hello")
+
+        assert ctx["history_messages"] == [{"role": "user", "content": "hello"}]
+
+    async def test_group_conversation_raises_and_is_not_cached(self, chat_service):
+        mocks = self._wire(chat_service, agent_id="")
+        conv_id = uuid4()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="no agent_id"):
+                await chat_service._prepare_single_context(conv_id, "hello")
+        assert mocks["conversation"].await_count == 2
+        mocks["agent"].assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# stream_group_response (pipelined speakers, incremental transcript)
+# ---------------------------------------------------------------------------
+
+
+class TestGroupPipeline:
+    """Next speaker's prompt is prepared while the current speaker streams."""
+
+    @staticmethod
+    def _wire(svc: ChatAIService, agents: list[dict]) -> AsyncMock:
+        async def mock_resolve(template_type, locale):
+            return _make_resolved_prompt(HARDCODED_FALLBACKS.get(template_type, "{agent_name}"))
+
+        svc._load_conversation_agents = AsyncMock(return_value=agents)
+        svc._load_event_references = AsyncMock(return_value=[])
+        svc._load_simulation = AsyncMock(return_value={"name": "Velgarien"})
+        svc._get_locale = AsyncMock(return_value="en")
+        svc._model_resolver.resolve_text_model = AsyncMock(return_value=MagicMock(model_id="m"))
+        svc._prompt_resolver.resolve = AsyncMock(side_effect=mock_resolve)
+        history = AsyncMock(return_value=[{"sender_role": "user", "content": "earlier"}])
+        svc._load_history = history
+        return history
+
+    async def test_prefetches_next_speaker_during_stream(self, chat_service):
+        agents = [{"id": str(uuid4()), "name": "Ava"}, {"id": str(uuid4()), "name": "Bo"}]
+        history = self._wire(chat_service, agents)
+        mood_started: dict[str, asyncio.Event] = {a["id"]: asyncio.Event() for a in agents}
+        seen_histories: list[list[dict]] = []
+
+        async def _mood(agent_id, locale="en"):
+            mood_started[str(agent_id)].set()
+            return ""
+
+        async def _stream(**kwargs):
+            seen_histories.append(kwargs["history_messages"])
+            agent = kwargs["agent"]
+            if agent["name"] == "Ava":
+                # Bo's prompt assembly must already be underway while Ava streams.
+                await asyncio.wait_for(mood_started[agents[1]["id"]].wait(), timeout=1)
+            assert kwargs["system_message"]["role"] == "system"
+            yield SSEEvent(
+                event="agent_done",
+                data={"message": {"agent_id": agent["id"], "content": f"{agent['name']} speaks"}},
+            )
+
+        chat_service._build_mood_context = _mood
+        chat_service.stream_single_response = _stream
+        events = [e async for e in chat_service.stream_group_response(uuid4(), "hello all")]
+
+        assert len(events) == 2
+        history.assert_awaited_once()  # loaded once, not per speaker
+        assert seen_histories[0] == [
+            {"role": "user", "content": "earlier"},
+            {"role": "user", "content": "hello all"},
+        ]
+        assert seen_histories[1][-1] == {"role": "assistant", "content": "[Ava]: Ava speaks"}
+        assert len(seen_histories[1]) == 3
+
+    async def test_disconnect_cancels_pending_prefetch(self, chat_service):
+        agents = [{"id": str(uuid4()), "name": "Ava"}, {"id": str(uuid4()), "name": "Bo"}]
+        self._wire(chat_service, agents)
+        entered = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def _mood(agent_id, locale="en"):
+            if str(agent_id) == agents[1]["id"]:
+                entered.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return ""
+
+        async def _stream(**kwargs):
+            yield SSEEvent(event="token", data={"content": "x"})
+
+        chat_service._build_mood_context = _mood
+        chat_service.stream_single_response = _stream
+        gen = chat_service.stream_group_response(uuid4(), "hello")
+        await gen.__anext__()
+        await asyncio.wait_for(entered.wait(), timeout=1)
+        await gen.aclose()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
 # ---------------------------------------------------------------------------
 # New prompt template types exist in HARDCODED_FALLBACKS
 # ---------------------------------------------------------------------------
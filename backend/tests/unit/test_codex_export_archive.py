@@ -0,0 +1,132 @@
+"""Tests for the hi-res archive builder — concurrent downloads, spooled ZIP, resumable upload."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import zipfile
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from backend.services import codex_export_service
+from backend.services.codex_export_service import _build_archive
+from backend.services.forge_feature_service import ForgeFeatureService
+from backend.tests.fake_supabase import FakeSupabase
+from backend.utils import resumable_upload
+from backend.utils.resumable_upload import upload_resumable
+
+
+class _Progress:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int, int]] = []
+
+    async def __call__(self, phase: str, current: int, total: int) -> None:
+        self.calls.append((phase, current, total))
+
+
+class TestBuildArchive:
+    async def test_downloads_concurrently_with_fallback(self, monkeypatch):
+        monkeypatch.setattr(codex_export_service.settings, "hires_archive_concurrency", 2)
+        in_flight = 0
+        peak = 0
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            name = request.url.path.rsplit("/", 1)[-1]
+            if (name.startswith("thumb-only") and name.endswith(".full.avif")) or name.startswith("gone"):
+                return httpx.Response(404)
+            return httpx.Response(200, content=name.encode())
+
+        manifest = [
+            (f"https://cdn/a{i}.full.avif", f"https://cdn/a{i}.avif", f"sim/agents/a{i}.avif") for i in range(5)
+        ]
+        manifest += [
+            ("https://cdn/thumb-only.full.avif", "https://cdn/thumb-only.avif", "sim/lore/t.avif"),
+            ("https://cdn/gone.full.avif", None, "sim/lore/gone.avif"),
+        ]
+        archive = io.BytesIO()
+        progress = _Progress()
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            count = await _build_archive(client, manifest, archive, progress)
+
+        assert count == 6
+        assert peak == 2
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.read("sim/agents/a3.avif") == b"a3.full.avif"
+            assert zf.read("sim/lore/t.avif") == b"thumb-only.avif"
+            assert "sim/lore/gone.avif" not in zf.namelist()
+        assert progress.calls[-1] == ("downloading", 7, 7)
+
+
+class TestResumableUpload:
+    async def test_failed_chunk_resumes_from_server_offset(self, monkeypatch):
+        monkeypatch.setattr(resumable_upload, "TUS_CHUNK_SIZE", 4)
+        stored = bytearray()
+        patches: list[int] = []
+        failed = False
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            nonlocal failed
+            if request.method == "POST":
+                assert request.headers["upload-length"] == "10"
+                return httpx.Response(201, headers={"location": "https://storage/upload/resumable/abc"})
+            if request.method == "HEAD":
+                return httpx.Response(200, headers={"upload-offset": str(len(stored))})
+            offset = int(request.headers["upload-offset"])
+            patches.append(offset)
+            assert offset == len(stored)
+            stored.extend(request.content)
+            if offset == 4 and not failed:
+                # Chunk stored but the response was lost.
+                failed = True
+                return httpx.Response(502)
+            return httpx.Response(204, headers={"upload-offset": str(len(stored))})
+
+        offsets: list[int] = []
+
+        async def _on_progress(offset: int) -> None:
+            offsets.append(offset)
+
+        with patch("backend.utils.resumable_upload.asyncio.sleep", AsyncMock()):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+                await upload_resumable(
+                    "simulation.assets",
+                    "sim/exports/a.zip",
+                    io.BytesIO(b"0123456789"),
+                    10,
+                    content_type="application/zip",
+                    on_progress=_on_progress,
+                    client=client,
+                )
+
+        assert bytes(stored) == b"0123456789"
+        assert patches == [0, 4, 8]
+        assert offsets == [4, 10]
+
+
+class TestReportProgress:
+    async def test_progress_is_merged_into_result(self):
+        fake = FakeSupabase(
+            {"feature_purchases": [{"id": "p1", "status": "processing", "result": {"manifest": 7}}]}
+        )
+
+        @fake.rpc("fn_report_feature_progress")
+        def _report(db, p):
+            for row in db.tables["feature_purchases"]:
+                if row["id"] == p["p_purchase_id"] and row["status"] == "processing":
+                    row["result"] = {**(row["result"] or {}), "progress": p["p_progress"]}
+
+        client = await fake.client()
+        await ForgeFeatureService.report_progress(client, "p1", "downloading", 3, 7)
+        await ForgeFeatureService.report_progress(client, "p1", "uploading", 1, 2)
+
+        assert fake.tables["feature_purchases"][0]["result"] == {
+            "manifest": 7,
+            "progress": {"phase": "uploading", "current": 1, "total": 2},
+        }
@@ -0,0 +1,133 @@
+"""Tests for the request-scoped DataLoader — tick batching, caching, errors."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.utils.data_loader import DataLoader, DataLoaders
+
+
+class _LoaderDB:
+    """Serves ``in_()`` lookups from in-memory tables and records every query."""
+
+    def __init__(self, tables: dict[str, list[dict]], *, fail: bool = False):
+        self.tables = tables
+        self.fail = fail
+        self.queries: list[tuple[str, str, list[str]]] = []
+
+    def table(self, name: str):
+        builder = MagicMock()
+        builder.select.return_value = builder
+
+        def _in(column, keys):
+            async def _execute():
+                self.queries.append((name, column, list(keys)))
+                if self.fail:
+                    raise RuntimeError("db down")
+                rows = [row for row in self.tables.get(name, []) if str(row.get(column)) in keys]
+                return MagicMock(data=rows)
+
+            builder.execute = _execute
+            return builder
+
+        builder.in_.side_effect = _in
+        return builder
+
+
+@pytest.fixture()
+def db():
+    return _LoaderDB(
+        {
+            "agents": [{"id": f"a{i}", "name": f"Agent {i}", "simulation_id": "s1"} for i in range(5)],
+            "zones": [
+                {"id": "z1", "city_id": "c1"},
+                {"id": "z2", "city_id": "c1"},
+                {"id": "z3", "city_id": "c2"},
+            ],
+        }
+    )
+
+
+class TestBatching:
+    async def test_loads_in_one_tick_share_one_query(self, db):
+        loader = DataLoader(db, "agents")
+
+        rows = await asyncio.gather(loader.load("a1"), loader.load("a3"), loader.load("missing"))
+
+        assert [r and r["name"] for r in rows] == ["Agent 1", "Agent 3", None]
+        assert db.queries == [("agents", "id", ["a1", "a3", "missing"])]
+
+    async def test_loads_from_concurrent_tasks_are_batched(self, db):
+        loader = DataLoader(db, "agents")
+
+        async def resolve(agent_id: str) -> str:
+            row = await loader.load(agent_id)
+            return row["name"]
+
+        names = await asyncio.gather(*(resolve(f"a{i}") for i in range(4)))
+
+        assert names == ["Agent 0", "Agent 1", "Agent 2", "Agent 3"]
+        assert len(db.queries) == 1
+
+    async def test_results_are_cached_per_key(self, db):
+        loader = DataLoader(db, "agents")
+
+        await loader.load_many(["a1", "a2"])
+        await loader.load_many(["a2", "a1", "a4"])
+
+        assert [q[2] for q in db.queries] == [["a1", "a2"], ["a4"]]
+
+    async def test_large_batches_are_split(self, db):
+        loader = DataLoader(db, "agents", max_batch=2)
+
+        await loader.load_many(["a0", "a1", "a2", "a3", "a4"])
+
+        assert [len(q[2]) for q in db.queries] == [2, 2, 1]
+
+    async def test_many_groups_rows_by_column(self, db):
+        loader = DataLoader(db, "zones", "city_id", many=True)
+
+        by_city = await loader.load_many(["c1", "c2", "c3"])
+
+        assert [[z["id"] for z in zones] for zones in by_city] == [["z1", "z2"], ["z3"], []]
+
+
+class TestCacheControl:
+    async def test_prime_and_clear(self, db):
+        loader = DataLoader(db, "agents")
+        loader.prime("a1", {"id": "a1", "name": "Primed"})
+
+        assert (await loader.load("a1"))["name"] == "Primed"
+        assert db.queries == []
+
+        loader.clear("a1")
+        assert (await loader.load("a1"))["name"] == "Agent 1"
+
+    async def test_errors_reach_every_waiter_and_are_not_cached(self, db):
+        db.fail = True
+        loader = DataLoader(db, "agents")
+
+        results = await asyncio.gather(loader.load("a1"), loader.load("a2"), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        db.fail = False
+        assert (await loader.load("a1"))["name"] == "Agent 1"
+
+
+class TestRegistry:
+    async def test_one_loader_per_table_column_and_select(self, db):
+        loaders = DataLoaders(db)
+
+        assert loaders.get("agents") is loaders.get("agents")
+        assert loaders.get("agents") is not loaders.get("agents", select="id, name")
+
+        await asyncio.gather(loaders.get("agents").load("a1"), loaders.get("zones").load("z1"))
+        assert loaders.batches == 2
+
+        loaders.clear("agents")
+        await loaders.get("agents").load("a1")
+        await loaders.get("zones").load("z1")
+        assert loaders.batches == 3
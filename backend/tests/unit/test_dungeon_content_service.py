@@ -0,0 +1,225 @@
+"""Tests for dungeon_content_service — versioned snapshots and scoped refresh."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services import dungeon_content_service as dcs
+
+SHADOW = "The Shadow"
+TOWER = "The Tower"
+
+
+def _enemy(eid: str, archetype: str, name: str = "Foe") -> dict:
+    return {
+        "id": eid,
+        "archetype": archetype,
+        "name_en": name,
+        "name_de": name,
+        "condition_threshold": 3,
+        "stress_resistance": 0,
+        "threat_level": "standard",
+        "attack_aptitude": "assassin",
+        "attack_power": 3,
+        "stress_attack_power": 2,
+        "telegraphed_intent": False,
+        "evasion": 10,
+        "resistances": [],
+        "vulnerabilities": [],
+        "action_weights": {"attack": 100},
+        "special_abilities": [],
+        "description_en": "",
+        "description_de": "",
+    }
+
+
+def _banter(bid: str, archetype: str) -> dict:
+    return {"id": bid, "archetype": archetype, "trigger": "room_entered", "text_en": bid, "text_de": bid}
+
+
+class _FakeQuery:
+    """Minimal PostgREST chain: records eq/in_ filters and applies them to rows."""
+
+    def __init__(self, db: _FakeDB, table: str):
+        self._db = db
+        self._table = table
+        self._filters: list[tuple[str, object]] = []
+        self._in: list[tuple[str, list]] = []
+
+    def select(self, *_a, **_kw):
+        return self
+
+    def order(self, *_a, **_kw):
+        return self
+
+    def eq(self, column: str, value: object):
+        self._filters.append((column, value))
+        return self
+
+    def in_(self, column: str, values: list):
+        self._in.append((column, values))
+        return self
+
+    async def execute(self):
+        self._db.calls.append((self._table, tuple(self._filters)))
+        rows = [
+            r
+            for r in self._db.rows.get(self._table, [])
+            if all(r.get(c) == v for c, v in self._filters) and all(r.get(c) in vs for c, vs in self._in)
+        ]
+        resp = MagicMock()
+        resp.data = rows
+        return resp
+
+
+class _FakeDB:
+    def __init__(self, rows: dict[str, list[dict]], versions: dict[str, str] | None):
+        self.rows = rows
+        self.versions = versions
+        self.calls: list[tuple[str, tuple]] = []
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(self, name)
+
+    def rpc(self, name: str, *_a):
+        assert name == "fn_dungeon_content_versions"
+        chain = MagicMock()
+
+        async def _execute():
+            resp = MagicMock()
+            resp.data = self.versions
+            return resp
+
+        chain.execute = _execute
+        return chain
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    """Keep the session-wide YAML-seeded cache intact and snapshots in tmp."""
+    monkeypatch.setattr(dcs.settings, "dungeon_content_snapshot_dir", str(tmp_path))
+    saved = dcs._content
+    yield
+    dcs._content = saved
+
+
+def _db(versions: dict[str, str] | None = None) -> _FakeDB:
+    return _FakeDB(
+        {
+            "dungeon_enemy_templates": [_enemy("shadow_a", SHADOW), _enemy("tower_a", TOWER)],
+            "dungeon_banter": [_banter("sb1", SHADOW), _banter("tb1", TOWER)],
+        },
+        {SHADOW: "s1", TOWER: "t1"} if versions is None else versions,
+    )
+
+
+class TestLoadAllContent:
+    async def test_full_load_records_versions_and_writes_snapshot(self):
+        db = _db()
+        await dcs.load_all_content(db)
+
+        assert set(dcs.get_enemy_registry()) == {SHADOW, TOWER}
+        assert dcs.get_content_version() == dcs.combined_version({SHADOW: "s1", TOWER: "t1"})
+        assert dcs.read_snapshot("content", dcs.get_content_version()) is not None
+
+    async def test_matching_snapshot_skips_table_reads(self):
+        await dcs.load_all_content(_db())
+        dcs.invalidate()
+
+        db = _db()
+        await dcs.load_all_content(db)
+
+        assert db.calls == []
+        assert "shadow_a" in dcs.get_enemy_registry()[SHADOW]
+
+    async def test_use_snapshot_false_forces_db_rebuild(self):
+        await dcs.load_all_content(_db())
+        db = _db()
+        await dcs.load_all_content(db, use_snapshot=False)
+        assert len(db.calls) == 10
+
+    async def test_missing_version_rpc_degrades_to_unversioned_load(self):
+        db = _db()
+        db.versions = None
+        await dcs.load_all_content(db)
+        assert dcs.get_content_version() == ""
+        assert SHADOW in dcs.get_banter_registry()
+
+
+class TestRefreshContent:
+    async def test_no_change_is_noop(self):
+        await dcs.load_all_content(_db())
+        db = _db()
+        assert await dcs.refresh_content(db) == []
+        assert db.calls == []
+
+    async def test_reloads_only_changed_archetype(self):
+        await dcs.load_all_content(_db())
+        before = dcs._content
+        tower_enemies = dcs.get_enemy_registry()[TOWER]
+
+        db = _db({SHADOW: "s2", TOWER: "t1"})
+        db.rows["dungeon_enemy_templates"][0] = _enemy("shadow_a", SHADOW, name="Renamed")
+        assert await dcs.refresh_content(db) == [SHADOW]
+
+        assert {c[1] for c in db.calls} == {(("archetype", SHADOW),)}
+        assert dcs.get_enemy_registry()[SHADOW]["shadow_a"].name_en == "Renamed"
+        # Untouched archetype keeps the very same objects; old cache unmodified.
+        assert dcs.get_enemy_registry()[TOWER] is tower_enemies
+        assert before.enemies[SHADOW]["shadow_a"].name_en == "Foe"
+
+    async def test_removed_scope_is_dropped(self):
+        await dcs.load_all_content(_db())
+        db = _db({TOWER: "t1"})
+        db.rows = {k: [r for r in v if r["archetype"] != SHADOW] for k, v in db.rows.items()}
+
+        assert await dcs.refresh_content(db) == [SHADOW]
+        assert SHADOW not in dcs.get_enemy_registry()
+        assert SHADOW not in dcs.get_banter_registry()
+
+    async def test_poll_without_rpc_does_not_full_reload(self):
+        await dcs.load_all_content(_db())
+        db = _db()
+        db.versions = None
+        assert await dcs.refresh_content(db, full_fallback=False) == []
+        assert db.calls == []
+
+
+class TestSnapshots:
+    def test_combined_version_is_order_independent(self):
+        assert dcs.combined_version({"a": "1", "b": "2"}) == dcs.combined_version({"b": "2", "a": "1"})
+        assert dcs.combined_version({"a": "1"}) != dcs.combined_version({"a": "2"})
+
+    def test_corrupt_snapshot_is_a_miss(self, tmp_path):
+        (tmp_path / dcs._snapshot_path("content", "deadbeef").name).write_bytes(b"not a pickle")
+        assert dcs.read_snapshot("content", "deadbeef") is None
+
+    def test_old_snapshots_are_pruned(self):
+        for i in range(dcs._SNAPSHOT_KEEP + 3):
+            dcs.write_snapshot("content", f"v{i}", {"i": i})
+        assert len(list(dcs.snapshot_dir().glob("content-*.pickle"))) == dcs._SNAPSHOT_KEEP
+
+    def test_shared_directory_disables_snapshots(self, tmp_path):
+        tmp_path.chmod(0o777)
+        dcs.write_snapshot("content", "v1", {"i": 1})
+        assert list(tmp_path.iterdir()) == []
+
+        tmp_path.chmod(0o700)
+        dcs.write_snapshot("content", "v1", {"i": 1})
+        tmp_path.chmod(0o777)
+        assert dcs.read_snapshot("content", "v1") is None
+
+    def test_writable_snapshot_file_is_ignored(self):
+        dcs.write_snapshot("content", "v1", {"i": 1})
+        dcs._snapshot_path("content", "v1").chmod(0o666)
+
+        assert dcs.read_snapshot("content", "v1") is None
+
+    def test_symlinked_snapshot_is_ignored(self, tmp_path):
+        dcs.write_snapshot("content", "v1", {"i": 1})
+        path = dcs._snapshot_path("content", "v2")
+        path.symlink_to(dcs._snapshot_path("content", "v1"))
+
+        assert dcs.read_snapshot("content", "v2") is None
@@ -0,0 +1,345 @@
+"""Tests for the in-memory PostgREST fake (backend/tests/fake_supabase.py)."""
+
+from __future__ import annotations
+
+import time
+from uuid import UUID, uuid4
+
+import pytest
+from postgrest.exceptions import APIError
+
+from backend.services.agent_memory_service import AgentMemoryService
+from backend.services.heartbeat_service import HeartbeatService
+from backend.services.scoring_service import ScoringService
+from backend.tests.fake_supabase import FakeSupabase
+from backend.utils.call_stats import track_calls
+
+SIM = "00000000-0000-0000-0000-0000000000a1"
+OTHER_SIM = "00000000-0000-0000-0000-0000000000a2"
+
+
+def _world() -> FakeSupabase:
+    return FakeSupabase(
+        {
+            "simulations": [
+                {"id": SIM, "name": "Velgarien", "slug": "velgarien"},
+                {"id": OTHER_SIM, "name": "Speranza", "slug": "speranza"},
+            ],
+            "agents": [
+                {
+                    "id": "ag-1",
+                    "simulation_id": SIM,
+                    "name": "Ada",
+                    "age": 41,
+                    "deleted_at": None,
+                    "data": {"mood": "calm"},
+                },
+                {
+                    "id": "ag-2",
+                    "simulation_id": SIM,
+                    "name": "Bram",
+                    "age": 29,
+                    "deleted_at": None,
+                    "data": {"mood": "tense"},
+                },
+                {
+                    "id": "ag-3",
+                    "simulation_id": SIM,
+                    "name": "Cleo",
+                    "age": None,
+                    "deleted_at": "2026-01-01T00:00:00Z",
+                    "data": {},
+                },
+                {"id": "ag-4", "simulation_id": OTHER_SIM, "name": "Dax", "age": 35, "deleted_at": None, "data": {}},
+            ],
+            "agent_activities": [
+                {"id": "act-1", "agent_id": "ag-1", "simulation_id": SIM, "kind": "work"},
+                {"id": "act-2", "agent_id": "ag-1", "simulation_id": SIM, "kind": "rest"},
+            ],
+        }
+    )
+
+
+class TestSelect:
+    async def test_filters_order_range_and_count(self):
+        client = await _world().client()
+
+        resp = await (
+            client.table("agents")
+            .select("id, name", count="exact")
+            .eq("simulation_id", SIM)
+            .is_("deleted_at", "null")
+            .order("name", desc=True)
+            .range(0, 0)
+            .execute()
+        )
+
+        assert resp.data == [{"id": "ag-2", "name": "Bram"}]
+        assert resp.count == 2
+
+    async def test_in_gte_neq_ilike_and_or(self):
+        client = await _world().client()
+        agents = client.table("agents")
+
+        by_ids = await agents.select("id").in_("id", ["ag-1", "ag-4"]).execute()
+        older = await agents.select("id").gte("age", 35).order("age").execute()
+        not_sim = await agents.select("id").neq("simulation_id", SIM).execute()
+        like = await agents.select("id").ilike("name", "%R%").execute()
+        either = await agents.select("id").or_("name.eq.Ada,age.lt.30").order("id").execute()
+
+        assert [r["id"] for r in by_ids.data] == ["ag-1", "ag-4"]
+        assert [r["id"] for r in older.data] == ["ag-4", "ag-1"]
+        assert [r["id"] for r in not_sim.data] == ["ag-4"]
+        assert [r["id"] for r in like.data] == ["ag-2"]
+        assert [r["id"] for r in either.data] == ["ag-1", "ag-2"]
+
+    async def test_nulls_sort_last_ascending(self):
+        client = await _world().client()
+
+        resp = await client.table("agents").select("name").eq("simulation_id", SIM).order("age").execute()
+
+        assert [r["name"] for r in resp.data] == ["Bram", "Ada", "Cleo"]
+
+    async def test_embedded_relations(self):
+        client = await _world().client()
+
+        resp = await (
+            client.table("agents")
+            .select("name, mood:data->>mood, simulations(slug), agent_activities(count)")
+            .eq("id", "ag-1")
+            .single()
+            .execute()
+        )
+        activity = await (
+            client.table("agent_activities")
+            .select("kind, agents!agent_activities_agent_id_fkey(name)")
+            .eq("id", "act-2")
+            .execute()
+        )
+
+        assert resp.data == {
+            "name": "Ada",
+            "mood": "calm",
+            "simulations": {"slug": "velgarien"},
+            "agent_activities": [{"count": 2}],
+        }
+        assert activity.data == [{"kind": "rest", "agents": {"name": "Ada"}}]
+
+    async def test_inner_embed_drops_rows_without_children(self):
+        client = await _world().client()
+
+        resp = await client.table("agents").select("id, agent_activities!inner(kind)").execute()
+
+        assert [r["id"] for r in resp.data] == ["ag-1"]
+
+    async def test_single_and_maybe_single(self):
+        client = await _world().client()
+
+        missing = await client.table("agents").select("*").eq("id", "nope").maybe_single().execute()
+        with pytest.raises(APIError) as exc:
+            await client.table("agents").select("*").eq("id", "nope").single().execute()
+
+        assert missing is None
+        assert exc.value.code == "PGRST116"
+
+
+class TestWrites:
+    async def test_insert_generates_ids_and_rejects_duplicates(self):
+        fake = _world()
+        client = await fake.client()
+
+        resp = await client.table("agents").insert({"simulation_id": SIM, "name": "Eve"}).execute()
+        with pytest.raises(APIError) as exc:
+            await client.table("agents").insert({"id": "ag-1", "name": "Clash"}).execute()
+
+        UUID(resp.data[0]["id"])
+        assert len(fake.tables["agents"]) == 5
+        assert exc.value.code == "23505"
+
+    async def test_upsert_on_conflict(self):
+        fake = FakeSupabase(
+            {
+                "epoch_scores": [
+                    {"id": "s1", "epoch_id": "e", "simulation_id": SIM, "cycle_number": 1, "composite_score": 10}
+                ]
+            }
+        )
+        client = await fake.client()
+        key = "epoch_id,simulation_id,cycle_number"
+
+        await (
+            client.table("epoch_scores")
+            .upsert(
+                [
+                    {"epoch_id": "e", "simulation_id": SIM, "cycle_number": 1, "composite_score": 40},
+                    {"epoch_id": "e", "simulation_id": SIM, "cycle_number": 2, "composite_score": 55},
+                ],
+                on_conflict=key,
+            )
+            .execute()
+        )
+        await (
+            client.table("epoch_scores")
+            .upsert(
+                {"epoch_id": "e", "simulation_id": SIM, "cycle_number": 2, "composite_score": 0},
+                on_conflict=key,
+                ignore_duplicates=True,
+            )
+            .execute()
+        )
+
+        scores = {r["cycle_number"]: r["composite_score"] for r in fake.tables["epoch_scores"]}
+        assert scores == {1: 40, 2: 55}
+        assert fake.tables["epoch_scores"][0]["id"] == "s1"
+
+    async def test_update_and_delete(self):
+        fake = _world()
+        client = await fake.client()
+
+        updated = await client.table("agents").update({"age": 50}).eq("simulation_id", OTHER_SIM).execute()
+        await client.table("agent_activities").delete().eq("agent_id", "ag-1").eq("kind", "rest").execute()
+
+        assert updated.data[0]["age"] == 50
+        assert [r["id"] for r in fake.tables["agent_activities"]] == ["act-1"]
+
+
+class TestRpc:
+    async def test_unknown_rpc_is_pgrst202(self):
+        client = await FakeSupabase().client()
+
+        with pytest.raises(APIError) as exc:
+            await client.rpc("fn_missing", {}).execute()
+
+        assert exc.value.code == "PGRST202"
+
+    async def test_unknown_rpc_fallback(self):
+        calls = []
+        client = await FakeSupabase(unknown_rpc=lambda name, params: calls.append(name)).client()
+
+        resp = await client.rpc("fn_missing", {"p_id": 1}).execute()
+
+        assert resp.data is None
+        assert calls == ["fn_missing"]
+
+    async def test_custom_rpc(self):
+        fake = _world()
+
+        @fake.rpc("fn_count_agents")
+        def _count(db, params):
+            return sum(1 for a in db.tables["agents"] if a["simulation_id"] == params["p_sim"])
+
+        client = await fake.client()
+        resp = await client.rpc("fn_count_agents", {"p_sim": SIM}).execute()
+
+        assert resp.data == 3
+
+    async def test_heartbeat_event_aging(self):
+        fake = FakeSupabase(
+            {
+                "events": [
+                    {
+                        "id": "ev-1",
+                        "simulation_id": SIM,
+                        "title": "Riot",
+                        "event_status": "active",
+                        "ticks_in_status": 3,
+                        "heartbeat_pressure": 1.0,
+                        "deleted_at": None,
+                    },
+                    {
+                        "id": "ev-2",
+                        "simulation_id": SIM,
+                        "title": "Fair",
+                        "event_status": "resolved",
+                        "ticks_in_status": 0,
+                        "heartbeat_pressure": 0.5,
+                        "deleted_at": None,
+                    },
+                ],
+            }
+        )
+        client = await fake.client()
+
+        aged, escalated, _, entries = await HeartbeatService._phase_age_events(
+            client, UUID(SIM), 1, uuid4(), {"active_to_escalating": 4}
+        )
+
+        assert (aged, escalated) == (1, 1)
+        assert [e["entry_type"] for e in entries] == ["event_escalation"]
+        riot, fair = fake.tables["events"]
+        assert (riot["event_status"], riot["ticks_in_status"], riot["heartbeat_pressure"]) == ("escalating", 0, 1.3)
+        assert (fair["event_status"], fair["ticks_in_status"]) == ("resolved", 1)
+
+    async def test_cycle_scores_normalise_and_upsert(self):
+        epoch_id = uuid4()
+        fake = FakeSupabase(
+            {
+                "game_epochs": [{"id": str(epoch_id), "config": {}}],
+                "epoch_participants": [
+                    {"epoch_id": str(epoch_id), "simulation_id": SIM},
+                    {"epoch_id": str(epoch_id), "simulation_id": OTHER_SIM},
+                ],
+                "operative_missions": [
+                    {
+                        "epoch_id": str(epoch_id),
+                        "source_simulation_id": SIM,
+                        "target_simulation_id": OTHER_SIM,
+                        "operative_type": "saboteur",
+                        "status": "success",
+                    },
+                ],
+            }
+        )
+        client = await fake.client()
+
+        scores = await ScoringService.compute_cycle_scores(client, epoch_id, 1)
+        await ScoringService.compute_cycle_scores(client, epoch_id, 1)
+
+        by_sim = {s["simulation_id"]: s for s in scores}
+        assert by_sim[SIM]["military_score"] == 5
+        assert by_sim[OTHER_SIM]["stability_score"] == 44
+        assert by_sim[SIM]["composite_score"] > by_sim[OTHER_SIM]["composite_score"]
+        assert len(fake.tables["epoch_scores"]) == 2
+
+    async def test_memory_retrieval_ranks_by_importance_and_similarity(self):
+        fake = FakeSupabase(
+            {
+                "agent_memories": [
+                    {"id": "m1", "agent_id": "ag-1", "content": "dull", "importance": 2, "embedding": [0.0, 1.0]},
+                    {"id": "m2", "agent_id": "ag-1", "content": "vivid", "importance": 9, "embedding": [1.0, 0.0]},
+                    {"id": "m3", "agent_id": "ag-2", "content": "other", "importance": 10, "embedding": [1.0, 0.0]},
+                ],
+            }
+        )
+        client = await fake.client()
+
+        memories = await AgentMemoryService.retrieve(client, "ag-1", UUID(SIM), top_k=5)
+
+        assert [m["id"] for m in memories] == ["m2", "m1"]
+        assert all(m.get("last_accessed_at") for m in fake.tables["agent_memories"][:2])
+
+
+class TestLatencyAndInstrumentation:
+    async def test_round_trips_are_counted_and_delayed(self):
+        fake = FakeSupabase({"agents": [{"id": "a", "simulation_id": SIM}]}, latency_ms=20)
+        client = await fake.client()
+
+        started = time.perf_counter()
+        with track_calls() as stats:
+            await client.table("agents").select("*").execute()
+            await client.table("agents").update({"name": "x"}).eq("id", "a").execute()
+        elapsed = time.perf_counter() - started
+
+        assert stats.db_calls == fake.requests == 2
+        assert stats.db_rows == 2
+        assert elapsed >= 0.04
+
+    async def test_latency_callable_per_request(self):
+        seen = []
+        fake = FakeSupabase(latency_ms=lambda request: seen.append(request.method) or 0)
+        client = await fake.client()
+
+        await client.table("agents").select("*").execute()
+        await client.rpc("fn_age_events_batch", {"p_sim_id": SIM}).execute()
+
+        assert seen == ["GET", "POST"]
@@ -0,0 +1,115 @@
+"""Tests for the concurrent forge image pipeline — job limits, budget, billing abort."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import pytest
+
+from backend.services.external.replicate import ReplicateBillingError, ReplicateError
+from backend.services.forge_orchestrator_service import ForgeOrchestratorService, _ImageJob
+from backend.utils.memory_budget import MemoryBudget
+
+SIM_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def _job(name: str, run) -> _ImageJob:
+    return _ImageJob("agent", name, name, run)
+
+
+@pytest.fixture()
+def progress():
+    with patch.object(ForgeOrchestratorService, "_update_lore_progress", new_callable=AsyncMock) as update:
+        yield update
+
+
+class TestRunImageJobs:
+    async def test_jobs_overlap_up_to_the_concurrency_limit(self, progress):
+        running = 0
+        peak = 0
+
+        async def _generate():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        with patch("backend.services.forge_orchestrator_service.settings.forge_image_concurrency", 3):
+            result = await ForgeOrchestratorService._run_image_jobs(
+                None, SIM_ID, [_job(f"a{i}", _generate) for i in range(8)]
+            )
+
+        assert result == (8, 0)
+        assert peak == 3
+        last = progress.await_args.args[2]
+        assert last == {"phase": "images", "current": 8, "total": 8}
+
+    async def test_failures_are_counted_not_raised(self, progress):
+        async def _fail():
+            raise ReplicateError("nsfw filter")
+
+        result = await ForgeOrchestratorService._run_image_jobs(
+            None, SIM_ID, [_job("a", AsyncMock()), _job("b", _fail)]
+        )
+
+        assert result == (1, 1)
+
+    async def test_billing_error_cancels_remaining_jobs(self, progress):
+        finished: list[str] = []
+
+        async def _slow():
+            await asyncio.sleep(1)
+            finished.append("slow")
+
+        async def _billing():
+            raise ReplicateBillingError("insufficient credit")
+
+        with pytest.raises(ReplicateBillingError):
+            await ForgeOrchestratorService._run_image_jobs(None, SIM_ID, [_job("slow", _slow), _job("bill", _billing)])
+
+        assert finished == []
+
+
+class TestMemoryBudget:
+    async def test_reservations_never_exceed_the_limit(self):
+        budget = MemoryBudget(100)
+
+        async def _encode(size: int):
+            async with budget.reserve(size):
+                await asyncio.sleep(0.005)
+
+        await asyncio.gather(*(_encode(40) for _ in range(6)), _encode(500))
+
+        assert budget.peak <= 100
+        assert budget.in_use == 0
+
+
+class TestReferenceImage:
+    async def test_conversion_runs_off_the_event_loop(self):
+        from PIL import Image
+
+        from backend.services.forge_image_service import ForgeImageService
+
+        source = io.BytesIO()
+        Image.new("RGB", (8, 8), (10, 20, 30)).save(source, format="WEBP")
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+        convert = ForgeImageService._reference_png
+
+        def _record(data: bytes) -> io.BytesIO:
+            threads.append(threading.get_ident())
+            return convert(data)
+
+        with (
+            patch("backend.utils.safe_fetch.safe_download", AsyncMock(return_value=(source.getvalue(), "image/webp"))),
+            patch.object(ForgeImageService, "_reference_png", staticmethod(_record)),
+        ):
+            buf = await ForgeImageService._download_reference_image("https://example.test/ref.avif")
+
+        assert threads and threads[0] != loop_thread
+        assert (buf.name, buf.read(8)) == ("reference.png", b"\x89PNG\r\n\x1a\n")
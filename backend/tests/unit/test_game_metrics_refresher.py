@@ -0,0 +1,118 @@
+"""Tests for GameMetricsRefresher — coalesced game-metrics MV refresh."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.services.game_metrics_refresher import GameMetricsRefresher
+from backend.services.heartbeat_service import HeartbeatService
+
+
+class _FakeAdmin:
+    """Counts refresh_all_game_metrics calls; each call can be held open."""
+
+    def __init__(self, *, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self.release = asyncio.Event()
+        self.release.set()
+
+    def rpc(self, name: str, params: dict):
+        assert name == "refresh_all_game_metrics"
+        chain = MagicMock()
+
+        async def _execute():
+            self.calls += 1
+            await self.release.wait()
+            if self.fail:
+                raise RuntimeError("refresh failed")
+            return MagicMock(data=None)
+
+        chain.execute = _execute
+        return chain
+
+
+@pytest.fixture(autouse=True)
+def _reset_refresher():
+    GameMetricsRefresher.reset()
+    yield
+    GameMetricsRefresher.reset()
+
+
+class TestFlush:
+    async def test_nothing_dirty_skips_rpc(self):
+        admin = _FakeAdmin()
+        assert await GameMetricsRefresher.flush(admin) == 0
+        assert admin.calls == 0
+
+    async def test_many_dirty_sims_cost_one_refresh(self):
+        admin = _FakeAdmin()
+        for _ in range(5):
+            GameMetricsRefresher.mark_dirty(uuid4())
+
+        assert await GameMetricsRefresher.flush(admin) == 5
+        assert admin.calls == 1
+        assert GameMetricsRefresher.dirty_simulations() == frozenset()
+
+    async def test_failed_flush_keeps_sims_dirty(self):
+        sim_id = uuid4()
+        GameMetricsRefresher.mark_dirty(sim_id)
+
+        with pytest.raises(RuntimeError):
+            await GameMetricsRefresher.flush(_FakeAdmin(fail=True))
+
+        assert GameMetricsRefresher.dirty_simulations() == {str(sim_id)}
+
+
+class TestSingleFlightRefresh:
+    async def test_concurrent_callers_share_one_trailing_refresh(self):
+        admin = _FakeAdmin()
+        admin.release.clear()
+
+        first = asyncio.create_task(GameMetricsRefresher.refresh(admin))
+        await asyncio.sleep(0)  # first call is now inside the RPC
+        waiters = [asyncio.create_task(GameMetricsRefresher.refresh(admin)) for _ in range(4)]
+        await asyncio.sleep(0)
+        admin.release.set()
+
+        results = await asyncio.gather(first, *waiters)
+
+        # One in-flight run + exactly one trailing run covering all four waiters.
+        assert admin.calls == 2
+        assert results.count(True) == 2
+
+    async def test_sequential_callers_each_refresh(self):
+        admin = _FakeAdmin()
+        await GameMetricsRefresher.refresh(admin)
+        await GameMetricsRefresher.refresh(admin)
+        assert admin.calls == 2
+
+
+class TestHeartbeatCoalescing:
+    async def test_loop_refreshes_once_for_all_due_sims(self):
+        admin = MagicMock()
+        sims = [{"id": str(uuid4()), "name": f"S{i}", "next_heartbeat_at": None} for i in range(4)]
+        chain = MagicMock()
+        chain.select.return_value = chain
+        chain.eq.return_value = chain
+        chain.is_.return_value = chain
+        chain.execute = AsyncMock(return_value=MagicMock(data=sims))
+        admin.table.return_value = chain
+        fake = _FakeAdmin()
+        admin.rpc = fake.rpc
+
+        async def _tick(_admin, sim, _interval):
+            GameMetricsRefresher.mark_dirty(sim["id"])
+
+        with (
+            patch.object(HeartbeatService, "_tick_simulation", side_effect=_tick),
+            patch("backend.services.heartbeat_service.WeatherProvider.prefetch", new=AsyncMock(return_value=0)),
+        ):
+            await HeartbeatService._tick_due_simulations(admin, 3600)
+
+        assert fake.calls == 1
+        assert GameMetricsRefresher.dirty_simulations() == frozenset()
@@ -69,7 +69,7 @@ class TestAtomicRPCPaths:
 
     @pytest.mark.asyncio
     async def test_deploying_transition_calls_rpc(self):
-        """deploying → active must use fn_transition_mission_status RPC."""
+        """deploying → active must use the batched fn_transition_missions_batch RPC."""
         mission = {
             "id": str(MISSION_ID),
             "epoch_id": str(EPOCH_ID),
@@ -83,14 +83,14 @@ class TestAtomicRPCPaths:
         missions_chain = _mock_chain(execute=AsyncMock(return_value=MagicMock(data=[mission])))
         sb = _mock_supabase(
             table_map={"operative_missions": missions_chain},
-            rpc_map={"fn_transition_mission_status": rpc_chain},
+            rpc_map={"fn_transition_missions_batch": rpc_chain},
         )
 
         await OperativeMissionService.resolve_pending_missions(sb, EPOCH_ID)
 
         sb.rpc.assert_any_call(
-            "fn_transition_mission_status",
-            {"p_mission_id": str(MISSION_ID), "p_from_status": "deploying", "p_to_status": "active"},
+            "fn_transition_missions_batch",
+            {"p_mission_ids": [str(MISSION_ID)], "p_from_status": "deploying", "p_to_status": "active"},
         )
 
     @pytest.mark.asyncio
@@ -0,0 +1,131 @@
+"""Tests for heartbeat tick profiling — call counting scopes, phase records, percentiles."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from backend.services.heartbeat_profiler import aggregate_ticks, percentile
+from backend.services.heartbeat_service import _run_phase
+from backend.utils.call_stats import instrument_client, note_db_call, note_llm_call, track_calls
+
+SIM_ID = UUID("00000000-0000-0000-0000-000000000001")
+CTX = {"sim_id": SIM_ID, "tick_number": 7, "sim_name": "Velgarien"}
+
+
+class TestCallStats:
+    async def test_nested_scopes_and_spawned_tasks_count(self):
+        async def _child():
+            note_db_call(rows=3)
+
+        with track_calls() as outer:
+            note_llm_call()
+            with track_calls() as inner:
+                await asyncio.gather(_child(), _child())
+
+        assert (inner.db_calls, inner.db_rows, inner.llm_calls) == (2, 6, 0)
+        assert (outer.db_calls, outer.db_rows, outer.llm_calls) == (2, 6, 1)
+
+    async def test_postgrest_responses_counted_with_content_range_rows(self):
+        def _handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[], headers={"content-range": "0-24/*"})
+
+        session = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        client = instrument_client(SimpleNamespace(postgrest=SimpleNamespace(session=session)))
+        instrument_client(client)  # idempotent
+
+        with track_calls() as stats:
+            await session.get("https://db/rest/v1/agents")
+            await session.get("https://db/rest/v1/agents")
+        await session.get("https://db/rest/v1/agents")  # outside any scope
+        await session.aclose()
+
+        assert (stats.db_calls, stats.db_rows) == (2, 50)
+
+    async def test_transport_errors_are_counted_and_close_the_span(self):
+        def _handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("down", request=request)
+
+        session = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        instrument_client(SimpleNamespace(postgrest=SimpleNamespace(session=session)))
+        parent = MagicMock()
+
+        with (
+            patch("backend.utils.call_stats.sentry_sdk.get_current_span", return_value=parent),
+            track_calls() as stats,
+            pytest.raises(httpx.ConnectError),
+        ):
+            await session.get("https://db/rest/v1/agents?id=eq.1")
+        await session.aclose()
+
+        assert (stats.db_calls, stats.db_rows, dict(stats.tables)) == (1, 0, {"agents": 1})
+        span = parent.start_child.return_value
+        span.set_status.assert_called_once_with("internal_error")
+        span.finish.assert_called_once()
+
+
+class TestRunPhase:
+    async def test_records_timing_and_calls(self):
+        timings: list[dict] = []
+
+        async def _phase():
+            note_db_call(rows=4)
+            note_llm_call()
+            return "done"
+
+        assert await _run_phase("anchors", _phase(), **CTX, timings=timings) == "done"
+
+        assert timings == [
+            {"phase": "anchors", "ms": timings[0]["ms"], "ok": True, "db_calls": 1, "db_rows": 4, "llm_calls": 1}
+        ]
+
+    async def test_failed_phase_is_recorded_and_swallowed(self):
+        timings: list[dict] = []
+
+        async def _phase():
+            note_db_call()
+            raise ValueError("boom")
+
+        assert await _run_phase("weather", _phase(), **CTX, timings=timings) is None
+        assert timings[0]["ok"] is False
+        assert timings[0]["db_calls"] == 1
+
+
+class TestAggregate:
+    def test_nearest_rank_percentiles(self):
+        values = [float(v) for v in range(1, 101)]
+        assert (percentile(values, 50), percentile(values, 95)) == (50.0, 95.0)
+        assert percentile([7.0], 95) == 7.0
+
+    def test_per_phase_rollup(self):
+        profiles = [
+            {
+                "tick_ms": 100.0 * i,
+                "phases": [
+                    {"phase": "event_aging", "ms": 10.0 * i, "ok": True, "db_calls": 2, "db_rows": 10, "llm_calls": 0},
+                    {"phase": "autonomy", "ms": 50.0, "ok": i != 3, "db_calls": 8, "db_rows": 0, "llm_calls": 1},
+                ],
+            }
+            for i in range(1, 5)
+        ]
+        profiles.append({"phases": []})
+
+        result = aggregate_ticks(profiles)
+
+        assert (result["samples"], result["tick_p50_ms"], result["tick_p95_ms"]) == (4, 200.0, 400.0)
+        aging, autonomy = result["phases"]
+        assert (aging["phase"], aging["p50_ms"], aging["p95_ms"], aging["avg_db_calls"]) == (
+            "event_aging",
+            20.0,
+            40.0,
+            2.0,
+        )
+        assert (autonomy["failures"], autonomy["avg_llm_calls"]) == (1, 1.0)
+
+    def test_empty_window(self):
+        assert aggregate_ticks([]) == {"samples": 0, "tick_p50_ms": None, "tick_p95_ms": None, "phases": []}
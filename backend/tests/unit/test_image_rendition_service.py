@@ -0,0 +1,109 @@
+"""Tests for single-decode multi-rendition encoding and parallel rendition uploads."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+from PIL import Image
+
+from backend.services import image_rendition_service as renditions
+from backend.services.forge_image_service import ForgeImageService
+from backend.services.image_rendition_service import Rendition
+
+
+def _png_bytes(size: tuple[int, int] = (240, 160), mode: str = "RGBA") -> bytes:
+    buf = io.BytesIO()
+    Image.new(mode, size, (120, 40, 200, 255)[: len(mode)]).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _open(data: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(data))
+
+
+@pytest.fixture(autouse=True)
+def _thread_mode(monkeypatch):
+    monkeypatch.setattr(renditions.settings, "image_encode_workers", 0)
+    renditions.reset_encode_stats()
+    yield
+    renditions.shutdown_encode_pool()
+
+
+class TestEncode:
+    async def test_decodes_once_for_all_renditions(self):
+        specs = (
+            Rendition("full", ".full.avif", None),
+            Rendition("thumb", ".avif", 60, quality=80),
+            Rendition("thumb_webp", ".webp", 60, format="WEBP", quality=80),
+        )
+        real_open = Image.open
+
+        with patch("PIL.Image.open", side_effect=real_open) as opened:
+            encoded = await renditions.encode(_png_bytes(), specs)
+
+        assert opened.call_count == 1
+        assert [(_open(e.data).format, _open(e.data).size) for e in encoded] == [
+            ("AVIF", (240, 160)),
+            ("AVIF", (60, 40)),
+            ("WEBP", (60, 40)),
+        ]
+        assert all(e.encode_ms >= 0 for e in encoded)
+
+    async def test_records_per_rendition_stats(self):
+        await renditions.encode(_png_bytes())
+        await renditions.encode(_png_bytes((2000, 1000)))
+
+        stats = renditions.encode_stats()
+        assert set(stats) == {"full.avif", "thumb.avif"}
+        assert stats["thumb.avif"]["count"] == 2
+        assert _open((await renditions.encode(_png_bytes((2000, 1000))))[1].data).size == (1024, 512)
+
+    async def test_round_trips_through_worker_process(self, monkeypatch):
+        monkeypatch.setattr(renditions.settings, "image_encode_workers", 1)
+
+        full, thumb = await renditions.encode(_png_bytes((1600, 800)))
+
+        assert (_open(full.data).size, _open(thumb.data).size) == ((1600, 800), (1024, 512))
+        assert renditions.get_encode_pool() is not None
+
+    def test_paths_and_content_types(self):
+        full, thumb = renditions.DUAL_AVIF
+        webp = Rendition("thumb_webp", ".webp", 1024, format="WEBP")
+
+        assert full.path_for("sim/agents/x.avif") == "sim/agents/x.full.avif"
+        assert thumb.path_for("sim/agents/x.avif") == "sim/agents/x.avif"
+        assert (webp.path_for("sim/agents/x.avif"), webp.content_type) == ("sim/agents/x.webp", "image/webp")
+
+
+class TestForgeUpload:
+    async def test_renditions_upload_concurrently(self):
+        in_flight = 0
+        peak = 0
+        uploaded: dict[str, str] = {}
+
+        async def _upload(path, data, options):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            uploaded[path] = options["content-type"]
+
+        async def _url(path):
+            return f"https://cdn.example.com/{path}"
+
+        supabase = MagicMock()
+        bucket = supabase.storage.from_.return_value
+        bucket.upload.side_effect = _upload
+        bucket.get_public_url.side_effect = _url
+        service = ForgeImageService(supabase, UUID("00000000-0000-0000-0000-000000000001"), replicate_api_key="r8_test")
+
+        url = await service._upload_dual_resolution("simulation.assets", "sim/agents/a.avif", _png_bytes())
+
+        assert url == "https://cdn.example.com/sim/agents/a.avif"
+        assert uploaded == {"sim/agents/a.full.avif": "image/avif", "sim/agents/a.avif": "image/avif"}
+        assert peak == 2
@@ -16,6 +16,13 @@ from unittest.mock import MagicMock
 import pytest
 from PIL import Image
 
+from backend.services.instagram_image_helpers import (
+    LayerCache,
+    add_noise_grain,
+    bleach_bypass,
+    grain_layer,
+    vignette_layer,
+)
 from backend.services.instagram_image_service import (
     IG_HEIGHT_PORTRAIT,
     IG_HEIGHT_STORY,
@@ -245,6 +252,87 @@ class TestAddNoiseGrain:
         assert np.array_equal(np.array(img), np.array(result))
 
 
+class TestNoiseGrainLayer:
+    def test_rgb_bands_shift_equally_and_alpha_untouched(self):
+        import numpy as np
+
+        img = Image.new("RGBA", (120, 90), (100, 100, 100, 200))
+        arr = np.asarray(add_noise_grain(img, sigma=15, opacity=0.5)).astype(int)
+        assert (arr[:, :, 0] == arr[:, :, 1]).all()
+        assert (arr[:, :, 0] == arr[:, :, 2]).all()
+        assert (arr[:, :, 3] == 200).all()
+        assert arr[:, :, 0].std() > 0
+
+    def test_clips_instead_of_wrapping(self):
+        import numpy as np
+
+        white = np.asarray(add_noise_grain(Image.new("RGB", (80, 80), (255, 255, 255)), sigma=40, opacity=1.0))
+        black = np.asarray(add_noise_grain(Image.new("RGB", (80, 80), (0, 0, 0)), sigma=40, opacity=1.0))
+        # Wrapping would produce dark pixels on white and bright pixels on black.
+        assert white.min() > 100
+        assert black.max() < 155
+
+
+class TestBleachBypassLut:
+    @staticmethod
+    def _reference(img, desaturation=0.6, contrast_boost=1.3, highlight_rolloff=0.88):
+        """Original full-image float32 implementation."""
+        import numpy as np
+        from PIL import ImageEnhance
+
+        work = img.convert("RGB")
+        work = ImageEnhance.Color(work).enhance(desaturation)
+        work = ImageEnhance.Contrast(work).enhance(contrast_boost)
+        arr = np.array(work).astype(np.float32) / 255.0
+        arr = np.where(arr > highlight_rolloff, highlight_rolloff + (arr - highlight_rolloff) * 0.3, arr)
+        shadow_mask = arr.mean(axis=2, keepdims=True) < 0.25
+        arr[:, :, 2] = np.where(shadow_mask[:, :, 0], arr[:, :, 2] + 0.025, arr[:, :, 2])
+        return np.clip(arr * 255, 0, 255).astype(np.uint8)
+
+    @pytest.mark.parametrize("rolloff", [0.88, 0.90])
+    def test_matches_float_reference_bit_for_bit(self, rolloff):
+        import numpy as np
+
+        rng = np.random.default_rng(7)
+        img = Image.fromarray(rng.integers(0, 256, (64, 96, 4), dtype=np.uint8), "RGBA")
+        result = bleach_bypass(img, highlight_rolloff=rolloff)
+
+        assert result.mode == "RGBA"
+        assert np.array_equal(np.asarray(result)[:, :, :3], self._reference(img, highlight_rolloff=rolloff))
+        assert np.array_equal(np.asarray(result)[:, :, 3], np.asarray(img)[:, :, 3])
+
+
+class TestLayerCache:
+    def test_hit_returns_shared_layer(self):
+        cache = LayerCache(max_bytes=10_000)
+        built = []
+
+        def build():
+            built.append(1)
+            return Image.new("L", (10, 10))
+
+        assert cache.get(("k",), build) is cache.get(("k",), build)
+        assert len(built) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_evicts_least_recently_used_over_byte_budget(self):
+        cache = LayerCache(max_bytes=250)  # room for two 10x10 "L" layers
+        a = cache.get(("a",), lambda: Image.new("L", (10, 10)))
+        cache.get(("b",), lambda: Image.new("L", (10, 10)))
+        cache.get(("a",), lambda: Image.new("L", (10, 10)))  # refresh a
+        cache.get(("c",), lambda: Image.new("L", (10, 10)))
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert cache.get(("a",), lambda: Image.new("L", (10, 10))) is a
+        assert cache.stats()["misses"] == 3  # a, b, c — a was not rebuilt
+
+    def test_keys_include_params(self):
+        assert vignette_layer(40, 20, 0.5) is not vignette_layer(40, 20, 0.3)
+        assert grain_layer(40, 20, 12, 0.05) is grain_layer(40, 20, 12, 0.05)
+
+
 class TestAddBokehDots:
     def test_does_not_change_dimensions(self):
         img = Image.new("RGBA", (200, 200), (10, 12, 18, 255))
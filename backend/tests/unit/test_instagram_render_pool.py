@@ -0,0 +1,143 @@
+"""Unit tests for the off-loop Instagram render pool and static layer cache."""
+
+from __future__ import annotations
+
+import io
+from concurrent.futures.process import BrokenProcessPool
+
+import httpx
+import pytest
+from httpx import ASGITransport
+from PIL import Image
+
+from backend.app import app
+from backend.dependencies import get_current_user
+from backend.models.common import CurrentUser
+from backend.services import instagram_image_helpers as helpers
+from backend.services import instagram_render_pool as pool
+from backend.services.instagram_image_service import IG_HEIGHT_PORTRAIT, IG_HEIGHT_STORY, IG_WIDTH
+from backend.tests.conftest import MOCK_ADMIN_EMAIL, MOCK_USER_ID
+
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+DETECTION_KWARGS = {
+    "archetype": "The Tower",
+    "signature": "tower",
+    "magnitude": 0.7,
+    "accent_hex": "#4a90d9",
+}
+
+
+def _png_bytes(color: tuple[int, int, int] = (40, 40, 60)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (IG_WIDTH, IG_HEIGHT_PORTRAIT), color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _size(data: bytes) -> tuple[int, int]:
+    return Image.open(io.BytesIO(data)).size
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool(monkeypatch):
+    monkeypatch.setattr(pool.settings, "instagram_render_workers", 0)
+    pool.reset_render_stats()
+    yield
+    pool.shutdown_render_pool()
+    pool.reset_render_stats()
+
+
+class TestRenderThreadMode:
+    async def test_story_job_renders_and_records_stats(self):
+        result = await pool.render("story_detection", **DETECTION_KWARGS)
+
+        assert result[:3] == JPEG_MAGIC
+        assert _size(result) == (IG_WIDTH, IG_HEIGHT_STORY)
+        stats = pool.render_stats()["story_detection"]
+        assert stats["count"] == 1
+        assert stats["failures"] == 0
+        assert stats["render_ms_avg"] > 0
+
+    async def test_unknown_job_raises_and_counts_failure(self):
+        with pytest.raises(ValueError, match="Unknown render job"):
+            await pool.render("story_nonexistent")
+        assert pool.render_stats()["story_nonexistent"]["failures"] == 1
+
+    async def test_stats_are_served_to_platform_admins(self):
+        with pytest.raises(ValueError):
+            await pool.render("story_nonexistent")
+        admin = CurrentUser(id=MOCK_USER_ID, email=MOCK_ADMIN_EMAIL, access_token="mock-token")
+        app.dependency_overrides[get_current_user] = lambda: admin
+        try:
+            async with httpx.AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as http:
+                resp = await http.get("/api/v1/admin/ops/render-stats")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert resp.status_code == 200
+        assert resp.json()["data"]["instagram"]["story_nonexistent"]["failures"] == 1
+
+    async def test_broken_pool_falls_back_to_thread(self, monkeypatch):
+        class _BrokenPool:
+            shut_down = False
+
+            def submit(self, *_a, **_kw):
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, **_kw):
+                self.shut_down = True
+
+        broken = _BrokenPool()
+        monkeypatch.setattr(pool, "_pool", broken)
+        monkeypatch.setattr(pool.settings, "instagram_render_workers", 1)
+
+        result = await pool.render("story_detection", **DETECTION_KWARGS)
+
+        assert result[:3] == JPEG_MAGIC
+        assert broken.shut_down
+        assert pool._pool is None
+
+
+class TestRenderProcessMode:
+    async def test_overlay_job_round_trips_through_worker_process(self, monkeypatch):
+        monkeypatch.setattr(pool.settings, "instagram_render_workers", 1)
+
+        result = await pool.render(
+            "overlay",
+            image_bytes=_png_bytes(),
+            title="PERSONNEL FILE — Agent Voss",
+            subtitle="SHARD: Velgarien",
+            color_primary="#e2e8f0",
+            color_background="#0f172a",
+            classification="PUBLIC",
+        )
+
+        assert _size(result) == (IG_WIDTH, IG_HEIGHT_PORTRAIT)
+        assert pool.get_render_pool() is not None
+
+
+class TestStaticLayerCache:
+    def test_layers_are_shared_per_size_and_palette(self):
+        helpers.clear_layer_caches()
+        assert helpers.vignette_layer(64, 32, 0.5) is helpers.vignette_layer(64, 32, 0.5)
+        assert helpers.scan_line_layer(64, 32, (1, 2, 3), 4, 18) is not helpers.scan_line_layer(
+            64, 32, (3, 2, 1), 4, 18
+        )
+
+    def test_story_render_does_not_mutate_cached_gradient(self):
+        from backend.services.instagram_story_composer import StoryComposer
+
+        accent = helpers.hex_to_rgb(DETECTION_KWARGS["accent_hex"])
+        layer = helpers.gradient_layer(IG_WIDTH, IG_HEIGHT_STORY, (*accent, 50), (0, 0, 0, 255))
+        before = layer.tobytes()
+
+        StoryComposer().compose_story_detection(**DETECTION_KWARGS)
+
+        assert layer.tobytes() == before
+
+    def test_scan_lines_match_uncached_rendering(self):
+        img = Image.new("RGBA", (40, 20), (10, 12, 18, 255))
+        helpers.draw_scan_lines_rgba(img, (200, 100, 50), spacing=4, alpha=60)
+
+        assert img.getpixel((5, 0)) != (10, 12, 18, 255)
+        assert img.getpixel((5, 1)) == (10, 12, 18, 255)
@@ -0,0 +1,158 @@
+"""Tests for MultiverseGraph — adjacency, weights, incremental updates."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.services import multiverse_graph as graph_module
+from backend.services.game_metrics_refresher import GameMetricsRefresher
+from backend.services.multiverse_graph import MultiverseGraph
+
+A, B, C, D = "sim-a", "sim-b", "sim-c", "sim-d"
+
+
+def _conn(conn_id: str, a: str, b: str, strength: float = 0.5, **extra) -> dict:
+    return {
+        "id": conn_id,
+        "simulation_a_id": a,
+        "simulation_b_id": b,
+        "strength": strength,
+        "is_active": True,
+        "bleed_vectors": ["memory"],
+        "created_at": f"2026-01-0{conn_id[-1]}T00:00:00Z",
+        "simulation_a": {"id": a, "name": a.upper()},
+        "simulation_b": {"id": b, "name": b.upper()},
+        **extra,
+    }
+
+
+class _GraphDB:
+    """Returns each table's rows regardless of filters; counts round trips."""
+
+    def __init__(self, tables: dict[str, list[dict]]):
+        self.tables = tables
+        self.round_trips = 0
+
+    def table(self, name: str):
+        builder = MagicMock()
+        builder.select.return_value = builder
+        builder.eq.return_value = builder
+        builder.order.return_value = builder
+
+        async def _execute():
+            self.round_trips += 1
+            return MagicMock(data=list(self.tables.get(name, [])))
+
+        builder.execute = _execute
+        return builder
+
+
+@pytest.fixture()
+def db():
+    return _GraphDB(
+        {
+            "simulation_connections": [
+                _conn("c1", A, B, 0.8),
+                _conn("c2", B, C, 0.5),
+                _conn("c3", C, A, 0.1),
+            ],
+            "mv_simulation_health": [
+                {"simulation_id": A, "overall_health": 0.5},
+                {"simulation_id": B, "overall_health": 1.0},
+            ],
+            "mv_embassy_effectiveness": [
+                {"simulation_a_id": B, "simulation_b_id": A, "effectiveness": 0.4},
+                {"simulation_a_id": A, "simulation_b_id": B, "effectiveness": 0.9},
+            ],
+        }
+    )
+
+
+class TestLoading:
+    async def test_neighbors_cover_both_directions(self, db):
+        edges = await MultiverseGraph.neighbors(db, A)
+
+        assert {e.target for e in edges} == {B, C}
+        ab = next(e for e in edges if e.target == B)
+        assert ab.strength == 0.8
+        assert ab.embassy_effectiveness == 0.9  # best of both embassy rows
+        assert ab.bleed_vectors == ["memory"]
+
+    async def test_queries_after_load_skip_the_db(self, db):
+        await MultiverseGraph.neighbors(db, A)
+        trips = db.round_trips
+
+        await MultiverseGraph.neighbors(db, B)
+        await MultiverseGraph.instability(db, A)
+        await MultiverseGraph.connections_among(db, {A, B})
+
+        assert trips == 3
+        assert db.round_trips == trips
+
+    async def test_expired_index_reloads(self, db, monkeypatch):
+        await MultiverseGraph.neighbors(db, A)
+        monkeypatch.setattr(graph_module, "_TTL_SECONDS", 0.0)
+        await MultiverseGraph.neighbors(db, A)
+        assert db.round_trips == 6
+
+    async def test_instability_defaults(self, db):
+        assert await MultiverseGraph.instability(db, A) == 0.5
+        assert await MultiverseGraph.instability(db, B) == 0.0
+        assert await MultiverseGraph.instability(db, D) == 0.0
+
+
+class TestIncrementalUpdates:
+    async def test_deactivated_connection_is_unlinked(self, db):
+        await MultiverseGraph.neighbors(db, A)
+        MultiverseGraph.upsert_connection({**_conn("c1", A, B), "is_active": False})
+
+        assert {e.target for e in await MultiverseGraph.neighbors(db, A)} == {C}
+        assert db.round_trips == 3
+
+    async def test_update_keeps_joined_summaries(self, db):
+        await MultiverseGraph.neighbors(db, A)
+        MultiverseGraph.upsert_connection(
+            {"id": "c1", "simulation_a_id": A, "simulation_b_id": B, "strength": 0.2, "is_active": True}
+        )
+
+        rows = await MultiverseGraph.connections_among(db, {A, B})
+        assert rows[0]["strength"] == 0.2
+        assert rows[0]["simulation_a"] == {"id": A, "name": "SIM-A"}
+        assert db.round_trips == 3
+
+    async def test_new_connection_without_joins_reloads(self, db):
+        await MultiverseGraph.neighbors(db, A)
+        MultiverseGraph.upsert_connection({"id": "c9", "simulation_a_id": A, "simulation_b_id": D, "strength": 0.3})
+
+        await MultiverseGraph.neighbors(db, A)
+        assert db.round_trips == 4  # connections only — weights still fresh
+
+    async def test_remove_connection(self, db):
+        await MultiverseGraph.neighbors(db, A)
+        MultiverseGraph.remove_connection("c2")
+
+        assert {e.target for e in await MultiverseGraph.neighbors(db, B)} == {A}
+
+    async def test_metrics_refresh_reloads_weights_only(self, db):
+        await MultiverseGraph.neighbors(db, A)
+        GameMetricsRefresher.reset()
+        admin = MagicMock()
+        admin.rpc.return_value.execute = AsyncMock()
+        db.tables["mv_embassy_effectiveness"] = []
+
+        await GameMetricsRefresher.refresh(admin)
+        edges = await MultiverseGraph.neighbors(db, A)
+
+        assert db.round_trips == 5
+        assert all(e.embassy_effectiveness == 0.0 for e in edges)
+
+
+class TestConnectionsAmong:
+    async def test_filters_to_both_endpoints_in_order(self, db):
+        rows = await MultiverseGraph.connections_among(db, {A, B, C})
+        assert [r["id"] for r in rows] == ["c1", "c2", "c3"]
+
+        rows = await MultiverseGraph.connections_among(db, {A, B})
+        assert [r["id"] for r in rows] == ["c1"]
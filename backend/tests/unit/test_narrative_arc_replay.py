@@ -0,0 +1,458 @@
+"""Deterministic replay harness for NarrativeArcService.
+
+Replays a recorded ten-tick history (events appearing, escalating and
+resolving; cascade rules on and off cooldown; a convergence pair; a scarring
+resolution) against an in-memory PostgREST fake, with uuid4 and the clock
+pinned. The chronicle entries and the final ``narrative_arcs`` table are
+compared against a golden trace recorded from the per-arc/per-rule query
+implementation, so any change to detection semantics shows up as a diff.
+
+The same harness counts round trips: a tick costs a constant number of
+queries no matter how many arcs and cascade rules a simulation has.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from backend.services import narrative_arc_service as nas
+from backend.services.narrative_arc_service import NarrativeArcService
+
+SIM_ID = UUID("00000000-0000-0000-0000-0000000000aa")
+HEARTBEAT_ID = UUID("00000000-0000-0000-0000-0000000000bb")
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+CONFIG = {"escalation_threshold": 3, "cascade_pressure_trigger": 0.6}
+
+
+# ── In-memory PostgREST fake ─────────────────────────────────────────────
+
+
+class _Query:
+    def __init__(self, db: _ArcDB, table: str):
+        self._db = db
+        self._table = table
+        self._filters: list = []
+        self._op = "select"
+        self._payload = None
+        self._limit: int | None = None
+        self._order: tuple[str, bool] | None = None
+
+    # Builders
+    def select(self, *_a, **_kw):
+        return self
+
+    def insert(self, payload):
+        self._op, self._payload = "insert", payload
+        return self
+
+    def update(self, payload):
+        self._op, self._payload = "update", payload
+        return self
+
+    def upsert(self, payload, **_kw):
+        self._op, self._payload = "upsert", payload
+        return self
+
+    def eq(self, col, val):
+        self._filters.append(lambda r: r.get(col) == val)
+        return self
+
+    def in_(self, col, vals):
+        self._filters.append(lambda r: r.get(col) in vals)
+        return self
+
+    def is_(self, col, val):
+        assert val == "null"
+        self._filters.append(lambda r: r.get(col) is None)
+        return self
+
+    def gte(self, col, val):
+        self._filters.append(lambda r: r.get(col) is not None and float(r[col]) >= val)
+        return self
+
+    def contains(self, col, vals):
+        self._filters.append(lambda r: set(vals) <= set(r.get(col) or []))
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def order(self, col, desc=False):
+        self._order = (col, desc)
+        return self
+
+    async def execute(self):
+        self._db.round_trips += 1
+        rows = self._db.tables.setdefault(self._table, [])
+        resp = MagicMock()
+        if self._op == "insert":
+            new = self._payload if isinstance(self._payload, list) else [self._payload]
+            rows.extend(copy.deepcopy(new))
+            resp.data = new
+            return resp
+        if self._op == "upsert":
+            by_id = {r["id"]: r for r in rows}
+            for row in self._payload if isinstance(self._payload, list) else [self._payload]:
+                if row["id"] in by_id:
+                    by_id[row["id"]].update(copy.deepcopy(row))
+                else:
+                    rows.append(copy.deepcopy(row))
+            resp.data = self._payload
+            return resp
+        matched = [r for r in rows if all(f(r) for f in self._filters)]
+        if self._op == "update":
+            for r in matched:
+                r.update(copy.deepcopy(self._payload))
+        if self._order:
+            col, desc = self._order
+            matched = sorted(matched, key=lambda r: r[col], reverse=desc)
+        if self._limit is not None:
+            matched = matched[: self._limit]
+        resp.data = copy.deepcopy(matched)
+        return resp
+
+
+class _ArcDB:
+    def __init__(self, tables: dict[str, list[dict]]):
+        self.tables = copy.deepcopy(tables)
+        self.round_trips = 0
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+
+# ── Recorded history ─────────────────────────────────────────────────────
+
+
+def _event(n: int, tag: str, first_tick: int, last_tick: int) -> dict:
+    return {"id": f"ev-{n}", "title": f"Event {n}", "tags": [tag], "first": first_tick, "last": last_tick}
+
+
+# (event, first tick active, last tick active)
+_HISTORY = [
+    *(_event(i, "economic_tremor", 1, 10) for i in range(5)),
+    *(_event(10 + i, "conflict_wave", 2, 4) for i in range(3)),
+    _event(20, "decay_bloom", 1, 10),
+]
+
+_RULES = [
+    {
+        "id": "rule-econ-conflict",
+        "source_signature": "economic_tremor",
+        "target_signature": "conflict_wave",
+        "transfer_rate": 0.5,
+        "cooldown_hours": 72,
+        "depth_cap": 5,
+        "is_active": True,
+        "last_triggered_at": None,
+        "narrative_en": "Markets ignite unrest",
+        "narrative_de": "Maerkte entzuenden Unruhen",
+    },
+    {
+        "id": "rule-econ-authority",
+        "source_signature": "economic_tremor",
+        "target_signature": "authority_fracture",
+        "transfer_rate": 0.4,
+        "cooldown_hours": 72,
+        "depth_cap": 5,
+        "is_active": True,
+        "last_triggered_at": "2026-10-18T12:00:00+00:00",  # still cooling down
+        "narrative_en": "Markets topple ministers",
+        "narrative_de": "Maerkte stuerzen Minister",
+    },
+    {
+        "id": "rule-conflict-decay",
+        "source_signature": "conflict_wave",
+        "target_signature": "decay_bloom",
+        "transfer_rate": 0.6,
+        "cooldown_hours": 72,
+        "depth_cap": 5,
+        "is_active": True,
+        "last_triggered_at": None,
+        "narrative_en": "War rots the districts",
+        "narrative_de": "Krieg zersetzt die Bezirke",
+    },
+]
+
+
+def _arc(arc_id: str, **fields) -> dict:
+    row = {
+        "id": arc_id,
+        "simulation_id": str(SIM_ID),
+        "arc_type": "escalation",
+        "primary_signature": "innovation_spark",
+        "secondary_signature": None,
+        "primary_archetype": None,
+        "secondary_archetype": None,
+        "status": "active",
+        "pressure": 0.3,
+        "peak_pressure": 0.3,
+        "started_at_tick": 0,
+        "last_active_tick": 0,
+        "ticks_active": 3,
+        "climax_start_tick": None,
+        "source_event_ids": [],
+        "scar_tissue_deposited": 0.0,
+    }
+    row.update(fields)
+    return row
+
+
+_SEED_ARCS = [
+    _arc("arc-tower", primary_signature="authority_fracture", primary_archetype="The Tower"),
+    _arc("arc-shadow", primary_signature="consciousness_drift", primary_archetype="The Shadow"),
+    _arc(
+        "arc-fading",
+        primary_signature="elemental_surge",
+        status="resolving",
+        pressure=0.15,
+        peak_pressure=0.7,
+        source_event_ids=["old-1", "old-2"],
+    ),
+]
+
+_SEED = {
+    "narrative_arcs": _SEED_ARCS,
+    "resonance_cascade_rules": _RULES,
+    "platform_settings": [
+        {
+            "setting_key": "heartbeat_convergence_pairs",
+            "setting_value": {
+                "Tower+Shadow": {"name": "The Long Night", "effects": {"stability": -0.1}},
+                "Tower+Deluge": {"name": "Flood Tide", "effects": {"stability": -0.2}},
+            },
+        }
+    ],
+    "event_zone_links": [
+        {"event_id": "old-1", "zone_id": "zone-1"},
+        {"event_id": "old-2", "zone_id": "zone-1"},
+        {"event_id": "old-2", "zone_id": "zone-2"},
+    ],
+    "zones": [
+        {"id": "zone-1", "description": "Harbour district."},
+        {"id": "zone-2", "description": None},
+    ],
+    "simulation_lore": [{"simulation_id": str(SIM_ID), "sort_order": 4}],
+}
+
+
+def _events_at(tick: int) -> list[dict]:
+    return [
+        {
+            "id": e["id"],
+            "title": e["title"],
+            "tags": e["tags"],
+            "simulation_id": str(SIM_ID),
+            "deleted_at": None,
+            "event_status": "active",
+        }
+        for e in _HISTORY
+        if e["first"] <= tick <= e["last"]
+    ]
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+@pytest.fixture()
+def pinned(monkeypatch):
+    counter = itertools.count(1)
+    monkeypatch.setattr(nas, "uuid4", lambda: UUID(int=next(counter)))
+    monkeypatch.setattr(nas, "datetime", _FrozenDatetime)
+
+
+async def _replay(db: _ArcDB, ticks: range) -> list[tuple]:
+    trace: list[tuple] = []
+    for tick in ticks:
+        db.tables["events"] = _events_at(tick)
+        entries, spawned, converged = await NarrativeArcService.detect_and_advance(
+            db, SIM_ID, tick, HEARTBEAT_ID, CONFIG
+        )
+        trace.append(
+            (
+                tick,
+                spawned,
+                converged,
+                [
+                    (
+                        e["entry_type"],
+                        e["severity"],
+                        e["metadata"].get("arc_id"),
+                        e["metadata"].get("pressure"),
+                    )
+                    for e in entries
+                ],
+            )
+        )
+    return trace
+
+
+def _arc_table(db: _ArcDB) -> list[tuple]:
+    return sorted(
+        (
+            a["id"],
+            a["arc_type"],
+            a.get("primary_signature"),
+            a.get("secondary_signature"),
+            a["status"],
+            float(a["pressure"]),
+            float(a["peak_pressure"]),
+            a["ticks_active"],
+            a.get("climax_start_tick"),
+        )
+        for a in db.tables["narrative_arcs"]
+    )
+
+
+# ── Golden trace ─────────────────────────────────────────────────────────
+
+# Recorded from the per-arc/per-rule query implementation (uuid4 counter, frozen clock).
+GOLDEN_TRACE = [
+    (
+        1,
+        0,
+        True,
+        [
+            ("narrative_arc", "warning", "00000000-0000-0000-0000-000000000001", 0.3),
+            ("convergence", "critical", "00000000-0000-0000-0000-000000000002", None),
+        ],
+    ),
+    (
+        2,
+        0,
+        False,
+        [
+            ("narrative_arc", "positive", "arc-fading", None),
+            ("narrative_arc", "warning", "00000000-0000-0000-0000-000000000001", None),
+            ("narrative_arc", "warning", "00000000-0000-0000-0000-000000000003", 0.1),
+        ],
+    ),
+    (
+        3,
+        1,
+        False,
+        [
+            ("narrative_arc", "warning", "00000000-0000-0000-0000-000000000003", None),
+            ("cascade_spawn", "critical", "00000000-0000-0000-0000-000000000004", 0.3),
+        ],
+    ),
+    (
+        4,
+        0,
+        False,
+        [
+            ("narrative_arc", "critical", "00000000-0000-0000-0000-000000000001", 0.9),
+            ("narrative_arc", "warning", "00000000-0000-0000-0000-000000000004", None),
+        ],
+    ),
+    (5, 0, False, []),
+    (6, 0, False, [("narrative_arc", "warning", "00000000-0000-0000-0000-000000000005", 0.3)]),
+    (7, 0, False, [("narrative_arc", "warning", "00000000-0000-0000-0000-000000000005", None)]),
+    (8, 0, False, []),
+    (9, 0, False, [("narrative_arc", "critical", "00000000-0000-0000-0000-000000000005", 0.9)]),
+    (10, 0, False, []),
+]
+GOLDEN_ARCS = [
+    ("00000000-0000-0000-0000-000000000001", "escalation", "economic_tremor", None, "resolving", 0.1729, 0.9, 10, 4),
+    ("00000000-0000-0000-0000-000000000002", "convergence", None, None, "active", 0.5, 0.5, 10, None),
+    ("00000000-0000-0000-0000-000000000003", "escalation", "conflict_wave", None, "active", 0.2, 0.2, 9, None),
+    (
+        "00000000-0000-0000-0000-000000000004",
+        "cascade",
+        "economic_tremor",
+        "conflict_wave",
+        "active",
+        0.3,
+        0.3,
+        8,
+        None,
+    ),
+    ("00000000-0000-0000-0000-000000000005", "escalation", "economic_tremor", None, "climax", 0.9, 0.9, 5, 9),
+    ("arc-fading", "escalation", "elemental_surge", None, "resolved", 0.0735, 0.7, 5, None),
+    ("arc-shadow", "escalation", "consciousness_drift", None, "active", 0.3, 0.3, 13, None),
+    ("arc-tower", "escalation", "authority_fracture", None, "active", 0.3, 0.3, 13, None),
+]
+
+
+class TestReplay:
+    async def test_history_matches_golden_trace(self, pinned):
+        db = _ArcDB(_SEED)
+        trace = await _replay(db, range(1, 11))
+
+        assert trace == GOLDEN_TRACE
+        assert _arc_table(db) == GOLDEN_ARCS
+
+    async def test_side_effects_match_history(self, pinned):
+        db = _ArcDB(_SEED)
+        await _replay(db, range(1, 11))
+
+        zones = {z["id"]: z["description"] for z in db.tables["zones"]}
+        scar = " The district still bears marks of the escalation of elemental_surge."
+        assert zones == {"zone-1": "Harbour district." + scar, "zone-2": scar}
+
+        lore = db.tables["simulation_lore"]
+        assert [(row["sort_order"], row.get("title")) for row in lore] == [(4, None), (5, "The Long Night")]
+
+        cooldowns = {r["id"]: r["last_triggered_at"] for r in db.tables["resonance_cascade_rules"]}
+        assert cooldowns == {
+            "rule-econ-conflict": NOW.isoformat(),
+            "rule-econ-authority": "2026-10-18T12:00:00+00:00",
+            "rule-conflict-decay": None,
+        }
+
+
+class TestRoundTrips:
+    @staticmethod
+    def _hot_seed(n_arcs: int, n_rules: int) -> dict:
+        signatures = [f"sig-{i}" for i in range(n_arcs)]
+        arcs = [
+            _arc(
+                f"arc-{i}", primary_signature=sig, status="climax", pressure=0.9, peak_pressure=0.9, climax_start_tick=9
+            )
+            for i, sig in enumerate(signatures)
+        ]
+        rules = [
+            {
+                "id": f"rule-{j}",
+                "source_signature": signatures[j % n_arcs],
+                "target_signature": f"target-{j}",
+                "transfer_rate": 0.5,
+                "cooldown_hours": 72,
+                "depth_cap": 1000,
+                "is_active": True,
+                "last_triggered_at": None,
+            }
+            for j in range(n_rules)
+        ]
+        return {**_SEED, "narrative_arcs": arcs, "resonance_cascade_rules": rules, "event_zone_links": []}
+
+    async def _tick_cost(self, seed: dict) -> tuple[int, int]:
+        db = _ArcDB(seed)
+        db.tables["events"] = _events_at(1)
+        _, spawned, _ = await NarrativeArcService.detect_and_advance(db, SIM_ID, 10, HEARTBEAT_ID, CONFIG)
+        return db.round_trips, spawned
+
+    async def test_tick_cost_independent_of_arcs_and_rules(self, pinned):
+        small_trips, small_spawned = await self._tick_cost(self._hot_seed(2, 2))
+        large_trips, large_spawned = await self._tick_cost(self._hot_seed(40, 120))
+
+        assert (small_spawned, large_spawned) == (2, 120)
+        assert large_trips == small_trips
+
+    async def test_quiet_tick_reads_in_bulk(self, pinned):
+        db = _ArcDB({"narrative_arcs": [], "platform_settings": []})
+        db.tables["events"] = []
+        await NarrativeArcService.detect_and_advance(db, SIM_ID, 1, HEARTBEAT_ID, CONFIG)
+
+        # Arcs + events snapshot only — no rules, pairs, or writes.
+        assert db.round_trips == 2
@@ -0,0 +1,142 @@
+"""Tests for keyset pagination helpers and their BaseService integration."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from backend.services.event_service import EventService
+from backend.services.location_service import CityService
+from backend.tests.fake_supabase import FakeSupabase
+from backend.utils.pagination import apply_page, decode_cursor, encode_cursor, next_cursor
+from backend.utils.responses import paginated
+
+ROW = {"id": "0b7f4a7e-0000-0000-0000-000000000001", "occurred_at": "2026-10-01T12:00:00+00:00"}
+
+
+def _query() -> MagicMock:
+    query = MagicMock()
+    for method in ("select", "eq", "order", "or_", "range", "limit"):
+        getattr(query, method).return_value = query
+    return query
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor(ROW, order_by="occurred_at", order_desc=True)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, order_by="occurred_at", order_desc=True) == (ROW["occurred_at"], ROW["id"])
+
+    def test_rejects_other_ordering(self):
+        cursor = encode_cursor(ROW, order_by="occurred_at", order_desc=True)
+
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor, order_by="occurred_at", order_desc=False)
+        assert exc.value.status_code == 400
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "e30", "W10"])
+    def test_rejects_garbage(self, cursor):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor, order_by="name", order_desc=False)
+        assert exc.value.status_code == 400
+
+    def test_next_cursor_only_on_full_pages(self):
+        assert next_cursor([ROW], limit=2, order_by="occurred_at", order_desc=True) is None
+        assert next_cursor([ROW], limit=1, order_by="occurred_at", order_desc=True) is not None
+        assert next_cursor([{"id": "x"}], limit=1, order_by="name", order_desc=False) is not None
+
+
+class TestApplyPage:
+    def test_offset_mode_adds_tie_break_and_range(self):
+        query = _query()
+        apply_page(query, order_by="name", order_desc=False, limit=25, offset=50)
+
+        query.order.assert_called_once_with("id", desc=False)
+        query.range.assert_called_once_with(50, 74)
+        query.or_.assert_not_called()
+
+    def test_keyset_mode_seeks_past_the_cursor(self):
+        query = _query()
+        cursor = encode_cursor(ROW, order_by="occurred_at", order_desc=True)
+        apply_page(query, order_by="occurred_at", order_desc=True, limit=10, offset=999, cursor=cursor)
+
+        ts, row_id = ROW["occurred_at"], ROW["id"]
+        query.or_.assert_called_once_with(
+            f'occurred_at.lt."{ts}",and(occurred_at.eq."{ts}",id.lt."{row_id}")',
+        )
+        query.limit.assert_called_once_with(10)
+        query.range.assert_not_called()
+
+    def test_ascending_seek_includes_trailing_nulls(self):
+        query = _query()
+        cursor = encode_cursor({"id": "1", "name": "Alpha"}, order_by="name", order_desc=False)
+        apply_page(query, order_by="name", order_desc=False, limit=5, cursor=cursor)
+
+        assert query.or_.call_args[0][0].endswith(",name.is.null")
+
+    @pytest.mark.parametrize("order_desc", [True, False])
+    async def test_pages_through_null_sort_values(self, order_desc):
+        values = [None, "2026-10-01T10:00:00+00:00", None, "2026-10-02T10:00:00+00:00", None, None, None]
+        events = [{"id": f"00000000-0000-0000-0000-00000000000{i}", "occurred_at": v} for i, v in enumerate(values)]
+        client = await FakeSupabase({"events": events}).client()
+
+        pages, cursor = [], None
+        for _ in events:  # bounded: a seek that never advances fails instead of hanging
+            query = client.table("events").select("*").order("occurred_at", desc=order_desc)
+            page = (
+                await apply_page(query, order_by="occurred_at", order_desc=order_desc, limit=2, cursor=cursor).execute()
+            ).data
+            pages.append(page)
+            cursor = next_cursor(page, limit=2, order_by="occurred_at", order_desc=order_desc)
+            if cursor is None:
+                break
+
+        # Descending puts NULLs first, so page 1 ends on one; ascending, page 3 does.
+        assert pages[0 if order_desc else 2][-1]["occurred_at"] is None
+        seen = [row["id"] for page in pages for row in page]
+        assert sorted(seen) == sorted(e["id"] for e in events)
+        assert len(seen) == len(events)
+
+    def test_quotes_are_escaped(self):
+        query = _query()
+        cursor = encode_cursor({"id": "1", "name": 'The "Spire", (old)'}, order_by="name", order_desc=False)
+        apply_page(query, order_by="name", order_desc=False, limit=5, cursor=cursor)
+
+        assert 'name.gt."The \\"Spire\\", (old)"' in query.or_.call_args[0][0]
+
+
+class TestServiceIntegration:
+    async def test_base_list_uses_class_ordering_and_count_mode(self):
+        query = _query()
+        query.execute = AsyncMock(return_value=MagicMock(data=[{"id": "c1", "name": "Alpha"}], count=40))
+        supabase = MagicMock()
+        supabase.table.return_value = query
+
+        data, total = await CityService.list(supabase, uuid4(), limit=1, count="estimated")
+
+        query.select.assert_called_once_with("*", count="estimated")
+        assert query.order.call_args_list[0].args == ("name",)
+        assert total == 40
+        cursor = CityService.page_cursor(data, 1)
+        assert decode_cursor(cursor, order_by="name", order_desc=False) == ("Alpha", "c1")
+
+    async def test_event_list_with_cursor_skips_offset(self):
+        query = _query()
+        query.execute = AsyncMock(return_value=MagicMock(data=[], count=0))
+        supabase = MagicMock()
+        supabase.table.return_value = query
+        cursor = EventService.page_cursor([ROW], 1)
+
+        await EventService.list(supabase, uuid4(), limit=1, offset=30, cursor=cursor)
+
+        query.range.assert_not_called()
+        query.limit.assert_called_once_with(1)
+
+    def test_meta_carries_next_cursor(self):
+        response = paginated([ROW], 100, 1, 0, next_cursor="abc")
+        assert response.meta.next_cursor == "abc"
+        assert paginated([], 0, 25, 0).meta.next_cursor is None
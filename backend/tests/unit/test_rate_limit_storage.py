@@ -0,0 +1,135 @@
+"""Tests for cluster-wide rate limiting — shared counters and user-keyed buckets."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import jwt as pyjwt
+import pytest
+from fastapi import HTTPException
+from limits import parse
+from limits.strategies import SlidingWindowCounterRateLimiter
+from starlette.requests import Request
+
+from backend import dependencies
+from backend.middleware import rate_limit
+from backend.middleware.rate_limit_storage import SharedCounterStorage, sync_shared_counters
+
+
+class _CounterTable:
+    """In-memory stand-in for rate_limit_counters + fn_rate_limit_sync."""
+
+    def __init__(self):
+        self.hits: dict[str, int] = {}
+        self.calls = 0
+
+    def rpc(self, name: str, params: dict):
+        assert name == "fn_rate_limit_sync"
+
+        async def _execute():
+            self.calls += 1
+            for hit in params["p_hits"]:
+                self.hits[hit["k"]] = max(0, self.hits.get(hit["k"], 0) + hit["n"])
+            rows = [{"key": k, "hits": self.hits[k]} for k in params["p_keys"] if k in self.hits]
+            return MagicMock(data=rows)
+
+        return MagicMock(execute=_execute)
+
+
+LIMIT = parse("3/minute")
+
+
+@pytest.fixture()
+def workers():
+    a, b = SharedCounterStorage(), SharedCounterStorage()
+    yield (a, SlidingWindowCounterRateLimiter(a)), (b, SlidingWindowCounterRateLimiter(b))
+    a.reset()
+    b.reset()
+
+
+class TestSharedCounters:
+    async def test_hits_on_one_worker_count_on_the_other(self, workers):
+        (a, limiter_a), (b, limiter_b) = workers
+        table = _CounterTable()
+
+        assert limiter_a.hit(LIMIT, "user:1")
+        assert limiter_a.hit(LIMIT, "user:1")
+        assert limiter_b.hit(LIMIT, "user:1")  # B has not heard from A yet
+
+        await a.sync(table)
+        await b.sync(table)  # B pushes its hit and learns A's two
+        await a.sync(table)
+
+        assert not limiter_b.hit(LIMIT, "user:1")
+        assert not limiter_a.hit(LIMIT, "user:1")
+        assert limiter_a.hit(LIMIT, "user:2")
+
+    async def test_one_rpc_per_sync_and_deltas_pushed_once(self, workers):
+        (a, limiter_a), _ = workers
+        table = _CounterTable()
+        for key in ("user:1", "user:2", "ip:1.2.3.4"):
+            limiter_a.hit(LIMIT, key)
+
+        await a.sync(table)
+        await a.sync(table)
+
+        assert table.calls == 2
+        assert sorted(table.hits.values()) == [1, 1, 1]
+        assert a.get(next(iter(table.hits))) == 1  # own hits are not double-counted
+
+    async def test_failed_sync_keeps_deltas_for_the_next_one(self, workers):
+        (a, limiter_a), _ = workers
+        limiter_a.hit(LIMIT, "user:1")
+        broken = MagicMock()
+        broken.rpc.return_value.execute = AsyncMock(side_effect=httpx.ConnectError("down"))
+
+        with pytest.raises(httpx.ConnectError):
+            await sync_shared_counters(broken)
+        assert limiter_a.hit(LIMIT, "user:1")  # still limiting locally
+
+        table = _CounterTable()
+        await a.sync(table)
+        assert list(table.hits.values()) == [2]
+
+    async def test_nothing_tracked_means_no_round_trip(self, workers):
+        (a, _), _ = workers
+        table = _CounterTable()
+        assert await a.sync(table) == 0
+        assert table.calls == 0
+
+
+def _request(authorization: str | None = None) -> Request:
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return Request({"type": "http", "headers": headers, "client": ("203.0.113.9", 1234)})
+
+
+def _token(claims: dict) -> str:
+    return pyjwt.encode(claims, "not-the-server-secret", algorithm="HS256")
+
+
+class TestRateLimitKey:
+    def test_verified_user_selects_user_bucket(self):
+        request = _request("Bearer anything")
+        request.state.user_id = "user-123"
+
+        assert rate_limit.rate_limit_key(request) == "user:user-123"
+
+    def test_unverified_bearer_and_anonymous_fall_back_to_ip(self):
+        # A public route never verifies the token, whatever its sub claims.
+        assert rate_limit.rate_limit_key(_request(f"Bearer {_token({'sub': 'victim'})}")) == "ip:203.0.113.9"
+        assert rate_limit.rate_limit_key(_request()) == "ip:203.0.113.9"
+
+    async def test_get_current_user_records_only_verified_subjects(self, monkeypatch):
+        user_id = "11111111-1111-1111-1111-111111111111"
+        monkeypatch.setattr(dependencies, "_decode_jwt", MagicMock(return_value={"sub": user_id}))
+        verified = _request("Bearer good")
+        await dependencies.get_current_user(verified, "Bearer good")
+
+        monkeypatch.setattr(dependencies, "_decode_jwt", MagicMock(side_effect=pyjwt.InvalidSignatureError()))
+        forged = _request("Bearer forged")
+        with pytest.raises(HTTPException):
+            await dependencies.get_current_user(forged, "Bearer forged")
+
+        assert rate_limit.rate_limit_key(verified) == f"user:{user_id}"
+        assert rate_limit.rate_limit_key(forged) == "ip:203.0.113.9"
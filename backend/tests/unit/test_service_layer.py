@@ -185,7 +185,8 @@ class TestLocationServiceFacade:
             .eq.return_value
             .order.return_value
         )
-        chain.range.return_value.execute = AsyncMock(return_value=MagicMock(data=cities, count=1))
+        # name order, then the id tie-break, then the offset window
+        chain.order.return_value.range.return_value.execute = AsyncMock(return_value=MagicMock(data=cities, count=1))
 
         data, total = await LocationService.list_cities(mock_sb, MOCK_SIM_ID)
 
@@ -240,8 +241,10 @@ class TestLocationServiceFacade:
             .eq.return_value
             .order.return_value
         )
-        # BaseService.list applies filters then range
-        chain.eq.return_value.range.return_value.execute = AsyncMock(return_value=MagicMock(data=zones, count=1))
+        # BaseService.list applies filters, the id tie-break, then range
+        chain.eq.return_value.order.return_value.range.return_value.execute = AsyncMock(
+            return_value=MagicMock(data=zones, count=1)
+        )
 
         data, total = await LocationService.list_zones(mock_sb, MOCK_SIM_ID, city_id=city_id)
 
@@ -258,7 +261,7 @@ class TestLocationServiceFacade:
             .eq.return_value
             .order.return_value
         )
-        chain.range.return_value.execute = AsyncMock(return_value=MagicMock(data=[], count=0))
+        chain.order.return_value.range.return_value.execute = AsyncMock(return_value=MagicMock(data=[], count=0))
 
         await LocationService.list_streets(mock_sb, MOCK_SIM_ID)
 
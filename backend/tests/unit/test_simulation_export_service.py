@@ -0,0 +1,127 @@
+"""Tests for the streaming simulation export — keyset paging, formats, resume."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zipfile
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from backend.services.simulation_export_service import SimulationExportService
+
+SIM_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+class _PagedDB:
+    """Serves ``gt("id")`` / ``order("id")`` / ``limit()`` queries and records them."""
+
+    def __init__(self, tables: dict[str, list[dict]]):
+        self.tables = {name: sorted(rows, key=lambda r: r["id"]) for name, rows in tables.items()}
+        self.queries: list[tuple[str, str | None]] = []
+
+    def table(self, name: str):
+        state: dict = {"after": None, "limit": None}
+        builder = MagicMock()
+        for method in ("select", "eq", "is_", "order"):
+            getattr(builder, method).return_value = builder
+
+        def _gt(column, value):
+            state["after"] = value
+            return builder
+
+        def _limit(n):
+            state["limit"] = n
+            return builder
+
+        async def _execute():
+            self.queries.append((name, state["after"]))
+            rows = [r for r in self.tables.get(name, []) if state["after"] is None or r["id"] > state["after"]]
+            return MagicMock(data=rows[: state["limit"]])
+
+        builder.gt.side_effect = _gt
+        builder.limit.side_effect = _limit
+        builder.execute = _execute
+        return builder
+
+
+def _rows(n: int) -> list[dict]:
+    return [{"id": str(uuid4()), "name": f"Row {i}", "data": {"i": i}} for i in range(n)]
+
+
+async def _collect(db, export_format, tables, resume=None) -> bytes:
+    chunks = [chunk async for chunk in SimulationExportService.stream(db, SIM_ID, export_format, tables, resume=resume)]
+    return b"".join(chunks)
+
+
+@pytest.fixture()
+def small_pages(monkeypatch):
+    monkeypatch.setattr(SimulationExportService, "page_size", 2)
+
+
+class TestStreaming:
+    async def test_ndjson_pages_with_keyset_and_checkpoints(self, small_pages):
+        db = _PagedDB({"agents": _rows(5), "buildings": _rows(1)})
+
+        lines = [json.loads(line) for line in (await _collect(db, "ndjson", ["agents", "buildings"])).splitlines()]
+
+        rows = [line for line in lines if "row" in line]
+        assert [r["table"] for r in rows] == ["agents"] * 5 + ["buildings"]
+        assert [q[0] for q in db.queries] == ["agents"] * 3 + ["buildings"]
+        assert db.queries[1][1] == sorted(r["id"] for r in db.tables["agents"])[1]  # keyset, not offset
+        assert sum("checkpoint" in line for line in lines) == 4
+        assert lines[-1]["manifest"]["tables"] == [{"name": "agents", "rows": 5}, {"name": "buildings", "rows": 1}]
+
+    async def test_resume_continues_after_checkpoint(self, small_pages):
+        db = _PagedDB({"agents": _rows(3), "buildings": _rows(2)})
+        first = [json.loads(line) for line in (await _collect(db, "ndjson", ["agents", "buildings"])).splitlines()]
+        checkpoint = next(line["checkpoint"] for line in first if "checkpoint" in line)
+
+        resumed = [
+            json.loads(line)
+            for line in (await _collect(db, "ndjson", ["agents", "buildings"], resume=checkpoint)).splitlines()
+        ]
+
+        first_ids = [line["row"]["id"] for line in first if "row" in line]
+        assert [line["row"]["id"] for line in resumed if "row" in line] == first_ids[2:]
+        assert resumed[-1]["manifest"]["resumed_from"] == checkpoint
+
+    async def test_csv_single_table(self, small_pages):
+        db = _PagedDB({"events": _rows(3)})
+
+        reader = csv.DictReader(io.StringIO((await _collect(db, "csv", ["events"])).decode()))
+        rows = list(reader)
+
+        assert reader.fieldnames == ["id", "name", "data"]
+        assert len(rows) == 3
+        assert json.loads(rows[0]["data"]) in ({"i": 0}, {"i": 1}, {"i": 2})
+
+    async def test_zip_members_and_manifest(self, small_pages):
+        db = _PagedDB({"agents": _rows(3), "simulation_lore": _rows(2)})
+
+        archive = zipfile.ZipFile(io.BytesIO(await _collect(db, "zip", ["agents", "simulation_lore"])))
+
+        assert archive.namelist() == ["agents.ndjson", "simulation_lore.ndjson", "manifest.json"]
+        assert len(archive.read("agents.ndjson").splitlines()) == 3
+        manifest = json.loads(archive.read("manifest.json"))
+        assert [t["rows"] for t in manifest["tables"]] == [3, 2]
+
+
+class TestValidation:
+    def test_tables_are_checked_and_ordered(self):
+        assert SimulationExportService.resolve_tables(["events", "agents"], "zip") == ["agents", "events"]
+        with pytest.raises(HTTPException):
+            SimulationExportService.resolve_tables(["users"], "ndjson")
+        with pytest.raises(HTTPException):
+            SimulationExportService.resolve_tables(["agents", "events"], "csv")
+
+    def test_resume_token_must_match_the_export(self):
+        with pytest.raises(HTTPException):
+            SimulationExportService.parse_resume(f"events:{uuid4()}", ["agents"])
+        with pytest.raises(HTTPException):
+            SimulationExportService.parse_resume("agents:not-a-uuid", ["agents"])
+        assert SimulationExportService.parse_resume(f"events:{SIM_ID}", ["agents", "events"]) == (1, str(SIM_ID))
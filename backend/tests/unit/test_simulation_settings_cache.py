@@ -0,0 +1,205 @@
+"""Tests for SimulationSettingsCache — hits, bulk preload, invalidation, stamps."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from backend.services import simulation_settings_cache as cache_module
+from backend.services.settings_service import SettingsService
+from backend.services.simulation_settings_cache import SettingsView, SimulationSettingsCache
+
+SIM_A = "00000000-0000-0000-0000-0000000000aa"
+SIM_B = "00000000-0000-0000-0000-0000000000bb"
+
+
+class _Response:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    """Just enough PostgREST builder for eq / in_ / gte filters."""
+
+    def __init__(self, db: _SettingsDB, table: str):
+        self._db = db
+        self._table = table
+        self._filters: list = []
+        self._write: dict | None = None
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def eq(self, col, value):
+        self._filters.append(lambda r: r.get(col) == value)
+        return self
+
+    def in_(self, col, values):
+        allowed = set(values)
+        self._filters.append(lambda r: r.get(col) in allowed)
+        return self
+
+    def gte(self, col, value):
+        self._filters.append(lambda r: r.get(col) >= value)
+        return self
+
+    def upsert(self, row, **_kwargs):
+        self._write = row
+        return self
+
+    async def execute(self):
+        self._db.round_trips += 1
+        rows = self._db.tables.setdefault(self._table, [])
+        if self._write is not None:
+            rows.append(self._write)
+            return _Response([self._write])
+        return _Response([r for r in rows if all(f(r) for f in self._filters)])
+
+
+class _SettingsDB:
+    def __init__(self, rows: list[dict] | None = None):
+        self.tables: dict[str, list[dict]] = {"simulation_settings": rows or []}
+        self.round_trips = 0
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+
+def _row(sim: str, category: str, key: str, value) -> dict:
+    return {"simulation_id": sim, "category": category, "setting_key": key, "setting_value": value}
+
+
+@pytest.fixture()
+def db():
+    return _SettingsDB(
+        [
+            _row(SIM_A, "world", "bleed_min_impact", 6),
+            _row(SIM_A, "world", "bleed_strength_decay", "0.4"),
+            _row(SIM_A, "heartbeat", "enabled", "false"),
+            _row(SIM_B, "heartbeat", "enabled", "true"),
+            _row(SIM_B, "general", "general.content_locale", "de"),
+        ]
+    )
+
+
+class TestSettingsView:
+    def test_typed_getters_coerce_and_default(self):
+        view = SettingsView({"n": "7", "f": "0.25", "b": "false", "bad": "x"})
+
+        assert view.get_int("n", 0) == 7
+        assert view.get_float("f", 1.0) == 0.25
+        assert view.get_bool("b", True) is False
+        assert view.get_bool("missing", True) is True
+        assert view.get_int("bad", 3) == 3
+        assert view.get_str("missing", "en") == "en"
+
+    def test_is_read_only(self):
+        with pytest.raises(TypeError):
+            SettingsView({"a": 1})["a"] = 2  # type: ignore[index]
+
+
+class TestGet:
+    async def test_second_read_is_a_hit(self, db):
+        first = await SimulationSettingsCache.get(db, SIM_A, "world")
+        second = await SimulationSettingsCache.get(db, SIM_A, "world")
+
+        assert first is second
+        assert first.get_int("bleed_min_impact", 8) == 6
+        assert db.round_trips == 1
+        assert SimulationSettingsCache.stats()["hits"] == 1
+
+    async def test_empty_category_is_cached(self, db):
+        assert dict(await SimulationSettingsCache.get(db, SIM_A, "bonds")) == {}
+        await SimulationSettingsCache.get(db, SIM_A, "bonds")
+        assert db.round_trips == 1
+
+    async def test_entries_expire(self, db, monkeypatch):
+        from cachetools import TTLCache
+
+        clock = [0.0]
+        monkeypatch.setattr(
+            SimulationSettingsCache,
+            "_entries",
+            TTLCache(maxsize=16, ttl=cache_module._TTL_SECONDS, timer=lambda: clock[0]),
+        )
+        await SimulationSettingsCache.get(db, SIM_A, "world")
+        clock[0] += cache_module._TTL_SECONDS + 1
+        await SimulationSettingsCache.get(db, SIM_A, "world")
+
+        assert db.round_trips == 2
+
+    async def test_find_searches_every_category(self, db):
+        assert await SimulationSettingsCache.find(db, SIM_B, "general.content_locale") == "de"
+        assert await SimulationSettingsCache.find(db, SIM_A, "general.content_locale") is None
+        # The all-category load also answers per-category reads.
+        heartbeat = await SimulationSettingsCache.get(db, SIM_B, "heartbeat")
+
+        assert heartbeat["enabled"] == "true"
+        assert db.round_trips == 2
+
+
+class TestPreload:
+    async def test_one_query_for_many_sims(self, db):
+        await SimulationSettingsCache.preload(db, [SIM_A, SIM_B], ["heartbeat", "bonds"])
+        assert db.round_trips == 1
+
+        assert (await SimulationSettingsCache.get(db, SIM_A, "heartbeat"))["enabled"] == "false"
+        assert (await SimulationSettingsCache.get(db, SIM_B, "heartbeat"))["enabled"] == "true"
+        assert dict(await SimulationSettingsCache.get(db, SIM_B, "bonds")) == {}
+        assert db.round_trips == 1
+
+
+class TestInvalidation:
+    async def test_settings_service_upsert_invalidates(self, db):
+        await SimulationSettingsCache.get(db, SIM_A, "world")
+
+        await SettingsService.upsert_setting(
+            db,
+            SIM_A,
+            uuid4(),
+            {"category": "world", "setting_key": "bleed_min_impact", "setting_value": 9},
+        )
+        db.tables["simulation_settings"] = [r for r in db.tables["simulation_settings"] if r.get("setting_value") != 6]
+
+        view = await SimulationSettingsCache.get(db, SIM_A, "world")
+        assert view["bleed_min_impact"] == 9
+
+    async def test_invalidation_during_load_is_not_cached(self, db):
+        original = _Query.execute
+
+        async def _racing_execute(query):
+            response = await original(query)
+            SimulationSettingsCache.invalidate(SIM_A, "world")
+            return response
+
+        with patch.object(_Query, "execute", _racing_execute):
+            await SimulationSettingsCache.get(db, SIM_A, "world")
+
+        assert SimulationSettingsCache.peek(SIM_A, "world") is None
+
+
+class TestVersionPoll:
+    async def test_moved_stamp_invalidates_every_category(self, db):
+        db.tables["simulation_settings_versions"] = [
+            {"simulation_id": SIM_A, "version": 1, "changed_at": "9999-01-01T00:00:00+00:00"}
+        ]
+        assert await SimulationSettingsCache.poll_versions(db) == 1
+
+        await SimulationSettingsCache.preload(db, [SIM_A, SIM_B], ["world", "heartbeat"])
+        assert await SimulationSettingsCache.poll_versions(db) == 0
+        assert SimulationSettingsCache.peek(SIM_A, "world") is not None
+
+        db.tables["simulation_settings_versions"][0]["version"] = 2
+        assert await SimulationSettingsCache.poll_versions(db) == 1
+
+        assert SimulationSettingsCache.peek(SIM_A, "world") is None
+        assert SimulationSettingsCache.peek(SIM_A, "heartbeat") is None
+        assert SimulationSettingsCache.peek(SIM_B, "heartbeat") is not None
+
+    async def test_stamps_outside_window_are_ignored(self, db):
+        db.tables["simulation_settings_versions"] = [
+            {"simulation_id": SIM_A, "version": 5, "changed_at": "2000-01-01T00:00:00+00:00"}
+        ]
+        assert await SimulationSettingsCache.poll_versions(db) == 0
@@ -0,0 +1,246 @@
+"""Per-epoch success-probability inputs (backend/services/success_modifier_table.py).
+
+The table runs against ``FakeSupabase`` with stand-ins for the three
+resonance RPCs, so the round-trip counts are those of the real client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from backend.models.epoch import OperativeDeploy
+from backend.services.success_modifier_table import SuccessInputs, SuccessModifierTable, success_probability
+from backend.tests.fake_supabase import FakeSupabase
+from backend.utils.call_stats import track_calls
+
+EPOCH_ID = str(uuid4())
+SIMS = [str(uuid4()) for _ in range(4)]
+ZONES = {sim: [str(uuid4()), str(uuid4())] for sim in SIMS}
+EMBASSY_ID = str(uuid4())
+
+
+def _backend(*, penalty_expires_at: str | None = None, latency_ms=0.0) -> FakeSupabase:
+    fake = FakeSupabase(
+        {
+            "epoch_participants": [{"epoch_id": EPOCH_ID, "simulation_id": sim} for sim in SIMS],
+            "zones": [
+                {"id": zone, "simulation_id": sim, "security_level": level}
+                for sim in SIMS
+                for zone, level in zip(ZONES[sim], ("high", "low"), strict=True)
+            ],
+            "operative_missions": [
+                {"id": str(uuid4()), "source_simulation_id": SIMS[1], "operative_type": "guardian", "status": status}
+                for status in ("active", "active", "returning")
+            ],
+            "embassies": [
+                {
+                    "id": EMBASSY_ID,
+                    "simulation_a_id": SIMS[0],
+                    "simulation_b_id": SIMS[1],
+                    "infiltration_penalty": 0.5 if penalty_expires_at else 0,
+                    "infiltration_penalty_expires_at": penalty_expires_at,
+                }
+            ],
+            "narrative_arcs": [
+                {
+                    "id": str(uuid4()),
+                    "simulation_id": SIMS[1],
+                    "arc_type": "convergence",
+                    "status": "active",
+                    "primary_archetype": "tower",
+                    "secondary_archetype": "shadow",
+                }
+            ],
+            "platform_settings": [
+                {
+                    "setting_key": "heartbeat_convergence_pairs",
+                    "setting_value": {"shadow+tower": {"effects": {"spy": 0.02, "saboteur": -0.01}}},
+                }
+            ],
+        },
+        latency_ms=latency_ms,
+    )
+    fake.rpc("fn_target_zone_pressure")(lambda db, p: 0.03 if p["p_zone_id"] else 0.01)
+    fake.rpc("fn_resonance_operative_modifier")(lambda db, p: -0.02 if p["p_operative_type"] == "spy" else 0.0)
+    fake.rpc("fn_attacker_pressure_penalty")(lambda db, p: -0.04)
+    return fake
+
+
+def _deploy(operative_type: str = "spy", target: int = 1, *, zone: bool = True) -> OperativeDeploy:
+    return OperativeDeploy(
+        agent_id=uuid4(),
+        operative_type=operative_type,
+        target_simulation_id=UUID(SIMS[target]),
+        embassy_id=UUID(EMBASSY_ID),
+        target_zone_id=UUID(ZONES[SIMS[target]][0]) if zone else None,
+    )
+
+
+class TestSuccessProbability:
+    def test_defaults_match_the_documented_baseline(self):
+        # 0.55 + 6*0.03 - 5.0*0.05 + 0.5*0.15
+        assert success_probability(SuccessInputs()) == pytest.approx(0.555)
+
+    def test_guardian_penalty_is_capped(self):
+        unguarded = success_probability(SuccessInputs())
+
+        assert unguarded - success_probability(SuccessInputs(guardian_count=1)) == pytest.approx(0.06)
+        assert unguarded - success_probability(SuccessInputs(guardian_count=5)) == pytest.approx(0.15)
+
+    def test_clamped_to_epoch_floor_and_ceiling(self):
+        cfg = {"probability_floor": 0.1, "probability_ceiling": 0.8}
+
+        assert success_probability(SuccessInputs(zone_security=10.0, guardian_count=9, aptitude=0), cfg) == 0.1
+        assert success_probability(SuccessInputs(aptitude=9, zone_security=0.0, surge_bonus=0.08), cfg) == 0.8
+
+
+class TestMaterialize:
+    async def test_cycle_start_is_batched_and_deploys_read_the_table(self):
+        fake = _backend()
+        client = await fake.client()
+
+        with track_calls() as warm:
+            await SuccessModifierTable.materialize(client, EPOCH_ID, 3)
+        with track_calls() as deploys:
+            for target in (1, 2, 3):
+                await SuccessModifierTable.target_inputs(
+                    client, _deploy(target=target, zone=False), SIMS[0], epoch_id=EPOCH_ID, cycle=3
+                )
+            inputs = await SuccessModifierTable.target_inputs(
+                client, _deploy(target=1, zone=False), SIMS[0], epoch_id=EPOCH_ID, cycle=3
+            )
+
+        # participants, zones, guardians, embassies, arcs, convergence pairs + two RPCs per simulation
+        assert warm.db_calls == 6 + 2 * len(SIMS)
+        # only the per-operative-type resonance modifier of each target is looked up
+        assert deploys.db_calls == 3
+        assert inputs == SuccessInputs(
+            zone_security=5.0,
+            guardian_count=2,
+            embassy_effectiveness=0.6,
+            zone_pressure=0.01,
+            resonance_modifier=-0.02,
+            attacker_penalty=-0.04,
+            convergence_modifier=0.02,
+        )
+
+    async def test_table_matches_fresh_lookups(self):
+        client = await _backend().client()
+        body = _deploy("saboteur")
+
+        fresh = await SuccessModifierTable.target_inputs(client, body, SIMS[0])
+        await SuccessModifierTable.materialize(client, EPOCH_ID, 3)
+        cached = await SuccessModifierTable.target_inputs(client, body, SIMS[0], epoch_id=EPOCH_ID, cycle=3)
+
+        assert cached == fresh
+        assert (fresh.zone_security, fresh.zone_pressure, fresh.convergence_modifier) == (8.5, 0.03, -0.01)
+
+    async def test_embassies_on_side_b_are_loaded(self):
+        fake = _backend(penalty_expires_at=(datetime.now(UTC) + timedelta(hours=1)).isoformat())
+        embassy = fake.tables["embassies"][0]
+        embassy["simulation_a_id"], embassy["simulation_b_id"] = str(uuid4()), SIMS[1]
+        client = await fake.client()
+        await SuccessModifierTable.materialize(client, EPOCH_ID, 3)
+
+        with track_calls() as stats:
+            inputs = await SuccessModifierTable.target_inputs(
+                client, _deploy(zone=False), SIMS[0], epoch_id=EPOCH_ID, cycle=3
+            )
+
+        assert stats.db_calls == 1  # resonance modifier only, no embassy fallback
+        assert inputs.embassy_effectiveness == pytest.approx(0.3)
+
+    async def test_locks_of_expired_epochs_are_dropped(self, monkeypatch):
+        monkeypatch.setattr("backend.services.success_modifier_table._MAX_EPOCHS", 2)
+        client = await _backend().client()
+        for epoch in ("e1", "e2", EPOCH_ID):
+            await SuccessModifierTable.target_inputs(client, _deploy(), SIMS[0], epoch_id=epoch, cycle=3)
+            SuccessModifierTable._tables.pop(epoch, None)
+
+        assert list(SuccessModifierTable._locks) == [EPOCH_ID]
+
+    async def test_concurrent_deploys_materialize_once_and_new_cycle_rebuilds(self):
+        seen: list[str] = []
+        fake = _backend(latency_ms=lambda request: seen.append(request.url.path) or 0)
+        client = await fake.client()
+
+        def participant_lookups() -> int:
+            return sum(1 for path in seen if path.endswith("/epoch_participants"))
+
+        await asyncio.gather(
+            *(
+                SuccessModifierTable.target_inputs(client, _deploy(target=t), SIMS[0], epoch_id=EPOCH_ID, cycle=3)
+                for t in (1, 2, 3, 1)
+            )
+        )
+        assert participant_lookups() == 1
+
+        fake.tables["operative_missions"][2]["status"] = "active"
+        inputs = await SuccessModifierTable.target_inputs(client, _deploy(), SIMS[0], epoch_id=EPOCH_ID, cycle=4)
+
+        assert participant_lookups() == 2
+        assert inputs.guardian_count == 3
+
+
+class TestEvents:
+    async def test_events_update_the_table_in_place(self):
+        client = await _backend().client()
+        await SuccessModifierTable.materialize(client, EPOCH_ID, 3)
+        expires = (datetime.now(UTC) + timedelta(hours=24)).isoformat()
+
+        SuccessModifierTable.note_guardians(EPOCH_ID, SIMS[1], +1)
+        SuccessModifierTable.set_zone_security(EPOCH_ID, ZONES[SIMS[1]][0], "lawless")
+        SuccessModifierTable.set_embassy_penalty(EPOCH_ID, EMBASSY_ID, 0.5, expires)
+        with track_calls() as stats:
+            inputs = await SuccessModifierTable.target_inputs(client, _deploy(), SIMS[0], epoch_id=EPOCH_ID, cycle=3)
+
+        assert stats.db_calls == 2  # zone-specific pressure + resonance modifier
+        assert (inputs.guardian_count, inputs.zone_security) == (3, 2.0)
+        assert inputs.embassy_effectiveness == pytest.approx(0.3)
+
+    async def test_unknown_zone_level_is_re_read(self):
+        fake = _backend()
+        client = await fake.client()
+        await SuccessModifierTable.materialize(client, EPOCH_ID, 3)
+        zone = ZONES[SIMS[1]][0]
+
+        fake.tables["zones"][2]["security_level"] = "fortress"
+        SuccessModifierTable.set_zone_security(EPOCH_ID, zone, None)
+        inputs = await SuccessModifierTable.target_inputs(client, _deploy(), SIMS[0], epoch_id=EPOCH_ID, cycle=3)
+
+        assert fake.tables["zones"][2]["id"] == zone
+        assert inputs.zone_security == 10.0
+
+    async def test_expired_infiltration_penalty_is_cleared_once(self):
+        fake = _backend(penalty_expires_at=(datetime.now(UTC) - timedelta(hours=1)).isoformat())
+        client = await fake.client()
+        await SuccessModifierTable.materialize(client, EPOCH_ID, 3)
+
+        first = await SuccessModifierTable.target_inputs(client, _deploy(), SIMS[0], epoch_id=EPOCH_ID, cycle=3)
+        with track_calls() as stats:
+            second = await SuccessModifierTable.target_inputs(client, _deploy(), SIMS[0], epoch_id=EPOCH_ID, cycle=3)
+
+        assert first.embassy_effectiveness == second.embassy_effectiveness == 0.6
+        assert stats.db_calls == 0
+        assert fake.tables["embassies"][0]["infiltration_penalty"] == 0
+
+    async def test_events_without_a_table_are_ignored(self):
+        SuccessModifierTable.note_guardians(EPOCH_ID, SIMS[1], +1)
+        SuccessModifierTable.set_zone_security(EPOCH_ID, ZONES[SIMS[1]][0], "high")
+
+        client = await _backend().client()
+        inputs = await SuccessModifierTable.target_inputs(client, _deploy(), SIMS[0], epoch_id=EPOCH_ID, cycle=3)
+
+        assert replace(inputs, zone_pressure=0.0) == SuccessInputs(
+            zone_security=8.5,
+            guardian_count=2,
+            embassy_effectiveness=0.6,
+            resonance_modifier=-0.02,
+            attacker_penalty=-0.04,
+            convergence_modifier=0.02,
+        )
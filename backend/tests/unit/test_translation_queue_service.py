@@ -0,0 +1,202 @@
+"""Tests for the durable auto-translation queue — coalescing, batching, memory."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.models.translation import TranslationContext
+from backend.services.translation_queue_service import TranslationQueueService, pack_batches, text_hash
+from backend.services.translation_service import schedule_auto_translation
+from backend.tests.fake_supabase import FakeSupabase
+
+CONTEXT = TranslationContext(simulation_name="Velgarien", simulation_theme="dystopia", entity_type="agents")
+
+
+def _job(
+    job_id: int, text: str, *, table="agents", field="character", cached=None, entity_type="agents", entity_name=None
+) -> dict:
+    return {
+        "id": job_id,
+        "table_name": table,
+        "entity_id": str(uuid4()),
+        "field": field,
+        "source_text": text,
+        "text_hash": text_hash(text),
+        "context": {
+            "simulation_name": "Velgarien",
+            "simulation_theme": "dystopia",
+            "entity_type": entity_type,
+            "entity_name": entity_name,
+        },
+        "cached": cached,
+    }
+
+
+def _admin(jobs: list[dict]) -> MagicMock:
+    admin = MagicMock()
+    calls: dict[str, list] = {"rpc": [], "released": []}
+
+    def _rpc(name, params):
+        calls["rpc"].append((name, params))
+        data = jobs if name == "fn_claim_translation_jobs" else len(params.get("p_results", []))
+        return MagicMock(execute=AsyncMock(return_value=MagicMock(data=data)))
+
+    admin.rpc.side_effect = _rpc
+    table = admin.table.return_value
+    table.update.return_value = table
+    table.upsert.return_value = table
+
+    def _in(column, ids):
+        calls["released"].extend(ids)
+        return table
+
+    table.in_.side_effect = _in
+    table.execute = AsyncMock(return_value=MagicMock(data=[]))
+    admin.calls = calls
+    return admin
+
+
+def _echo_translate(calls: list):
+    async def _translate(fields, context=None, **_kwargs):
+        calls.append(dict(fields))
+        return {name: f"DE:{text}" for name, text in fields.items()}
+
+    return _translate
+
+
+class TestEnqueue:
+    def test_schedule_buffers_instead_of_spawning_tasks(self):
+        entity_id = uuid4()
+        with patch("asyncio.create_task") as create_task:
+            schedule_auto_translation(
+                "agents", entity_id, {"character": "Brave", "background": " "}, "Velgarien", "dystopia"
+            )
+        create_task.assert_not_called()
+        assert list(TranslationQueueService._buffer) == [("agents", str(entity_id), "character")]
+
+    async def test_repeated_edits_coalesce_and_flush_in_one_upsert(self):
+        entity_id = uuid4()
+        TranslationQueueService.enqueue("agents", entity_id, {"character": "first"}, CONTEXT)
+        TranslationQueueService.enqueue("agents", entity_id, {"character": "second"}, CONTEXT)
+        admin = _admin([])
+
+        assert await TranslationQueueService.flush(admin) == 1
+
+        rows = admin.table.return_value.upsert.call_args.args[0]
+        assert [r["source_text"] for r in rows] == ["second"]
+        assert TranslationQueueService._buffer == {}
+
+    async def test_failed_flush_keeps_the_buffer(self):
+        TranslationQueueService.enqueue("agents", uuid4(), {"character": "text"}, CONTEXT)
+        admin = _admin([])
+        admin.table.return_value.execute = AsyncMock(side_effect=ConnectionError("down"))
+
+        with pytest.raises(ConnectionError):
+            await TranslationQueueService.flush(admin)
+        assert len(TranslationQueueService._buffer) == 1
+
+
+class TestDrain:
+    async def test_unique_texts_translated_once_in_one_batch(self):
+        jobs = [_job(1, "Brave"), _job(2, "Brave"), _job(3, "Quiet")]
+        admin = _admin(jobs)
+        calls: list = []
+
+        with patch(
+            "backend.services.translation_queue_service.TranslationService.translate_fields", _echo_translate(calls)
+        ):
+            assert await TranslationQueueService.drain(admin) == 3
+
+        assert calls == [{"character:0": "Brave", "character:1": "Quiet"}]
+        name, params = admin.calls["rpc"][-1]
+        assert name == "fn_complete_translation_jobs"
+        assert [r["text"] for r in params["p_results"]] == ["DE:Brave", "DE:Brave", "DE:Quiet"]
+
+    async def test_batches_keep_field_names_and_entity_context(self):
+        jobs = [
+            _job(1, "Brave", entity_name="Ada"),
+            _job(2, "Grew up in the docks", field="background", entity_name="Ada"),
+            _job(3, "Quiet", entity_name="Bram"),
+        ]
+        admin = _admin(jobs)
+        seen: list[tuple[str | None, dict]] = []
+
+        async def _translate(fields, context=None, **_kwargs):
+            seen.append((context.entity_name, dict(fields)))
+            return {name: f"DE:{text}" for name, text in fields.items()}
+
+        with patch("backend.services.translation_queue_service.TranslationService.translate_fields", _translate):
+            await TranslationQueueService.drain(admin)
+
+        assert seen == [
+            ("Ada", {"character:0": "Brave", "background:1": "Grew up in the docks"}),
+            ("Bram", {"character:0": "Quiet"}),
+        ]
+        assert [r["text"] for r in admin.calls["rpc"][-1][1]["p_results"]] == [
+            "DE:Brave",
+            "DE:Grew up in the docks",
+            "DE:Quiet",
+        ]
+
+    async def test_remembered_translations_skip_the_provider(self):
+        admin = _admin([_job(1, "Brave", cached="Tapfer")])
+        translate = AsyncMock()
+
+        with patch("backend.services.translation_queue_service.TranslationService.translate_fields", translate):
+            await TranslationQueueService.drain(admin)
+
+        translate.assert_not_called()
+        assert admin.calls["rpc"][-1][1]["p_results"][0]["text"] == "Tapfer"
+
+    async def test_failed_batch_releases_only_its_jobs(self):
+        jobs = [_job(1, "Brave"), _job(2, "Old tower", table="buildings", field="description", entity_type="buildings")]
+        admin = _admin(jobs)
+
+        async def _translate(fields, context=None, **_kwargs):
+            if context.entity_type == "buildings":
+                raise ValueError("malformed output")
+            return {name: f"DE:{text}" for name, text in fields.items()}
+
+        with patch("backend.services.translation_queue_service.TranslationService.translate_fields", _translate):
+            await TranslationQueueService.drain(admin)
+
+        assert [r["id"] for r in admin.calls["rpc"][-1][1]["p_results"]] == [1]
+        assert admin.calls["released"] == [2]
+
+
+class TestAttempts:
+    async def test_job_failing_every_time_is_dropped_after_five_attempts(self):
+        fake = FakeSupabase({"translation_jobs": [], "translation_memory": []})
+
+        @fake.rpc("fn_claim_translation_jobs")
+        def _claim(db, p):
+            # Python port of migration 243: purge exhausted, claim attempts < 5.
+            jobs = db.tables["translation_jobs"]
+            jobs[:] = [j for j in jobs if j["attempts"] < 5 or j["claimed_at"] is not None]
+            claimed = [j for j in jobs if j["attempts"] < 5 and j["claimed_at"] is None][: p["p_limit"]]
+            for job in claimed:
+                job.update(claimed_at="now", attempts=job["attempts"] + 1)
+            return [{**job, "cached": None} for job in claimed]
+
+        TranslationQueueService.enqueue("agents", uuid4(), {"character": "Brave"}, CONTEXT)
+        admin = await fake.client()
+        await TranslationQueueService.flush(admin)
+        translate = AsyncMock(side_effect=ValueError("malformed output"))
+
+        with patch("backend.services.translation_queue_service.TranslationService.translate_fields", translate):
+            claimed = [await TranslationQueueService.drain(admin) for _ in range(7)]
+
+        assert claimed == [1, 1, 1, 1, 1, 0, 0]
+        assert translate.await_count == 5
+        assert fake.tables["translation_jobs"] == []
+
+
+class TestPackBatches:
+    def test_respects_item_and_size_limits(self):
+        texts = ["a" * 40, "b" * 40, "c" * 40, "d", "e", "f"]
+
+        assert pack_batches(texts, max_items=2, max_chars=100) == [texts[0:2], [texts[2], "d"], ["e", "f"]]
+        assert pack_batches(texts, max_items=10, max_chars=50) == [[texts[0]], [texts[1]], [texts[2], "d", "e", "f"]]
@@ -0,0 +1,257 @@
+"""Tests for WeatherProvider — geo-cell cache and batched Open-Meteo fetches.
+
+Runs against a real local HTTP stub (not mocked httpx) so request counts,
+query strings and the single-vs-list response shapes are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from backend.config import settings
+from backend.services import weather_provider
+from backend.services.ambient_weather_service import AmbientWeatherService
+from backend.services.heartbeat_service import HeartbeatService
+from backend.services.weather_provider import WeatherProvider, cell_for
+from backend.tests.fake_supabase import FakeSupabase
+from backend.utils.call_stats import track_calls
+
+
+class _OpenMeteoStub:
+    """Minimal Open-Meteo: one ``current`` block per requested location."""
+
+    def __init__(self):
+        self.requests: list[dict[str, list[str]]] = []
+        self.status = 200
+        self.delay = 0.0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                query = parse_qs(urlparse(self.path).query)
+                stub.requests.append(query)
+                if stub.delay:
+                    threading.Event().wait(stub.delay)
+                if stub.status != 200:
+                    self.send_response(stub.status)
+                    self.end_headers()
+                    return
+                lats = query["latitude"][0].split(",")
+                locations = [
+                    {
+                        "current": {"temperature_2m": float(lat), "weather_code": 3, "is_day": 1},
+                        "daily": {"sunrise": ["2026-10-19T07:10"], "sunset": ["2026-10-19T18:05"]},
+                    }
+                    for lat in lats
+                ]
+                body = json.dumps(locations if len(locations) > 1 else locations[0]).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1/forecast"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture()
+async def stub(monkeypatch):
+    server = _OpenMeteoStub()
+    monkeypatch.setattr(settings, "open_meteo_url", server.url)
+    WeatherProvider.clear()
+    yield server
+    await WeatherProvider.aclose()
+    WeatherProvider.clear()
+    server.close()
+
+
+class TestCells:
+    def test_nearby_points_share_a_cell(self):
+        assert cell_for(50.081, 14.441) == cell_for(50.089, 14.449)
+
+    def test_distant_points_do_not(self):
+        assert cell_for(50.08, 14.44) != cell_for(50.18, 14.44)
+
+    def test_negative_coordinates_quantize_consistently(self):
+        assert cell_for(-33.87, 151.21) == cell_for(-33.81, 151.29)
+
+
+class TestGet:
+    async def test_same_cell_hits_cache(self, stub):
+        first = await WeatherProvider.get(50.081, 14.441)
+        second = await WeatherProvider.get(50.085, 14.445)
+
+        assert first is second
+        assert len(stub.requests) == 1
+        assert first["current"]["weather_code"] == 3
+        assert first["daily"]["sunrise"] == ["2026-10-19T07:10"]
+
+    async def test_concurrent_callers_share_one_request(self, stub):
+        stub.delay = 0.1
+        results = await asyncio.gather(*(WeatherProvider.get(50.08, 14.44) for _ in range(5)))
+
+        assert len(stub.requests) == 1
+        assert all(r is results[0] for r in results)
+
+    async def test_http_error_raises_and_does_not_cache(self, stub):
+        stub.status = 503
+        with pytest.raises(weather_provider.httpx.HTTPStatusError):
+            await WeatherProvider.get(50.08, 14.44)
+
+        stub.status = 200
+        await WeatherProvider.get(50.08, 14.44)
+        assert len(stub.requests) == 2
+
+    async def test_entry_expires_at_next_update_slot(self, stub):
+        await WeatherProvider.get(50.08, 14.44)
+        cell = cell_for(50.08, 14.44)
+        expiry = weather_provider._expires_at(cell, None, 1_000_000.0)
+
+        assert expiry > 1_000_000.0
+        assert (expiry - weather_provider._CADENCE_GRACE_SECONDS) % weather_provider._UPDATE_CADENCE_SECONDS == 0
+
+
+class TestPrefetch:
+    async def test_batches_distinct_cells_into_one_request(self, stub):
+        coords = [(50.08, 14.44), (50.081, 14.441), (52.52, 13.40), (48.85, 2.35)]
+        fetched = await WeatherProvider.prefetch(coords)
+
+        assert fetched == 3
+        assert len(stub.requests) == 1
+        assert len(stub.requests[0]["latitude"][0].split(",")) == 3
+
+        for lat, lon in coords:
+            await WeatherProvider.get(lat, lon)
+        assert len(stub.requests) == 1
+
+    async def test_large_batches_are_chunked(self, stub, monkeypatch):
+        monkeypatch.setattr(weather_provider, "_BATCH_SIZE", 2)
+        await WeatherProvider.prefetch([(10.0 + i, 20.0) for i in range(5)])
+        assert len(stub.requests) == 3
+
+    async def test_failure_is_swallowed(self, stub):
+        stub.status = 500
+        assert await WeatherProvider.prefetch([(50.08, 14.44)]) == 0
+
+    async def test_warm_cells_are_skipped(self, stub):
+        await WeatherProvider.get(50.08, 14.44)
+        assert await WeatherProvider.prefetch([(50.08, 14.44)]) == 0
+        assert len(stub.requests) == 1
+
+
+class TestFetchConditions:
+    async def test_reads_through_provider(self, stub):
+        conditions = await AmbientWeatherService.fetch_conditions(52.52, 13.40, "Test")
+
+        assert conditions.weather_code == 3
+        assert conditions.sunrise == "2026-10-19T07:10"
+        assert len(stub.requests) == 1
+
+    async def test_falls_back_to_cached_weather(self, stub):
+        stub.status = 500
+        conditions = await AmbientWeatherService.fetch_conditions(
+            52.52, 13.40, "Test", cached_weather={"weather_code": 61, "temperature": 4.0}
+        )
+
+        assert conditions.weather_code == 61
+        assert conditions.temperature == 4.0
+
+
+class TestHeartbeatPrefetch:
+    async def test_only_weather_enabled_sims_share_one_request(self, stub):
+        sims = [
+            {"id": "a", "name": "A", "theme": "custom"},
+            {"id": "b", "name": "B", "theme": "custom"},
+            {"id": "c", "name": "C", "weather_lat": 40.71, "weather_lon": -74.0},
+            {"id": "d", "name": "D", "weather_lat": -33.87, "weather_lon": 151.21},
+        ]
+        fake = FakeSupabase(
+            {
+                "simulations": [
+                    {**sim, "status": "active", "simulation_type": "template", "next_heartbeat_at": None}
+                    for sim in sims
+                ],
+                "simulation_settings": [
+                    {
+                        "simulation_id": sim_id,
+                        "category": "heartbeat",
+                        "setting_key": "weather_enabled",
+                        "setting_value": value,
+                    }
+                    for sim_id, value in (("a", "true"), ("b", "true"), ("c", True), ("d", "false"))
+                ],
+            }
+        )
+        ticked: list[str] = []
+
+        async def _tick(_admin, sim, _interval):
+            ticked.append(sim["id"])
+
+        with (
+            patch.object(HeartbeatService, "_tick_simulation", side_effect=_tick),
+            patch.object(HeartbeatService, "_flush_game_metrics", new=AsyncMock()),
+        ):
+            await HeartbeatService._tick_due_simulations(await fake.client(), 3600)
+
+        assert sorted(ticked) == ["a", "b", "c", "d"]
+        assert len(stub.requests) == 1
+        # a + b share the theme-default cell, c has its own; d has weather off
+        assert len(stub.requests[0]["latitude"][0].split(",")) == 2
+
+    async def test_nothing_is_fetched_when_no_sim_enables_weather(self, stub):
+        fake = FakeSupabase(
+            {"simulations": [{"id": "a", "name": "A", "status": "active", "simulation_type": "template"}]}
+        )
+
+        with (
+            patch.object(HeartbeatService, "_tick_simulation", new=AsyncMock()),
+            patch.object(HeartbeatService, "_flush_game_metrics", new=AsyncMock()),
+        ):
+            await HeartbeatService._tick_due_simulations(await fake.client(), 3600)
+
+        assert stub.requests == []
+
+
+class TestLastSummary:
+    async def test_previous_heartbeat_is_read_once_per_simulation(self, stub):
+        fake = FakeSupabase(
+            {
+                "simulation_heartbeats": [
+                    {
+                        "simulation_id": "a",
+                        "status": "completed",
+                        "tick_number": 7,
+                        "summary": {"weather": {"weather_code": 61, "bag_state": {"rain": [1, 0]}}},
+                    }
+                ]
+            }
+        )
+        client = await fake.client()
+        sim = {"id": "a", "name": "A", "theme": "custom"}
+
+        with track_calls() as first:
+            _, summary = await AmbientWeatherService.process_tick(client, "a", sim, "hb-1", 8)
+        with track_calls() as second:
+            await AmbientWeatherService.process_tick(client, "a", sim, "hb-2", 9)
+
+        assert first.tables["simulation_heartbeats"] == 1
+        assert "simulation_heartbeats" not in second.tables
+        assert WeatherProvider.last_summary("a")["bag_state"] == summary["bag_state"]
+        assert len(stub.requests) == 1
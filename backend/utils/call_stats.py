@@ -0,0 +1,191 @@
+"""Per-scope counters for outbound calls: PostgREST round trips and LLM requests.
+
+``track_calls()`` opens a scope that collects every call made by the code
+running inside it, including tasks spawned from it (they inherit the
+context). Scopes nest, and a call counts toward every enclosing scope, so
+one heartbeat phase, the whole tick, and an HTTP request can be measured
+at the same time. Outside any scope, recording costs one ContextVar lookup.
+
+PostgREST round trips are recorded by a wrapper around the client's httpx
+transport (``instrument_client``): latency, response bytes, the table or RPC hit,
+and rows from PostgREST's ``Content-Range`` header. The same table queried
+repeatedly with the same filter columns but different values is flagged
+as an N+1 pattern. When a Sentry transaction is active, each round trip
+also becomes an ``op="db"`` span, which is what Sentry's own N+1 detector
+groups on. LLM requests are counted by ``note_llm_call()`` in
+OpenRouterService.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import httpx
+import sentry_sdk
+
+if TYPE_CHECKING:
+    from supabase import AsyncClient as Client
+
+_CONTENT_RANGE = re.compile(r"^(\d+)-(\d+)/")
+_REST_PREFIX = "/rest/v1/"
+# Query parameters that shape the result rather than filter rows.
+_NON_FILTER_PARAMS = frozenset({"select", "order", "limit", "offset", "on_conflict", "columns"})
+_EXTENSION_KEY = "call_stats"
+
+# Distinct parameter sets for one query shape before it counts as N+1.
+N_PLUS_ONE_THRESHOLD = 5
+
+
+@dataclass
+class CallStats:
+    db_calls: int = 0
+    db_rows: int = 0
+    llm_calls: int = 0
+    db_ms: float = 0.0
+    db_bytes: int = 0
+    tables: Counter[str] = field(default_factory=Counter, repr=False)
+    _shapes: dict[str, set[str]] = field(default_factory=dict, repr=False)
+
+    def as_dict(self) -> dict:
+        """The compact counters stored with heartbeat phase records."""
+        return {"db_calls": self.db_calls, "db_rows": self.db_rows, "llm_calls": self.llm_calls}
+
+    def n_plus_one(self) -> list[str]:
+        """Query shapes repeated with at least ``N_PLUS_ONE_THRESHOLD`` different parameter sets."""
+        return sorted(shape for shape, params in self._shapes.items() if len(params) >= N_PLUS_ONE_THRESHOLD)
+
+    def summary(self) -> dict:
+        """Full breakdown for logs and the admin query-stats rollup."""
+        return {
+            "db_calls": self.db_calls,
+            "db_rows": self.db_rows,
+            "db_ms": round(self.db_ms, 1),
+            "db_bytes": self.db_bytes,
+            "llm_calls": self.llm_calls,
+            "tables": dict(self.tables.most_common(10)),
+            "n_plus_one": self.n_plus_one(),
+        }
+
+
+_scopes: ContextVar[tuple[CallStats, ...]] = ContextVar("call_stats_scopes", default=())
+
+
+@contextmanager
+def track_calls() -> Iterator[CallStats]:
+    """Collect the calls made inside the block (and tasks it spawns)."""
+    stats = CallStats()
+    token = _scopes.set((*_scopes.get(), stats))
+    try:
+        yield stats
+    finally:
+        _scopes.reset(token)
+
+
+def note_db_call(
+    rows: int = 0,
+    *,
+    table: str = "",
+    elapsed_ms: float = 0.0,
+    nbytes: int = 0,
+    shape: str = "",
+    params: str = "",
+) -> None:
+    for stats in _scopes.get():
+        stats.db_calls += 1
+        stats.db_rows += rows
+        stats.db_ms += elapsed_ms
+        stats.db_bytes += nbytes
+        if table:
+            stats.tables[table] += 1
+        if shape:
+            stats._shapes.setdefault(shape, set()).add(params)
+
+
+def note_llm_call() -> None:
+    for stats in _scopes.get():
+        stats.llm_calls += 1
+
+
+def _rows_from_content_range(header: str | None) -> int:
+    match = _CONTENT_RANGE.match(header or "")
+    return int(match.group(2)) - int(match.group(1)) + 1 if match else 0
+
+
+def _query_shape(request: httpx.Request) -> tuple[str, str, str]:
+    """``(table, shape, params)`` — e.g. ``("agents", "GET agents (id)", "id=eq.42")``."""
+    path = request.url.path
+    table = path.split(_REST_PREFIX, 1)[-1] if _REST_PREFIX in path else path.rsplit("/", 1)[-1]
+    filters = sorted({key for key, _ in request.url.params.multi_items() if key not in _NON_FILTER_PARAMS})
+    shape = f"{request.method} {table}" + (f" ({', '.join(filters)})" if filters else "")
+    return table, shape, str(request.url.params)
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Wraps a PostgREST session's transport to time and count each round trip.
+
+    A transport wrapper rather than event hooks: a request that fails in the
+    transport (connect error, timeout) never reaches a response hook, which
+    leaked its Sentry span and dropped the call from the counts.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport):
+        self._inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        parent = sentry_sdk.get_current_span()
+        if not _scopes.get() and parent is None:
+            return await self._inner.handle_async_request(request)
+        table, shape, params = _query_shape(request)
+        span = None
+        if parent is not None:
+            span = parent.start_child(op="db", name=shape, origin="auto.db.postgrest")
+            span.set_data("db.system", "postgresql")
+        t0 = time.perf_counter()
+        rows = nbytes = 0
+        try:
+            response = await self._inner.handle_async_request(request)
+            # PostgREST responses are read in full by the caller anyway; reading
+            # here makes the payload size available without a Content-Length.
+            nbytes = len(await response.aread())
+            rows = _rows_from_content_range(response.headers.get("content-range"))
+            if span is not None:
+                span.set_data("db.rows", rows)
+                span.set_data("http.response_content_length", nbytes)
+                span.set_http_status(response.status_code)
+            return response
+        except BaseException:
+            if span is not None:
+                span.set_status("internal_error")
+            raise
+        finally:
+            if span is not None:
+                span.finish()
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            note_db_call(rows, table=table, elapsed_ms=elapsed_ms, nbytes=nbytes, shape=shape, params=params)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def instrument_client(client: Client) -> Client:
+    """Record the client's PostgREST round trips in the active scopes.
+
+    Must run after any auth change on the client: supabase-py rebuilds its
+    PostgREST session on sign-in, which drops the instrumented transport.
+    """
+    session = getattr(client.postgrest, "session", None)
+    if isinstance(session, httpx.AsyncClient) and not isinstance(session._transport, _InstrumentedTransport):
+        session._transport = _InstrumentedTransport(session._transport)
+        # Proxy mounts (HTTP(S)_PROXY) take precedence over the default transport.
+        session._mounts = {
+            pattern: transport if transport is None else _InstrumentedTransport(transport)
+            for pattern, transport in session._mounts.items()
+        }
+    return client
@@ -0,0 +1,165 @@
+"""Request-scoped batching loaders for PostgREST lookups by key.
+
+Code that resolves related rows one id at a time (an agent name per
+mission, the owning simulation per row, every drafted agent) costs one
+round trip per id. A ``DataLoader`` collects every ``load(key)`` made in
+the same event-loop tick and issues a single ``.in_(column, keys)`` query
+for them, then caches each key's result for the rest of the request.
+
+Loaders are grouped in a ``DataLoaders`` registry bound to one Supabase
+client — one loader per ``(table, column, select)``. Routers get a fresh
+registry per request through ``backend.dependencies.get_loaders`` and pass
+it down to services; a service called without one can build its own
+(``DataLoaders(supabase)``) for local batching.
+
+Results follow the client they were loaded with, so a registry must never
+outlive its request or be shared between clients with different RLS.
+
+Usage::
+
+    agents = loaders.get("agents", select="id, name")
+    ada, grace = await asyncio.gather(agents.load(ada_id), agents.load(grace_id))
+    names = await loaders.get("simulations", select="id, name").load_many(sim_ids)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from backend.utils.responses import extract_list
+from supabase import AsyncClient as Client
+
+logger = logging.getLogger(__name__)
+
+_MAX_BATCH = 200  # keys per IN (...) — keeps the request URL well under limits
+
+
+class DataLoader:
+    """Batches ``load(key)`` calls on one ``(table, column)`` into ``in_()`` queries.
+
+    With ``many=False`` each key resolves to the first matching row or
+    ``None``; with ``many=True`` to the list of matching rows (e.g. all
+    zones of a city). ``select`` must include ``column``.
+    """
+
+    def __init__(
+        self,
+        supabase: Client,
+        table: str,
+        column: str = "id",
+        *,
+        select: str = "*",
+        many: bool = False,
+        max_batch: int = _MAX_BATCH,
+    ) -> None:
+        self._supabase = supabase
+        self.table = table
+        self.column = column
+        self.select = select
+        self.many = many
+        self.max_batch = max_batch
+        self._cache: dict[str, asyncio.Future] = {}
+        self._queue: list[str] = []
+        self.batches = 0  # number of queries issued (tests, diagnostics)
+
+    async def load(self, key: UUID | str) -> Any:
+        """Row (or rows) for ``key``, batched with other loads in this tick."""
+        return await self._future(str(key))
+
+    async def load_many(self, keys: Iterable[UUID | str]) -> list[Any]:
+        """Results for ``keys`` in order, all in one batch."""
+        futures = [self._future(str(key)) for key in keys]
+        return list(await asyncio.gather(*futures))
+
+    def prime(self, key: UUID | str, value: Any) -> None:
+        """Seed the cache with an already-fetched row (no-op if present)."""
+        key = str(key)
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: UUID | str | None = None) -> None:
+        """Forget one key (after a write) or the whole cache."""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(str(key), None)
+
+    def _future(self, key: str) -> asyncio.Future:
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        if not self._queue:
+            # Runs after every task already scheduled for this tick has had
+            # its turn, so their loads land in the same batch.
+            loop.call_soon(self._dispatch)
+        self._queue.append(key)
+        return future
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        for start in range(0, len(keys), self.max_batch):
+            task = asyncio.ensure_future(self._run_batch(keys[start : start + self.max_batch]))
+            task.add_done_callback(_log_unexpected)
+
+    async def _run_batch(self, keys: list[str]) -> None:
+        self.batches += 1
+        try:
+            response = await self._supabase.table(self.table).select(self.select).in_(self.column, keys).execute()
+            rows = extract_list(response)
+        except Exception as exc:  # re-raised in every waiting load()
+            for key in keys:
+                future = self._cache.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            return
+
+        grouped: dict[str, list[dict]] = {}
+        for row in rows:
+            grouped.setdefault(str(row.get(self.column)), []).append(row)
+        for key in keys:
+            future = self._cache.get(key)
+            if future is None or future.done():
+                continue
+            matches = grouped.get(key, [])
+            future.set_result(matches if self.many else (matches[0] if matches else None))
+
+
+def _log_unexpected(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("DataLoader batch crashed", exc_info=task.exception())
+
+
+class DataLoaders:
+    """Per-request registry of ``DataLoader``s sharing one Supabase client."""
+
+    def __init__(self, supabase: Client) -> None:
+        self.supabase = supabase
+        self._loaders: dict[tuple[str, str, str, bool], DataLoader] = {}
+
+    def get(self, table: str, column: str = "id", *, select: str = "*", many: bool = False) -> DataLoader:
+        """The loader for ``(table, column, select)``, created on first use."""
+        key = (table, column, select, many)
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = DataLoader(self.supabase, table, column, select=select, many=many)
+            self._loaders[key] = loader
+        return loader
+
+    def clear(self, table: str | None = None) -> None:
+        """Drop cached rows — of one table after a write to it, or all."""
+        for (loader_table, *_), loader in self._loaders.items():
+            if table is None or loader_table == table:
+                loader.clear()
+
+    @property
+    def batches(self) -> int:
+        return sum(loader.batches for loader in self._loaders.values())
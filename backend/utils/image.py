@@ -17,6 +17,22 @@ AVIF_QUALITY_THUMB = 80  # Display-optimized thumbnails
 MAX_IMAGE_DIMENSION = 1024  # Default thumbnail max edge
 
 
+def decoded_size_estimate(image_bytes: bytes) -> int:
+    """Peak bytes a full decode + encode of the image will allocate.
+
+    Reads only the header (no pixel decode): one RGBA frame plus the same
+    again for the resized copy and encoder buffers. Falls back to a
+    multiple of the compressed size when the header cannot be read.
+    """
+    try:
+        from PIL import Image
+
+        width, height = Image.open(io.BytesIO(image_bytes)).size
+    except (ImportError, OSError, ValueError):
+        return len(image_bytes) * 10
+    return width * height * 4 * 2
+
+
 def convert_to_avif(
     image_bytes: bytes,
     max_dimension: int | None = MAX_IMAGE_DIMENSION,
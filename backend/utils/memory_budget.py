@@ -0,0 +1,38 @@
+"""Async byte budget for memory-heavy stages (image decode/encode).
+
+Holders reserve an estimate of what they are about to allocate and wait
+while the budget is exhausted, so concurrent pipelines keep a fixed peak
+regardless of how many jobs are in flight. A reservation larger than the
+whole budget is clamped to it — it runs alone instead of never.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+class MemoryBudget:
+    """Counting semaphore over bytes."""
+
+    def __init__(self, limit_bytes: int) -> None:
+        self.limit = max(1, limit_bytes)
+        self.in_use = 0
+        self.peak = 0
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def reserve(self, nbytes: int) -> AsyncIterator[int]:
+        """Hold ``nbytes`` (clamped to the limit) for the duration of the block."""
+        nbytes = min(max(0, nbytes), self.limit)
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_use + nbytes <= self.limit)
+            self.in_use += nbytes
+            self.peak = max(self.peak, self.in_use)
+        try:
+            yield nbytes
+        finally:
+            async with self._cond:
+                self.in_use -= nbytes
+                self._cond.notify_all()
@@ -0,0 +1,93 @@
+"""Keyset (cursor) pagination helpers for PostgREST list queries.
+
+Offset pagination (``.range(offset, offset + limit - 1)``) makes Postgres
+walk past every skipped row, and ``count="exact"`` counts the whole filtered
+set — both grow with the table. Keyset pagination seeks straight to the
+first row after the previous page's last ``(order_by, id)`` pair, so deep
+pages cost the same as the first.
+
+The cursor is opaque to clients: url-safe base64 of the last row's sort
+value and id plus the ordering it was issued for. Reusing a cursor with a
+different ordering is rejected rather than silently returning wrong rows.
+
+``id`` breaks ties. Every list (offset or keyset) adds the ``id`` tie-break,
+so a cursor taken from an offset page continues exactly where that page
+ended. Nullable sort columns (e.g. ``events.occurred_at``) are paged with
+Postgres' default NULL placement — what a plain ``.order()`` produces:
+NULLs after every value ascending, before every value descending.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any, Literal
+
+from backend.utils.errors import bad_request
+
+CountMode = Literal["exact", "planned", "estimated"]
+
+
+def _quote(value: Any) -> str:
+    """Quote a value for a PostgREST logic-tree filter (commas, colons, parens)."""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def encode_cursor(row: dict, *, order_by: str, order_desc: bool) -> str:
+    payload = {"v": row.get(order_by), "id": str(row["id"]), "o": order_by, "d": order_desc}
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *, order_by: str, order_desc: bool) -> tuple[Any, str]:
+    """Return ``(sort_value, id)`` from a cursor issued for this ordering."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        value, row_id = payload["v"], str(payload["id"])
+        issued_for = (payload["o"], bool(payload["d"]))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError):
+        raise bad_request("Invalid pagination cursor.") from None
+    if issued_for != (order_by, order_desc):
+        raise bad_request("Pagination cursor does not match this list's ordering.")
+    return value, row_id
+
+
+def apply_page(
+    query,
+    *,
+    order_by: str,
+    order_desc: bool,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+):
+    """Add the ``id`` tie-break and either a keyset seek or an offset window.
+
+    ``query`` must already be ordered by ``order_by``.
+    """
+    query = query.order("id", desc=order_desc)
+    if cursor is None:
+        return query.range(offset, offset + limit - 1)
+    value, row_id = decode_cursor(cursor, order_by=order_by, order_desc=order_desc)
+    op = "lt" if order_desc else "gt"
+    if value is None:
+        # Rest of the NULL run, then (descending) every non-NULL row.
+        seek = f"and({order_by}.is.null,id.{op}.{_quote(row_id)})"
+        if order_desc:
+            seek += f",{order_by}.not.is.null"
+    else:
+        seek = f"{order_by}.{op}.{_quote(value)},and({order_by}.eq.{_quote(value)},id.{op}.{_quote(row_id)})"
+        if not order_desc:
+            seek += f",{order_by}.is.null"
+    query = query.or_(seek)
+    return query.limit(limit)
+
+
+def next_cursor(rows: list[dict], *, limit: int, order_by: str, order_desc: bool) -> str | None:
+    """Cursor for the page after ``rows`` — None when this was the last page."""
+    if len(rows) < limit or not rows or "id" not in rows[-1]:
+        return None
+    return encode_cursor(rows[-1], order_by=order_by, order_desc=order_desc)
@@ -65,7 +65,13 @@ def extract_list(response: object) -> list[dict]:
     return getattr(response, "data", None) or []
 
 
-def paginated(data: list, total: int, limit: int, offset: int) -> PaginatedResponse:
+def paginated(
+    data: list,
+    total: int,
+    limit: int,
+    offset: int,
+    next_cursor: str | None = None,
+) -> PaginatedResponse:
     """Build a PaginatedResponse with auto-computed count.
 
     Replaces the verbose pattern::
@@ -77,5 +83,5 @@ def paginated(data: list, total: int, limit: int, offset: int) -> PaginatedRespo
     """
     return PaginatedResponse(
         data=data,
-        meta=PaginationMeta(count=len(data), total=total, limit=limit, offset=offset),
+        meta=PaginationMeta(count=len(data), total=total, limit=limit, offset=offset, next_cursor=next_cursor),
     )
@@ -0,0 +1,111 @@
+"""Resumable (TUS) uploads to Supabase Storage.
+
+``storage.from_(bucket).upload()`` sends the whole object in one multipart
+request, which needs the body in memory and restarts from zero when the
+connection drops. For large objects (export archives) this module speaks
+the TUS protocol Supabase Storage exposes at ``/storage/v1/upload/resumable``:
+the file is read and sent in fixed 6 MiB chunks, and a failed chunk is
+retried from the offset the server reports instead of from the start.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+from collections.abc import Awaitable, Callable
+from typing import BinaryIO
+
+import httpx
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Supabase Storage requires exactly 6 MiB per chunk (the last one may be shorter).
+TUS_CHUNK_SIZE = 6 * 1024 * 1024
+_TUS_VERSION = "1.0.0"
+
+
+def _metadata(**fields: str) -> str:
+    return ",".join(f"{key} {base64.b64encode(value.encode()).decode()}" for key, value in fields.items())
+
+
+async def upload_resumable(
+    bucket: str,
+    path: str,
+    file: BinaryIO,
+    size: int,
+    *,
+    content_type: str,
+    upsert: bool = False,
+    max_retries: int = 3,
+    on_progress: Callable[[int], Awaitable[None]] | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> None:
+    """Upload ``size`` bytes of ``file`` (seekable) to ``bucket/path``.
+
+    ``on_progress`` is awaited with the confirmed byte offset after every
+    chunk. Raises ``httpx.HTTPError`` once a chunk has failed ``max_retries``
+    times in a row.
+    """
+    key = settings.supabase_service_role_key
+    headers = {"authorization": f"Bearer {key}", "apikey": key, "tus-resumable": _TUS_VERSION}
+    owns_client = client is None
+    client = client or httpx.AsyncClient(timeout=60.0)
+    try:
+        created = await client.post(
+            f"{settings.supabase_url}/storage/v1/upload/resumable",
+            headers={
+                **headers,
+                "upload-length": str(size),
+                "x-upsert": "true" if upsert else "false",
+                "upload-metadata": _metadata(bucketName=bucket, objectName=path, contentType=content_type),
+            },
+        )
+        created.raise_for_status()
+        location = created.headers["location"]
+
+        offset = 0
+        failures = 0
+        resync = False
+        while offset < size:
+            try:
+                if resync:
+                    # The failed chunk may have been partly stored — continue
+                    # from wherever the server got to.
+                    head = await client.head(location, headers=headers)
+                    head.raise_for_status()
+                    offset = int(head.headers["upload-offset"])
+                    resync = False
+                    continue
+                file.seek(offset)
+                chunk = file.read(TUS_CHUNK_SIZE)
+                resp = await client.patch(
+                    location,
+                    content=chunk,
+                    headers={
+                        **headers,
+                        "upload-offset": str(offset),
+                        "content-type": "application/offset+octet-stream",
+                    },
+                )
+                resp.raise_for_status()
+                offset = int(resp.headers["upload-offset"])
+                failures = 0
+            except httpx.HTTPError:
+                failures += 1
+                if failures > max_retries:
+                    raise
+                logger.warning(
+                    "Resumable upload chunk failed — resuming",
+                    extra={"path": path, "offset": offset, "attempt": failures},
+                )
+                resync = True
+                await asyncio.sleep(0.5 * 2**failures)
+                continue
+            if on_progress is not None:
+                await on_progress(offset)
+    finally:
+        if owns_client:
+            await client.aclose()
@@ -83,6 +83,7 @@ import asyncio
 from typing import TYPE_CHECKING
 
 from backend.config import settings
+from backend.utils.call_stats import instrument_client
 from supabase import create_async_client
 
 if TYPE_CHECKING:
@@ -118,9 +119,11 @@ async def get_admin_supabase_client() -> Client:
         # past the outer check between its None-observation and
         # lock acquisition.
         if _client is None:
-            _client = await create_async_client(
-                settings.supabase_url,
-                settings.supabase_service_role_key,
+            _client = instrument_client(
+                await create_async_client(
+                    settings.supabase_url,
+                    settings.supabase_service_role_key,
+                )
             )
     return _client
 
@@ -5,9 +5,11 @@
  * 1. Global config editing (toggles + numeric inputs for all heartbeat params)
  * 2. Per-simulation override editor (select sim, set interval/enabled overrides)
  * 3. Cascade rules table (source/target, threshold, rate, cooldown, active toggle)
+ * 4. Phase timings (p50/p95, DB calls, rows, LLM calls over recent ticks)
  *
  * Grid of simulation cards: last tick, next tick countdown, status,
- * active arcs, scar tissue level. Force Tick button per simulation.
+ * active arcs, scar tissue level, tick p50/p95 and slowest phase.
+ * Force Tick button per simulation.
  */
 
 import { localized, msg } from '@lit/localize';
@@ -19,6 +21,7 @@ import { captureError } from '../../services/SentryService.js';
 import type {
   CascadeRule,
   HeartbeatDashboard,
+  HeartbeatPhaseTiming,
   HeartbeatSimulationStatus,
   PlatformSetting,
 } from '../../types/index.js';
@@ -891,6 +894,17 @@ export class VelgAdminHeartbeatTab extends LitElement {
 
   /* ── Formatters ────────────────────────── */
 
+  private _formatMs(ms: number | null | undefined): string {
+    if (ms == null) return '—';
+    return ms >= 1000 ? `${(ms / 1000).toFixed(1)}s` : `${Math.round(ms)}ms`;
+  }
+
+  private _slowestPhase(phases: HeartbeatPhaseTiming[]): string {
+    if (phases.length === 0) return '—';
+    const slowest = phases.reduce((a, b) => (b.p95_ms > a.p95_ms ? b : a));
+    return `${slowest.phase} (${this._formatMs(slowest.p95_ms)})`;
+  }
+
   private _formatCountdown(nextAt: string | null | undefined): string {
     if (!nextAt) return msg('Never ticked');
     const next = new Date(nextAt);
@@ -945,6 +959,7 @@ export class VelgAdminHeartbeatTab extends LitElement {
       ${this._renderEventAgingRules()}
       ${this._renderOverrideEditor(d)}
       ${this._renderCascadeRules()}
+      ${this._renderPhaseTimings(d)}
       ${this._renderSimulations(d)}
     `;
   }
@@ -1431,7 +1446,68 @@ export class VelgAdminHeartbeatTab extends LitElement {
     `;
   }
 
-  /* ── Section 4: Simulation Cards ───────── */
+  /* ── Section 4: Phase Timings ──────────── */
+
+  private _renderPhaseTimings(d: HeartbeatDashboard) {
+    const t = d.timings;
+    return html`
+      <div class="section">
+        <div class="section-header">
+          <div class="section-header__marker"></div>
+          <h2 class="section-header__title">${msg('Phase Timings')}</h2>
+        </div>
+
+        ${
+          !t || t.phases.length === 0
+            ? html`<div class="empty">${msg('No tick profiles recorded yet.')}</div>`
+            : html`
+              <div class="rules-table-wrap">
+                <table class="rules-table" role="grid">
+                  <thead>
+                    <tr>
+                      <th scope="col">${msg('Phase')}</th>
+                      <th scope="col">p50</th>
+                      <th scope="col">p95</th>
+                      <th scope="col">${msg('DB calls')}</th>
+                      <th scope="col">${msg('Rows')}</th>
+                      <th scope="col">${msg('LLM calls')}</th>
+                      <th scope="col">${msg('Failures')}</th>
+                    </tr>
+                  </thead>
+                  <tbody>
+                    ${t.phases.map((p) => this._renderPhaseRow(p))}
+                    <tr>
+                      <td><span class="rules-table__signature">${msg('Full tick')}</span></td>
+                      <td>${this._formatMs(t.tick_p50_ms)}</td>
+                      <td>${this._formatMs(t.tick_p95_ms)}</td>
+                      <td colspan="4">
+                        <span class="rules-table__timestamp">${msg('Samples')}: ${t.samples}</span>
+                      </td>
+                    </tr>
+                  </tbody>
+                </table>
+              </div>
+            `
+        }
+      </div>
+    `;
+  }
+
+  private _renderPhaseRow(p: HeartbeatPhaseTiming) {
+    return html`
+      <tr>
+        <td><span class="rules-table__signature">${p.phase}</span></td>
+        <td>${this._formatMs(p.p50_ms)}</td>
+        <td>${this._formatMs(p.p95_ms)}</td>
+        <td>${p.avg_db_calls.toFixed(1)}</td>
+        <td>${p.avg_db_rows.toFixed(0)}</td>
+        <td>${p.avg_llm_calls.toFixed(2)}</td>
+        <td>${p.failures}</td>
+      </tr>
+    `;
+  }
+
+  /* ── Section 5: Simulation Cards ───────── */
 
   private _renderSimulations(d: HeartbeatDashboard) {
     return html`
@@ -1484,6 +1560,22 @@ export class VelgAdminHeartbeatTab extends LitElement {
             <span class="stat__label">${msg('Next Tick')}</span>
             <span class="stat__value">${this._formatCountdown(sim.next_heartbeat_at)}</span>
           </div>
+          ${
+            sim.timings?.samples
+              ? html`
+                <div class="stat">
+                  <span class="stat__label">${msg('Tick p50 / p95')}</span>
+                  <span class="stat__value">
+                    ${this._formatMs(sim.timings.tick_p50_ms)} / ${this._formatMs(sim.timings.tick_p95_ms)}
+                  </span>
+                </div>
+                <div class="stat">
+                  <span class="stat__label">${msg('Slowest phase')}</span>
+                  <span class="stat__value">${this._slowestPhase(sim.timings.phases)}</span>
+                </div>
+              `
+              : nothing
+          }
         </div>
 
         ${
@@ -384,8 +384,15 @@ export class VelgChronicleExport extends LitElement {
       purchaseId,
       (p: FeaturePurchase) => {
         if (p.status === 'processing') {
+          const reported = (p.result as { progress?: { phase: string; current: number; total: number } })
+            ?.progress;
           const elapsed = Date.now() - new Date(p.created_at).getTime();
-          const progress = Math.min(95, Math.floor(elapsed / 600));
+          let progress = Math.min(95, Math.floor(elapsed / 600));
+          if (reported?.total) {
+            // Hi-res archives report real progress: downloads fill the bar to 80%, the upload to 95%.
+            const [start, span] = reported.phase === 'uploading' ? [80, 15] : [0, 80];
+            progress = Math.floor(start + (reported.current / reported.total) * span);
+          }
           if (type === 'codex') this._codexProgress = progress;
           else this._hiresProgress = progress;
         }
@@ -283,6 +283,7 @@
 's091dd6d6b5697679': `Strukturelle Ermüdung wird gescannt`,
 's09218687d0aa8f05': `Blockiert Botschafter für 3 Zyklen`,
 's093641b6b0b83f65': `Beginne mit einer leeren Seite und definiere alle Taxonomien manuell.`,
+'s093695260e37663c': `Stichproben`,
 's09391a34f9177cc3': str`${0} ausstehende Freigabeanfrage(n)`,
 's09496407b5d8849f': `RP`,
 's09511fa51e2df09d': `Der Anfangskeim`,
@@ -2743,6 +2744,7 @@ I am returning my Bureau credentials. I am staying. Not because the Cite has con
 's5f629a6cf64431bc': `Artikel transformieren`,
 's5f638e093a9475d6': `Diplomatische Signale`,
 's5f6d493aa2083b20': `Zugriffsrichtlinie konnte nicht aktualisiert werden.`,
+'s5f6ebf95d19f8e33': `Phasenlaufzeiten`,
 's5f6f9644660e172f': `Benutzerdefinierte Breiten-/Längengrad-Überschreibung`,
 's5f727bffa219bbd3': `Keine Berufe zugewiesen.`,
 's5f78cf86663f468a': `Fehler beim Laden der Integrations-Einstellungen`,
@@ -2989,6 +2991,7 @@ ASSESSMENT: All systems nominal. HAVEN is aware that this statement is unusual.
 's6747acf5ac300175': `Wirtschaftskrise`,
 's674e9843445d37c3': `Sekunden zwischen Heartbeat-Ticks über alle aktiven Simulationen. Niedrigere Werte (10–30s) machen Simulationen lebendig und reaktionsschnell, erhöhen aber Server-CPU- und DB-Last proportional. Höhere Werte (60–120s) reduzieren die Last.`,
 's674ef2a0a46654ea': `Wie erinnern sich KI-Charaktere an vergangene Gespräche?`,
+'s6757a04efc70f5ea': `DB-Aufrufe`,
 's67692ad3a0f77eee': `Bidirektionale Beziehung`,
 's679e2f205c4d05d6': `Übertragungskanal gesperrt.`,
 's67b8018a7525d086': `Jenseits des Turing-Tests`,
@@ -4209,6 +4212,7 @@ CARTOGRAPHIC NOTE: No Cartographer has been assigned to Conventional Memory. The
 's94ce12ec16c77830': `Sozialdynamik`,
 's94d63573d312fe9b': `Identität`,
 's94db77580ece9a3b': `Konfrontation`,
+'s94e31af44158289f': `Langsamste Phase`,
 's94e8a172d8f4805e': `Puls`,
 's94ecba01f5292a80': `Erkunde Flaggschiff-Simulationen und beantrage Zugang.`,
 's94ed854bc800b54c': `Steigendes Wasser`,
@@ -4485,6 +4489,7 @@ BUREAU ASSESSMENT: Station Null is Instance C of the TOWER phenomenon – the in
 's9e6a38d6c7b139ab': `Counter-Intel-Sweeps`,
 's9e6a9c05eaaa3bfa': `+ Ereignis erstellen`,
 's9e6f9b57969ac357': `Deep-Space-Horror`,
+'s9e6fdc1ac07c2ffb': `Noch keine Tick-Profile aufgezeichnet.`,
 's9e7195c07946fbef': `Jede Resonanz hat eine Signatur (eine eindeutige Wellenformkennung), eine Magnitude (wie stark der Effekt) und eine Abklingrate (wie schnell sie nachlässt). Aktive Resonanzen modifizieren Spielmechaniken: sie können Erfolgsraten steigern oder senken.`,
 's9e722735c4eb77c8': `Literarische Domains`,
 's9e7e430455123c4e': `Systeme, die sich selbst erschaffen`,
@@ -5689,6 +5694,7 @@ CARTOGRAPHIC NOTE: This is Dr. Eleanor Hartley's Shard. The Bureau's senior fiel
 'scac33d89d10e383e': `Zyklus 5: Velgariens Spionageabwehr fängt den Propagandisten ab und rettet Souveränitätspunkte.`,
 'scac48aec63cfdb2d': `Anmelden, um Nachrichtenartikel zu durchsuchen und umzuwandeln`,
 'scac6554173b3c72a': `Hierher bewegen`,
+'scace072bef961918': `Zeilen`,
 'scad29a51b4101c08': `Beziehungsveränderungen`,
 'scad5eccc2fe20425': `Bergegut, im Trümmerfeld gefangen.`,
 'scae04091588abd60': `Welten`,
@@ -6133,6 +6139,7 @@ Shattered worlds. Bleeding borders. The map has no edges. Which world do you ent
 'sdbda38e8f04a8c4e': `Das Multiversum ist kein Problem, das gelöst werden muss. Es ist eine Frage, die bewohnt werden will.`,
 'sdbdf61a5b207bd4d': `untersucht die sich auflösenden Muster`,
 'sdbe1dd4c097e6939': `Noch keine Spielstände aufgezeichnet.`,
+'sdbf94c5ca5fb21ce': `Tick p50 / p95`,
 'sdc04f3afa87ccf7f': `Was sind Ereignisse?`,
 'sdc24016839eb9c79': `Agentenstimmung &amp; Stress`,
 'sdc2508aba9b9ef42': `Einstellungen erfolgreich gespeichert.`,
@@ -6660,6 +6667,7 @@ DIRECTOR'S NOTE: The recommended action section has been consumed by the documen
 'sef84f9bb51dbe45b': `Ein unerwarteter Fehler beim Laden der Straßen`,
 'sef852ce66910e061': `Infrastrukturschädigung. Stuft die Sicherheitsstufen der Zielzone herab und schwächt die Verteidigung für Folgeoperationen. Clausewitz’ Friktion, zur Waffe gemacht.`,
 'sef90f4462ac9809c': `Aktivitäts-Abfangprotokoll`,
+'sef9a0e8d4191c829': `Gesamter Tick`,
 'sef9fb24c04d90f87': `Abgelehnt`,
 'sefa31a113ecaf05b': `Narrative Kohärenz.`,
 'sefa6d10a951e2aee': str`Endgültig zerstören: ${0}`,
@@ -7020,6 +7028,7 @@ DIRECTOR'S NOTE: The recommended action section has been consumed by the documen
 'sfc5f4ae305bebcdf': `8 Dungeon-Archetypen – jeder an einen Resonanztyp gebunden, mit einzigartigen Feinden und Begegnungen`,
 'sfc689a2e3ae782de': `Diese Archetyp-Detailseite ist noch nicht verf\\u00fcgbar. Erkunde die verf\\u00fcgbaren Archetypen unten.`,
 'sfc710e8c4e733b26': `Autonome Agenten-Operationen`,
+'sfc7b75be43f7bb21': `LLM-Aufrufe`,
 'sfc7ddf1195836108': `Räumliche Telemetrie wird komprimiert`,
 'sfc8180c642f2eca2': `Was ist eine Epoche?`,
 'sfc8531b2fd0f31cb': `Bilder`,
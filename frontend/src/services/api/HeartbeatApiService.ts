@@ -122,8 +122,12 @@ export class HeartbeatApiService extends BaseApiService {
     return this.get('/admin/heartbeat/cascade-rules');
   }
 
-  forceTick(simulationId: string): Promise<ApiResponse<HeartbeatTick>> {
-    return this.post(`/admin/heartbeat/force-tick/${simulationId}`);
+  /** With `profile`, the tick runs under cProfile and the report is returned as `cprofile`. */
+  forceTick(
+    simulationId: string,
+    profile = false,
+  ): Promise<ApiResponse<HeartbeatTick & { cprofile?: string }>> {
+    return this.post(`/admin/heartbeat/force-tick/${simulationId}${profile ? '?profile=true' : ''}`);
   }
 }
 
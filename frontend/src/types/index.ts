@@ -1489,7 +1489,7 @@ export type PaginatedResponse<T> =
   | {
       success: true;
       data: T[];
-      meta: { count: number; total: number; limit: number; offset: number };
+      meta: { count: number; total: number; limit: number; offset: number; next_cursor?: string | null };
       error?: undefined;
     }
   | { success: false; data?: undefined; meta?: undefined; error: ApiError };
@@ -1875,6 +1875,24 @@ export interface CascadeRule {
 
 // --- Heartbeat Admin Dashboard ---
 
+export interface HeartbeatPhaseTiming {
+  phase: string;
+  samples: number;
+  p50_ms: number;
+  p95_ms: number;
+  avg_db_calls: number;
+  avg_db_rows: number;
+  avg_llm_calls: number;
+  failures: number;
+}
+
+export interface HeartbeatTimings {
+  samples: number;
+  tick_p50_ms: number | null;
+  tick_p95_ms: number | null;
+  phases: HeartbeatPhaseTiming[];
+}
+
 export interface HeartbeatSimulationStatus {
   simulation_id: UUID;
   simulation_name: string;
@@ -1886,6 +1904,7 @@ export interface HeartbeatSimulationStatus {
   active_arcs: number;
   scar_tissue_level: number;
   pending_responses: number;
+  timings: HeartbeatTimings;
 }
 
 export interface HeartbeatDashboard {
@@ -1893,4 +1912,5 @@ export interface HeartbeatDashboard {
   interval_seconds: number;
   active_systems: string[];
   simulations: HeartbeatSimulationStatus[];
+  timings: HeartbeatTimings;
 }
@@ -27,89 +27,88 @@ from pathlib import Path
 def clean_for_production(input_path: str, output_path: str) -> dict[str, int]:
     """Transform pg_dump SQL for hosted Supabase compatibility.
 
+    Streams line by line — only the statement being collapsed is buffered,
+    so dumps of any size run in constant memory.
+
     Returns a dict of transformation counts for reporting.
     """
-    input_text = Path(input_path).read_text(encoding="utf-8")
-    lines = input_text.splitlines()
-
     stats = {
         "meta_commands_removed": 0,
         "set_statements_removed": 0,
         "comments_removed": 0,
         "trigger_statements_fixed": 0,
         "multiline_inserts_collapsed": 0,
-        "total_lines_in": len(lines),
+        "total_lines_in": 0,
+        "total_lines_out": 0,
     }
 
-    # Pass 1: Line-level transformations
-    cleaned_lines: list[str] = []
-    for line in lines:
-        # 1. Remove psql meta-commands
-        if line.startswith("\\restrict") or line.startswith("\\unrestrict"):
-            stats["meta_commands_removed"] += 1
-            continue
-
-        # 2. Remove SET configuration statements
-        if re.match(r"^SET\s+", line):
-            stats["set_statements_removed"] += 1
-            continue
-
-        # 3. Strip pg_dump comments, but preserve data lines starting with ---
-        # pg_dump comments are "-- " (dash-dash-space) or bare "--" (empty comment)
-        # Data lines like '--- END EVENTS ---' inside strings start with ---
-        if line == "--" or re.match(r"^-- [A-Z]", line):
-            stats["comments_removed"] += 1
-            continue
-
-        # Also strip pg_dump section headers like "-- Data for Name: agents; ..."
-        if re.match(r"^-- (Data for|Name:|Type:|Schema:|Owner:)", line):
-            stats["comments_removed"] += 1
-            continue
-
-        # 4. Replace DISABLE/ENABLE TRIGGER ALL → USER
-        if "DISABLE TRIGGER ALL" in line:
-            line = line.replace("DISABLE TRIGGER ALL", "DISABLE TRIGGER USER")
-            stats["trigger_statements_fixed"] += 1
-        elif "ENABLE TRIGGER ALL" in line:
-            line = line.replace("ENABLE TRIGGER ALL", "ENABLE TRIGGER USER")
-            stats["trigger_statements_fixed"] += 1
-
-        cleaned_lines.append(line)
-
-    # Pass 2: Collapse multi-line INSERT strings
-    # pg_dump with --inserts can produce multi-line string values when the data
-    # contains newlines (e.g., prompt templates). These break the Supabase CLI
-    # statement parser. We collapse them into single-line E-strings.
-    output_lines: list[str] = []
-    i = 0
-    while i < len(cleaned_lines):
-        line = cleaned_lines[i]
-
-        if line.startswith("INSERT INTO") and not line.rstrip().endswith(";"):
-            # This INSERT spans multiple lines — collect all lines until ;
-            parts = [line]
-            i += 1
-            while i < len(cleaned_lines):
-                parts.append(cleaned_lines[i])
-                if cleaned_lines[i].rstrip().endswith(";"):
-                    i += 1
-                    break
-                i += 1
-
-            # Join into single line, replacing real newlines within string
-            # literals with \n escape sequences
-            collapsed = _collapse_multiline_insert(parts)
-            output_lines.append(collapsed)
-            stats["multiline_inserts_collapsed"] += 1
-        else:
-            output_lines.append(line)
-            i += 1
+    # Multi-line INSERT being collected (see pass 2 below)
+    parts: list[str] = []
+
+    with (
+        open(input_path, encoding="utf-8") as src,
+        open(output_path, "w", encoding="utf-8") as dst,
+    ):
+
+        def emit(out: str) -> None:
+            dst.write(out + "\n")
+            stats["total_lines_out"] += 1
+
+        for raw in src:
+            line = raw.rstrip("\r\n")
+            stats["total_lines_in"] += 1
+
+            # Pass 1: Line-level transformations
+            # 1. Remove psql meta-commands
+            if line.startswith("\\restrict") or line.startswith("\\unrestrict"):
+                stats["meta_commands_removed"] += 1
+                continue
 
-    stats["total_lines_out"] = len(output_lines)
+            # 2. Remove SET configuration statements
+            if re.match(r"^SET\s+", line):
+                stats["set_statements_removed"] += 1
+                continue
 
-    # Write output
-    output_text = "\n".join(output_lines) + "\n"
-    Path(output_path).write_text(output_text, encoding="utf-8")
+            # 3. Strip pg_dump comments, but preserve data lines starting with ---
+            # pg_dump comments are "-- " (dash-dash-space) or bare "--" (empty comment)
+            # Data lines like '--- END EVENTS ---' inside strings start with ---
+            if line == "--" or re.match(r"^-- [A-Z]", line):
+                stats["comments_removed"] += 1
+                continue
+
+            # Also strip pg_dump section headers like "-- Data for Name: agents; ..."
+            if re.match(r"^-- (Data for|Name:|Type:|Schema:|Owner:)", line):
+                stats["comments_removed"] += 1
+                continue
+
+            # 4. Replace DISABLE/ENABLE TRIGGER ALL → USER
+            if "DISABLE TRIGGER ALL" in line:
+                line = line.replace("DISABLE TRIGGER ALL", "DISABLE TRIGGER USER")
+                stats["trigger_statements_fixed"] += 1
+            elif "ENABLE TRIGGER ALL" in line:
+                line = line.replace("ENABLE TRIGGER ALL", "ENABLE TRIGGER USER")
+                stats["trigger_statements_fixed"] += 1
+
+            # Pass 2: Collapse multi-line INSERT strings
+            # pg_dump with --inserts can produce multi-line string values when the data
+            # contains newlines (e.g., prompt templates). These break the Supabase CLI
+            # statement parser. We collapse them into single-line E-strings.
+            if parts:
+                # Inside an INSERT that spans multiple lines — collect until ;
+                parts.append(line)
+                if line.rstrip().endswith(";"):
+                    emit(_collapse_multiline_insert(parts))
+                    stats["multiline_inserts_collapsed"] += 1
+                    parts = []
+            elif line.startswith("INSERT INTO") and not line.rstrip().endswith(";"):
+                parts = [line]
+            else:
+                emit(line)
+
+        if parts:
+            # Unterminated statement at EOF — collapse what we have
+            emit(_collapse_multiline_insert(parts))
+            stats["multiline_inserts_collapsed"] += 1
 
     return stats
 
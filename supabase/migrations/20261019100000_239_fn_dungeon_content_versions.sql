@@ -0,0 +1,80 @@
+-- ============================================================================
+-- Migration 239: fn_dungeon_content_versions — per-scope content stamps
+--
+-- WHY: dungeon_content_service rebuilt the whole in-memory content cache
+-- (10 tables, ~all rows, Pydantic parse) at every boot and after every admin
+-- edit. The service now keeps hash-addressed compiled snapshots on local disk
+-- and reloads only the scopes that actually changed. Both need a cheap,
+-- authoritative answer to "what version of the content is in the DB right
+-- now?" — this function is that answer.
+--
+-- WHAT it returns: one jsonb object mapping scope → md5 digest.
+--   * Archetype scopes are keyed by archetype name ("The Shadow", ...) and
+--     cover banter, enemies, spawns, encounters (+ their choices via the
+--     encounter FK), loot, anchors, entrance texts and barometer texts.
+--   * Ability scopes are keyed "ability:{school}" and cover combat_abilities.
+-- Digests hash the full row text, so ANY column change (including direct SQL
+-- edits and seed migrations that bypass the admin API) changes the stamp.
+--
+-- CROSS-WORKER CONSISTENCY: the stamp is computed by Postgres, so every worker
+-- and every replica sees the same value without a publish step. Workers poll
+-- it on a short interval (dungeon_content_service._content_refresh_loop) and
+-- reload only the scopes whose digest moved.
+--
+-- COST: a sequential scan of ~2k small rows + md5 — single-digit ms, versus
+-- shipping every row over PostgREST and re-validating it in Python.
+--
+-- SECURITY: read-only (STABLE), SECURITY INVOKER. EXECUTE only to service_role
+-- per ADR-006 — the backend calls it with the admin client.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.fn_dungeon_content_versions()
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    WITH per_table AS (
+        SELECT archetype AS scope, 'banter' AS tbl,
+               md5(string_agg(t::text, '|' ORDER BY t.id)) AS digest
+          FROM dungeon_banter t GROUP BY archetype
+        UNION ALL
+        SELECT archetype, 'enemies', md5(string_agg(t::text, '|' ORDER BY t.id))
+          FROM dungeon_enemy_templates t GROUP BY archetype
+        UNION ALL
+        SELECT archetype, 'spawns', md5(string_agg(t::text, '|' ORDER BY t.id))
+          FROM dungeon_spawn_configs t GROUP BY archetype
+        UNION ALL
+        SELECT archetype, 'encounters', md5(string_agg(t::text, '|' ORDER BY t.id))
+          FROM dungeon_encounter_templates t GROUP BY archetype
+        UNION ALL
+        SELECT e.archetype, 'choices', md5(string_agg(c::text, '|' ORDER BY c.encounter_id, c.id))
+          FROM dungeon_encounter_choices c
+          JOIN dungeon_encounter_templates e ON e.id = c.encounter_id
+         GROUP BY e.archetype
+        UNION ALL
+        SELECT archetype, 'loot', md5(string_agg(t::text, '|' ORDER BY t.id))
+          FROM dungeon_loot_items t GROUP BY archetype
+        UNION ALL
+        SELECT archetype, 'anchors', md5(string_agg(t::text, '|' ORDER BY t.id))
+          FROM dungeon_anchor_objects t GROUP BY archetype
+        UNION ALL
+        SELECT archetype, 'entrance_texts', md5(string_agg(t::text, '|' ORDER BY t.id))
+          FROM dungeon_entrance_texts t GROUP BY archetype
+        UNION ALL
+        SELECT archetype, 'barometer_texts', md5(string_agg(t::text, '|' ORDER BY t.id))
+          FROM dungeon_barometer_texts t GROUP BY archetype
+        UNION ALL
+        SELECT 'ability:' || school, 'abilities', md5(string_agg(t::text, '|' ORDER BY t.id))
+          FROM combat_abilities t GROUP BY school
+    )
+    SELECT COALESCE(jsonb_object_agg(scope, digest), '{}'::jsonb)
+      FROM (
+        SELECT scope, md5(string_agg(tbl || ':' || digest, '|' ORDER BY tbl)) AS digest
+          FROM per_table
+         GROUP BY scope
+      ) s;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.fn_dungeon_content_versions() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.fn_dungeon_content_versions() TO service_role;
@@ -0,0 +1,72 @@
+-- ============================================================================
+-- Migration 240: simulation_settings_versions — per-simulation settings stamps
+--
+-- WHY: simulation_settings is read on every hot path (heartbeat overrides,
+-- echo bleed, model resolution per chat turn, bond gates, map theme hints)
+-- but written rarely. The backend now keeps a process-wide cache keyed by
+-- (simulation_id, category) (backend/services/simulation_settings_cache.py).
+-- Local writes through SettingsService invalidate directly; this table tells
+-- every OTHER worker that a simulation's settings moved.
+--
+-- WHAT: one row per simulation holding a monotonically increasing version
+-- (global sequence, so a delete + re-insert can never reuse a value) and the
+-- time of the last change. A row-level trigger on simulation_settings bumps
+-- it on INSERT / UPDATE / DELETE, so direct SQL edits and seed migrations
+-- that bypass the API are covered too.
+--
+-- CROSS-WORKER CONSISTENCY: workers poll the rows changed in the last two
+-- minutes (index on changed_at — normally zero rows) every few seconds and
+-- drop every cached category of a simulation whose version moved.
+--
+-- No FK to simulations: cascaded settings deletes during a simulation delete
+-- fire the trigger after the parent row is gone. Orphan stamps are inert.
+--
+-- SECURITY: RLS enabled with no policies — only service_role reads the table.
+-- The trigger function is SECURITY DEFINER so member writes through RLS can
+-- still bump the stamp; EXECUTE revoked from client roles per ADR-006.
+-- ============================================================================
+
+CREATE SEQUENCE IF NOT EXISTS public.simulation_settings_version_seq;
+
+CREATE TABLE IF NOT EXISTS public.simulation_settings_versions (
+    simulation_id uuid PRIMARY KEY,
+    version bigint NOT NULL,
+    changed_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_simulation_settings_versions_changed_at
+    ON public.simulation_settings_versions (changed_at);
+
+ALTER TABLE public.simulation_settings_versions ENABLE ROW LEVEL SECURITY;
+
+REVOKE ALL ON TABLE public.simulation_settings_versions FROM PUBLIC, anon, authenticated;
+GRANT SELECT ON TABLE public.simulation_settings_versions TO service_role;
+
+CREATE OR REPLACE FUNCTION public.fn_bump_simulation_settings_version()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    INSERT INTO simulation_settings_versions (simulation_id, version, changed_at)
+    VALUES (
+        COALESCE(NEW.simulation_id, OLD.simulation_id),
+        nextval('simulation_settings_version_seq'),
+        now()
+    )
+    ON CONFLICT (simulation_id) DO UPDATE
+        SET version = EXCLUDED.version,
+            changed_at = EXCLUDED.changed_at;
+    RETURN NULL;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.fn_bump_simulation_settings_version() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.fn_bump_simulation_settings_version() TO service_role;
+
+DROP TRIGGER IF EXISTS trg_simulation_settings_version ON public.simulation_settings;
+CREATE TRIGGER trg_simulation_settings_version
+    AFTER INSERT OR UPDATE OR DELETE ON public.simulation_settings
+    FOR EACH ROW
+    EXECUTE FUNCTION public.fn_bump_simulation_settings_version();
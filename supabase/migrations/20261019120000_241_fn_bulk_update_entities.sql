@@ -0,0 +1,107 @@
+-- ============================================================================
+-- Migration 241: fn_bulk_update_entities — chunked per-row patches in one call
+--
+-- WHY: bulk edits from the editor (PATCH /agents|buildings|events/bulk) used
+-- to be one HTTP round trip and one transaction per row. PostgREST can do a
+-- multi-row INSERT and a single-value UPDATE ... WHERE id IN (...), but not
+-- an UPDATE where every row gets its own values. BaseService.update_many
+-- sends up to 100 patches per call to this function instead.
+--
+-- WHAT: p_patches is a jsonb array of objects, each with an "id" and the
+-- columns to change. Each patch becomes one UPDATE whose SET list is exactly
+-- the patch's keys; values are cast through jsonb_populate_record so enums,
+-- arrays and jsonb columns behave like a PostgREST write. id, simulation_id,
+-- created_at, deleted_at and updated_at are never taken from the patch;
+-- updated_at is stamped with now(). Only live rows (deleted_at IS NULL) of
+-- p_simulation_id are touched. A patch may carry "if_updated_at" — the same
+-- optimistic lock as the single-row If-Updated-At header: the row is only
+-- updated while its updated_at still equals that value.
+--
+-- Returns a jsonb array aligned with p_patches: the updated row, the string
+-- "conflict" when the row exists but its updated_at no longer matches
+-- if_updated_at, or null when the id matched nothing (missing, other
+-- simulation, soft-deleted, or hidden by RLS). Any SQL error aborts the whole call — one transaction per
+-- chunk — and the backend reports it on every row of that chunk.
+--
+-- SECURITY: SECURITY INVOKER, so the caller's RLS UPDATE policies apply
+-- exactly as for a direct table write. Table names are whitelisted and all
+-- identifiers go through format('%I'). Because it is not SECURITY DEFINER
+-- it is granted to authenticated (the user-JWT client) and service_role;
+-- anon and PUBLIC are revoked.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.fn_bulk_update_entities(
+    p_table text,
+    p_simulation_id uuid,
+    p_patches jsonb
+)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+    v_patch jsonb;
+    v_sets text;
+    v_row jsonb;
+    v_results jsonb := '[]'::jsonb;
+BEGIN
+    IF p_table NOT IN ('agents', 'buildings', 'events') THEN
+        RAISE EXCEPTION 'fn_bulk_update_entities: table % is not supported', p_table
+            USING ERRCODE = '42501';
+    END IF;
+    IF jsonb_typeof(p_patches) IS DISTINCT FROM 'array' THEN
+        RAISE EXCEPTION 'fn_bulk_update_entities: p_patches must be a jsonb array'
+            USING ERRCODE = '22023';
+    END IF;
+
+    FOR v_patch IN SELECT value FROM jsonb_array_elements(p_patches) LOOP
+        v_row := NULL;
+
+        SELECT string_agg(format('%1$I = r.%1$I', key), ', ')
+          INTO v_sets
+          FROM jsonb_object_keys(
+              v_patch - 'id' - 'simulation_id' - 'created_at' - 'deleted_at' - 'updated_at' - 'if_updated_at'
+          ) AS key;
+
+        IF v_sets IS NOT NULL AND v_patch ? 'id' THEN
+            EXECUTE format(
+                'UPDATE %1$I AS t
+                    SET %2$s, updated_at = now()
+                   FROM jsonb_populate_record(NULL::%1$I, $1) AS r
+                  WHERE t.id = ($1->>''id'')::uuid
+                    AND t.simulation_id = $2
+                    AND t.deleted_at IS NULL
+                    AND ($1->>''if_updated_at'' IS NULL
+                         OR t.updated_at = ($1->>''if_updated_at'')::timestamptz)
+                RETURNING to_jsonb(t.*)',
+                p_table,
+                v_sets
+            )
+            INTO v_row
+            USING v_patch, p_simulation_id;
+
+            -- Distinguish a lost optimistic lock from a missing row.
+            IF v_row IS NULL AND v_patch ? 'if_updated_at' THEN
+                EXECUTE format(
+                    'SELECT to_jsonb(''conflict''::text)
+                       FROM %1$I AS t
+                      WHERE t.id = ($1->>''id'')::uuid
+                        AND t.simulation_id = $2
+                        AND t.deleted_at IS NULL',
+                    p_table
+                )
+                INTO v_row
+                USING v_patch, p_simulation_id;
+            END IF;
+        END IF;
+
+        v_results := v_results || jsonb_build_array(v_row);
+    END LOOP;
+
+    RETURN v_results;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.fn_bulk_update_entities(text, uuid, jsonb) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.fn_bulk_update_entities(text, uuid, jsonb) TO authenticated, service_role;
@@ -0,0 +1,80 @@
+-- ============================================================================
+-- Migration 242: rate_limit_counters — cluster-wide slowapi sliding windows
+--
+-- WHY: the slowapi limiter kept its counters in process memory, so every
+-- uvicorn worker and every replica had its own budget. Adding API replicas
+-- multiplied the AI quotas (RATE_LIMIT_AI_GENERATION / RATE_LIMIT_AI_CHAT)
+-- and with them the LLM spend. Limits are now counted cluster-wide
+-- (backend/middleware/rate_limit_storage.py).
+--
+-- WHAT: one row per sliding-window key ("<limit>/<bucket>/<window index>")
+-- with the hits of all workers and an expiry. Each worker batches its hits
+-- locally and calls fn_rate_limit_sync about once per second: one statement
+-- adds its deltas and returns the totals of every live key it tracks.
+--
+-- UNLOGGED: counters are disposable — after a crash the table is truncated
+-- and limits restart from zero, which is harmless. In exchange, the
+-- per-second upserts from every worker skip WAL entirely.
+--
+-- CROSS-WORKER CONSISTENCY: a limit can be overshot by at most the hits
+-- other workers admit between two syncs. If the RPC fails, workers keep
+-- their deltas and limit per process until it succeeds again.
+--
+-- Expired rows are deleted opportunistically (bounded batch per call).
+--
+-- SECURITY: RLS enabled with no policies; table and function are
+-- service_role only. Keys contain user ids / client IPs, never exposed.
+-- ============================================================================
+
+CREATE UNLOGGED TABLE IF NOT EXISTS public.rate_limit_counters (
+    key text PRIMARY KEY,
+    hits integer NOT NULL DEFAULT 0,
+    expires_at timestamptz NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_counters_expires_at
+    ON public.rate_limit_counters (expires_at);
+
+ALTER TABLE public.rate_limit_counters ENABLE ROW LEVEL SECURITY;
+
+REVOKE ALL ON TABLE public.rate_limit_counters FROM PUBLIC, anon, authenticated;
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE public.rate_limit_counters TO service_role;
+
+-- p_hits: [{"k": key, "n": delta, "ttl": seconds until the window expires}]
+--         (keys unique within one call — the backend aggregates them)
+-- p_keys: every live key the caller tracks; their totals are returned.
+CREATE OR REPLACE FUNCTION public.fn_rate_limit_sync(p_hits jsonb, p_keys text[])
+RETURNS TABLE (key text, hits integer)
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+#variable_conflict use_column
+BEGIN
+    IF jsonb_typeof(p_hits) = 'array' AND jsonb_array_length(p_hits) > 0 THEN
+        INSERT INTO rate_limit_counters AS c (key, hits, expires_at)
+        SELECT h->>'k',
+               (h->>'n')::integer,
+               now() + make_interval(secs => GREATEST((h->>'ttl')::double precision, 1))
+          FROM jsonb_array_elements(p_hits) AS h
+        ON CONFLICT ON CONSTRAINT rate_limit_counters_pkey DO UPDATE
+            SET hits = GREATEST(c.hits + EXCLUDED.hits, 0),
+                expires_at = GREATEST(c.expires_at, EXCLUDED.expires_at);
+    END IF;
+
+    DELETE FROM rate_limit_counters
+     WHERE rate_limit_counters.key IN (
+         SELECT r.key FROM rate_limit_counters r
+          WHERE r.expires_at < now()
+          LIMIT 500
+     );
+
+    RETURN QUERY
+        SELECT c.key, c.hits
+          FROM rate_limit_counters c
+         WHERE c.key = ANY(p_keys)
+           AND c.expires_at > now();
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.fn_rate_limit_sync(jsonb, text[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.fn_rate_limit_sync(jsonb, text[]) TO service_role;
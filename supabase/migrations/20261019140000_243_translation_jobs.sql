@@ -0,0 +1,180 @@
+-- ============================================================================
+-- Migration 243: translation_jobs + translation_memory — durable auto-translation
+--
+-- WHY: schedule_auto_translation spawned one asyncio task per entity write,
+-- each building its own DeepL translator (or LLM call) and issuing its own
+-- _de UPDATE. Bursts (memory extraction, activity narratives, lore saves)
+-- fanned out into hundreds of concurrent calls, and a restart dropped every
+-- translation still in flight.
+--
+-- WHAT:
+--   translation_jobs    one row per (table, entity, EN field) awaiting its
+--                       German text. A newer write of the same field
+--                       replaces the pending text (upsert on that key), so
+--                       repeated edits coalesce into one job.
+--   translation_memory  EN text hash -> DE text. Any text translated once is
+--                       reused instead of paying for it again.
+--
+-- The backend TranslationQueueService flushes its in-process buffer into
+-- translation_jobs, claims batches with fn_claim_translation_jobs (memory
+-- hits come back pre-filled), packs the remaining unique texts into DeepL /
+-- LLM batch calls, and writes all results with one
+-- fn_complete_translation_jobs call.
+--
+-- CROSS-WORKER: claims use FOR UPDATE SKIP LOCKED, so every worker can
+-- drain the queue. A claim older than p_stale_seconds (crashed worker) is
+-- claimed again; a failed batch releases its jobs (claimed_at = NULL) for
+-- the next drain. A job is claimed at most 5 times: exhausted jobs are never
+-- picked and are deleted once no worker holds a live claim on them.
+-- Completion only deletes a job whose text hash still matches, and only
+-- writes the _de column while the EN column still holds the translated
+-- text, so a translation can never overwrite a newer edit.
+--
+-- SECURITY: RLS enabled with no policies; tables and functions are
+-- service_role only (SECURITY INVOKER — the caller already bypasses RLS).
+-- Target table/column pairs are whitelisted to the TRANSLATABLE_FIELDS of
+-- backend/services/translation_service.py and go through format('%I').
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS public.translation_jobs (
+    id bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    table_name text NOT NULL,
+    entity_id uuid NOT NULL,
+    field text NOT NULL,
+    source_text text NOT NULL,
+    text_hash text NOT NULL,
+    context jsonb NOT NULL DEFAULT '{}'::jsonb,
+    attempts integer NOT NULL DEFAULT 0,
+    claimed_at timestamptz,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    CONSTRAINT translation_jobs_entity_field_key UNIQUE (table_name, entity_id, field)
+);
+
+CREATE INDEX IF NOT EXISTS idx_translation_jobs_claimable
+    ON public.translation_jobs (id) WHERE claimed_at IS NULL;
+
+CREATE TABLE IF NOT EXISTS public.translation_memory (
+    text_hash text PRIMARY KEY,
+    translated_text text NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+
+ALTER TABLE public.translation_jobs ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.translation_memory ENABLE ROW LEVEL SECURITY;
+
+REVOKE ALL ON TABLE public.translation_jobs FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON TABLE public.translation_memory FROM PUBLIC, anon, authenticated;
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE public.translation_jobs TO service_role;
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE public.translation_memory TO service_role;
+
+
+-- Claim up to p_limit jobs. "cached" is the remembered translation of the
+-- job's text, or NULL when it still has to be translated.
+CREATE OR REPLACE FUNCTION public.fn_claim_translation_jobs(
+    p_limit integer DEFAULT 200,
+    p_stale_seconds integer DEFAULT 300
+)
+RETURNS TABLE (
+    id bigint,
+    table_name text,
+    entity_id uuid,
+    field text,
+    source_text text,
+    text_hash text,
+    context jsonb,
+    cached text
+)
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+#variable_conflict use_column
+BEGIN
+    DELETE FROM translation_jobs j
+     WHERE j.attempts >= 5
+       AND (j.claimed_at IS NULL OR j.claimed_at < now() - make_interval(secs => p_stale_seconds));
+
+    RETURN QUERY
+    WITH picked AS (
+        SELECT j.id
+          FROM translation_jobs j
+         WHERE j.attempts < 5
+           AND (j.claimed_at IS NULL OR j.claimed_at < now() - make_interval(secs => p_stale_seconds))
+         ORDER BY j.id
+         LIMIT p_limit
+           FOR UPDATE SKIP LOCKED
+    ), claimed AS (
+        UPDATE translation_jobs j
+           SET claimed_at = now(),
+               attempts = j.attempts + 1
+          FROM picked
+         WHERE j.id = picked.id
+        RETURNING j.id, j.table_name, j.entity_id, j.field, j.source_text, j.text_hash, j.context
+    )
+    SELECT c.id, c.table_name, c.entity_id, c.field, c.source_text, c.text_hash, c.context, m.translated_text
+      FROM claimed c
+      LEFT JOIN translation_memory m ON m.text_hash = c.text_hash
+     ORDER BY c.id;
+END;
+$$;
+
+
+-- p_results: [{"id": job id, "hash": text hash the job was claimed with,
+--              "text": German translation}]
+-- Returns the number of _de columns written.
+CREATE OR REPLACE FUNCTION public.fn_complete_translation_jobs(p_results jsonb)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+    v_allowed constant text[] := ARRAY[
+        'agents.character', 'agents.background', 'agents.primary_profession',
+        'buildings.description', 'buildings.building_type', 'buildings.building_condition',
+        'zones.description', 'zones.zone_type',
+        'city_streets.street_type',
+        'simulations.description',
+        'simulation_lore.title', 'simulation_lore.epigraph', 'simulation_lore.body',
+        'simulation_lore.image_caption',
+        'simulation_chronicles.title', 'simulation_chronicles.headline', 'simulation_chronicles.content',
+        'agent_memories.content',
+        'agent_activities.narrative_text'
+    ];
+    r record;
+    v_job record;
+    v_rows integer;
+    v_written integer := 0;
+BEGIN
+    FOR r IN
+        SELECT * FROM jsonb_to_recordset(p_results) AS x(id bigint, hash text, text text)
+    LOOP
+        CONTINUE WHEN r.text IS NULL OR r.text = '';
+
+        INSERT INTO translation_memory (text_hash, translated_text)
+        VALUES (r.hash, r.text)
+        ON CONFLICT (text_hash) DO NOTHING;
+
+        -- A newer write replaced the text since the claim: leave that job queued.
+        DELETE FROM translation_jobs j
+         WHERE j.id = r.id AND j.text_hash = r.hash
+        RETURNING j.table_name, j.entity_id, j.field, j.source_text INTO v_job;
+        CONTINUE WHEN NOT FOUND;
+        CONTINUE WHEN NOT (v_job.table_name || '.' || v_job.field) = ANY (v_allowed);
+
+        EXECUTE format(
+            'UPDATE public.%1$I SET %2$I = $1 WHERE id = $2 AND %3$I = $3',
+            v_job.table_name, v_job.field || '_de', v_job.field
+        ) USING r.text, v_job.entity_id, v_job.source_text;
+        GET DIAGNOSTICS v_rows = ROW_COUNT;
+        v_written := v_written + v_rows;
+    END LOOP;
+
+    RETURN v_written;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.fn_claim_translation_jobs(integer, integer) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION public.fn_complete_translation_jobs(jsonb) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.fn_claim_translation_jobs(integer, integer) TO service_role;
+GRANT EXECUTE ON FUNCTION public.fn_complete_translation_jobs(jsonb) TO service_role;
@@ -0,0 +1,19 @@
+-- ============================================================================
+-- Migration 244: index for the heartbeat profile window
+--
+-- WHY: every tick now stores a per-phase profile (wall time, DB round trips,
+-- rows, LLM calls) in simulation_heartbeats.summary.profile, and the admin
+-- heartbeat dashboard aggregates the most recent completed ticks across all
+-- simulations into p50/p95 per phase. simulation_heartbeats is only indexed
+-- by simulation, so "latest N completed ticks" sorted the whole table.
+--
+-- WHAT: partial index on created_at DESC for completed ticks; the dashboard
+-- query (status = 'completed' ORDER BY created_at DESC LIMIT 500) reads the
+-- first 500 index entries.
+--
+-- SECURITY: index only; no grants or policies change.
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_heartbeats_completed_recent
+    ON public.simulation_heartbeats (created_at DESC)
+    WHERE status = 'completed';
@@ -0,0 +1,119 @@
+-- ============================================================================
+-- Migration 245: batched mission resolution
+--
+-- WHY: resolve_pending_missions issued one fn_transition_mission_status RPC
+-- per deploying mission and one UPDATE per resolved mission, plus two
+-- participant lookups and an epoch lookup per mission for the betrayal
+-- check. When several epochs share a deadline, those round trips serialise
+-- behind each other and delay the deadline, scoring and notifications of
+-- every epoch in the sweep.
+--
+-- WHAT:
+--   1. fn_transition_missions_batch — compare-and-swap status transition for
+--      a set of missions (deploying → active), one UPDATE.
+--   2. fn_resolve_missions_batch — persist the rolled outcomes of a cycle:
+--      status, resolved_at and mission_result for every mission in one
+--      UPDATE. Only missions still 'active' are written (same CAS guarantee
+--      as fn_transition_mission_status); the updated rows are returned, so a
+--      mission resolved concurrently is simply absent from the result. This
+--      write is the claim: success effects run only for the returned rows.
+--   3. fn_record_mission_results — store the success-effect results of the
+--      claimed missions in one UPDATE once the effects have run.
+--
+-- SECURITY: SECURITY DEFINER + search_path=public + EXECUTE only to
+-- service_role per ADR-006. Called from the cycle pipeline with the admin
+-- client.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.fn_transition_missions_batch(
+    p_mission_ids UUID[],
+    p_from_status TEXT,
+    p_to_status   TEXT
+)
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_rows INT;
+BEGIN
+    IF p_from_status NOT IN ('deploying', 'active', 'returning', 'success', 'failed', 'detected', 'captured') THEN
+        RAISE EXCEPTION 'Invalid from_status: %', p_from_status;
+    END IF;
+    IF p_to_status NOT IN ('deploying', 'active', 'returning', 'success', 'failed', 'detected', 'captured') THEN
+        RAISE EXCEPTION 'Invalid to_status: %', p_to_status;
+    END IF;
+
+    UPDATE operative_missions
+       SET status = p_to_status
+     WHERE id = ANY(p_mission_ids)
+       AND status = p_from_status;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$;
+
+COMMENT ON FUNCTION public.fn_transition_missions_batch(UUID[], TEXT, TEXT) IS
+    'Batch compare-and-swap mission status transition — replaces one fn_transition_mission_status call per mission in resolve_pending_missions. Returns the number of missions transitioned.';
+
+REVOKE ALL ON FUNCTION public.fn_transition_missions_batch(UUID[], TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.fn_transition_missions_batch(UUID[], TEXT, TEXT) TO service_role;
+
+
+-- p_results: [{"id": uuid, "status": text, "mission_result": jsonb}, ...]
+CREATE OR REPLACE FUNCTION public.fn_resolve_missions_batch(
+    p_results JSONB
+)
+RETURNS SETOF public.operative_missions
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    UPDATE public.operative_missions m
+       SET status = r.status,
+           resolved_at = now(),
+           mission_result = r.mission_result
+      FROM jsonb_to_recordset(p_results) AS r(id UUID, status TEXT, mission_result JSONB)
+     WHERE m.id = r.id
+       AND m.status = 'active'
+       AND r.status IN ('success', 'failed', 'detected', 'captured')
+    RETURNING m.*;
+$$;
+
+COMMENT ON FUNCTION public.fn_resolve_missions_batch(JSONB) IS
+    'Persist rolled mission outcomes for a cycle in one UPDATE — replaces the per-mission UPDATE in resolve_pending_missions. Only missions still active are written; returns the updated rows.';
+
+REVOKE ALL ON FUNCTION public.fn_resolve_missions_batch(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.fn_resolve_missions_batch(JSONB) TO service_role;
+
+
+-- p_results: [{"id": uuid, "mission_result": jsonb}, ...]
+CREATE OR REPLACE FUNCTION public.fn_record_mission_results(
+    p_results JSONB
+)
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_rows INT;
+BEGIN
+    UPDATE public.operative_missions m
+       SET mission_result = r.mission_result
+      FROM jsonb_to_recordset(p_results) AS r(id UUID, mission_result JSONB)
+     WHERE m.id = r.id
+       AND m.status = 'success';
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$;
+
+COMMENT ON FUNCTION public.fn_record_mission_results(JSONB) IS
+    'Store success-effect results for missions already claimed by fn_resolve_missions_batch, in one UPDATE. Returns the number of missions written.';
+
+REVOKE ALL ON FUNCTION public.fn_record_mission_results(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.fn_record_mission_results(JSONB) TO service_role;
@@ -0,0 +1,38 @@
+-- ============================================================================
+-- Migration 246: merge feature progress into feature_purchases.result
+--
+-- WHY: long-running features (hi-res archive export) report download and
+-- upload progress in feature_purchases.result.progress, which the client
+-- polls. Writing it with a plain UPDATE replaced the whole result object, so
+-- a progress tick wiped any other key already stored there.
+--
+-- WHAT: fn_report_feature_progress — sets result.progress with jsonb_set in
+-- one UPDATE and leaves every other key of result untouched. Only purchases
+-- still 'processing' are written, so a late tick cannot touch a completed or
+-- failed purchase.
+--
+-- SECURITY: SECURITY DEFINER + search_path=public + EXECUTE only to
+-- service_role per ADR-006. Called from the export worker with the admin
+-- client.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.fn_report_feature_progress(
+    p_purchase_id UUID,
+    p_progress    JSONB
+)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    UPDATE public.feature_purchases
+       SET result = jsonb_set(COALESCE(result, '{}'::jsonb), '{progress}', p_progress)
+     WHERE id = p_purchase_id
+       AND status = 'processing';
+$$;
+
+COMMENT ON FUNCTION public.fn_report_feature_progress(UUID, JSONB) IS
+    'Merge a progress object into feature_purchases.result.progress without overwriting the rest of result.';
+
+REVOKE ALL ON FUNCTION public.fn_report_feature_progress(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.fn_report_feature_progress(UUID, JSONB) TO service_role;